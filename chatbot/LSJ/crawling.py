@@ -1,5 +1,7 @@
 import os
 import re
+import sys
+import json
 import time
 import pymysql
 import requests
@@ -16,11 +18,20 @@ from selenium.webdriver.support import expected_conditions as EC
 from datetime import datetime
 import pytz
 
+# 챗봇 서버와 같은 기술 표준화 사전, 지역/경력/마감일 파서 사용 (chatbot/jumpit/skills.py, facets.py)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from jumpit.facets import parse_posting_facets
+from jumpit.skills import normalize_skills
+
 # 한국 시간 설정
 KST = pytz.timezone("Asia/Seoul")
 
 load_dotenv()
 
+# 크롤링 진행 상황 파일 (챗봇 서버의 /api/metrics/ 에서 읽어서 노출)
+CRAWL_PROGRESS_PATH = os.getenv('CRAWL_PROGRESS_PATH', 'crawl_progress.json')
+progress = {"phase": "starting", "found": 0, "processed": 0, "saved": 0, "skipped": 0, "errors": 0}
+
 # MariaDB 연결 설정
 db = pymysql.connect(
     host=os.getenv('DB_HOST'),
@@ -31,6 +42,18 @@ db = pymysql.connect(
     charset="utf8mb4"
 )
 
+def update_progress(**fields):
+    """진행 상황 갱신 후 파일에 기록 (임시 파일에 쓰고 교체해 읽는 쪽이 깨진 파일을 보지 않도록 함)"""
+    progress.update(fields)
+    progress["updated_at"] = time.time()
+    try:
+        tmp_path = f"{CRAWL_PROGRESS_PATH}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(progress, f)
+        os.replace(tmp_path, CRAWL_PROGRESS_PATH)
+    except OSError as e:
+        print(f"진행 상황 기록 중 오류 발생: {e}")
+
 def create_saved_jobs_table():
     """저장된 공고 테이블 생성 및 초기화"""
     cursor = db.cursor()
@@ -55,10 +78,19 @@ def create_saved_jobs_table():
         채용절차 TEXT,
         학력 VARCHAR(255),
         근무지역_상세 VARCHAR(255),
-        마감일자 VARCHAR(255)
+        마감일자 VARCHAR(255),
+        표준기술 TEXT,
+        지역코드 VARCHAR(10),
+        시군구 VARCHAR(50),
+        경력_최소 INT,
+        경력_최대 INT,
+        마감일 DATE,
+        상시채용 TINYINT(1) DEFAULT 0
     )
     """
     cursor.execute(create_table_query)
+    # 검색/추천에서 마감된 공고를 범위 조건(마감일 >= 오늘)으로 거르기 위한 인덱스
+    cursor.execute("CREATE INDEX idx_job_posting_deadline ON job_posting_new (마감일)")
     db.commit()
     cursor.close()
 
@@ -177,6 +209,7 @@ def scrape_jobs():
         job_data = []
         job_elements = driver.find_elements(By.XPATH, "//section/div")
         print(f"총 {len(job_elements)}개의 공고를 찾았습니다.")
+        update_progress(phase="listing", found=len(job_elements))
         
 
         for job_element in job_elements:
@@ -198,17 +231,20 @@ def scrape_jobs():
 
             except Exception as e:
                 print(f"Error: {e}")
+                update_progress(errors=progress["errors"] + 1)
 
         driver.quit()
         return job_data
     except Exception as e:
         print(f"크롤링 중 오류 발생: {e}")
+        update_progress(phase="failed")
         return []
 
 def save_to_db(job_data):
     """DB에 크롤링한 데이터 저장"""
     cursor = db.cursor()
     saved_job_count = 0
+    update_progress(phase="details")
     
     for job in job_data:
         title, company_name, skill, loc, condition, date, job_url = job
@@ -216,34 +252,45 @@ def save_to_db(job_data):
         # 'D-day'인 데이터 제외
         if date.strip().lower() == 'd-day':
             print(f"'{title}' 공고는 'D-day'이므로 제외됨.")
+            update_progress(processed=progress["processed"] + 1, skipped=progress["skipped"] + 1)
             continue
 
         # 상세 정보 크롤링
         details = scrape_job_details(job_url)
+        # 사용기술 원문 → 표준 기술 이름 (예: "파이썬,k8s" → "Python,Kubernetes")
+        standard_skills = ",".join(normalize_skills(skill))
+        # 근무지역/근로조건/마감일 원문 → 지역코드, 시군구, 경력 범위, 마감일, 상시채용 (예: "서울 강남구" → KR-11, 강남구)
+        facets = parse_posting_facets(loc, condition, date, details.get("마감일자"), datetime.now(KST))
 
         insert_query = """
-        INSERT INTO job_posting_new (제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크, 주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차, 학력, 근무지역_상세, 마감일자)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO job_posting_new (제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크, 주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차, 학력, 근무지역_상세, 마감일자, 표준기술, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         try:
-            cursor.execute(insert_query, (title, company_name, skill, loc, condition, date, job_url, *details.values()))
+            cursor.execute(insert_query, (title, company_name, skill, loc, condition, date, job_url, *details.values(), standard_skills, *facets))
             db.commit()
             saved_job_count += 1  # 저장된 공고 카운트 증가
+            update_progress(processed=progress["processed"] + 1, saved=saved_job_count)
         except Exception as e:
             print(f"DB 저장 중 오류 발생: {e}")
             db.rollback()
+            update_progress(processed=progress["processed"] + 1, errors=progress["errors"] + 1)
     
     cursor.close()
     print(f"총 {saved_job_count}개의 공고 DB 저장 완료!")
 
 def main():
     print("채용 정보를 크롤링하는 중...")
+    update_progress(phase="listing", started_at=time.time())
     job_data = scrape_jobs()
     
     if job_data:
         save_to_db(job_data)
+        update_progress(phase="done")
     else:
         print("저장할 데이터가 없습니다.")
+        if progress["phase"] != "failed":
+            update_progress(phase="done")
 
 if __name__ == "__main__":
     create_saved_jobs_table()
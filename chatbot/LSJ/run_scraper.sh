@@ -10,6 +10,12 @@ source /home/ubuntu/job-search-support-chatbot/sesac/bin/activate
 # 크롤링 실행
 /home/ubuntu/job-search-support-chatbot/sesac/bin/python /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.py > /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.log 2>&1
 
+# 공고 검색 인덱스 재생성 (챗봇 서버가 파일 변경을 감지해 다시 읽음)
+cd /home/ubuntu/job-search-support-chatbot/chatbot && /home/ubuntu/job-search-support-chatbot/sesac/bin/python -m jumpit.retrieval build >> /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.log 2>&1
+
+# 사용자 맞춤 추천 공고 재계산 (새 공고 기준)
+cd /home/ubuntu/job-search-support-chatbot/chatbot && /home/ubuntu/job-search-support-chatbot/sesac/bin/python -m jumpit.recommend build >> /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.log 2>&1
+
 # 로그 끝날 때 한국시간으로 기록
 echo "=== Script Ended ===" >> /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.log
 echo "$(date '+%Y-%m-%d %H:%M:%S')" >> /home/ubuntu/job-search-support-chatbot/chatbot/LSJ/crawling.log
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""
+요청당 인증 비용 마이크로벤치마크 (jwt_required, check_username)
+
+토큰/사용자 캐시를 끈 경우와 켠 경우의 요청당 처리 시간을 비교합니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --users 100
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 OPENAI_API_KEY=mock python -m bench.auth_bench --requests 20000
+"""
+import argparse
+import json
+import time
+
+from bench.replay import percentile, setup_django
+
+
+def measure(func, requests):
+    """func() 를 requests 번 호출한 요청당 시간(µs) 통계"""
+    samples = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return {
+        "mean_us": round(sum(samples) / len(samples), 2),
+        "p50_us": round(percentile(samples, 50), 2),
+        "p99_us": round(percentile(samples, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인증 비용 마이크로벤치마크")
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=100, help="토큰을 번갈아 사용할 사용자 수")
+    args = parser.parse_args()
+
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.http import HttpResponse
+    from django.test import RequestFactory
+
+    from bench.fixtures import bench_username
+    from jumpit.auth_cache import token_cache, user_cache
+    from jumpit.views import generate_jwt, jwt_required
+
+    users = list(User.objects.filter(username__in=[bench_username(i) for i in range(args.users)]))
+    factory = RequestFactory()
+    auth_requests = [factory.get("/api/resumes/", HTTP_AUTHORIZATION=f"Bearer {generate_jwt(u)}") for u in users]
+    usernames = [u.username for u in users] + [f"missing_{i}" for i in range(len(users))]
+    protected = jwt_required(lambda request: HttpResponse())
+
+    counter = {"jwt": 0, "user": 0}
+
+    def verify():
+        request = auth_requests[counter["jwt"] % len(auth_requests)]
+        counter["jwt"] += 1
+        assert protected(request).status_code == 200
+
+    def lookup():
+        username = usernames[counter["user"] % len(usernames)]
+        counter["user"] += 1
+        user_cache.get(username)
+
+    results = {}
+    # 캐시 끔: 토큰 캐시 크기 0, 사용자 캐시 유효 시간 0
+    token_cache.max_size, user_cache.ttl = 0, 0
+    token_cache.clear()
+    results["jwt_required_uncached"] = measure(verify, args.requests)
+    results["user_lookup_uncached"] = measure(lookup, min(args.requests, 2000))
+
+    token_cache.max_size, user_cache.ttl = 4096, 60
+    for _ in range(len(auth_requests)):
+        verify()
+    for _ in range(len(usernames)):
+        lookup()
+    results["jwt_required_cached"] = measure(verify, args.requests)
+    results["user_lookup_cached"] = measure(lookup, args.requests)
+
+    print(json.dumps({"users": len(users), "requests": args.requests, **results}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+검색어 자동완성 벤치마크 (자모 접두사 트라이 vs 제안 전체 접두사 비교)
+
+제안 목록에서 고른 단어를 한 타씩(자모 단위, 입력 중인 글자 포함) 입력하며 매번 제안을 조회해 시간을 재고,
+트라이 크기와 입력한 단어가 제안 목록에 나오기까지 필요한 타수를 출력합니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --postings 50000 --no-migrate
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.autocomplete_bench
+"""
+import argparse
+import json
+import random
+import time
+
+from bench.replay import percentile
+
+# 두벌식 입력 중 화면에 보이는 글자 ("백엔드" → ㅂ, 배, 백, 백ㅇ, 백에, 백엔, 백엔ㄷ, 백엔드)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+
+def keystrokes(word):
+    """단어를 입력하는 동안 입력창에 보이는 문자열 목록 (완성형 글자는 초성 → 초성+중성 → 완성 순)"""
+    typed = []
+    for position, char in enumerate(word):
+        done = word[:position]
+        code = ord(char) - 0xAC00
+        if 0 <= code < 11172:
+            first = _CHOSEONG[code // 588]
+            open_syllable = chr(0xAC00 + code - code % 28)
+            typed.append(done + first)
+            typed.append(done + open_syllable)
+            if code % 28:
+                typed.append(done + char)
+        else:
+            typed.append(done + char)
+    return typed
+
+
+def brute_force(trie, keys, prefix, limit):
+    """비교용: 모든 제안의 자모 키(keys)와 접두사 비교 후 공고 수 순 정렬"""
+    from jumpit.hangul import decompose
+
+    jamo = decompose(" ".join(prefix.split()))
+    matches = [number for number, key in enumerate(keys) if key.startswith(jamo)]
+    matches.sort(key=lambda number: -trie.counts[number])
+    return [trie.terms[number] for number in matches[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색어 자동완성 벤치마크")
+    parser.add_argument("--words", type=int, default=200, help="입력해 볼 제안 수")
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from jumpit.autocomplete import SuggestionTrie, suggestion_entries
+    from jumpit.db import get_db_connection
+    from jumpit.hangul import decompose
+    from jumpit.retrieval import JobIndex, fetch_index_rows
+
+    conn = get_db_connection()
+    rows = fetch_index_rows(conn)
+    conn.close()
+    index = JobIndex.build(rows)
+    trie = index.suggestions
+    # 인덱스 생성 중 자동완성 부분만 다시 측정
+    started = time.perf_counter()
+    SuggestionTrie.build(suggestion_entries(
+        [row[1] for row in rows], [row[4].split(',') if row[4] else [] for row in rows], [row[11] for row in rows]))
+    build_ms = (time.perf_counter() - started) * 1e3
+    keys = [decompose(term) for term in trie.terms]
+    arrays = trie.to_arrays()
+
+    rng = random.Random(args.seed)
+    words = rng.sample(trie.terms, min(args.words, len(trie)))
+    trie_samples, brute_samples = [], []
+    strokes_to_top = []
+    for word in words:
+        typed = keystrokes(word)
+        found_at = None
+        for count, prefix in enumerate(typed, 1):
+            started = time.perf_counter()
+            result = trie.suggest(prefix, args.limit)
+            trie_samples.append((time.perf_counter() - started) * 1e6)
+            if found_at is None and word in [item["text"] for item in result]:
+                found_at = count
+        for prefix in typed[::4]:
+            started = time.perf_counter()
+            brute_force(trie, keys, prefix, args.limit)
+            brute_samples.append((time.perf_counter() - started) * 1e6)
+        strokes_to_top.append((found_at or len(typed)) / len(typed))
+
+    print(json.dumps({
+        "postings": len(index),
+        "suggestions": len(trie),
+        "trie_nodes": len(trie.labels),
+        "trie_bytes": sum(len(value.tobytes()) for key, value in arrays.items() if key != 'ac_terms'),
+        "trie_build_ms": round(build_ms, 1),
+        "words_typed": len(words),
+        "lookups": len(trie_samples),
+        "trie_p50_us": round(percentile(trie_samples, 50), 1),
+        "trie_p99_us": round(percentile(trie_samples, 99), 1),
+        "brute_force_p50_us": round(percentile(brute_samples, 50), 1),
+        "brute_force_p99_us": round(percentile(brute_samples, 99), 1),
+        # 단어 길이 대비 제안 목록에 나타날 때까지 입력한 비율 (평균)
+        "keystrokes_ratio": round(sum(strokes_to_top) / len(strokes_to_top), 3),
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
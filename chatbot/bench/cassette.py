@@ -0,0 +1,48 @@
+import hashlib
+import json
+import os
+import threading
+
+
+def prompt_key(model, messages):
+    """모델과 메세지 내용으로 만든 녹화 키"""
+    payload = json.dumps(
+        {"model": model, "messages": [[m.get("role"), m.get("content")] for m in messages]},
+        ensure_ascii=False, sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """실제 프롬프트/응답 녹화 파일 (JSON Lines, 한 줄에 한 건)"""
+
+    def __init__(self, path):
+        self.path = path
+        self._entries = {}
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, model, messages):
+        entry = self._entries.get(prompt_key(model, messages))
+        return entry["response"] if entry else None
+
+    def record(self, model, messages, response, usage=None):
+        entry = {
+            "key": prompt_key(model, messages),
+            "model": model,
+            "messages": messages,
+            "response": response,
+            "usage": usage,
+        }
+        with self._lock:
+            self._entries[entry["key"]] = entry
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
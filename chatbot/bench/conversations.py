@@ -0,0 +1,49 @@
+# 벤치마크용 대화 시나리오 (사용자 입력 순서대로)
+
+SEARCH_DETAIL = [
+    "백엔드 개발자 공고 알려줘",
+    "더 보여줘",
+    "3번 공고 주요업무랑 자격요건 알려줘",
+    "3번 공고 복지 및 혜택도 알려줘",
+]
+
+SEARCH_TO_COVER_LETTER = [
+    "데이터 엔지니어 공고 보여줘",
+    "2번 공고 상세 정보 알려줘",
+    "2번 공고로 자기소개서 작성해줘. Python과 Airflow로 데이터 파이프라인 프로젝트를 진행한 경험이 있습니다.",
+    "직무 역량 부분을 더 구체적으로 수정해줘",
+]
+
+FULL_JOURNEY = [
+    "AI 개발자 공고 알려줘",
+    "더 보여줘",
+    "1번 공고 우대사항 알려줘",
+    "1번 공고로 자기소개서 작성해줘. LangChain으로 챗봇 프로젝트를 진행했고 인턴 경험이 있습니다.",
+    "입사 후 포부를 수정해줘",
+    "기술 면접 연습하고 싶어",
+    "LangGraph로 상태 기반 워크플로우를 구성했고 노드별로 분기를 나눴습니다.",
+    "프롬프트 길이가 길어질 때는 이전 대화를 요약해서 넣었습니다.",
+    "면접 종료할게",
+]
+
+SEARCH_TO_RECOMMEND = [
+    "백엔드 개발자 공고 알려줘",
+    "2번 공고 주요업무 알려줘",
+    "나한테 맞는 공고 추천해줘",
+    "1번 공고 자격요건 알려줘",
+]
+
+TENACITY_INTERVIEW = [
+    "인성 면접 연습하고 싶어",
+    "팀 프로젝트에서 리더를 맡아 일정 관리를 했습니다.",
+    "의견 충돌이 있을 때는 데이터를 근거로 설득했습니다.",
+    "그만할게",
+]
+
+SCENARIOS = {
+    "search_detail": SEARCH_DETAIL,
+    "search_to_cover_letter": SEARCH_TO_COVER_LETTER,
+    "full_journey": FULL_JOURNEY,
+    "search_to_recommend": SEARCH_TO_RECOMMEND,
+    "tenacity_interview": TENACITY_INTERVIEW,
+}
@@ -0,0 +1,89 @@
+"""
+설정 화면 대시보드 반복 조회 벤치마크
+
+같은 사용자가 설정 화면을 여러 번 여는 경우 (브라우저가 ETag 로 확인) 와
+매번 새로 받는 경우의 요청당 시간, DB 쿼리 수, 응답 크기를 비교합니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --users 100
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 OPENAI_API_KEY=mock python -m bench.dashboard_bench --loads 500
+"""
+import argparse
+import json
+import os
+import time
+
+from bench.replay import percentile, setup_django
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 반복 조회 벤치마크")
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--user", type=int, default=0, help="bench_username 번호")
+    parser.add_argument("--history", type=int, default=200, help="미리 채울 자기소개서/면접 질문 수")
+    args = parser.parse_args()
+
+    # 벤치마크는 단일 프로세스 (워커별 캐시로 ETag 사용)
+    os.environ.setdefault("HISTORY_ETAGS", "true")
+    os.environ.setdefault("HISTORY_ETAGS_SINGLE_PROCESS", "true")
+    setup_django()
+    from django.contrib.auth.models import User
+    from django.test import Client
+
+    from bench.fixtures import bench_username
+    from jumpit import versions
+    from jumpit.db import get_db_connection
+    from jumpit.metrics import DB_QUERY_SECONDS
+    from jumpit.views import generate_jwt
+
+    user = User.objects.get(username=bench_username(args.user))
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM saved_cover_letter WHERE customer_id = %s", (user.username,))
+    cursor.execute("DELETE FROM personal_interview_question WHERE customer_id = %s", (user.username,))
+    for i in range(args.history):
+        cursor.execute("INSERT INTO saved_cover_letter (customer_id, 채용공고, 자기소개서) VALUES (%s, %s, %s)",
+                       (user.username, f"벤치마크 공고 {i}", "자기소개서 본문 " * 300))
+        cursor.execute("INSERT INTO personal_interview_question (customer_id, 면접질문) VALUES (%s, %s)",
+                       (user.username, f"벤치마크 면접 질문 {i}"))
+    conn.commit()
+    cursor.close()
+    conn.close()
+    versions.bump(versions.RESUMES, user.username)
+    versions.bump(versions.INTERVIEWS, user.username)
+
+    client = Client(HTTP_HOST="localhost", HTTP_AUTHORIZATION=f"Bearer {generate_jwt(user)}")
+
+    def db_queries():
+        # 히스토그램 구간별 개수의 합 = 실행된 쿼리 수
+        return sum(sum(counts) for counts, _ in list(DB_QUERY_SECONDS._values.values()))
+
+    def run(conditional):
+        etag = None
+        samples, sizes, statuses = [], [], {}
+        queries_before = db_queries()
+        for _ in range(args.loads):
+            headers = {"HTTP_IF_NONE_MATCH": etag} if conditional and etag else {}
+            started = time.perf_counter()
+            response = client.get("/api/dashboard/", **headers)
+            samples.append((time.perf_counter() - started) * 1000)
+            sizes.append(len(response.content))
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+            etag = response.get("ETag", etag)
+        return {
+            "statuses": statuses,
+            "mean_ms": round(sum(samples) / len(samples), 3),
+            "p50_ms": round(percentile(samples, 50), 3),
+            "p99_ms": round(percentile(samples, 99), 3),
+            "db_queries_per_load": round((db_queries() - queries_before) / args.loads, 2),
+            "bytes_per_load": round(sum(sizes) / len(sizes), 1),
+        }
+
+    print(json.dumps({
+        "loads": args.loads,
+        "history_rows": args.history,
+        "unconditional": run(conditional=False),
+        "conditional": run(conditional=True),
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
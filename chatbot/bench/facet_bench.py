@@ -0,0 +1,84 @@
+"""
+지역/경력/마감일 조건 검색 + 패싯 개수 벤치마크 (SQL LIKE + GROUP BY vs 패싯 비트맵 인덱스)
+
+같은 조건의 결과 수와 근무지역별 공고 수를 SQL 과 인덱스로 각각 계산해 시간을 비교합니다.
+SQL 은 근무지역/근로조건 원문 LIKE 라 "경력 2년" 같은 범위 조건은 표현할 수 없어 구간 문자열로 근사합니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --postings 50000 --no-migrate
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.facet_bench
+"""
+import argparse
+import json
+
+from bench.skill_bench import timed
+from jumpit.bitmap import Bitmap
+
+QUERIES = [
+    {"regions": ["서울"], "career": None, "condition_like": None},
+    {"regions": ["서울 강남구", "경기 성남시"], "career": None, "condition_like": None},
+    {"regions": ["서울"], "career": 0, "condition_like": "%신입%"},
+    {"regions": [], "career": 2, "condition_like": "%1~3년%"},
+]
+
+
+def sql_query(cursor, regions, condition_like):
+    conditions, params = [], []
+    if regions:
+        conditions.append("(" + " OR ".join(["근무지역 LIKE %s"] * len(regions)) + ")")
+        params += [f"{region}%" for region in regions]
+    if condition_like:
+        conditions.append("근로조건 LIKE %s")
+        params.append(condition_like)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    cursor.execute(f"SELECT COUNT(*) FROM job_posting_new {where}", params)
+    total = cursor.fetchone()[0]
+    # 근무지역별 개수 (지역 조건을 뺀 결과 기준, 인덱스의 패싯 개수와 같은 방식)
+    other = "WHERE 근로조건 LIKE %s" if condition_like else ""
+    cursor.execute(f"SELECT 근무지역, COUNT(*) FROM job_posting_new {other} GROUP BY 근무지역",
+                   [condition_like] if condition_like else [])
+    return total, cursor.fetchall()
+
+
+def index_query(facets, regions, career):
+    region_filter = facets.region_filter(regions)[0] if regions else None
+    career_filter = facets.career_filter(career) if career is not None else None
+    everything = Bitmap.full(facets.size)
+    result = everything
+    for bitmap in (region_filter, career_filter):
+        if bitmap is not None:
+            result = result & bitmap
+    region_counts = facets.region_counts((career_filter or everything).to_array())
+    return len(result), region_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지역/경력 조건 검색 + 패싯 개수 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from jumpit.db import get_db_connection
+    from jumpit.retrieval import JobIndex, fetch_index_rows
+
+    conn = get_db_connection()
+    index = JobIndex.build(fetch_index_rows(conn))
+    cursor = conn.cursor()
+    report = {"postings": len(index), "queries": []}
+    for query in QUERIES:
+        (sql_total, _), sql_us = timed(
+            lambda: sql_query(cursor, query["regions"], query["condition_like"]), args.repeat)
+        (index_total, _), index_us = timed(
+            lambda: index_query(index.facets, query["regions"], query["career"]), args.repeat * 20)
+        report["queries"].append({
+            "regions": query["regions"],
+            "career": query["career"],
+            "sql_p50_us": sql_us,
+            "index_p50_us": index_us,
+            "sql_results": sql_total,
+            "index_results": index_total,
+        })
+    cursor.close()
+    conn.close()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+합성 채용 공고 코퍼스 적재
+
+크롤러(LSJ/crawling.py)와 같은 job_posting_new 테이블을 만들고 가짜 공고를 채웁니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --postings 5000 --users 100
+"""
+import argparse
+import os
+import random
+from datetime import date, timedelta
+
+from jumpit.db import DB_BACKEND, get_db_connection
+from jumpit.facets import parse_posting_facets
+from jumpit.skills import normalize_skills
+
+FIELDS = [
+    ("백엔드", ["Python", "Django", "FastAPI", "Java", "Spring", "MySQL", "Redis", "AWS", "Docker"]),
+    ("프론트엔드", ["JavaScript", "TypeScript", "React", "Vue.js", "Next.js", "HTML", "CSS"]),
+    ("풀스택", ["JavaScript", "Node.js", "React", "Python", "Django", "MySQL", "AWS"]),
+    ("인공지능 (AI)", ["Python", "PyTorch", "TensorFlow", "LangChain", "OpenAI", "Docker"]),
+    ("머신러닝 (ML)", ["Python", "PyTorch", "scikit-learn", "Pandas", "Spark", "Kubernetes"]),
+    ("데이터 엔지니어", ["Python", "Spark", "Kafka", "Airflow", "Hadoop", "AWS", "SQL"]),
+    ("데이터 분석가", ["Python", "SQL", "Pandas", "Tableau", "R"]),
+    ("클라우드", ["AWS", "GCP", "Azure", "Terraform", "Kubernetes", "Linux"]),
+    ("데브옵스 (DevOps)", ["Kubernetes", "Docker", "Jenkins", "Terraform", "AWS", "Linux"]),
+    ("보안", ["Linux", "Python", "C", "네트워크", "AWS"]),
+    ("안드로이드", ["Kotlin", "Java", "Android", "Firebase"]),
+    ("iOS", ["Swift", "SwiftUI", "Objective-C"]),
+    ("임베디드", ["C", "C++", "RTOS", "Linux", "ARM"]),
+    ("로봇", ["C++", "ROS", "Python", "OpenCV"]),
+    ("반도체", ["C", "Verilog", "Python", "MATLAB"]),
+    ("게임", ["C++", "Unity", "C#", "Unreal Engine"]),
+]
+ROLES = ["개발자", "엔지니어", "프로그래머", "리드", "인턴"]
+COMPANIES = ["점핏", "새싹테크", "오픈랩스", "클라우드원", "데이터웨이브", "로보틱스코리아",
+             "핀테크플러스", "헬스케어AI", "게임스튜디오", "모빌리티랩", "커머스허브", "에듀테크"]
+REGIONS = ["서울 강남구", "서울 서초구", "서울 마포구", "서울 영등포구", "서울 송파구", "경기 성남시",
+           "경기 수원시", "부산 해운대구", "대전 유성구", "인천 연수구", "광주 북구", "제주 제주시"]
+CONDITIONS = ["신입", "경력 1~3년", "경력 3~5년", "경력 5~10년", "신입·경력 0~3년", "경력 무관"]
+EDUCATION = ["학력무관", "고졸 이상", "초대졸 이상", "대졸 이상", "석사 이상"]
+
+BENCH_PASSWORD = "bench-password-1234"
+# 크롤링하고 며칠 지난 코퍼스로 생성 (모집기간 D-n 은 크롤링 당일 기준, 일부 공고는 이미 마감)
+CRAWLED_DAYS_AGO = 10
+
+CREATE_JOB_POSTING_TABLE = """
+CREATE TABLE IF NOT EXISTS job_posting_new (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    제목 VARCHAR(255),
+    회사명 VARCHAR(255),
+    사용기술 TEXT,
+    근무지역 VARCHAR(255),
+    근로조건 VARCHAR(255),
+    모집기간 VARCHAR(255),
+    링크 TEXT,
+    저장일시 DATETIME DEFAULT CONVERT_TZ(NOW(), 'UTC', 'Asia/Seoul'),
+    주요업무 TEXT,
+    자격요건 TEXT,
+    우대사항 TEXT,
+    복지_및_혜택 TEXT,
+    채용절차 TEXT,
+    학력 VARCHAR(255),
+    근무지역_상세 VARCHAR(255),
+    마감일자 VARCHAR(255),
+    표준기술 TEXT,
+    지역코드 VARCHAR(10),
+    시군구 VARCHAR(50),
+    경력_최소 INT,
+    경력_최대 INT,
+    마감일 DATE,
+    상시채용 TINYINT(1) DEFAULT 0
+)
+"""
+
+
+def generate_postings(count, seed=0):
+    """크롤러 저장 형식과 같은 15개 컬럼 튜플 목록 생성"""
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count):
+        field, skills = rng.choice(FIELDS)
+        company = f"{rng.choice(COMPANIES)}{i % 97}"
+        region = rng.choice(REGIONS)
+        skill = ",".join(rng.sample(skills, k=min(len(skills), rng.randint(2, 5))))
+        days = rng.randint(1, 60)
+        always_open = rng.random() < 0.2
+        postings.append((
+            f"{field} {rng.choice(ROLES)} 채용 ({i})",
+            company,
+            skill,
+            region,
+            rng.choice(CONDITIONS),
+            "상시" if always_open else f"D-{days}",
+            f"https://jumpit.saramin.co.kr/position/{100000 + i}",
+            f"- {field} 서비스 개발 및 운영\n- {skill.replace(',', ', ')} 기반 시스템 설계\n" * rng.randint(1, 4),
+            f"- {field} 관련 경험 {rng.randint(0, 5)}년 이상\n- {skill.split(',')[0]} 활용 능력\n" * rng.randint(1, 3),
+            f"- {rng.choice(skills)} 사용 경험\n- 대용량 트래픽 처리 경험\n" * rng.randint(1, 3),
+            "- 유연 근무제\n- 점심 식대 지원\n- 교육비 지원\n" * rng.randint(1, 3),
+            "서류전형 > 1차 면접 > 2차 면접 > 최종 합격",
+            rng.choice(EDUCATION),
+            f"{region} 테헤란로 {rng.randint(1, 500)}",
+            "상시채용" if always_open else (date.today() + timedelta(days=days - CRAWLED_DAYS_AGO)).isoformat(),
+        ))
+    return postings
+
+
+def load_corpus(postings=5000, users=100, seed=0, migrate=True):
+    """job_posting_new 를 합성 공고로 교체하고 벤치마크용 사용자 생성"""
+    db = get_db_connection()
+    cursor = db.cursor()
+    cursor.execute("DROP TABLE IF EXISTS job_posting_new")
+    cursor.execute(CREATE_JOB_POSTING_TABLE)
+    cursor.execute("CREATE INDEX idx_job_posting_deadline ON job_posting_new (마감일)")
+    cursor.executemany("""
+    INSERT INTO job_posting_new (제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크, 주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차, 학력, 근무지역_상세, 마감일자, 표준기술, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, [
+        posting + (",".join(normalize_skills(posting[2])),)
+        + parse_posting_facets(posting[3], posting[4], posting[5], posting[14])
+        for posting in generate_postings(postings, seed)
+    ])
+    cursor.execute("CREATE TABLE IF NOT EXISTS customer (customer_id VARCHAR(20) PRIMARY KEY)")
+    db.commit()
+    cursor.close()
+    db.close()
+
+    if migrate:
+        # Django 사용자 테이블(auth_user, 세션)까지 준비, 사용자 생성 시 customer 테이블은 signals.py 가 채움
+        import django
+        from django.core.management import call_command
+
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chatbot.settings")
+        django.setup()
+        call_command("migrate", verbosity=0)
+        from django.contrib.auth.hashers import make_password
+        from django.contrib.auth.models import User
+        password = make_password(BENCH_PASSWORD)
+        for i in range(users):
+            username = bench_username(i)
+            if not User.objects.filter(username=username).exists():
+                User.objects.create(username=username, password=password)
+
+
+def bench_username(i):
+    return f"bench{i:05d}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 채용 공고 코퍼스 적재")
+    parser.add_argument("--postings", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-migrate", action="store_true", help="Django 테이블/사용자 생성 생략")
+    args = parser.parse_args()
+    load_corpus(args.postings, args.users, args.seed, migrate=not args.no_migrate)
+    print(f"{DB_BACKEND}: 공고 {args.postings}건, 사용자 {args.users}명 적재 완료")
+
+
+if __name__ == "__main__":
+    main()
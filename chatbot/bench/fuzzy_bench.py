@@ -0,0 +1,98 @@
+"""
+검색어 오타 교정 벤치마크 (자모 trigram 후보 + 편집 거리 vs 어휘 전체 편집 거리 비교)
+
+흔한 모바일 오타 목록을 교정해 정확도와 시간을 재고, 교정 전후 키워드 일치 공고 수를 비교합니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --postings 50000 --no-migrate
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fuzzy_bench
+"""
+import argparse
+import json
+import time
+
+from bench.replay import percentile
+
+# (오타, 기대하는 교정)
+MISSPELLINGS = [
+    ("백앤드", "백엔드"), ("벡엔드", "백엔드"), ("프론트앤드", "프론트엔드"), ("프론트엔두", "프론트엔드"),
+    ("파이선", "파이썬"), ("파이쎤", "파이썬"), ("pyhton", "Python"), ("pytohn", "Python"),
+    ("djnago", "Django"), ("dajngo", "Django"), ("spirng", "Spring"), ("sprign", "Spring"),
+    ("리액드", "리액트"), ("raect", "React"), ("kubernates", "Kubernetes"), ("kuberentes", "Kubernetes"),
+    ("typescirpt", "TypeScript"), ("javascirpt", "JavaScript"), ("자바스크립", "자바스크립트"),
+    ("데이타", "데이터"), ("머신런닝", "머신러닝"), ("머신러님", "머신러닝"), ("안드로이두", "안드로이드"),
+    ("안드로드", "안드로이드"), ("엔지니아", "엔지니어"), ("앤지니어", "엔지니어"), ("반도채", "반도체"),
+    ("임베디트", "임베디드"), ("클라우두", "클라우드"), ("데브옵수", "데브옵스"), ("풀스텍", "풀스택"),
+    ("tensorflwo", "TensorFlow"), ("pytroch", "PyTorch"), ("도카", "도커"), ("레디수", "레디스"),
+]
+
+
+def brute_force(fuzzy, word):
+    """비교용: 어휘 전체와 편집 거리 계산"""
+    from jumpit.fuzzy import edit_distance, max_distance
+    from jumpit.hangul import decompose
+
+    jamo = decompose(word)
+    limit = max_distance(len(jamo))
+    best = None
+    for term, candidate, count in zip(fuzzy.terms, fuzzy._jamo, fuzzy.counts):
+        distance = edit_distance(jamo, candidate, limit)
+        if distance <= limit and (best is None or (distance, -count) < (best[1], -best[2])):
+            best = (term, distance, count)
+    return best[0] if best else None
+
+
+def timed(func, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return result, samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색어 오타 교정 벤치마크")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    from jumpit.db import get_db_connection
+    from jumpit.retrieval import JobIndex, fetch_index_rows
+
+    conn = get_db_connection()
+    index = JobIndex.build(fetch_index_rows(conn))
+    conn.close()
+    started = time.perf_counter()
+    fuzzy = index.fuzzy
+    report = {
+        "postings": len(index),
+        "vocabulary": len(fuzzy),
+        "fuzzy_index_build_ms": round((time.perf_counter() - started) * 1e3, 1),
+        "misspellings": len(MISSPELLINGS),
+    }
+    index_samples, brute_samples, results = [], [], []
+    correct = 0
+    for typo, expected in MISSPELLINGS:
+        fixed, samples = timed(lambda: fuzzy.correct(typo), args.repeat)
+        index_samples += samples
+        _, samples = timed(lambda: brute_force(fuzzy, typo), max(1, args.repeat // 10))
+        brute_samples += samples
+        correct += fixed == expected
+        results.append({
+            "typo": typo,
+            "corrected": fixed,
+            "expected": expected,
+            "lexical_before": len(index.lexical([typo])),
+            "lexical_after": len(index.lexical([fixed])) if fixed else 0,
+        })
+    report.update({
+        "accuracy": round(correct / len(MISSPELLINGS), 3),
+        "trigram_p50_us": round(percentile(index_samples, 50), 1),
+        "trigram_p99_us": round(percentile(index_samples, 99), 1),
+        "brute_force_p50_us": round(percentile(brute_samples, 50), 1),
+        "results": results,
+    })
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
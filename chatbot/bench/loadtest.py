@@ -0,0 +1,235 @@
+"""
+/api/chat/ 다중 턴 부하 테스트
+
+JWT 인증된 가상 사용자 N명이 시나리오를 동시에 실행하며 턴/노드별 지연 시간을 측정합니다.
+    python -m bench.mock_llm_server --port 8100 &
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --users 100
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 OPENAI_API_BASE=http://127.0.0.1:8100/v1 \\
+        OPENAI_API_KEY=mock python -m bench.loadtest --users 50 --concurrency 16 --output loadtest.json
+
+--url 을 지정하면 실행 중인 서버로 HTTP 요청을 보냅니다 (이 경우 노드/DB/세션 측정 없음).
+"""
+import argparse
+import json
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from bench.replay import percentile, setup_django
+
+_local = threading.local()
+
+
+class TurnProbe:
+    """한 턴 동안 발생한 노드 실행, DB 쿼리, LLM 호출, 세션 저장 기록"""
+
+    def __init__(self):
+        self.nodes = []
+        self.db_queries = 0
+        self.llm_calls = 0
+        self.session_bytes = 0
+
+
+def _current_probe():
+    return getattr(_local, "probe", None)
+
+
+def install_probes():
+    """워크플로우 생성 전에 노드/DB/LLM/세션 측정 코드를 끼워 넣음"""
+    import pymysql.cursors
+    from django.contrib.sessions.backends.db import SessionStore
+    from langchain_openai import ChatOpenAI
+
+    from jumpit.db import SQLiteCursor
+    from jumpit.hs import JobAssistantBot
+
+    def wrap_node(name, func):
+        def node(self, state):
+            started = time.perf_counter()
+            try:
+                return func(self, state)
+            finally:
+                probe = _current_probe()
+                if probe is not None:
+                    probe.nodes.append((name, time.perf_counter() - started))
+        return node
+
+    for name in ["classify_intent", "search_job_chat", "cover_letter_chat", "interview_chat",
+                 "unknown_message", "tenacity_interview", "technology_interview"]:
+        setattr(JobAssistantBot, name, wrap_node(name, getattr(JobAssistantBot, name)))
+
+    def wrap_counter(func, attribute):
+        def wrapper(*args, **kwargs):
+            probe = _current_probe()
+            if probe is not None:
+                setattr(probe, attribute, getattr(probe, attribute) + 1)
+            return func(*args, **kwargs)
+        return wrapper
+
+    for cursor_class in (pymysql.cursors.Cursor, SQLiteCursor):
+        cursor_class.execute = wrap_counter(cursor_class.execute, "db_queries")
+        cursor_class.executemany = wrap_counter(cursor_class.executemany, "db_queries")
+    ChatOpenAI.invoke = wrap_counter(ChatOpenAI.invoke, "llm_calls")
+
+    original_save = SessionStore.save
+
+    def save(self, must_create=False):
+        probe = _current_probe()
+        if probe is not None:
+            probe.session_bytes += len(self.encode(self._get_session(no_load=must_create)))
+        return original_save(self, must_create)
+
+    SessionStore.save = save
+
+
+def run_user_inprocess(index, script):
+    """Django 테스트 클라이언트로 한 사용자의 시나리오 실행"""
+    from django.contrib.auth.models import User
+    from django.test import Client
+
+    from bench.fixtures import bench_username
+    from jumpit.views import generate_jwt
+
+    user = User.objects.get(username=bench_username(index))
+    client = Client(HTTP_HOST="localhost", HTTP_AUTHORIZATION=f"Bearer {generate_jwt(user)}")
+    turns = []
+    for step, user_input in enumerate(script):
+        _local.probe = TurnProbe()
+        started = time.perf_counter()
+        response = client.post("/api/chat/", data=json.dumps({"user_input": user_input}),
+                               content_type="application/json")
+        elapsed = time.perf_counter() - started
+        probe, _local.probe = _local.probe, None
+        turns.append({
+            "step": step,
+            "seconds": elapsed,
+            "status": response.status_code,
+            "nodes": probe.nodes,
+            "db_queries": probe.db_queries,
+            "llm_calls": probe.llm_calls,
+            "session_bytes": probe.session_bytes,
+        })
+    return turns
+
+
+def run_user_http(url, token, script):
+    """실행 중인 서버로 한 사용자의 시나리오 실행 (세션 쿠키 유지)"""
+    import http.cookiejar
+    import urllib.error
+    import urllib.request
+
+    opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+    turns = []
+    for step, user_input in enumerate(script):
+        request = urllib.request.Request(
+            f"{url.rstrip('/')}/api/chat/",
+            data=json.dumps({"user_input": user_input}).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Authorization": f"Bearer {token}"},
+        )
+        started = time.perf_counter()
+        try:
+            with opener.open(request, timeout=300) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        turns.append({"step": step, "seconds": time.perf_counter() - started, "status": status})
+    return turns
+
+
+def summarize(values, scale=1000.0, digits=1):
+    """개수, 평균, p50/p95/p99 (기본 ms 단위)"""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values) * scale, digits),
+        "p50": round(percentile(values, 50) * scale, digits),
+        "p95": round(percentile(values, 95) * scale, digits),
+        "p99": round(percentile(values, 99) * scale, digits),
+        "max": round(max(values) * scale, digits),
+    }
+
+
+def build_report(args, scripts, results, elapsed):
+    turns = [turn for user_turns in results for turn in user_turns]
+    by_step = defaultdict(list)
+    by_node = defaultdict(list)
+    for user_index, user_turns in enumerate(results):
+        script_name, script = scripts[user_index]
+        for turn in user_turns:
+            by_step[f"{script_name}[{turn['step']}] {script[turn['step']]}"].append(turn["seconds"])
+            for node, seconds in turn.get("nodes", []):
+                by_node[node].append(seconds)
+    report = {
+        "config": {"users": args.users, "concurrency": args.concurrency, "scenario": args.scenario,
+                   "target": args.url or "inprocess"},
+        "elapsed_seconds": round(elapsed, 3),
+        "turns": len(turns),
+        "errors": sum(1 for turn in turns if turn["status"] >= 400),
+        "throughput_turns_per_sec": round(len(turns) / elapsed, 2) if elapsed else 0,
+        "turn_latency_ms": summarize([turn["seconds"] for turn in turns]),
+        "turn_latency_ms_by_step": {step: summarize(values) for step, values in sorted(by_step.items())},
+        "node_latency_ms": {node: summarize(values) for node, values in sorted(by_node.items())},
+    }
+    if not args.url:
+        report["db_queries_per_turn"] = summarize([turn["db_queries"] for turn in turns], scale=1)
+        report["llm_calls_per_turn"] = summarize([turn["llm_calls"] for turn in turns], scale=1)
+        report["session_bytes_per_turn"] = summarize([turn["session_bytes"] for turn in turns], scale=1, digits=0)
+        report["session_bytes_total"] = sum(turn["session_bytes"] for turn in turns)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="/api/chat/ 다중 턴 부하 테스트")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--scenario", default="mix", help="bench/conversations.py 시나리오 이름 또는 mix")
+    parser.add_argument("--url", help="실행 중인 서버 주소 (예: http://127.0.0.1:8000)")
+    parser.add_argument("--output", help="JSON 결과 파일 경로 (기본: 표준 출력)")
+    args = parser.parse_args()
+
+    setup_django()
+    from bench.conversations import SCENARIOS
+
+    names = sorted(SCENARIOS) if args.scenario == "mix" else [args.scenario]
+    scripts = [(names[i % len(names)], SCENARIOS[names[i % len(names)]]) for i in range(args.users)]
+
+    if args.url:
+        import jwt
+        from django.conf import settings
+        from django.contrib.auth.models import User
+
+        from bench.fixtures import bench_username
+
+        # jumpit.views 를 불러오면 챗봇이 초기화되므로 토큰만 직접 발급
+        tokens = []
+        for i in range(args.users):
+            user = User.objects.get(username=bench_username(i))
+            tokens.append(jwt.encode({
+                "user_id": user.id,
+                "username": user.username,
+                "exp": int(time.time()) + settings.JWT_EXP_DELTA_SECONDS,
+            }, settings.JWT_SECRET, algorithm="HS256"))
+        run = lambda i: run_user_http(args.url, tokens[i], scripts[i][1])  # noqa: E731
+    else:
+        install_probes()
+        import jumpit.views  # noqa: F401  측정 코드가 들어간 상태로 워크플로우 생성
+        run = lambda i: run_user_inprocess(i, scripts[i][1])  # noqa: E731
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(run, range(args.users)))
+    report = build_report(args, scripts, results, time.perf_counter() - started)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+OpenAI 호환 Chat Completions 모의 서버
+
+챗봇을 실제 OpenAI 없이 실행/부하 테스트하기 위한 서버입니다.
+    python -m bench.mock_llm_server --port 8100 --latency-ms 300 --tokens-per-sec 60
+    OPENAI_API_BASE=http://127.0.0.1:8100/v1 OPENAI_API_KEY=mock python manage.py runserver
+
+느린 응답/오류 재현 (LLM 게이트웨이 헤지, 차단기 확인용)
+    python -m bench.mock_llm_server --tail-rate 0.05 --tail-ms 5000 --error-rate 0.02
+    python -m bench.mock_llm_server --slow-models gpt-4o  # 특정 모델만 항상 느리게
+
+모드
+    mock   : bench/responder.py 규칙으로 답변 생성 (기본)
+    replay : --cassette 에 녹화된 답변 사용, 없으면 규칙 기반 답변
+    record : --upstream 으로 실제 요청을 전달하고 답변을 --cassette 에 녹화
+"""
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .cassette import Cassette
+from .responder import respond
+
+
+def estimate_tokens(text):
+    """토크나이저 없이 대략적인 토큰 수 추정 (한글 약 2자당 1토큰)"""
+    return max(1, len(text) // 2)
+
+
+class MockLLMConfig:
+    def __init__(self, latency_ms=300, jitter_ms=100, tokens_per_sec=60.0, mode="mock",
+                 cassette=None, upstream="https://api.openai.com/v1", seed=None,
+                 tail_rate=0.0, tail_ms=5000, error_rate=0.0, slow_models=()):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.tail_rate = tail_rate
+        self.tail_ms = tail_ms
+        self.error_rate = error_rate
+        self.slow_models = set(slow_models)
+        self.tokens_per_sec = tokens_per_sec
+        self.mode = mode
+        self.cassette = Cassette(cassette) if cassette else None
+        self.upstream = upstream.rstrip("/")
+        self.random = random.Random(seed)
+        self.stats = {"requests": 0, "cassette_hits": 0, "recorded": 0, "completion_tokens": 0,
+                      "tail_delays": 0, "errors": 0}
+        self.lock = threading.Lock()
+
+    def first_token_delay(self, model=None):
+        with self.lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms)
+            tail = model in self.slow_models or self.random.random() < self.tail_rate
+        if tail:
+            self.count("tail_delays")
+            return self.tail_ms / 1000
+        return max(0.0, self.latency_ms + jitter) / 1000
+
+    def should_fail(self):
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.stats[name] += value
+
+
+def call_upstream(config, body):
+    """실제 API 호출 (녹화 모드), 스트리밍 없이 전체 답변을 받음"""
+    body = {**body, "stream": False}
+    body.pop("stream_options", None)
+    request = urllib.request.Request(
+        f"{config.upstream}/chat/completions",
+        data=json.dumps(body).encode("utf-8"),
+        headers={
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY', '')}",
+        },
+    )
+    with urllib.request.urlopen(request, timeout=120) as response:
+        data = json.loads(response.read())
+    return data["choices"][0]["message"]["content"], data.get("usage")
+
+
+def complete(config, body):
+    """요청 본문에 대한 답변 텍스트 결정"""
+    model = body.get("model", "mock")
+    messages = body.get("messages", [])
+    if config.cassette is not None and config.mode in ("replay", "record"):
+        recorded = config.cassette.get(model, messages)
+        if recorded is not None:
+            config.count("cassette_hits")
+            return recorded
+        if config.mode == "record":
+            content, usage = call_upstream(config, body)
+            config.cassette.record(model, messages, content, usage)
+            config.count("recorded")
+            return content
+    prompt = "\n".join(str(m.get("content", "")) for m in messages)
+    return respond(prompt)
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload):
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/").endswith("/models"):
+            return self._send_json(200, {"object": "list", "data": [{"id": "gpt-4o", "object": "model"}]})
+        if self.path.rstrip("/") == "/stats":
+            return self._send_json(200, self.config.stats)
+        self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._send_json(404, {"error": {"message": "not found"}})
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        config = self.config
+        config.count("requests")
+        if config.should_fail():
+            config.count("errors")
+            return self._send_json(500, {"error": {"message": "mock upstream error", "type": "server_error"}})
+
+        content = complete(config, body)
+        prompt_tokens = sum(estimate_tokens(str(m.get("content", ""))) for m in body.get("messages", []))
+        completion_tokens = estimate_tokens(content)
+        config.count("completion_tokens", completion_tokens)
+        usage = {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+        time.sleep(config.first_token_delay(body.get("model")))
+
+        completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+        created = int(time.time())
+        model = body.get("model", "mock")
+        if not body.get("stream"):
+            time.sleep(completion_tokens / config.tokens_per_sec)
+            return self._send_json(200, {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        def send_chunk(delta, finish_reason=None, chunk_usage=None):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": created,
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if delta is not None else [],
+            }
+            if chunk_usage:
+                chunk["usage"] = chunk_usage
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        # 2자(약 1토큰)씩 tokens_per_sec 속도로 전송
+        send_chunk({"role": "assistant", "content": ""})
+        for i in range(0, len(content), 2):
+            send_chunk({"content": content[i:i + 2]})
+            time.sleep(1 / config.tokens_per_sec)
+        send_chunk({}, finish_reason="stop")
+        if (body.get("stream_options") or {}).get("include_usage"):
+            send_chunk(None, chunk_usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+        self.close_connection = True
+
+
+def create_server(host="127.0.0.1", port=8100, **config):
+    handler = type("ConfiguredMockLLMHandler", (MockLLMHandler,), {"config": MockLLMConfig(**config)})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 모의 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=300, help="첫 토큰까지 지연 시간")
+    parser.add_argument("--jitter-ms", type=float, default=100)
+    parser.add_argument("--tokens-per-sec", type=float, default=60.0)
+    parser.add_argument("--mode", choices=["mock", "replay", "record"], default="mock")
+    parser.add_argument("--cassette", help="녹화 파일 경로 (JSON Lines)")
+    parser.add_argument("--upstream", default="https://api.openai.com/v1")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--tail-rate", type=float, default=0.0, help="첫 토큰이 --tail-ms 만큼 늦어지는 요청 비율")
+    parser.add_argument("--tail-ms", type=float, default=5000)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류를 반환할 요청 비율")
+    parser.add_argument("--slow-models", nargs="*", default=[], help="항상 --tail-ms 만큼 늦게 응답할 모델")
+    args = parser.parse_args()
+
+    server = create_server(
+        args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        tokens_per_sec=args.tokens_per_sec, mode=args.mode, cassette=args.cassette,
+        upstream=args.upstream, seed=args.seed, tail_rate=args.tail_rate, tail_ms=args.tail_ms,
+        error_rate=args.error_rate, slow_models=args.slow_models,
+    )
+    print(f"모의 LLM 서버 실행: http://{args.host}:{args.port}/v1 ({args.mode})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
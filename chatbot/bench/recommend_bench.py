@@ -0,0 +1,56 @@
+"""
+추천 배치 점수 계산 벤치마크 (사용자별 전체 비교 vs 사용자 묶음 행렬곱)
+
+합성 공고로 int8 벡터 저장소를 만들고, 임의 프로필 벡터의 상위 공고를 두 방식으로 계산해 시간을 비교합니다.
+    python -m bench.recommend_bench --postings 100000 --users 2000
+"""
+import argparse
+import json
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추천 배치 점수 계산 벤치마크")
+    parser.add_argument("--postings", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--top-k", type=int, default=30)
+    args = parser.parse_args()
+
+    from jumpit.vector_store import VectorStore, write_generation
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(args.postings, args.dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    profiles = rng.normal(size=(args.users, args.dim)).astype(np.float32)
+    profiles /= np.linalg.norm(profiles, axis=1, keepdims=True)
+
+    directory = tempfile.mkdtemp(prefix="recommend_bench_")
+    try:
+        write_generation(directory, "job_posting", np.arange(1, args.postings + 1), vectors)
+        store = VectorStore(directory, "job_posting")
+        report = {"postings": args.postings, "users": args.users, "top_k": args.top_k}
+
+        # 사용자 한 명씩 전체 비교 (일부 사용자로 측정 후 전체 사용자 수로 환산)
+        sample = min(args.users, 50)
+        started = time.perf_counter()
+        single = [store.scan(profile, args.top_k)[0] for profile in profiles[:sample]]
+        per_user = (time.perf_counter() - started) / sample
+        report["per_user_loop_s"] = round(per_user * args.users, 2)
+
+        started = time.perf_counter()
+        rows, _ = store.scan_batch(profiles, args.top_k)
+        report["batched_matmul_s"] = round(time.perf_counter() - started, 2)
+        report["speedup"] = round(per_user * args.users / max(report["batched_matmul_s"], 1e-9), 1)
+        report["same_results"] = all(set(a.tolist()) == set(b.tolist()) for a, b in zip(single, rows[:sample]))
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
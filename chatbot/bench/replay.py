@@ -0,0 +1,83 @@
+"""
+대화 시나리오를 워크플로우에 직접 재생하는 벤치마크
+
+    python -m bench.mock_llm_server --port 8100 &
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 OPENAI_API_BASE=http://127.0.0.1:8100/v1 \\
+        OPENAI_API_KEY=mock python -m bench.replay --users 20 --concurrency 8
+"""
+import argparse
+import copy
+import json
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def setup_django():
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chatbot.settings")
+    django.setup()
+
+
+def replay_conversation(workflow, initial_state, user_id, script):
+    """시나리오 한 개 재생, 턴별 (입력, 소요 시간, 응답 길이) 반환"""
+    state = copy.deepcopy(initial_state)
+    state["user_id"] = user_id
+    turns = []
+    for user_input in script:
+        state["user_input"] = user_input
+        started = time.perf_counter()
+        result = workflow.invoke(state)
+        elapsed = time.perf_counter() - started
+        state.update(result)
+        turns.append({"input": user_input, "seconds": elapsed, "response_chars": len(state.get("response") or "")})
+    return turns
+
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워크플로우 대화 재생 벤치마크")
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--scenario", default="full_journey")
+    args = parser.parse_args()
+
+    setup_django()
+    from bench.conversations import SCENARIOS
+    from bench.fixtures import bench_username
+    from jumpit.views import INITIAL_STATE, workflow
+
+    script = SCENARIOS[args.scenario]
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(
+            lambda i: replay_conversation(workflow, INITIAL_STATE, bench_username(i), script),
+            range(args.users),
+        ))
+    elapsed = time.perf_counter() - started
+
+    latencies = [turn["seconds"] for turns in results for turn in turns]
+    print(json.dumps({
+        "scenario": args.scenario,
+        "users": args.users,
+        "turns": len(latencies),
+        "seconds": round(elapsed, 3),
+        "turns_per_sec": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 1) if latencies else 0,
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+import re
+
+# 합성 공고 코퍼스(bench/fixtures.py)와 같은 직무 키워드
+JOB_KEYWORDS = [
+    "백엔드", "프론트엔드", "프론트", "풀스택", "AI", "인공지능", "머신러닝", "데이터",
+    "데이터 분석", "데이터 엔지니어", "클라우드", "데브옵스", "보안", "안드로이드", "iOS",
+    "로봇", "반도체", "임베디드", "게임", "Python", "Java", "Django", "Spring", "React",
+    "개발자", "엔지니어",
+]
+DETAIL_WORDS = ["상세", "업무", "요건", "우대", "복지", "혜택", "절차", "학력", "마감", "근무지", "주소"]
+EXPERIENCE_WORDS = ["프로젝트", "경험", "인턴", "자격증", "경력", "개발했", "진행했", "수상"]
+ORDINALS = {"첫": 1, "두": 2, "세": 3, "네": 4, "다섯": 5, "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10}
+
+COVER_LETTER_SECTIONS = ["지원 동기", "성격의 장단점", "직무 역량", "입사 후 포부"]
+
+
+def extract_user_input(prompt):
+    """프롬프트에 채워진 사용자 입력 부분"""
+    match = re.search(r"사용자 입력:\s*(.*?)\s*(?:DB 내역:|자기소개서:|결과:)", prompt, re.S)
+    if match:
+        return match.group(1).strip()
+    match = re.search(r"\[사용자 (?:경험 및 직무|수정 요청)\]\s*(.*?)\s*(?:자기소개서는|사용자의 요청을)", prompt, re.S)
+    return match.group(1).strip() if match else prompt
+
+
+def extract_number(text):
+    match = re.search(r"(\d+)\s*번", text)
+    if match:
+        return int(match.group(1))
+    for word, number in ORDINALS.items():
+        if f"{word} 번째" in text or f"{word}번째" in text:
+            return number
+    return None
+
+
+def _contains(text, words):
+    return any(word.lower() in text.lower() for word in words)
+
+
+def _long_text(title, length):
+    sentence = f"{title}와 관련하여 저는 문제를 구조적으로 분석하고 끝까지 해결하는 개발자입니다. "
+    return f"[{title}]\n" + (sentence * (length // len(sentence) + 1))[:length]
+
+
+def respond(prompt):
+    """hs.py 프롬프트 템플릿을 식별하여 워크플로우가 진행될 수 있는 그럴듯한 답변 생성"""
+    user_input = extract_user_input(prompt)
+    number = extract_number(user_input)
+
+    if "JOB_SEARCH" in prompt and "COVER_LETTER" in prompt:  # intent_template
+        if "면접" in user_input:
+            return "INTERVIEW"
+        if _contains(user_input, ["자기소개서", "자소서", "수정"]) or _contains(user_input, EXPERIENCE_WORDS):
+            return "COVER_LETTER"
+        if "추천" in user_input and not number and not _contains(user_input, JOB_KEYWORDS):
+            return "RECOMMEND"
+        if number or _contains(user_input, ["더", "다음", "공고"] + JOB_KEYWORDS + DETAIL_WORDS):
+            return "JOB_SEARCH"
+        return "UNKNOWN"
+    if "채용 공고 추가 제공" in prompt:  # search_job_prompt
+        if _contains(user_input, ["더", "다음", "추가"]) and not number:
+            return "채용 공고 추가 제공, -1"
+        if number and _contains(user_input, DETAIL_WORDS):
+            return f"상세 정보, {number}"
+        if _contains(user_input, JOB_KEYWORDS + ["공고"]):
+            return "채용 공고 제공, -1"
+        return "관련 없음, -1"
+    if "직무 관련 키워드가 포함되어 있는지" in prompt:  # jobname_prompt
+        return "include" if _contains(user_input, JOB_KEYWORDS) else "not_include"
+    if "키워드를 추출하세요" in prompt:  # jobname_extract_prompt
+        keywords = [kw for kw in JOB_KEYWORDS if kw.lower() in user_input.lower() and kw not in ("개발자", "엔지니어")]
+        if not keywords:
+            # 모르는 단어(오타 포함)는 입력한 그대로 추출 ("백앤드 개발자 공고" → "백앤드")
+            keywords = re.findall(r"(\S+)\s*(?:개발자|엔지니어|공고|채용)", user_input)[:1]
+        return ", ".join(keywords)
+    if "어떤 상세 정보를 원하는지" in prompt:  # moreinfo_extract_prompt
+        fields = [
+            field for word, field in [
+                ("업무", "주요업무"), ("자격", "자격요건"), ("우대", "우대사항"), ("복지", "복지_및_혜택"),
+                ("절차", "채용절차"), ("학력", "학력"), ("마감", "마감일자"), ("주소", "근무지역_상세"),
+            ] if word in user_input
+        ]
+        return ", ".join(fields) or "제목, 회사명, 사용기술, 주요업무, 자격요건, 우대사항, 마감일자"
+    if "자연스럽게 전달" in prompt:  # natural_response
+        match = re.search(r"상세 정보: (.*?)\s*형식:", prompt, re.S)
+        return match.group(1) if match else ""
+    if "자기소개서 기능과 관계 없는" in prompt:  # cover_letter_prompt
+        if _contains(user_input, ["수정", "바꿔", "변경", "고쳐"]):
+            return "자기소개서 수정, -1"
+        if _contains(user_input, ["자기소개서", "자소서"] + EXPERIENCE_WORDS + JOB_KEYWORDS) or number:
+            return f"자기소개서 작성, {number if number else 0}"
+        return "관련 없음, -1"
+    if "all_include" in prompt:  # experience_prompt_without_job
+        has_job = _contains(user_input, JOB_KEYWORDS)
+        has_exp = _contains(user_input, EXPERIENCE_WORDS)
+        return {(True, True): "all_include", (True, False): "job_include",
+                (False, True): "experience_include"}.get((has_job, has_exp), "not_include")
+    if "experience_include" in prompt:  # experience_prompt
+        return "experience_include" if _contains(user_input, EXPERIENCE_WORDS) else "experience_exclude"
+    if "[기존 자기소개서 내용]" in prompt or "자기소개서는 다음 4가지" in prompt:  # cover_letter_write / refine
+        return "\n\n".join(_long_text(section, 300) for section in COVER_LETTER_SECTIONS)
+    if "단순 면접" in prompt:  # interview_intent
+        if _contains(user_input, ["종료", "그만"]):
+            return "종료"
+        if "인성" in user_input:
+            return "인성 면접"
+        if _contains(user_input, ["기술", "자기소개서"]):
+            return "기술 면접"
+        if "면접" in user_input:
+            return "단순 면접"
+        return "면접 답변"
+    if "자기소개서를 찾아 출력" in prompt:  # interview_cover_letter
+        return user_input if len(user_input) > 200 else "없음"
+    if "면접관입니다" in prompt:  # interview_tenacity / interview_technology
+        return f"'{user_input[:30]}'에 대해 말씀해주셨는데, 그 과정에서 가장 어려웠던 점은 무엇이었나요?"
+    return "UNKNOWN"
@@ -0,0 +1,76 @@
+"""
+공고 검색 인덱스 벤치마크 (전체 비교 vs IVF)
+
+합성 공고로 인덱스를 만들어 생성 시간, 질의당 시간, IVF 의 recall@10 (전체 비교 결과 기준) 을 측정합니다.
+    python -m bench.retrieval_bench --postings 100000 --queries 200
+"""
+import argparse
+import json
+import random
+import time
+
+from bench.fixtures import FIELDS, generate_postings
+from bench.replay import percentile
+
+QUERIES = [
+    "ML 엔지니어", "머신러닝 모델 서빙 경험", "백엔드 자바 스프링", "리액트 프론트엔드",
+    "챗봇 개발 해본 적 있어요", "데이터 파이프라인 구축", "쿠버네티스 운영", "파이썬 서버 개발",
+]
+
+
+def timed_queries(index, queries, nprobe):
+    samples, results = [], []
+    for query in queries:
+        started = time.perf_counter()
+        results.append([row for row, _ in index.vector(query, top_k=10, nprobe=nprobe)])
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공고 검색 인덱스 벤치마크")
+    parser.add_argument("--postings", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16])
+    args = parser.parse_args()
+
+    from jumpit.retrieval import JobIndex
+
+    rng = random.Random(1)
+    queries = [rng.choice(QUERIES + [field for field, _ in FIELDS]) for _ in range(args.queries)]
+    postings = generate_postings(args.postings)
+    rows = [(i + 1, p[0], p[2], p[7]) for i, p in enumerate(postings)]
+
+    report = {"postings": args.postings, "queries": args.queries}
+    started = time.perf_counter()
+    flat = JobIndex.build(rows, ann_threshold=len(rows))
+    report["build_flat_s"] = round(time.perf_counter() - started, 2)
+    started = time.perf_counter()
+    ivf = JobIndex.build(rows, ann_threshold=0)
+    report["build_ivf_s"] = round(time.perf_counter() - started, 2)
+    report["ivf_lists"] = len(ivf.centroids)
+
+    flat_samples, exact = timed_queries(flat, queries, 0)
+    report["flat"] = {"p50_ms": round(percentile(flat_samples, 50), 2), "p99_ms": round(percentile(flat_samples, 99), 2)}
+    exact_ids = [{int(flat.ids[row]) for row in result} for result in exact]
+    for nprobe in args.nprobe:
+        samples, approx = timed_queries(ivf, queries, nprobe)
+        recall = sum(
+            len(truth & {int(ivf.ids[row]) for row in result}) / max(1, len(truth))
+            for truth, result in zip(exact_ids, approx)
+        ) / len(queries)
+        report[f"ivf_nprobe_{nprobe}"] = {
+            "p50_ms": round(percentile(samples, 50), 2),
+            "p99_ms": round(percentile(samples, 99), 2),
+            "recall_at_10": round(recall, 3),
+        }
+
+    started = time.perf_counter()
+    for query in queries:
+        flat.search([query.split()[0]], query)
+    report["hybrid_mean_ms"] = round((time.perf_counter() - started) * 1000 / len(queries), 2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+기술 조건 공고 필터 벤치마크 (사용기술 LIKE 검색 vs 표준 기술 비트맵)
+
+같은 조건(모두 포함 / 제외)을 SQL LIKE 와 비트맵 연산으로 계산해 시간과 결과 수를 비교합니다.
+LIKE 는 부분 일치라 "Java" 조건에 "JavaScript" 공고도 포함됩니다.
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.fixtures --postings 50000 --no-migrate
+    DB_BACKEND=sqlite DB_SQLITE_PATH=bench.sqlite3 python -m bench.skill_bench
+"""
+import argparse
+import json
+import time
+
+from bench.replay import percentile
+
+QUERIES = [
+    {"all_of": ["Python", "Django"], "none_of": []},
+    {"all_of": ["Java"], "none_of": []},
+    {"all_of": ["Python"], "none_of": ["Java"]},
+    {"all_of": ["AWS", "Docker", "Kubernetes"], "none_of": ["Azure"]},
+    {"all_of": ["C"], "none_of": []},
+]
+
+
+def like_query(cursor, all_of, none_of):
+    conditions = ["사용기술 LIKE %s"] * len(all_of) + ["사용기술 NOT LIKE %s"] * len(none_of)
+    cursor.execute(
+        f"SELECT id FROM job_posting_new WHERE {' AND '.join(conditions)}",
+        [f"%{term}%" for term in all_of + none_of],
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return result, round(percentile(samples, 50), 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기술 조건 공고 필터 벤치마크")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from jumpit.db import get_db_connection
+    from jumpit.retrieval import JobIndex, fetch_index_rows
+
+    conn = get_db_connection()
+    index = JobIndex.build(fetch_index_rows(conn))
+    cursor = conn.cursor()
+    report = {"postings": len(index), "queries": []}
+    for query in QUERIES:
+        like_ids, like_us = timed(lambda: like_query(cursor, query["all_of"], query["none_of"]), args.repeat)
+        bitmap, bitmap_us = timed(lambda: index.skills.match(query["all_of"], (), query["none_of"]), args.repeat * 50)
+        bitmap_ids = set(index.ids[bitmap.to_array()].tolist())
+        report["queries"].append({
+            **query,
+            "like_p50_us": like_us,
+            "bitmap_p50_us": bitmap_us,
+            "like_results": len(like_ids),
+            "bitmap_results": len(bitmap_ids),
+            # LIKE 에만 있는 결과 = 부분 일치 오탐
+            "like_false_positives": len(like_ids - bitmap_ids),
+        })
+    cursor.close()
+    conn.close()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+워커당 벡터 메모리 벤치마크 (float32 np.load vs int8/float16 메모리 맵)
+
+워커 프로세스 여러 개가 같은 공고 벡터를 읽고 질의를 실행한 뒤 각 워커의 RSS/PSS 를 측정합니다.
+PSS 는 공유 페이지를 나눠 계산하므로 워커 수만큼 곱하면 실제 사용 메모리에 가깝습니다 (Linux 전용).
+    python -m bench.vector_store_bench --postings 200000 --workers 4
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+from bench.replay import percentile
+
+
+def memory_kb():
+    """현재 프로세스의 (RSS, PSS) KB"""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:"):
+                values[parts[0][:-1]] = int(parts[1])
+    return values.get("Rss", 0), values.get("Pss", 0)
+
+
+def worker(mode, directory, queries, barrier, results):
+    from jumpit.vector_store import VectorStore
+
+    base_rss, base_pss = memory_kb()
+    if mode == "float32":
+        with np.load(os.path.join(directory, "vectors.npz")) as data:
+            vectors = data["vectors"]
+        scan = lambda q: np.argpartition(-(vectors @ q), 10)[:10]
+    else:
+        store = VectorStore(os.path.join(directory, mode), "job_posting")
+        scan = lambda q: store.scan(q, 10)[0]
+    samples = []
+    for q in queries:
+        started = time.perf_counter()
+        scan(q)
+        samples.append((time.perf_counter() - started) * 1000)
+    # 모든 워커가 읽기를 마친 시점에 측정 (공유 페이지가 워커 수로 나뉘도록)
+    barrier.wait()
+    rss, pss = memory_kb()
+    results.put({"rss_mb": (rss - base_rss) / 1024, "pss_mb": (pss - base_pss) / 1024,
+                 "p50_ms": percentile(samples, 50)})
+    barrier.wait()
+
+
+def run(mode, directory, queries, workers):
+    barrier = multiprocessing.Barrier(workers)
+    results = multiprocessing.Queue()
+    processes = [multiprocessing.Process(target=worker, args=(mode, directory, queries, barrier, results))
+                 for _ in range(workers)]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return {
+        "rss_mb_per_worker": round(sum(r["rss_mb"] for r in reports) / workers, 1),
+        "pss_mb_per_worker": round(sum(r["pss_mb"] for r in reports) / workers, 1),
+        "scan_p50_ms": round(sum(r["p50_ms"] for r in reports) / workers, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커당 벡터 메모리 벤치마크")
+    parser.add_argument("--postings", type=int, default=200000)
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    from jumpit.vector_store import VectorStore, write_generation
+
+    rng = np.random.default_rng(0)
+    vectors = rng.normal(size=(args.postings, args.dim)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    ids = np.arange(1, args.postings + 1)
+    queries = [vectors[i] + rng.normal(scale=0.05, size=args.dim).astype(np.float32)
+               for i in rng.choice(args.postings, args.queries, replace=False)]
+
+    directory = tempfile.mkdtemp(prefix="vector_store_bench_")
+    try:
+        np.savez(os.path.join(directory, "vectors.npz"), vectors=vectors)
+        report = {"postings": args.postings, "dim": args.dim, "workers": args.workers}
+        exact = [set(np.argsort(-(vectors @ q))[:10].tolist()) for q in queries]
+        for dtype in ("int8", "float16"):
+            write_generation(os.path.join(directory, dtype), "job_posting", ids, vectors, dtype=dtype)
+            store = VectorStore(os.path.join(directory, dtype), "job_posting")
+            recall = sum(len(truth & set(store.scan(q, 10)[0].tolist())) for truth, q in zip(exact, queries))
+            report[f"{dtype}_file_mb"] = round(store.nbytes() / 2 ** 20, 1)
+            report[f"{dtype}_recall_at_10"] = round(recall / (10 * len(queries)), 3)
+        report["float32_file_mb"] = round(vectors.nbytes / 2 ** 20, 1)
+        del vectors
+        for mode in ("float32", "int8", "float16"):
+            report[mode] = run(mode, directory, queries, args.workers)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "jumpit.middleware.RequestTraceMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -123,6 +124,50 @@ DATABASES = {
     }
 }
 
+# 로컬 벤치마크/오프라인 실행: 챗봇 테이블과 같은 SQLite 파일 사용 (jumpit/db.py)
+if os.getenv("DB_BACKEND", "mysql").lower() == "sqlite":
+    DATABASES["default"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.getenv("DB_SQLITE_PATH", "jobara.sqlite3"),
+    }
+
+# 캐시: 내역 변경 버전(jumpit/versions.py) 등, 워커가 여러 개면 CACHE_REDIS_URL 로 공유 캐시 사용 (redis 패키지 필요)
+if os.getenv("CACHE_REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("CACHE_REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "OPTIONS": {"MAX_ENTRIES": 100000},
+        }
+    }
+
+# 내역 API 의 ETag/304 (jumpit/versions.py): 버전이 워커끼리 공유되어야 하므로 기본은 공유 캐시가 있을 때만 사용
+# 워커별 캐시로 켜면 다른 워커의 저장을 모른 채 304 를 돌려주므로, 단일 프로세스(개발, 벤치마크)임을 명시해야 함
+HISTORY_ETAGS = os.getenv("HISTORY_ETAGS", "true" if os.getenv("CACHE_REDIS_URL") else "false").lower() == "true"
+HISTORY_ETAGS_SINGLE_PROCESS = os.getenv("HISTORY_ETAGS_SINGLE_PROCESS", "false").lower() == "true"
+if HISTORY_ETAGS and not os.getenv("CACHE_REDIS_URL") and not HISTORY_ETAGS_SINGLE_PROCESS:
+    from django.core.exceptions import ImproperlyConfigured
+
+    raise ImproperlyConfigured(
+        "HISTORY_ETAGS 는 워커끼리 공유하는 캐시(CACHE_REDIS_URL)가 필요합니다. "
+        "단일 프로세스에서만 실행하면 HISTORY_ETAGS_SINGLE_PROCESS=true 를 설정하세요."
+    )
+
+# 로그: 큐 기반 비동기 JSON 로그 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT, LOG_SAMPLE_RATE 로 조정)
+from jumpit.log import logging_config
+
+LOGGING = logging_config()
+
+# /api/metrics/ 접근: Authorization: Bearer <METRICS_TOKEN> 또는 허용 IP 목록(쉼표 구분)의 수집기만
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_ALLOWED_IPS = [ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",") if ip.strip()]
+
 # JWT 관련 환경 변수 추가 (실제 값은 .env 파일에 설정)
 JWT_SECRET = os.getenv("JWT_SECRET", "your_default_secret_key")
 JWT_EXP_DELTA_SECONDS = int(os.getenv("JWT_EXP_DELTA_SECONDS", 3600))
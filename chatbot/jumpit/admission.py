@@ -0,0 +1,190 @@
+import functools
+import logging
+import math
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+from django.http import JsonResponse
+
+from .metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_QUEUE_WAIT_SECONDS, ADMISSION_REJECTIONS
+
+logger = logging.getLogger(__name__)
+
+# 엔드포인트 종류별 동시 실행 수 / 대기열 길이 / 사용자당 동시 요청 수 / 대기열 최대 대기 시간(초)
+# 덮어쓰기 예: ADMISSION_CONCURRENCY="chat=4,history=32"
+ADMISSION_CONCURRENCY = os.getenv('ADMISSION_CONCURRENCY', '')
+ADMISSION_QUEUE_SIZE = os.getenv('ADMISSION_QUEUE_SIZE', '')
+ADMISSION_PER_USER = os.getenv('ADMISSION_PER_USER', '')
+ADMISSION_QUEUE_TIMEOUT = os.getenv('ADMISSION_QUEUE_TIMEOUT', '')
+ADMISSION_ENABLED = os.getenv('ADMISSION_ENABLED', 'true').lower() == 'true'
+# X-Forwarded-For 를 믿을 리버스 프록시 주소 (쉼표 구분, 예: "127.0.0.1,10.0.0.2")
+# 비워 두면 헤더는 무시하고 접속 주소(REMOTE_ADDR)만 사용 (클라이언트가 헤더를 바꿔 IP 별 제한을 피하지 못하도록)
+TRUSTED_PROXIES = {address.strip() for address in os.getenv('ADMISSION_TRUSTED_PROXIES', '').split(',') if address.strip()}
+
+# chat 은 LLM 이 느려지면 워커를 오래 붙잡으므로 동시 실행 수를 워커 수보다 작게 두어
+# 조회(history), 로그인(auth) 요청을 처리할 워커가 남도록 함
+DEFAULT_LIMITS = {
+    # 종류: (동시 실행, 대기열, 사용자당, 대기 시간)
+    'chat': (8, 8, 2, 5.0),
+    'history': (16, 32, 4, 2.0),
+    'auth': (8, 16, 4, 2.0),
+}
+
+
+class Rejected(Exception):
+    """대기열이 가득 찼거나 대기 시간 초과 (503), 사용자 동시 요청 수 초과 (429)"""
+
+    def __init__(self, status, reason, retry_after):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def _parse(value, cast):
+    parsed = {}
+    for item in value.split(','):
+        name, _, number = item.partition('=')
+        if name.strip() and number.strip():
+            parsed[name.strip()] = cast(number)
+    return parsed
+
+
+class AdmissionGate:
+    """엔드포인트 종류 하나의 동시 실행 제한과 FIFO 대기열"""
+
+    def __init__(self, name, concurrency, queue_size, per_user, queue_timeout):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue_size
+        self.per_user = per_user
+        self.queue_timeout = queue_timeout
+        self._active = 0
+        self._waiting = deque()
+        self._users = defaultdict(int)  # 사용자 → 실행 중 + 대기 중 요청 수
+        self._service_seconds = 1.0  # 처리 시간 지수 이동 평균 (Retry-After 추정용)
+        self._cond = threading.Condition()
+
+    def retry_after(self):
+        """대기열이 빠지는 데 걸릴 것으로 보이는 시간(초)"""
+        backlog = len(self._waiting) + 1
+        return max(1, math.ceil(self._service_seconds * backlog / max(1, self.concurrency)))
+
+    def acquire(self, user):
+        started = time.perf_counter()
+        with self._cond:
+            if user and self.per_user and self._users.get(user, 0) >= self.per_user:
+                raise Rejected(429, 'per_user', self.retry_after())
+            if self._active >= self.concurrency or self._waiting:
+                if len(self._waiting) >= self.queue_size:
+                    raise Rejected(503, 'queue_full', self.retry_after())
+                ticket = object()
+                self._waiting.append(ticket)
+                self._users[user] += 1
+                ADMISSION_QUEUE_DEPTH.set(len(self._waiting), endpoint=self.name)
+                deadline = time.monotonic() + self.queue_timeout
+                try:
+                    while self._waiting[0] is not ticket or self._active >= self.concurrency:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._drop_user(user)
+                            raise Rejected(503, 'queue_timeout', self.retry_after())
+                        self._cond.wait(remaining)
+                finally:
+                    self._waiting.remove(ticket)
+                    ADMISSION_QUEUE_DEPTH.set(len(self._waiting), endpoint=self.name)
+                    # 앞사람이 빠졌으니 다음 대기자 확인
+                    self._cond.notify_all()
+            else:
+                self._users[user] += 1
+            self._active += 1
+        ADMISSION_IN_FLIGHT.inc(endpoint=self.name)
+        ADMISSION_QUEUE_WAIT_SECONDS.observe(time.perf_counter() - started, endpoint=self.name)
+        return time.perf_counter()
+
+    def _drop_user(self, user):
+        self._users[user] -= 1
+        if self._users[user] <= 0:
+            del self._users[user]
+
+    def release(self, user, admitted_at):
+        elapsed = time.perf_counter() - admitted_at
+        with self._cond:
+            self._active -= 1
+            self._drop_user(user)
+            self._service_seconds = 0.8 * self._service_seconds + 0.2 * elapsed
+            self._cond.notify_all()
+        ADMISSION_IN_FLIGHT.dec(endpoint=self.name)
+
+
+def _build_gates():
+    concurrency = _parse(ADMISSION_CONCURRENCY, int)
+    queue_size = _parse(ADMISSION_QUEUE_SIZE, int)
+    per_user = _parse(ADMISSION_PER_USER, int)
+    queue_timeout = _parse(ADMISSION_QUEUE_TIMEOUT, float)
+    return {
+        name: AdmissionGate(
+            name,
+            concurrency.get(name, limits[0]),
+            queue_size.get(name, limits[1]),
+            per_user.get(name, limits[2]),
+            queue_timeout.get(name, limits[3]),
+        )
+        for name, limits in DEFAULT_LIMITS.items()
+    }
+
+
+GATES = _build_gates()
+
+
+def _client_key(request):
+    """사용자 구분 키: JWT 사용자, 없으면 클라이언트 IP (로그인/회원가입)"""
+    payload = getattr(request, 'user_payload', None)
+    if payload and payload.get('username'):
+        return 'user:' + payload['username']
+    return 'ip:' + client_ip(request)
+
+
+def client_ip(request):
+    """클라이언트 IP: 접속 주소, 신뢰하는 프록시를 거쳐 왔으면 X-Forwarded-For 에서 프록시가 아닌 마지막 주소"""
+    address = request.META.get('REMOTE_ADDR', '')
+    if address not in TRUSTED_PROXIES:
+        return address
+    # 오른쪽(가까운 프록시가 붙인 주소)부터 거슬러 올라감, 그보다 왼쪽은 클라이언트가 쓴 값일 수 있음
+    for forwarded in reversed(request.META.get('HTTP_X_FORWARDED_FOR', '').split(',')):
+        forwarded = forwarded.strip()
+        if forwarded and forwarded not in TRUSTED_PROXIES:
+            return forwarded
+    return address
+
+
+def admission(endpoint):
+    """엔드포인트 종류(chat/history/auth)별 입장 제한 데코레이터 (jwt_required 안쪽에 적용)"""
+    gate = GATES[endpoint]
+
+    def decorator(view_func):
+        @functools.wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if not ADMISSION_ENABLED:
+                return view_func(request, *args, **kwargs)
+            user = _client_key(request)
+            try:
+                admitted_at = gate.acquire(user)
+            except Rejected as e:
+                ADMISSION_REJECTIONS.inc(endpoint=endpoint, reason=e.reason)
+                logger.warning("요청 거절: %s %s", endpoint, e.reason, extra={"client": user, "sample": True})
+                if e.status == 429:
+                    message = '이전 요청을 처리하고 있습니다. 잠시 후 다시 시도해주세요.'
+                else:
+                    message = '요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.'
+                response = JsonResponse({'error': message}, status=e.status)
+                response['Retry-After'] = str(e.retry_after)
+                return response
+            try:
+                return view_func(request, *args, **kwargs)
+            finally:
+                gate.release(user, admitted_at)
+        return wrapper
+    return decorator
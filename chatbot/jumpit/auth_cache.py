@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from django.contrib.auth.models import User
+
+from .metrics import CACHE_REQUESTS
+
+# 검증된 토큰 캐시 크기 (0 이면 매번 검증)
+JWT_CACHE_SIZE = int(os.getenv('JWT_CACHE_SIZE', '4096'))
+# 사용자 정보 캐시 크기와 유효 시간(초), 다른 워커에서 가입/수정된 경우는 유효 시간이 지나야 반영
+USER_CACHE_SIZE = int(os.getenv('USER_CACHE_SIZE', '4096'))
+USER_CACHE_TTL = float(os.getenv('USER_CACHE_TTL', '60'))
+
+
+class TokenCache:
+    """토큰 sha256 → 검증된 payload LRU 캐시 (exp 가 지나면 다시 검증)"""
+
+    def __init__(self, max_size=JWT_CACHE_SIZE):
+        self.max_size = max_size
+        self._items = OrderedDict()  # digest → (payload, 만료 시각)
+        self._lock = threading.Lock()
+
+    def get(self, digest):
+        with self._lock:
+            entry = self._items.get(digest)
+            if entry is None:
+                return None
+            if entry[1] is not None and entry[1] <= time.time():
+                del self._items[digest]
+                return None
+            self._items.move_to_end(digest)
+            return entry[0]
+
+    def put(self, digest, payload):
+        if not self.max_size:
+            return
+        exp = payload.get('exp')
+        with self._lock:
+            self._items[digest] = (payload, float(exp) if isinstance(exp, (int, float)) else None)
+            self._items.move_to_end(digest)
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+token_cache = TokenCache()
+
+
+def decode_token(token, secret, algorithms):
+    """검증된 JWT payload 반환 (캐시 적중 시 서명 검증 생략), 실패하면 jwt 예외"""
+    # 원문 토큰 대신 digest 를 키로 사용 (메모리에 토큰을 남기지 않음)
+    digest = hashlib.sha256(token.encode('utf-8')).digest()
+    payload = token_cache.get(digest)
+    if payload is not None:
+        CACHE_REQUESTS.inc(cache="jwt", result="hit")
+        return payload
+    CACHE_REQUESTS.inc(cache="jwt", result="miss")
+    payload = jwt.decode(token, secret, algorithms=algorithms)
+    token_cache.put(digest, payload)
+    return payload
+
+
+class UserProfileCache:
+    """username → 사용자 정보 (없는 사용자도 저장), post_save 시그널로 무효화"""
+
+    def __init__(self, max_size=USER_CACHE_SIZE, ttl=USER_CACHE_TTL):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items = OrderedDict()  # username → (정보 또는 None, 저장 시각)
+        self._lock = threading.Lock()
+
+    def get(self, username):
+        """{'id', 'username', 'email'} 또는 None (없는 사용자)"""
+        with self._lock:
+            entry = self._items.get(username)
+            if entry is not None and time.monotonic() - entry[1] < self.ttl:
+                self._items.move_to_end(username)
+                CACHE_REQUESTS.inc(cache="user_profile", result="hit")
+                return entry[0]
+        CACHE_REQUESTS.inc(cache="user_profile", result="miss")
+        profile = User.objects.filter(username=username).values('id', 'username', 'email').first()
+        with self._lock:
+            self._items[username] = (profile, time.monotonic())
+            self._items.move_to_end(username)
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+        return profile
+
+    def invalidate(self, username=None):
+        with self._lock:
+            if username is None:
+                self._items.clear()
+            else:
+                self._items.pop(username, None)
+
+
+user_cache = UserProfileCache()
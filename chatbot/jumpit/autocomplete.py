@@ -0,0 +1,189 @@
+"""
+검색어 자동완성 (자모 단위 접두사 트라이, 공고 수 순위)
+
+공고 제목 단어/구, 표준 기술(별칭 포함), 회사명을 자모로 분해한 키로 트라이를 만들고
+노드마다 공고 수 상위 제안을 미리 담아 두어, 입력한 글자만큼 트라이를 따라가면 바로 제안 목록이 나옵니다.
+자모 단위라 입력 중인 글자("백ㅇ", "갭" ← "개발" 입력 중)도 완성된 단어의 앞부분과 일치합니다.
+검색 인덱스(retrieval.py)와 함께 크롤링 세대마다 만들어 인덱스 파일에 배열로 저장합니다.
+"""
+import os
+import re
+
+import numpy as np
+
+from .hangul import decompose
+from .skills import SKILL_ALIASES
+
+# 노드마다 미리 담아 두는 제안 수 (요청 limit 의 최대값)
+AUTOCOMPLETE_TOP_K = int(os.getenv('AUTOCOMPLETE_TOP_K', '10'))
+# 제목 단어/구를 제안에 넣을 최소 공고 수 (공고 하나에만 있는 표현은 제외)
+AUTOCOMPLETE_MIN_COUNT = int(os.getenv('AUTOCOMPLETE_MIN_COUNT', '2'))
+
+# 제안 종류 (배열에는 번호로 저장)
+SUGGESTION_KINDS = ("title", "skill", "company")
+TITLE, SKILL, COMPANY = range(len(SUGGESTION_KINDS))
+
+_WORD = re.compile(r'[0-9a-zA-Z가-힣#+.]+')
+# 모든 공고 제목에 있어 제안으로 의미 없는 단어
+_STOP_WORDS = {"채용", "모집", "구인", "공고", "및"}
+_LEGAL_FORM = re.compile(r'^\s*(?:\(주\)|㈜|주식회사)\s*|\s*(?:\(주\)|㈜|주식회사)\s*$')
+_ROOT = "\x00"
+
+
+def _normalize(text):
+    return " ".join(text.split())
+
+
+def _title_phrases(title):
+    """제목 → 제안할 단어와 이어진 두 단어 구 ("[점핏] 백엔드 개발자 (Java)" → 백엔드, 개발자, 백엔드 개발자, ...)"""
+    words = [word for word in _WORD.findall(title)
+             if len(word) >= 2 and not word.isdigit() and word.lower() not in _STOP_WORDS]
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def suggestion_entries(titles, skill_lists, companies, active=None):
+    """공고별 제목/표준 기술 목록/회사명 → [(표시 문자열, 종류, 공고 수, 키 목록)]
+
+    active: 공고 위치별 마감 전 여부 (공고 수는 마감되지 않은 공고만 셈)
+    대소문자만 다른 표현은 하나로 묶고 처음 나온 형태로 표시
+    회사명은 법인 표기를 뗀 이름으로 묶고 ("(주)점핏", "점핏" → 점핏), 표기가 붙은 원래 이름은 검색 키로만 씀
+    """
+    counts = [{}, {}, {}]
+    display = {}
+    legal_names = {}
+
+    def add(kind, text):
+        key = (kind, _normalize(text).lower())
+        if key[1]:
+            counts[kind][key[1]] = counts[kind].get(key[1], 0) + 1
+            display.setdefault(key, _normalize(text))
+
+    for position, (title, skills, company) in enumerate(zip(titles, skill_lists, companies)):
+        if active is not None and not active[position]:
+            continue
+        for phrase in _title_phrases(title or ""):
+            add(TITLE, phrase)
+        for skill in set(skills):
+            add(SKILL, skill)
+        if company:
+            name = _LEGAL_FORM.sub("", company) or company
+            add(COMPANY, name)
+            if _normalize(name) != _normalize(company):
+                legal_names.setdefault(_normalize(name).lower(), set()).add(_normalize(company))
+
+    entries = []
+    for kind, kind_counts in enumerate(counts):
+        for text, count in kind_counts.items():
+            if kind == TITLE and count < AUTOCOMPLETE_MIN_COUNT:
+                continue
+            term = display[(kind, text)]
+            keys = [term]
+            if kind == SKILL:
+                # "파이" → Python, "쿠버" → Kubernetes
+                keys += SKILL_ALIASES.get(term, [])
+            elif kind == COMPANY:
+                # "(주)점핏", "주식회사 점핏" 으로 입력해도 검색
+                keys += sorted(legal_names.get(text, ()))
+            entries.append((term, kind, count, keys))
+    return entries
+
+
+class SuggestionTrie:
+    """자모 접두사 트라이 (너비 우선 순서의 평탄한 배열)
+
+    labels[i]: 노드 i 로 들어오는 자모 (루트는 \\x00)
+    first_child[i] ~ first_child[i + 1]: 노드 i 의 자식 노드 번호 구간 (자모 순 정렬)
+    top_offsets[i] ~ top_offsets[i + 1]: top_entries 에서 노드 i 의 제안 번호 구간 (공고 수 순)
+    """
+
+    def __init__(self, terms, kinds, counts, labels, first_child, top_offsets, top_entries):
+        self.terms = terms
+        self.kinds = kinds
+        self.counts = counts
+        self.labels = labels
+        self.first_child = first_child
+        self.top_offsets = top_offsets
+        self.top_entries = top_entries
+
+    def __len__(self):
+        return len(self.terms)
+
+    @classmethod
+    def empty(cls):
+        return cls.build([])
+
+    @classmethod
+    def build(cls, entries, top_k=AUTOCOMPLETE_TOP_K):
+        """entries: suggestion_entries 결과, 노드마다 공고 수 상위 top_k 개를 담음"""
+        # 공고 수 순으로 넣으면 노드마다 먼저 들어온 top_k 개가 곧 상위 제안
+        entries = sorted(entries, key=lambda entry: (-entry[2], len(entry[0]), entry[0]))
+        children = [{}]
+        tops = [[]]
+        for number, (_, _, _, keys) in enumerate(entries):
+            for key in keys:
+                node = 0
+                path = [0]
+                for char in decompose(_normalize(key)):
+                    child = children[node].get(char)
+                    if child is None:
+                        child = children[node][char] = len(children)
+                        children.append({})
+                        tops.append([])
+                    node = child
+                    path.append(node)
+                for node in path:
+                    # 같은 제안의 다른 키(별칭)가 지나간 노드에는 한 번만
+                    if len(tops[node]) < top_k and (not tops[node] or tops[node][-1] != number):
+                        tops[node].append(number)
+
+        # 너비 우선 순서로 번호를 다시 매겨 자식 노드가 연속되도록 배치
+        order, labels, first_child = [0], [_ROOT], []
+        for node in order:
+            first_child.append(len(order))
+            for char in sorted(children[node]):
+                order.append(children[node][char])
+                labels.append(char)
+        first_child.append(len(order))
+        top_offsets = np.zeros(len(order) + 1, dtype=np.int64)
+        top_offsets[1:] = np.cumsum([len(tops[node]) for node in order])
+        top_entries = np.array([number for node in order for number in tops[node]], dtype=np.int32)
+        return cls(
+            [entry[0] for entry in entries],
+            np.array([entry[1] for entry in entries], dtype=np.int8),
+            np.array([entry[2] for entry in entries], dtype=np.int64),
+            "".join(labels), np.array(first_child, dtype=np.int64), top_offsets, top_entries,
+        )
+
+    def to_arrays(self):
+        return {
+            'ac_terms': np.array(self.terms, dtype=str), 'ac_kinds': self.kinds, 'ac_counts': self.counts,
+            'ac_labels': np.array(self.labels), 'ac_first_child': self.first_child,
+            'ac_top_offsets': self.top_offsets, 'ac_top_entries': self.top_entries,
+        }
+
+    @classmethod
+    def from_arrays(cls, data):
+        return cls(data['ac_terms'].tolist(), data['ac_kinds'], data['ac_counts'], str(data['ac_labels']),
+                   data['ac_first_child'], data['ac_top_offsets'], data['ac_top_entries'])
+
+    def _node(self, prefix):
+        """접두사의 자모를 따라간 노드 번호 (없으면 None)"""
+        node = 0
+        for char in decompose(_normalize(prefix)):
+            position = self.labels.find(char, self.first_child[node], self.first_child[node + 1])
+            if position < 0:
+                return None
+            node = position
+        return node
+
+    def suggest(self, prefix, limit=AUTOCOMPLETE_TOP_K):
+        """prefix 로 시작하는 제안 [{"text", "kind", "count"}], 공고 수 순 (빈 입력이면 전체 상위)"""
+        node = self._node(prefix)
+        if node is None:
+            return []
+        begin = int(self.top_offsets[node])
+        end = min(int(self.top_offsets[node + 1]), begin + limit)
+        return [
+            {"text": self.terms[number], "kind": SUGGESTION_KINDS[self.kinds[number]], "count": int(self.counts[number])}
+            for number in self.top_entries[begin:end].tolist()
+        ]
@@ -0,0 +1,159 @@
+"""
+압축 비트맵 (roaring bitmap 방식, NumPy 로 구현)
+
+공고 위치(0 ~ n-1)를 2^16 개 단위 청크로 나누고, 청크마다 원소가 적으면 정렬된 uint16 배열,
+많으면 1024 개 uint64 비트 배열로 저장합니다. AND/OR/NOT 은 청크끼리의 배열/비트 연산으로 계산합니다.
+"""
+import numpy as np
+
+CHUNK_BITS = 16
+CHUNK_SIZE = 1 << CHUNK_BITS
+# 원소가 이보다 많으면 비트 배열이 더 작음 (4096 x 2바이트 = 8KB = 비트 배열 크기)
+ARRAY_MAX = 4096
+_WORDS = CHUNK_SIZE // 64
+_POPCOUNT = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+
+
+def _is_bits(container):
+    return container.dtype == np.uint64
+
+
+def _bits_from_array(values):
+    flags = np.zeros(CHUNK_SIZE, dtype=bool)
+    flags[values] = True
+    return np.packbits(flags, bitorder='little').view(np.uint64)
+
+
+def _array_from_bits(words):
+    return np.flatnonzero(np.unpackbits(words.view(np.uint8), bitorder='little')).astype(np.uint16)
+
+
+def _cardinality(container):
+    if _is_bits(container):
+        return int(_POPCOUNT[container.view(np.uint8)].sum())
+    return len(container)
+
+
+def _optimize(container):
+    """원소 수에 맞는 형식으로 변환, 비었으면 None"""
+    if _is_bits(container):
+        count = _cardinality(container)
+        if count == 0:
+            return None
+        return _array_from_bits(container) if count <= ARRAY_MAX else container
+    if not len(container):
+        return None
+    return container if len(container) <= ARRAY_MAX else _bits_from_array(container)
+
+
+def _bits_contain(words, values):
+    values = values.astype(np.int64)
+    return ((words[values >> 6] >> (values & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+
+def _and(a, b):
+    if _is_bits(a) and _is_bits(b):
+        return _optimize(a & b)
+    if _is_bits(a):
+        a, b = b, a
+    if _is_bits(b):
+        return _optimize(a[_bits_contain(b, a)])
+    return _optimize(np.intersect1d(a, b, assume_unique=True))
+
+
+def _or(a, b):
+    if not _is_bits(a) and not _is_bits(b):
+        return _optimize(np.union1d(a, b))
+    a = a if _is_bits(a) else _bits_from_array(a)
+    b = b if _is_bits(b) else _bits_from_array(b)
+    return a | b
+
+
+def _andnot(a, b):
+    if _is_bits(a) and _is_bits(b):
+        return _optimize(a & ~b)
+    if _is_bits(b):
+        return _optimize(a[~_bits_contain(b, a)])
+    if _is_bits(a):
+        return _optimize(a & ~_bits_from_array(b))
+    return _optimize(np.setdiff1d(a, b, assume_unique=True))
+
+
+class Bitmap:
+    """정수 집합 (공고 위치), 연산 결과도 Bitmap"""
+
+    __slots__ = ('containers',)
+
+    def __init__(self, containers=None):
+        # 청크 번호 → uint16 정렬 배열 또는 uint64[1024] 비트 배열
+        self.containers = containers or {}
+
+    @classmethod
+    def from_positions(cls, positions):
+        positions = np.unique(np.asarray(positions, dtype=np.int64))
+        containers = {}
+        if len(positions):
+            highs = positions >> CHUNK_BITS
+            bounds = np.flatnonzero(np.diff(highs)) + 1
+            for chunk in np.split(positions, bounds):
+                container = _optimize((chunk & (CHUNK_SIZE - 1)).astype(np.uint16))
+                if container is not None:
+                    containers[int(chunk[0] >> CHUNK_BITS)] = container
+        return cls(containers)
+
+    @classmethod
+    def full(cls, size):
+        """0 ~ size-1 전체 (NOT 연산의 기준 집합)"""
+        return cls.from_positions(np.arange(size))
+
+    def to_array(self):
+        """정렬된 위치 배열 (int64)"""
+        parts = []
+        for high in sorted(self.containers):
+            container = self.containers[high]
+            values = _array_from_bits(container) if _is_bits(container) else container
+            parts.append(values.astype(np.int64) + (high << CHUNK_BITS))
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return sum(_cardinality(container) for container in self.containers.values())
+
+    def __bool__(self):
+        return bool(self.containers)
+
+    def __contains__(self, position):
+        container = self.containers.get(position >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = position & (CHUNK_SIZE - 1)
+        if _is_bits(container):
+            return bool(_bits_contain(container, np.array([low]))[0])
+        index = np.searchsorted(container, low)
+        return index < len(container) and container[index] == low
+
+    def __and__(self, other):
+        containers = {}
+        for high in self.containers.keys() & other.containers.keys():
+            container = _and(self.containers[high], other.containers[high])
+            if container is not None:
+                containers[high] = container
+        return Bitmap(containers)
+
+    def __or__(self, other):
+        containers = dict(self.containers)
+        for high, container in other.containers.items():
+            containers[high] = _or(containers[high], container) if high in containers else container
+        return Bitmap(containers)
+
+    def __sub__(self, other):
+        """차집합 (AND NOT)"""
+        containers = {}
+        for high, container in self.containers.items():
+            if high in other.containers:
+                container = _andnot(container, other.containers[high])
+            if container is not None:
+                containers[high] = container
+        return Bitmap(containers)
+
+    def nbytes(self):
+        return sum(container.nbytes for container in self.containers.values())
@@ -0,0 +1,199 @@
+import os
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import pymysql
+from dotenv import load_dotenv
+
+from .tracing import TracedConnection
+
+load_dotenv()
+
+# mysql (기본) 또는 sqlite (로컬 벤치마크/오프라인 실행용)
+DB_BACKEND = os.getenv('DB_BACKEND', 'mysql').lower()
+DB_SQLITE_PATH = os.getenv('DB_SQLITE_PATH', 'jobara.sqlite3')
+# 재사용할 유휴 연결 최대 수 (짧은 조회 API 용)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '8'))
+
+
+def get_db_connection():
+    """DB 연결 생성 (DB_BACKEND=sqlite 이면 MySQL 문법을 변환하는 SQLite 연결), 쿼리는 트레이스에 기록"""
+    if DB_BACKEND == 'sqlite':
+        return TracedConnection(SQLiteConnection(DB_SQLITE_PATH))
+    return TracedConnection(pymysql.connect(
+        host=os.getenv('DB_HOST'),
+        port=int(os.getenv('DB_PORT')),
+        user=os.getenv('DB_USER'),
+        password=os.getenv('DB_PASSWORD'),
+        database=os.getenv('DB_NAME'),
+        charset="utf8mb4"
+    ))
+
+
+class ConnectionPool:
+    """유휴 연결을 보관했다가 재사용 (요청마다 연결을 새로 맺는 비용 절약)"""
+
+    def __init__(self, factory=get_db_connection, size=DB_POOL_SIZE):
+        self.factory = factory
+        self._idle = queue.LifoQueue(maxsize=size)
+
+    @contextmanager
+    def connection(self):
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self.factory()
+        else:
+            try:
+                conn.ping(reconnect=True)
+            except Exception:
+                conn = self.factory()
+        try:
+            yield conn
+        except Exception:
+            # 오류가 난 연결은 상태를 알 수 없으므로 버림
+            conn.close()
+            raise
+        try:
+            # 다음 사용자가 이전 트랜잭션 스냅샷을 보지 않도록 종료
+            conn.rollback()
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+pool = ConnectionPool()
+
+
+# 이 프로젝트에서 사용하는 MySQL/MariaDB 문법 → SQLite 문법
+_SQLITE_REWRITES = [
+    (re.compile(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", re.I), "INTEGER PRIMARY KEY AUTOINCREMENT"),
+    (re.compile(r"CONVERT_TZ\(\s*NOW\(\)\s*,\s*'UTC'\s*,\s*'Asia/Seoul'\s*\)", re.I), "(datetime('now', '+9 hours'))"),
+    (re.compile(r"DATE_FORMAT\(\s*([^,()]+?)\s*,\s*('[^']*')\s*\)", re.I), r"strftime(\2, \1)"),
+    (re.compile(r"\bCURDATE\(\)", re.I), "date('now', '+9 hours')"),
+    (re.compile(r"\bNOW\(\)", re.I), "datetime('now')"),
+    (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+]
+_ALTER_AUTO_INCREMENT = re.compile(r"^\s*ALTER\s+TABLE\s+\S+\s+AUTO_INCREMENT\s*=", re.I)
+_CREATE_TABLE_NAME = re.compile(r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.I)
+_INLINE_INDEX = re.compile(r",\s*(UNIQUE\s+)?(?:INDEX|KEY)\s+(\w+)\s*\(([^)]*)\)", re.I)
+
+
+def translate_mysql_to_sqlite(query):
+    """MySQL 쿼리를 SQLite 에서 실행 가능한 문장 목록으로 변환"""
+    if _ALTER_AUTO_INCREMENT.match(query):
+        return []
+    for pattern, replacement in _SQLITE_REWRITES:
+        query = pattern.sub(replacement, query)
+    statements = []
+    table = _CREATE_TABLE_NAME.search(query)
+    if table:
+        # CREATE TABLE 안의 INDEX 정의는 별도 CREATE INDEX 문으로 분리
+        for unique, name, columns in _INLINE_INDEX.findall(query):
+            statements.append(
+                f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table.group(1)} ({columns})"
+            )
+        query = _INLINE_INDEX.sub("", query)
+    return [query] + statements
+
+
+class SQLiteCursor:
+    """pymysql 커서와 같은 방식으로 사용하는 SQLite 커서"""
+
+    def __init__(self, connection, as_dict=False):
+        self.connection = connection
+        self._cursor = connection._conn.cursor()
+        self.as_dict = as_dict
+
+    def _prepare(self, query, args):
+        if args is not None:
+            # pymysql 과 동일하게 인자가 있을 때만 %s, %% 를 해석
+            query = query.replace("%%", "\0").replace("%s", "?").replace("\0", "%")
+        return translate_mysql_to_sqlite(query)
+
+    def execute(self, query, args=None):
+        statements = self._prepare(query, args)
+        for i, statement in enumerate(statements):
+            self._cursor.execute(statement, tuple(args or ()) if i == 0 else ())
+        return self._cursor.rowcount
+
+    def executemany(self, query, args):
+        statements = self._prepare(query, args)
+        self._cursor.executemany(statements[0], [tuple(arg) for arg in args])
+        return self._cursor.rowcount
+
+    def _row(self, row):
+        if row is None or not self.as_dict:
+            return row
+        return {column[0]: value for column, value in zip(self._cursor.description, row)}
+
+    def fetchone(self):
+        return self._row(self._cursor.fetchone())
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        return [self._row(row) for row in rows] if self.as_dict else tuple(rows)
+
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class SQLiteConnection:
+    """pymysql.connect() 대신 사용하는 SQLite 연결
+
+    여러 요청 스레드가 한 객체를 같이 쓰므로 실제 sqlite3 연결은 스레드마다 따로 엶.
+    문장 단위 자동 커밋이라 commit/rollback 은 호환용 (닫지 않은 읽기 커서가 다른 스레드의 쓰기를 막지 않도록 함)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    @property
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def cursor(self, cursor_class=None):
+        as_dict = cursor_class is not None and issubclass(cursor_class, pymysql.cursors.DictCursorMixin)
+        return SQLiteCursor(self, as_dict=as_dict)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def ping(self, reconnect=True):
+        return True
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
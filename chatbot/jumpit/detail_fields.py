@@ -0,0 +1,163 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# job_posting_new 상세 정보 컬럼 → 사용자에게 보여줄 이름
+DETAIL_COLUMNS = OrderedDict([
+    ("제목", "제목"),
+    ("회사명", "회사명"),
+    ("사용기술", "사용기술"),
+    ("근무지역", "근무지역"),
+    ("근로조건", "근로조건"),
+    ("모집기간", "모집기간"),
+    ("링크", "링크"),
+    ("주요업무", "주요업무"),
+    ("자격요건", "자격요건"),
+    ("우대사항", "우대사항"),
+    ("복지_및_혜택", "복지 및 혜택"),
+    ("채용절차", "채용절차"),
+    ("학력", "학력요건"),
+    ("근무지역_상세", "근무지역 상세"),
+    ("마감일자", "마감일자"),
+])
+
+# 사용자/LLM이 쓰는 표현 → 컬럼 이름 (공백, 밑줄 제거 후 비교)
+FIELD_ALIASES = {
+    "공고명": "제목",
+    "공고제목": "제목",
+    "회사": "회사명",
+    "기업": "회사명",
+    "기업명": "회사명",
+    "기술": "사용기술",
+    "기술스택": "사용기술",
+    "스택": "사용기술",
+    "근무지": "근무지역",
+    "위치": "근무지역",
+    "조건": "근로조건",
+    "경력": "근로조건",
+    "모집": "모집기간",
+    "지원링크": "링크",
+    "url": "링크",
+    "업무": "주요업무",
+    "담당업무": "주요업무",
+    "자격": "자격요건",
+    "지원자격": "자격요건",
+    "우대": "우대사항",
+    "우대조건": "우대사항",
+    "복지": "복지_및_혜택",
+    "혜택": "복지_및_혜택",
+    "복리후생": "복지_및_혜택",
+    "전형": "채용절차",
+    "전형절차": "채용절차",
+    "채용과정": "채용절차",
+    "학력요건": "학력",
+    "학력조건": "학력",
+    "상세주소": "근무지역_상세",
+    "주소": "근무지역_상세",
+    "마감": "마감일자",
+    "마감일": "마감일자",
+    "마감기한": "마감일자",
+}
+
+# 상세 정보 전부를 요청하는 표현
+ALL_FIELD_KEYWORDS = {"전부", "전체", "모두", "모든정보", "상세정보", "모든상세정보", "all"}
+
+
+def _normalize(token):
+    return re.sub(r"[\s_\"'`\[\]()\-:.*]", "", token).lower()
+
+
+# 정규화한 키 → 컬럼 이름, 부분 일치 검사는 긴 키부터
+_FIELD_KEYS = {_normalize(column): column for column in DETAIL_COLUMNS}
+_FIELD_KEYS.update({_normalize(label): column for column, label in DETAIL_COLUMNS.items()})
+_FIELD_KEYS.update({_normalize(alias): column for alias, column in FIELD_ALIASES.items()})
+_FIELD_KEYS_BY_LENGTH = sorted(_FIELD_KEYS.items(), key=lambda item: -len(item[0]))
+
+
+def parse_detail_fields(text) -> List[str]:
+    """LLM 출력 혹은 사용자 입력에서 요청한 상세 정보 컬럼 목록 추출 (등록된 컬럼만 반환)"""
+    columns = []
+    for token in re.split(r"[,\n/·]+", text or ""):
+        key = _normalize(token)
+        if not key:
+            continue
+        if key in ALL_FIELD_KEYWORDS:
+            return list(DETAIL_COLUMNS)
+        column = _FIELD_KEYS.get(key)
+        found = [column] if column else _mentioned_fields(key)
+        for column in found:
+            if column not in columns:
+                columns.append(column)
+    return columns
+
+
+def _mentioned_fields(key):
+    """정규화한 문장에 포함된 컬럼 이름/별칭 → 컬럼 목록 (문장에 나온 순서)
+
+    긴 키부터 찾고 찾은 부분은 지워서 짧은 키가 다시 일치하지 않게 함 ("우대조건" 이 "조건" → 근로조건으로도 잡히지 않도록)
+    """
+    remaining = key
+    found = []
+    for k, column in _FIELD_KEYS_BY_LENGTH:
+        position = remaining.find(k)
+        while position != -1:
+            found.append((position, column))
+            remaining = remaining[:position] + "\0" * len(k) + remaining[position + len(k):]
+            position = remaining.find(k)
+    return [column for _, column in sorted(found)]
+
+
+@dataclass
+class PostingDetail:
+    """공고 한 건의 상세 정보 (조회한 컬럼만 채워짐)"""
+    job_id: int
+    link: Optional[str] = None
+    fields: Dict[str, Optional[str]] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    def missing(self, columns) -> List[str]:
+        return [column for column in columns if column not in self.fields]
+
+    def items(self, columns) -> List[Tuple[str, Optional[str]]]:
+        """(표시 이름, 값) 목록"""
+        return [(DETAIL_COLUMNS[column], self.fields.get(column)) for column in columns]
+
+
+class PostingDetailCache:
+    """(공고 id, 링크) → PostingDetail LRU 캐시
+
+    크롤링하면 job_posting_new 를 다시 만들어 같은 id 가 다른 공고가 되므로 링크까지 키로 사용
+    (다른 공고의 컬럼이 섞이거나 이전 공고의 값을 돌려주지 않음)
+    """
+
+    def __init__(self, max_size=2048, ttl=600):
+        self.max_size = max_size
+        self.ttl = ttl  # 같은 공고의 내용이 바뀐 경우(다시 크롤링)를 반영하는 유효 시간(초)
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, job_id, link) -> PostingDetail:
+        """캐시된 상세 정보 반환, 없거나 만료되었으면 빈 객체를 새로 등록"""
+        key = (job_id, link)
+        with self._lock:
+            detail = self._items.get(key)
+            if detail is not None and time.monotonic() - detail.loaded_at < self.ttl:
+                self._items.move_to_end(key)
+                return detail
+            detail = PostingDetail(job_id, link)
+            self._items[key] = detail
+            if len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+            return detail
+
+    def invalidate(self, job_id=None):
+        """job_id 의 상세 정보 삭제 (링크와 무관하게), None 이면 전체"""
+        with self._lock:
+            if job_id is None:
+                self._items.clear()
+            else:
+                for key in [key for key in self._items if key[0] == job_id]:
+                    del self._items[key]
@@ -0,0 +1,144 @@
+"""
+마감된 공고 제외 + 결과 캐시 정리 스위퍼
+
+마감일(DATE, 인덱스)과 상시채용 컬럼으로 검색/추천 쿼리에서 마감된 공고를 범위 조건으로 거르고,
+크롤링 사이에 마감된 공고는 스위퍼가 주기적으로 찾아 추천 결과 테이블과 상세 정보 캐시에서 지웁니다.
+"""
+import logging
+import os
+import threading
+
+from .facets import is_open_ended, parse_deadline, today
+from .metrics import POSTINGS_EXPIRED
+
+logger = logging.getLogger(__name__)
+
+# 마감된 공고를 확인하는 간격(초), 0 이면 스위퍼를 실행하지 않음
+EXPIRY_SWEEP_SECONDS = float(os.getenv('EXPIRY_SWEEP_SECONDS', '600'))
+
+
+def active_condition(alias=""):
+    """마감되지 않은 공고 조건 (상시채용, 마감일 모름 포함), alias: job_posting_new 의 별칭
+
+    오늘 날짜는 DB 시간대 대신 한국 날짜 리터럴로 비교 (검색 인덱스의 마감 판단과 같은 기준)
+    """
+    prefix = f"{alias}." if alias else ""
+    return f"({prefix}상시채용 = 1 OR {prefix}마감일 IS NULL OR {prefix}마감일 >= '{today().isoformat()}')"
+
+
+def create_deadline_index(conn):
+    """마감일 범위 조건용 인덱스 (이미 있으면 무시, 다른 오류는 기록)"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("CREATE INDEX idx_job_posting_deadline ON job_posting_new (마감일)")
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        # MySQL: Duplicate key name (1061), SQLite: index ... already exists
+        if getattr(e, 'args', (None,))[0] != 1061 and 'already exists' not in str(e):
+            logger.warning("마감일 인덱스 생성 실패: %r", e)
+    cursor.close()
+
+
+def backfill_deadlines(conn, batch=1000):
+    """마감일자/모집기간 원문으로 마감일, 상시채용 컬럼 채우기 (컬럼을 새로 추가한 테이블), 반환: 채운 공고 수
+
+    D-day 표기는 저장일시(크롤링 시각) 기준
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, 마감일자, 모집기간, 저장일시 FROM job_posting_new WHERE 마감일 IS NULL")
+    rows = cursor.fetchall()
+    updates = []
+    for job_id, deadline_text, period_text, saved_at in rows:
+        deadline = parse_deadline(deadline_text, period_text, saved_at)
+        open_ended = is_open_ended(deadline_text, period_text)
+        if deadline is not None or open_ended:
+            updates.append((deadline.isoformat() if deadline else None, int(open_ended), job_id))
+    for begin in range(0, len(updates), batch):
+        cursor.executemany("UPDATE job_posting_new SET 마감일 = %s, 상시채용 = %s WHERE id = %s",
+                           updates[begin:begin + batch])
+    conn.commit()
+    cursor.close()
+    return len(updates)
+
+
+def fetch_expired_ids(conn, since=None, day=None):
+    """since 이후 ~ day(오늘) 전날까지 마감된 공고 id (since 가 없으면 마감된 공고 전체)"""
+    day = day or today()
+    cursor = conn.cursor()
+    if since is None:
+        cursor.execute("SELECT id FROM job_posting_new WHERE 마감일 < %s", (day.isoformat(),))
+    else:
+        cursor.execute("SELECT id FROM job_posting_new WHERE 마감일 >= %s AND 마감일 < %s",
+                       (since.isoformat(), day.isoformat()))
+    ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    return ids
+
+
+def remove_expired_recommendations(conn, job_ids, batch=500):
+    """추천 결과 테이블에서 마감된 공고 삭제, 반환: 삭제한 행 수"""
+    removed = 0
+    cursor = conn.cursor()
+    for begin in range(0, len(job_ids), batch):
+        chunk = job_ids[begin:begin + batch]
+        cursor.execute(
+            f"DELETE FROM recommended_job_posting WHERE 공고_id IN ({', '.join(['%s'] * len(chunk))})", chunk)
+        removed += max(cursor.rowcount, 0)
+    conn.commit()
+    cursor.close()
+    return removed
+
+
+class ExpirySweeper:
+    """날짜가 바뀔 때마다 새로 마감된 공고를 결과 캐시에서 정리
+
+    on_expired: 마감된 공고 id 목록을 받는 콜백 목록 (메모리 캐시 무효화)
+    """
+
+    def __init__(self, connection_factory, on_expired=(), interval=EXPIRY_SWEEP_SECONDS):
+        self.connection_factory = connection_factory
+        self.on_expired = list(on_expired)
+        self.interval = interval
+        # 이 날짜 전날까지 마감된 공고는 정리 완료
+        self.swept_until = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def sweep(self, day=None):
+        """새로 마감된 공고 정리, 반환: 정리한 공고 수 (오늘 이미 정리했으면 0)"""
+        day = day or today()
+        if self.swept_until == day:
+            return 0
+        conn = self.connection_factory()
+        try:
+            job_ids = fetch_expired_ids(conn, self.swept_until, day)
+            if job_ids:
+                removed = remove_expired_recommendations(conn, job_ids)
+                logger.info("마감 공고 %d건 정리 (추천 결과 %d행 삭제)", len(job_ids), removed)
+        finally:
+            conn.close()
+        for callback in self.on_expired:
+            callback(job_ids)
+        POSTINGS_EXPIRED.inc(len(job_ids))
+        self.swept_until = day
+        return len(job_ids)
+
+    def start(self):
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name='expiry-sweeper', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while True:
+            try:
+                self.sweep()
+            except Exception:
+                # 마감일 컬럼이 생기기 전에 크롤링한 테이블 등, 다음 주기에 다시 시도
+                logger.warning("마감 공고 정리 중 오류 발생", exc_info=True)
+            if self._stop.wait(self.interval):
+                return
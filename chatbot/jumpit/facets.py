@@ -0,0 +1,372 @@
+"""
+근무지역 / 경력 / 마감일 패싯 (원문 파싱 + 공고 위치 비트맵 인덱스)
+
+크롤러(LSJ/crawling.py)가 근무지역, 근로조건, 모집기간/마감일자 원문을 지역 코드, 경력 범위, 마감일로 바꿔 저장하고,
+검색 인덱스(retrieval.py)는 값마다 공고 비트맵을 만들어 조건 검색과 결과별 패싯 개수를 DB 조회 없이 계산합니다.
+    "서울 강남구"        → ("KR-11", "강남구")
+    "신입·경력 0~3년"    → (0, 3)
+    "D-12" / "상시채용"  → 크롤링 날짜 + 12일 / None (상시채용 플래그)
+마감일이 지난 공고는 검색/추천에서 제외 (expiry.py 의 SQL 범위 조건, 인덱스에서는 active 비트맵)
+"""
+import re
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+from .bitmap import Bitmap
+
+# 시/도 → 지역 코드 (ISO 3166-2:KR)
+REGION_CODES = {
+    "서울": "KR-11", "부산": "KR-26", "대구": "KR-27", "인천": "KR-28", "광주": "KR-29",
+    "대전": "KR-30", "울산": "KR-31", "세종": "KR-50", "경기": "KR-41", "강원": "KR-42",
+    "충북": "KR-43", "충남": "KR-44", "전북": "KR-45", "전남": "KR-46", "경북": "KR-47",
+    "경남": "KR-48", "제주": "KR-49",
+}
+REGION_NAMES = {code: name for name, code in REGION_CODES.items()}
+_REGION_ALIASES = {
+    "서울특별시": "서울", "서울시": "서울", "부산광역시": "부산", "부산시": "부산", "대구광역시": "대구",
+    "대구시": "대구", "인천광역시": "인천", "인천시": "인천", "광주광역시": "광주", "대전광역시": "대전",
+    "대전시": "대전", "울산광역시": "울산", "울산시": "울산", "세종특별자치시": "세종", "세종시": "세종",
+    "경기도": "경기", "강원도": "강원", "강원특별자치도": "강원", "충청북도": "충북", "충청남도": "충남",
+    "전라북도": "전북", "전북특별자치도": "전북", "전라남도": "전남", "경상북도": "경북", "경상남도": "경남",
+    "제주도": "제주", "제주특별자치도": "제주",
+}
+# 시/군/구 (성남시 분당구 처럼 두 단계면 앞의 시까지만 사용)
+_DISTRICT = re.compile(r'^[가-힣]+(?:시|군|구)$')
+
+# 경력 상한 없음 ("경력 무관", "10년 이상")
+CAREER_NO_LIMIT = 99
+# 경력 조건 검색에서 구분하는 최대 연차 (이보다 많으면 이 값으로 취급)
+CAREER_MAX_YEARS = 10
+# 상한 없는 표기: "5년 이상", "5년↑", "5년+", "10년~"
+_YEARS = re.compile(r'(\d+)\s*(?:년)?\s*(?:[~\-–]\s*(\d+)\s*년?)?\s*(이상|↑|\+|[~\-–])?')
+_D_DAY = re.compile(r'D\s*-\s*(\d+)', re.IGNORECASE)
+_DATE = re.compile(r'(\d{2,4})[.\-/](\d{1,2})[.\-/](\d{1,2})')
+
+# 패싯 개수를 보여줄 구간 (이름, 최소, 최대)
+CAREER_BUCKETS = [("신입", 0, 0), ("1~3년", 1, 3), ("4~6년", 4, 6), ("7~9년", 7, 9), ("10년 이상", 10, CAREER_NO_LIMIT)]
+# 마감까지 남은 일수 구간 (상시채용은 별도 항목)
+DEADLINE_BUCKETS = [("마감", None, -1), ("7일 이내", 0, 7), ("8~30일", 8, 30), ("30일 이후", 31, None)]
+OPEN_ENDED = "상시"
+# 마감일 배열에서 상시채용(또는 알 수 없음)을 나타내는 값
+_NO_DEADLINE = 0
+# 마감일은 한국 날짜 기준 (서버/DB 시간대와 무관하게 비교)
+KST = ZoneInfo("Asia/Seoul")
+
+
+def today():
+    """오늘 한국 날짜"""
+    return datetime.now(KST).date()
+
+
+def region_code(name):
+    """시/도 이름("서울", "경기도") 또는 코드("KR-11") → 지역 코드 (모르면 None)"""
+    name = (name or "").strip()
+    if name.upper() in REGION_NAMES:
+        return name.upper()
+    return REGION_CODES.get(_REGION_ALIASES.get(name, name))
+
+
+def parse_region(text):
+    """근무지역 원문 → (지역 코드, 시/군/구), 여러 곳이면 첫 지역 ("서울 강남구 외 1")"""
+    tokens = re.split(r'[\s,·/]+', (text or "").strip())
+    code = region_code(tokens[0]) if tokens else None
+    if code is None:
+        return None, None
+    district = tokens[1] if len(tokens) > 1 and _DISTRICT.match(tokens[1]) else None
+    return code, district
+
+
+def parse_career(text):
+    """근로조건 원문 → (최소 연차, 최대 연차), 신입은 0년, 상한이 없으면 CAREER_NO_LIMIT
+
+    "신입" → (0, 0), "경력 1~3년" → (1, 3), "신입·경력 0~3년" → (0, 3), "경력 무관" → (0, 99), "경력 5년 이상" → (5, 99)
+    "신입/경력" → (0, 99), "경력 10년~" → (10, 99)
+    """
+    text = (text or "").strip()
+    if not text:
+        return None, None
+    if "무관" in text:
+        return 0, CAREER_NO_LIMIT
+    newcomer = "신입" in text
+    match = _YEARS.search(text)
+    if match:
+        low = int(match.group(1))
+        if match.group(2):
+            high = int(match.group(2))
+        elif match.group(3):
+            high = CAREER_NO_LIMIT
+        else:
+            high = low
+        return (0 if newcomer else min(low, high)), max(low, high)
+    if newcomer:
+        # 연차 없이 신입과 경력을 함께 뽑는 공고
+        return 0, (CAREER_NO_LIMIT if "경력" in text else 0)
+    if "경력" in text:
+        return 1, CAREER_NO_LIMIT
+    return None, None
+
+
+def _to_date(value):
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.fromisoformat(str(value)).date()
+    except ValueError:
+        return None
+
+
+def parse_deadline(deadline_text, period_text=None, crawled_at=None):
+    """마감일자 원문("2026-11-30", "26.11.30") 또는 모집기간("D-12", 크롤링 날짜 기준) → 마감일
+
+    상시채용이거나 알 수 없으면 None
+    """
+    deadline_text = (deadline_text or "").strip()
+    match = _DATE.search(deadline_text)
+    if match:
+        year, month, day = (int(part) for part in match.groups())
+        try:
+            return date(year + 2000 if year < 100 else year, month, day)
+        except ValueError:
+            pass
+    if OPEN_ENDED in deadline_text:
+        return None
+    match = _D_DAY.search(period_text or "")
+    if match:
+        return (_to_date(crawled_at) or today()) + timedelta(days=int(match.group(1)))
+    return None
+
+
+def is_open_ended(deadline_text, period_text=None):
+    """상시채용 여부 (마감일자 또는 모집기간이 "상시")"""
+    return OPEN_ENDED in (deadline_text or "") or OPEN_ENDED in (period_text or "")
+
+
+def parse_posting_facets(region, condition, period, deadline, crawled_at=None):
+    """공고 원문 → (지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용) 크롤러 저장 형식"""
+    return (*parse_region(region), *parse_career(condition), parse_deadline(deadline, period, crawled_at),
+            int(is_open_ended(deadline, period)))
+
+
+def _day_number(value):
+    value = _to_date(value)
+    return value.toordinal() if value else _NO_DEADLINE
+
+
+def _bitmaps_by_value(values, count):
+    """값 배열(공고 위치 순서) → 값 번호별 위치 비트맵 (음수는 값 없음)"""
+    order = np.argsort(values, kind='stable')
+    bounds = np.searchsorted(values[order], np.arange(count + 1))
+    return [Bitmap.from_positions(order[bounds[i]:bounds[i + 1]]) for i in range(count)]
+
+
+class FacetIndex:
+    """공고 위치별 지역/경력/마감일 배열 + 값별 비트맵
+
+    조건 검색은 비트맵(지역, 연차) 또는 정렬된 마감일 구간으로, 패싯 개수는 결과 위치의 값 배열을 세어 계산
+    """
+
+    def __init__(self, region_names, regions, district_names, districts, career_min, career_max, deadlines):
+        self.region_names = [str(name) for name in region_names]
+        self.district_names = [str(name) for name in district_names]
+        self.regions = np.asarray(regions, dtype=np.int16)
+        self.districts = np.asarray(districts, dtype=np.int16)
+        self.career_min = np.asarray(career_min, dtype=np.int16)
+        self.career_max = np.asarray(career_max, dtype=np.int16)
+        self.deadlines = np.asarray(deadlines, dtype=np.int32)
+        self.size = len(self.regions)
+        self._region_lookup = {name: i for i, name in enumerate(self.region_names)}
+        self._district_lookup = {name: i for i, name in enumerate(self.district_names)}
+        self._region_bitmaps = _bitmaps_by_value(self.regions, len(self.region_names))
+        self._district_bitmaps = _bitmaps_by_value(self.districts, len(self.district_names))
+        # 연차 n 에 지원 가능한 공고 (최소 <= n <= 최대)
+        known = self.career_min >= 0
+        self._career_bitmaps = [
+            Bitmap.from_positions(np.flatnonzero(known & (self.career_min <= years) & (self.career_max >= years)))
+            for years in range(CAREER_MAX_YEARS + 1)
+        ]
+        # 마감일 순 위치 (상시채용 제외), 마감일 구간 검색용
+        dated = np.flatnonzero(self.deadlines != _NO_DEADLINE)
+        self._by_deadline = dated[np.argsort(self.deadlines[dated], kind='stable')]
+        self._sorted_deadlines = self.deadlines[self._by_deadline]
+        self._open_ended = Bitmap.from_positions(np.flatnonzero(self.deadlines == _NO_DEADLINE))
+        # (날짜, 마감되지 않은 공고 비트맵), 날짜가 바뀌면 다시 계산
+        self._active = None
+
+    @classmethod
+    def build(cls, facet_rows):
+        """공고 위치 순서의 (지역코드, 시군구, 경력_최소, 경력_최대, 마감일) 목록으로 생성"""
+        facet_rows = list(facet_rows)
+        region_names = sorted({row[0] for row in facet_rows if row[0]})
+        district_names = sorted({f"{row[0]} {row[1]}" for row in facet_rows if row[0] and row[1]})
+        region_lookup = {name: i for i, name in enumerate(region_names)}
+        district_lookup = {name: i for i, name in enumerate(district_names)}
+        regions = [region_lookup.get(row[0], -1) for row in facet_rows]
+        districts = [district_lookup.get(f"{row[0]} {row[1]}", -1) for row in facet_rows]
+        career_min = [row[2] if row[2] is not None else -1 for row in facet_rows]
+        career_max = [row[3] if row[3] is not None else -1 for row in facet_rows]
+        deadlines = [_day_number(row[4]) for row in facet_rows]
+        return cls(region_names, regions, district_names, districts, career_min, career_max, deadlines)
+
+    @classmethod
+    def empty(cls, size):
+        unknown = np.full(size, -1)
+        return cls([], unknown, [], unknown, unknown, unknown, np.zeros(size))
+
+    def take(self, order):
+        """공고 위치 순서 변경 (IVF 클러스터 정렬 후)"""
+        return FacetIndex(self.region_names, self.regions[order], self.district_names, self.districts[order],
+                          self.career_min[order], self.career_max[order], self.deadlines[order])
+
+    def to_arrays(self):
+        """인덱스 파일 저장용 배열 (키 이름 → 배열)"""
+        return {
+            'facet_region_names': np.array(self.region_names, dtype=str), 'facet_regions': self.regions,
+            'facet_district_names': np.array(self.district_names, dtype=str), 'facet_districts': self.districts,
+            'facet_career_min': self.career_min, 'facet_career_max': self.career_max,
+            'facet_deadlines': self.deadlines,
+        }
+
+    @classmethod
+    def from_arrays(cls, data):
+        return cls(data['facet_region_names'], data['facet_regions'], data['facet_district_names'],
+                   data['facet_districts'], data['facet_career_min'], data['facet_career_max'],
+                   data['facet_deadlines'])
+
+    def resolve_region(self, term):
+        """"서울", "KR-11", "경기 성남시", "경기도 성남시" → ('region' | 'district', 번호), 모르면 None"""
+        code, district = parse_region(term)
+        if code is None:
+            return None
+        if district:
+            number = self._district_lookup.get(f"{code} {district}")
+            return ('district', number) if number is not None else None
+        number = self._region_lookup.get(code)
+        return ('region', number) if number is not None else None
+
+    def region_filter(self, terms):
+        """지역 조건(여러 개면 OR) → (위치 비트맵, 모르는 지역 목록)"""
+        result, unknown = Bitmap(), []
+        for term in terms:
+            resolved = self.resolve_region(term)
+            if resolved is None:
+                unknown.append(term)
+                continue
+            kind, number = resolved
+            result = result | (self._region_bitmaps if kind == 'region' else self._district_bitmaps)[number]
+        return result, unknown
+
+    def career_filter(self, years):
+        """연차 years 로 지원 가능한 공고 (신입 = 0)"""
+        return self._career_bitmaps[max(0, min(int(years), CAREER_MAX_YEARS))]
+
+    def deadline_filter(self, min_days=None, max_days=None, day=None, include_open=False):
+        """마감까지 남은 일수가 [min_days, max_days] 인 공고 (정렬된 마감일 구간), include_open 이면 상시채용 포함"""
+        current = (day or today()).toordinal()
+        low = 0 if min_days is None else np.searchsorted(self._sorted_deadlines, current + min_days, side='left')
+        high = (len(self._sorted_deadlines) if max_days is None
+                else np.searchsorted(self._sorted_deadlines, current + max_days, side='right'))
+        result = Bitmap.from_positions(self._by_deadline[low:high])
+        return result | self._open_ended if include_open else result
+
+    def open_ended(self):
+        return self._open_ended
+
+    def active(self, day=None):
+        """마감되지 않은 공고 (마감일이 오늘 이후, 상시채용/마감일 모름 포함), 날짜별로 한 번 계산"""
+        key = (day or today()).toordinal()
+        cached = self._active
+        if cached is None or cached[0] != key:
+            cached = self._active = (key, self.deadline_filter(0, None, day, include_open=True))
+        return cached[1]
+
+    def expired_mask(self, day=None):
+        """공고 위치별 마감 여부 배열"""
+        current = (day or today()).toordinal()
+        return (self.deadlines != _NO_DEADLINE) & (self.deadlines < current)
+
+    def counts(self, positions, day=None):
+        """결과 위치 배열 → 패싯별 [{"value", "count"}] (개수 0 인 값 제외, 개수 순)"""
+        return {
+            'region': self.region_counts(positions),
+            'district': self.district_counts(positions),
+            'career': self.career_counts(positions),
+            'deadline': self.deadline_counts(positions, day),
+        }
+
+    def region_counts(self, positions):
+        counts = np.bincount(self.regions[positions] + 1, minlength=len(self.region_names) + 1)[1:]
+        return _ranked([(REGION_NAMES.get(name, name), name) for name in self.region_names], counts)
+
+    def district_counts(self, positions):
+        counts = np.bincount(self.districts[positions] + 1, minlength=len(self.district_names) + 1)[1:]
+        labels = []
+        for name in self.district_names:
+            code, district = name.split(' ', 1)
+            labels.append((f"{REGION_NAMES.get(code, code)} {district}", name))
+        return _ranked(labels, counts)
+
+    def career_counts(self, positions):
+        """경력 구간별 개수 (공고의 경력 범위가 구간과 겹치면 포함, 한 공고가 여러 구간에 포함될 수 있음)"""
+        low, high = self.career_min[positions], self.career_max[positions]
+        known = low >= 0
+        counts = [int((known & (low <= bucket_high) & (high >= bucket_low)).sum())
+                  for _, bucket_low, bucket_high in CAREER_BUCKETS]
+        return _ranked([(name, name) for name, _, _ in CAREER_BUCKETS], counts, keep_order=True)
+
+    def deadline_counts(self, positions, day=None):
+        deadlines = self.deadlines[positions]
+        dated = deadlines != _NO_DEADLINE
+        remaining = deadlines[dated] - (day or today()).toordinal()
+        counts = []
+        for _, low, high in DEADLINE_BUCKETS:
+            selected = np.ones(len(remaining), dtype=bool)
+            if low is not None:
+                selected &= remaining >= low
+            if high is not None:
+                selected &= remaining <= high
+            counts.append(int(selected.sum()))
+        labels = [(name, name) for name, _, _ in DEADLINE_BUCKETS] + [(OPEN_ENDED, OPEN_ENDED)]
+        return _ranked(labels, counts + [int((~dated).sum())], keep_order=True)
+
+    def filters_from_text(self, text):
+        """챗봇 입력 문장에서 지역/연차 조건 추출 ("서울 강남 신입 백엔드" → 서울 강남구 + 신입)
+
+        반환: 조건을 모두 만족하는 공고 비트맵, 조건이 없으면 None
+        """
+        words = re.findall(r'[가-힣A-Za-z0-9]+', text or "")
+        result = None
+        regions = []
+        for i, word in enumerate(words):
+            code = region_code(word)
+            if code is None:
+                continue
+            following = words[i + 1] if i + 1 < len(words) else ""
+            # "강남" 처럼 구/시 없이 쓴 지역도 인덱스에 있는 이름이면 인정
+            candidates = [following, following + "구", following + "시", following + "군"] if following else []
+            district = next((name for name in candidates if f"{code} {name}" in self._district_lookup), None)
+            regions.append(f"{code} {district}" if district else code)
+        if regions:
+            result, _ = self.region_filter(regions)
+        years = None
+        match = re.search(r'경력\s*(\d+)\s*년|(\d+)\s*년\s*차', text or "")
+        if "신입" in (text or ""):
+            years = 0
+        elif match:
+            years = int(match.group(1) or match.group(2))
+        if years is not None:
+            career = self.career_filter(years)
+            result = career if result is None else result & career
+        return result
+
+
+def _ranked(labels, counts, keep_order=False):
+    """(표시 이름, 값) 목록과 개수 → 개수가 있는 항목 목록"""
+    items = [{"label": label, "value": value, "count": int(count)}
+             for (label, value), count in zip(labels, counts) if count]
+    return items if keep_order else sorted(items, key=lambda item: -item["count"])
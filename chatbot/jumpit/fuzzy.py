@@ -0,0 +1,114 @@
+"""
+검색어 오타 교정 (자모 trigram 후보 + 편집 거리 확인)
+
+공고 제목/기술 이름 어휘를 자모로 분해해 trigram 역색인을 만들고, 검색 키워드와 일치하는 공고가 없을 때
+어휘에 없는 단어를 편집 거리가 가까운 어휘로 바꿔 검색합니다. ("백앤드" → "백엔드", "파이선" → "파이썬", "pyhton" → "Python")
+자모 단위라 받침/모음 하나 틀린 한글 오타도 편집 거리 1 입니다.
+"""
+import re
+
+from .hangul import decompose
+
+# 자모 길이별 허용 편집 거리 (짧은 단어는 다른 단어로 바뀌기 쉬워 교정하지 않음)
+_MIN_LENGTH = 4
+_SHORT_LENGTH = 8
+_PAD = "\x00"
+_WORD = re.compile(r'\S+')
+
+
+def max_distance(length):
+    if length < _MIN_LENGTH:
+        return 0
+    return 1 if length <= _SHORT_LENGTH else 2
+
+
+def _trigrams(jamo):
+    padded = f"{_PAD}{_PAD}{jamo}{_PAD}{_PAD}"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """인접 글자 바뀜을 1 로 세는 편집 거리 (OSA), limit 을 넘으면 limit + 1"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, previous2[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+class FuzzyIndex:
+    """어휘(표시 형태) + 공고 수 → 자모 trigram 역색인"""
+
+    def __init__(self, terms, counts):
+        self.terms = [str(term) for term in terms]
+        self.counts = [int(count) for count in counts]
+        self._jamo = [decompose(term) for term in self.terms]
+        self._known = {term.lower() for term in self.terms}
+        self._postings = {}
+        for number, jamo in enumerate(self._jamo):
+            for gram in _trigrams(jamo):
+                self._postings.setdefault(gram, []).append(number)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def lookup(self, word, limit=None):
+        """word 와 편집 거리 limit 이내의 어휘 [(어휘, 거리, 공고 수)], 거리 → 공고 수 순"""
+        jamo = decompose(word.strip())
+        limit = max_distance(len(jamo)) if limit is None else limit
+        if limit == 0:
+            return []
+        grams = _trigrams(jamo)
+        shared = {}
+        for gram in grams:
+            for number in self._postings.get(gram, ()):
+                shared[number] = shared.get(number, 0) + 1
+        # 편집 한 번(인접 글자 바뀜 포함)은 trigram 을 최대 4개 바꿈 → 공유 trigram 이 이보다 적으면 거리 limit 초과
+        matches = []
+        for number, count in shared.items():
+            candidate = self._jamo[number]
+            if count < max(len(jamo), len(candidate)) + 2 - 4 * limit:
+                continue
+            distance = edit_distance(jamo, candidate, limit)
+            if distance <= limit:
+                matches.append((self.terms[number], distance, self.counts[number]))
+        matches.sort(key=lambda match: (match[1], -match[2]))
+        return matches
+
+    def correct(self, word):
+        """어휘에 없는 단어 → 가장 가까운 어휘 (이미 있는 단어이거나 후보가 없으면 None)"""
+        if word.lower() in self._known:
+            return None
+        matches = self.lookup(word)
+        if not matches:
+            return None
+        best = matches[0]
+        # 같은 거리의 후보가 여럿이면 공고 수가 많은 쪽, 공고 수까지 같으면 판단하지 않음
+        if len(matches) > 1 and matches[1][1] == best[1] and matches[1][2] == best[2]:
+            return None
+        return best[0]
+
+    def correct_keywords(self, keywords):
+        """검색 키워드 목록 교정, 반환: (교정한 키워드 목록, {원래 단어: 교정한 단어})"""
+        changes = {}
+        corrected = []
+        for keyword in keywords:
+            words = []
+            for word in _WORD.findall(keyword):
+                fixed = self.correct(word)
+                if fixed:
+                    changes[word] = fixed
+                words.append(fixed or word)
+            corrected.append(" ".join(words))
+        return corrected, changes
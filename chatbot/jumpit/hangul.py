@@ -0,0 +1,35 @@
+"""
+한글 자모 분해 (오타 교정, 자동완성에서 글자 대신 자모 단위로 비교)
+
+"백엔드" → "ㅂㅐㄱㅇㅔㄴㄷㅡ", 겹받침/이중모음은 두벌식 자판에서 누르는 순서대로 나눔 ("ㅘ" → "ㅗㅏ", "ㄳ" → "ㄱㅅ")
+입력 중인 글자("백ㅇ", "배")도 완성된 단어의 자모 앞부분과 일치합니다.
+"""
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ",
+              "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONGSEONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ",
+              "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 낱자로 입력된 겹자모 (입력 중인 글자)
+_COMPAT = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ",
+    "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ",
+    "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+_SYLLABLE_FIRST = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+
+def decompose(text):
+    """문자열 → 자모 문자열 (한글 외 문자는 소문자로 그대로 유지)"""
+    parts = []
+    for char in text.lower():
+        code = ord(char)
+        if _SYLLABLE_FIRST <= code <= _SYLLABLE_LAST:
+            offset = code - _SYLLABLE_FIRST
+            parts.append(_CHOSEONG[offset // 588])
+            parts.append(_JUNGSEONG[offset % 588 // 28])
+            parts.append(_JONGSEONG[offset % 28])
+        else:
+            parts.append(_COMPAT.get(char, char))
+    return "".join(parts)
+
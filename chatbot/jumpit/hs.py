@@ -1,14 +1,34 @@
+import logging
 import pymysql
 import os
+import time
 from typing import Dict, TypedDict, Optional, List, Literal
 from datetime import datetime
-from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 from langgraph.graph import StateGraph, END
 from dotenv import load_dotenv
 import graphviz
 from django.contrib.auth.models import User
 
+from .db import get_db_connection
+from .detail_fields import PostingDetailCache, parse_detail_fields
+from .expiry import ExpirySweeper, active_condition, backfill_deadlines, create_deadline_index
+from .llm_gateway import LLMGateway
+from .metrics import CACHE_REQUESTS, LLM_REQUESTS, LLM_SECONDS, LLM_TOKENS, SEARCH_CORRECTIONS, SUGGESTIONS_SELECTED
+from .prompt_budget import fit_prompt
+from .render import (
+    JOB_DETAIL_FOOTER,
+    JOB_LIST_FOOTER,
+    JOB_LIST_LAST_FOOTER,
+    render_job_detail,
+    render_job_list,
+)
+from .recommend import create_recommendation_table, recommend_for_user
+from .retrieval import JobRetriever
+from .speculation import SPECULATIVE_ROUTING, Speculator
+from .tracing import span, traced_node
+from . import versions
+
 # Amazon Polly 관련 라이브러리 (이제 사용하지 않을 수도 있음)
 import boto3
 import uuid
@@ -17,6 +37,16 @@ import uuid
 load_dotenv()
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 LANGCHAIN_API_KEY = os.getenv('LANGCHAIN_API_KEY')
+# 상세 정보 응답을 LLM으로 한 번 더 다듬을지 여부 (기본: 템플릿 출력)
+DETAIL_LLM_POLISH = os.getenv('DETAIL_LLM_POLISH', 'false').lower() == 'true'
+# 하이브리드 검색 결과 최대 공고 수 (목록은 10개씩 보여줌)
+JOB_SEARCH_MAX_RESULTS = int(os.getenv('JOB_SEARCH_MAX_RESULTS', '300'))
+# 공고 검색 결과 컬럼 (render.py 의 목록 형식, 마지막 컬럼은 공고 id)
+JOB_RESULT_COLUMNS = """제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크,
+            주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차,
+            학력, 근무지역_상세, 마감일자, id"""
+
+logger = logging.getLogger(__name__)
 
 class State(TypedDict):
     user_id: str  # 사용자 id
@@ -27,6 +57,7 @@ class State(TypedDict):
     job_name: str  # 직무 이름 / 채용 공고 기능에서 사용
     selected_job: int  # 선택한 공고 번호
     index_job: int  # 더보기 기능을 위한 공고 index
+    job_result_set: Optional[int]  # 가장 최근 공고 검색 결과 번호 (순위 → 공고 id 매핑용)
     job_search: bool  # 공고 탐색 여부
     response: Optional[str]  # 챗봇 답변
     job_results: Optional[List[tuple]]  # 공고 질문 답변 출력 결과
@@ -43,29 +74,29 @@ class State(TypedDict):
     intent_interview: Optional[str]  # 면접 기능에서의 분기
     experience: Optional[str]  # 자기소개서에 반영할 경험
     job_name: Optional[str]  # 자기소개서에 반영할 직무 이름
+    suggestion: Optional[Dict[str, str]]  # 자동완성에서 고른 검색어 {"text", "kind"} (이번 턴에만 사용)
 
 class JobAssistantBot:
     def __init__(self):
         try:
-            self.db = pymysql.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT')),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                charset="utf8mb4"
-            )
-            print("DB 연결 성공")
-
-            self.llm = ChatOpenAI(
-                model="gpt-4o",
-                streaming=True,
-                temperature=0
-            )
-            print("OpenAI API 초기화 성공")
+            self.db = get_db_connection()
+            logger.info("DB 연결 성공")
+
+            # 분류 프롬프트는 fast 모델, 생성 프롬프트는 main 모델 (마감 시간, 헤지, 차단기 적용)
+            self.llm = LLMGateway()
+            logger.info("OpenAI API 초기화 성공")
+
+            # 사용자 id → (검색 번호, 순위별 (공고 id, 링크) 리스트, 확인한 순위 → (현재 공고 id, 링크), 저장한 공고 링크 집합)
+            self.job_rank_cache = {}
+            # 공고 id → 조회한 상세 정보
+            self.detail_cache = PostingDetailCache()
+            # 공고 하이브리드 검색 인덱스 (크롤링 후 python -m jumpit.retrieval build 로 생성)
+            self.retriever = JobRetriever(connection_factory=get_db_connection)
+            # 기본 분기 분류와 하위 분기 분류 동시 실행 (SPECULATIVE_ROUTING=true)
+            self.speculator = Speculator(self.ask) if SPECULATIVE_ROUTING else None
 
             self._initialize_prompts()
-            print("프롬프트 초기화 성공")
+            logger.info("프롬프트 초기화 성공")
             
             # self.create_and_save_customer_db()
             self.create_saved_jobs_table()
@@ -73,9 +104,15 @@ class JobAssistantBot:
             self.create_saved_cover_letter_table()
             self.create_saved_interview_question_table()
             self.create_personal_interview_question_table()
-            print("DB 초기화 완료")
-        except Exception as e:
-            print(f"초기화 중 오류 발생: {e}")
+            self.create_history_indexes()
+            create_recommendation_table(self.db)
+            self.create_deadline_columns()
+            logger.info("DB 초기화 완료")
+            # 크롤링 사이에 마감된 공고를 추천 결과/상세 정보 캐시에서 정리
+            self.expiry_sweeper = ExpirySweeper(get_db_connection, on_expired=[self._invalidate_expired])
+            self.expiry_sweeper.start()
+        except Exception:
+            logger.exception("초기화 중 오류 발생")
             raise
 
     def _initialize_prompts(self):
@@ -99,6 +136,8 @@ class JobAssistantBot:
               : 면접 연습을 요청
               : 사용자가 본인의 자기소개서를 입력하는 경우
               : 사용자가 본인의 자기소개서를 입력하고 면접 연습을 요청하는 경우
+            - RECOMMEND
+              : 직무나 키워드 없이 본인에게 맞는 공고 추천을 요청 (예: 나한테 맞는 공고 추천해줘, 맞춤 공고)
             - JOBNAME
               : 직무 이름만을 입력한 경우
               : 예: AI 개발자, 데이터 엔지니어 등
@@ -114,6 +153,9 @@ class JobAssistantBot:
             예시 입력: "4번 공고"
             예시 출력: COVER_LETTER
 
+            예시 입력: "나한테 맞는 공고 추천해줘"
+            예시 출력: RECOMMEND
+
             사용자 입력: {user_input}
             결과:""")
         
@@ -479,36 +521,67 @@ class JobAssistantBot:
     #     cursor.close()
     
     def create_saved_jobs_table(self):
-        """선택한 직무의 공고들 저장하는 DB"""
+        """사용자별 검색 결과의 공고 번호(순위) → (공고 id, 링크) 매핑 DB
+
+        다른 워커가 검색한 결과도 이 테이블로 찾으므로 서버(워커)가 시작할 때 비우지 않음
+        """
         cursor = self.db.cursor()
+        if not self._has_column(cursor, "saved_job_posting", "검색번호"):
+            # 순위 매핑 이전의 공고 복사본 테이블 (검색할 때마다 비우던 임시 결과라 한 번만 새 형식으로 교체)
+            logger.info("saved_job_posting 을 순위 매핑 형식으로 변환")
+            cursor.execute("DROP TABLE IF EXISTS saved_job_posting")
         create_table_query = """
         CREATE TABLE IF NOT EXISTS saved_job_posting (
-            id INT AUTO_INCREMENT PRIMARY KEY,
             customer_id VARCHAR(20),
-            제목 VARCHAR(255),
-            회사명 VARCHAR(255),
-            사용기술 TEXT,
-            근무지역 VARCHAR(255),
-            근로조건 VARCHAR(255),
-            모집기간 VARCHAR(255),
-            링크 TEXT,
+            검색번호 BIGINT,
+            순위 INT,
+            공고_id INT,
+            링크 VARCHAR(500),
             저장일시 DATETIME DEFAULT CONVERT_TZ(NOW(), 'UTC', 'Asia/Seoul'),
-            주요업무 TEXT,
-            자격요건 TEXT,
-            우대사항 TEXT,
-            복지_및_혜택 TEXT,
-            채용절차 TEXT,
-            학력 VARCHAR(255),
-            근무지역_상세 VARCHAR(255),
-            마감일자 VARCHAR(255),
+            PRIMARY KEY (customer_id, 검색번호, 순위),
             foreign key(customer_id) references customer (customer_id)
         )
         """
         cursor.execute(create_table_query)
-        cursor.execute("DELETE FROM saved_job_posting")
-        cursor.execute("ALTER TABLE saved_job_posting AUTO_INCREMENT = 1")
+        if not self._has_column(cursor, "saved_job_posting", "링크"):
+            # 링크 컬럼 추가 전에 만든 매핑 테이블
+            cursor.execute("ALTER TABLE saved_job_posting ADD COLUMN 링크 VARCHAR(500)")
         self.db.commit()
         cursor.close()
+
+    def create_deadline_columns(self):
+        """job_posting_new 의 마감일/상시채용 컬럼과 마감일 인덱스
+
+        크롤러가 이 컬럼을 만들기 전에 크롤링한 테이블이면 검색/추천의 마감 조건(active_condition)이
+        Unknown column 으로 실패하므로, 시작할 때 컬럼을 추가하고 마감일자/모집기간 원문으로 채움
+        """
+        cursor = self.db.cursor()
+        if not self._has_column(cursor, "job_posting_new", "id"):
+            logger.warning("job_posting_new 테이블이 없어 마감일 컬럼을 확인하지 않습니다. 크롤링 후 다시 시작하세요.")
+            cursor.close()
+            return
+        added = False
+        if not self._has_column(cursor, "job_posting_new", "마감일"):
+            cursor.execute("ALTER TABLE job_posting_new ADD COLUMN 마감일 DATE")
+            added = True
+        if not self._has_column(cursor, "job_posting_new", "상시채용"):
+            cursor.execute("ALTER TABLE job_posting_new ADD COLUMN 상시채용 TINYINT(1) DEFAULT 0")
+            added = True
+        self.db.commit()
+        cursor.close()
+        if added:
+            logger.info("job_posting_new 에 마감일 컬럼 추가, 공고 %d건 채움", backfill_deadlines(self.db))
+        create_deadline_index(self.db)
+
+    def _has_column(self, cursor, table, column):
+        """table 에 column 이 있는지 (테이블이 없어도 False)"""
+        try:
+            cursor.execute(f"SELECT {column} FROM {table} WHERE 1 = 0")
+            cursor.fetchall()
+            return True
+        except Exception:
+            self.db.rollback()
+            return False
     
     def create_selected_job_posting_table(self):
         """상세 정보 조회한 공고 저장하는 DB"""
@@ -590,11 +663,63 @@ class JobAssistantBot:
         self.db.commit()
         cursor.close()
 
+    def create_history_indexes(self):
+        """내역 조회 API 의 (customer_id, 저장일시, id) 페이지 조회용 인덱스"""
+        cursor = self.db.cursor()
+        for table in ("saved_cover_letter", "personal_interview_question", "selected_job_posting"):
+            try:
+                cursor.execute(f"CREATE INDEX idx_{table}_history ON {table} (customer_id, 저장일시, id)")
+                self.db.commit()
+            except Exception as e:
+                # 이미 만들어진 인덱스 (MySQL 은 CREATE INDEX IF NOT EXISTS 를 지원하지 않음)
+                logger.debug("인덱스 생성 생략: %s (%s)", table, e)
+        cursor.close()
+
+    def ask(self, template_name, **kwargs) -> str:
+        """프롬프트 템플릿 이름으로 LLM 호출 후 답변 반환 (템플릿별 토큰 예산 적용, 호출 시간, 토큰 수 기록)"""
+        prompt, budget_tokens = fit_prompt(template_name, getattr(self, template_name), kwargs)
+        started = time.perf_counter()
+        try:
+            with span(f"llm.{template_name}", kind="llm", template=template_name, prompt_chars=len(prompt),
+                      budget_tokens=budget_tokens) as current:
+                message, call = self.llm.invoke(template_name, prompt)
+                usage = getattr(message, "usage_metadata", None) or {}
+                current.set(
+                    **call,
+                    prompt_tokens=usage.get("input_tokens"),
+                    completion_tokens=usage.get("output_tokens"),
+                    completion_chars=len(str(message.content)),
+                )
+        except Exception:
+            LLM_REQUESTS.inc(template=template_name, status="error")
+            raise
+        finally:
+            LLM_SECONDS.observe(time.perf_counter() - started, template=template_name)
+        LLM_REQUESTS.inc(template=template_name, status="ok")
+        LLM_TOKENS.inc(usage.get("input_tokens") or 0, template=template_name, type="prompt")
+        LLM_TOKENS.inc(usage.get("output_tokens") or 0, template=template_name, type="completion")
+        return str(message.content)
+
+    def ask_sub(self, state: State, template_name) -> str:
+        """하위 분기 분류 (classify_intent 에서 미리 실행한 결과가 있으면 사용)"""
+        if self.speculator:
+            result = self.speculator.take(state["user_id"], template_name, state["user_input"])
+            if result is not None:
+                return result
+        return self.ask(template_name, user_input=state["user_input"])
+
     def classify_intent(self, state: State) -> State:
         """기본 분기 설정"""
-        intent = str(self.llm.invoke(self.intent_template.format(user_input=state["user_input"])).content).strip()
-        print('user_id:', state['user_id'])
-        print(f"Classified intent: {intent}")
+        if state.get("suggestion"):
+            # 자동완성에서 고른 검색어는 분류 없이 바로 공고 검색
+            return {**state, "intent": "JOB_SEARCH"}
+        if self.speculator:
+            intent = self.speculator.classify(
+                state, lambda: self.ask("intent_template", user_input=state["user_input"]).strip()
+            )
+        else:
+            intent = self.ask("intent_template", user_input=state["user_input"]).strip()
+        logger.debug("LLM intent: %s", intent, extra={"user_id": state['user_id']})
         if state["interview_in"] and state["intent_interview"]:
             intent = "INTERVIEW"
         if state["cover_letter_now"] and intent == "JOBNAME":
@@ -602,80 +727,253 @@ class JobAssistantBot:
             state["cover_letter_now"] = False
         elif intent == "JOBNAME":
             intent = "JOB_SEARCH"
-        if intent not in ["JOB_SEARCH", "COVER_LETTER", "INTERVIEW", "UNKNOWN"]:
+        if intent not in ["JOB_SEARCH", "COVER_LETTER", "INTERVIEW", "RECOMMEND", "UNKNOWN"]:
             intent = "UNKNOWN"
-        print(f"Classified intent: {intent}")
+        logger.info("Classified intent: %s", intent, extra={"user_id": state['user_id']})
+        if self.speculator:
+            self.speculator.settle(state['user_id'], intent)
         return {**state, "intent": intent}
     
     def search_job(self, state: State) -> State:
-        """선택한 직무의 공고 검색"""
-        cursor = self.db.cursor()
-        search_keyword = str(self.llm.invoke(self.jobname_extract_prompt.format(user_input=state["user_input"])).content).strip()
-        print(search_keyword)
-        search_keywords = [kw.strip() for kw in search_keyword.split(',') if kw.strip()]
-        print(search_keywords)
+        """선택한 직무의 공고 검색 (하이브리드 검색 인덱스가 있으면 순위 결합 결과, 없으면 LIKE 검색)"""
+        suggestion = state.get("suggestion")
+        if suggestion:
+            SUGGESTIONS_SELECTED.inc(kind=suggestion["kind"])
+            if suggestion["kind"] == "company":
+                return {**state, "job_results": self.fetch_company_jobs(suggestion["text"])}
+        if suggestion:
+            # 자동완성 제안은 인덱스 어휘 그대로이므로 LLM 키워드 추출/오타 교정 없이 검색
+            search_keywords = [suggestion["text"]]
+        else:
+            search_keyword = self.ask("jobname_extract_prompt", user_input=state["user_input"]).strip()
+            search_keywords = [kw.strip() for kw in search_keyword.split(',') if kw.strip()]
+        logger.debug("검색 키워드: %s", search_keywords)
         if not search_keywords:
             return {**state, "response": "검색할 직무 키워드를 입력해주세요."}
+        index = self.retriever.index()
+        if index is None:
+            # 인덱스가 없으면 키워드 LIKE 검색
+            return {**state, "job_results": self.like_search(search_keywords)}
+
+        # 키워드 일치 + 입력 문장 전체의 벡터 유사도 (다른 표현, 경험 위주 질문 대응)
+        # 입력에 지역/연차가 있으면 ("서울 강남 신입") 패싯 비트맵으로 그 조건의 공고만 검색, 마감된 공고는 항상 제외
+        allowed = index.facets.active()
+        text_filter = index.facets.filters_from_text(state["user_input"])
+        if text_filter is not None:
+            allowed = allowed & text_filter
+        # 어휘에 없는 단어가 있고 원래 키워드로는 일치하는 공고가 없으면 오타 교정 후 검색 ("백앤드" → "백엔드")
+        # (벡터 결과만 남는 경우도 포함, 사용자가 다시 입력하지 않아도 됨)
+        correction = None
+        corrected, changes = index.fuzzy.correct_keywords(search_keywords) if not suggestion else ([], {})
+        if changes and not index.lexical(search_keywords):
+            logger.debug("검색어 교정: %s", changes)
+            search_keywords = corrected
+            correction = ", ".join(f"'{word}' → '{fixed}'" for word, fixed in changes.items())
+        with span("retrieval.hybrid", kind="search", keywords=len(search_keywords), corrected=bool(correction)) as current:
+            job_ids = index.search(search_keywords, f"{state['user_input']} {' '.join(search_keywords)}",
+                                   allowed=allowed)
+            job_ids = job_ids[:JOB_SEARCH_MAX_RESULTS]
+            current.set(results=len(job_ids))
+        if correction:
+            SEARCH_CORRECTIONS.inc(result="found" if job_ids else "empty")
+        result = self.fetch_jobs_by_id(job_ids)
+        if len(result) != len(job_ids) or not all(index.same_posting(row[-1], row[6]) for row in result):
+            # 인덱스를 만든 뒤 다시 크롤링한 테이블 (크롤링 중이거나 인덱스 생성 실패): 같은 id 가 다른 공고
+            logger.warning("공고 인덱스가 현재 공고 테이블과 다릅니다. 키워드 LIKE 검색으로 대체")
+            return {**state, "job_results": self.like_search(search_keywords)}
+        return {**state, "job_results": result, "search_correction": correction}
+
+    def like_search(self, search_keywords):
+        """제목/사용기술 LIKE 검색 (인덱스가 없거나 공고 테이블과 맞지 않을 때)"""
+        cursor = self.db.cursor()
         conditions = " OR ".join(["(제목 LIKE %s OR 사용기술 LIKE %s)" for _ in search_keywords])
         params = [f"%{keyword}%" for keyword in search_keywords for _ in range(2)]
-        print(conditions, params)
+        logger.debug("공고 검색 조건", extra={"conditions": conditions, "params": params, "sample": True})
         query = f"""
-        SELECT 제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크,
-            주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차, 
-            학력, 근무지역_상세, 마감일자
+        SELECT {JOB_RESULT_COLUMNS}
         FROM job_posting_new
-        WHERE {conditions}
+        WHERE ({conditions}) AND {active_condition()}
         """
         cursor.execute(query, params)
         result = cursor.fetchall()
         cursor.close()
-        return {**state, "job_results": result}
-    
-    def search_select_job(self, state: State) -> Dict:
-        """선택한 공고의 상세 정보 검색"""
+        return result
+
+    def fetch_company_jobs(self, company):
+        """회사명이 같은 마감 전 공고, 최신 공고 순 (자동완성에서 회사를 고른 경우)"""
         cursor = self.db.cursor()
-        query = """
-        SELECT 제목, 사용기술, 주요업무, 자격요건, 우대사항
-        FROM saved_job_posting
-        WHERE id = %s AND customer_id = %s
-        """
-        # print(query)
-        cursor.execute(query, (state['selected_job'], state['user_id'],))
+        cursor.execute(f"""
+        SELECT {JOB_RESULT_COLUMNS}
+        FROM job_posting_new
+        WHERE 회사명 = %s AND {active_condition()}
+        ORDER BY id DESC
+        LIMIT %s
+        """, (company, JOB_SEARCH_MAX_RESULTS))
         result = cursor.fetchall()
         cursor.close()
-        # print(result)
-        if result:
-            return {
-                'job_name': result[0][0],
-                'tech_stack': result[0][1],
-                'job_desc': result[0][2],
-                'requirements': result[0][3],
-                'preferences': result[0][4]
-            }
+        return result
+
+    def _invalidate_expired(self, job_ids):
+        """스위퍼 콜백: 마감된 공고의 상세 정보 캐시 삭제"""
+        for job_id in job_ids:
+            self.detail_cache.invalidate(job_id)
+
+    def fetch_jobs_by_id(self, job_ids):
+        """공고 id 목록 → 검색 결과 형식의 행 목록 (id 순서 유지, 그 사이 삭제된 공고는 제외)"""
+        if not job_ids:
+            return []
+        cursor = self.db.cursor()
+        query = f"""
+        SELECT {JOB_RESULT_COLUMNS}
+        FROM job_posting_new
+        WHERE id IN ({", ".join(["%s"] * len(job_ids))})
+        """
+        cursor.execute(query, job_ids)
+        rows = {row[-1]: row for row in cursor.fetchall()}
+        cursor.close()
+        return [rows[job_id] for job_id in job_ids if job_id in rows]
+
+    def resolve_job_id(self, state: State, num):
+        """공고 번호(순위)를 사용자의 최근 검색 결과 기준 현재 job_posting_new 공고 id로 변환"""
+        job = self.resolve_job(state, num)
+        return job[0] if job else None
+
+    def resolve_job(self, state: State, num):
+        """공고 번호(순위) → (현재 공고 id, 링크), 찾을 수 없으면 None
+
+        확인한 (id, 링크) 는 순위 캐시에 남겨 같은 번호를 다시 조회할 때 DB 를 거치지 않음
+        (id 로 조회하는 쿼리는 링크도 함께 확인하고, 다르면 forget_job 후 다시 찾음)
+        """
+        result_set = state.get('job_result_set')
+        if not result_set or not num or num < 1:
+            return None
+        cached = self._rank_cache(state)
+        if cached and num in cached[2]:
+            CACHE_REQUESTS.inc(cache="job_rank", result="hit")
+            return cached[2][num]
+        if cached and cached[1] is not None:
+            CACHE_REQUESTS.inc(cache="job_rank", result="hit")
+            jobs = cached[1]
+            if num > len(jobs):
+                return None
+            job_id, link = jobs[num - 1]
+        else:
+            CACHE_REQUESTS.inc(cache="job_rank", result="miss")
+            # 다른 워커에서 검색한 경우 (customer_id, 검색번호, 순위) 기본 키로 조회
+            cursor = self.db.cursor()
+            query = """
+            SELECT 공고_id, 링크
+            FROM saved_job_posting
+            WHERE customer_id = %s AND 검색번호 = %s AND 순위 = %s
+            """
+            cursor.execute(query, (state['user_id'], result_set, num))
+            result = cursor.fetchone()
+            cursor.close()
+            if not result:
+                return None
+            job_id, link = result
+        job_id = self.current_job_id(job_id, link)
+        if job_id is None:
+            return None
+        if cached is None:
+            previous = self.job_rank_cache.get(state['user_id'])
+            # 검색 번호는 검색 시각이라 더 최근 검색이면 교체 (순위 목록 없이 확인한 순위만 캐시)
+            if previous is not None and previous[0] > result_set:
+                return (job_id, link)
+            cached = self.job_rank_cache[state['user_id']] = (result_set, None, {}, set())
+        cached[2][num] = (job_id, link)
+        return (job_id, link)
+
+    def _rank_cache(self, state: State):
+        """state 의 검색 결과에 해당하는 순위 캐시, 없거나 다른 검색이면 None"""
+        cached = self.job_rank_cache.get(state['user_id'])
+        return cached if cached and cached[0] == state.get('job_result_set') else None
+
+    def forget_job(self, state: State, num):
+        """확인해 둔 순위의 공고 삭제 (다시 크롤링되어 id 가 바뀐 경우), 삭제했으면 True"""
+        cached = self._rank_cache(state)
+        return bool(cached) and cached[2].pop(num, None) is not None
+
+    def current_job_id(self, job_id, link):
+        """검색 당시의 (공고 id, 링크) → 지금 job_posting_new 에서 그 공고의 id
+
+        크롤링할 때마다 job_posting_new 를 다시 만들어 같은 id 가 다른 공고를 가리킬 수 있으므로 링크로 확인하고,
+        id 가 바뀌었으면 링크로 다시 찾음 (크롤링 중이거나 빠진 공고, 링크 없이 저장된 매핑이면 None)
+        """
+        if not link:
+            return None
+        cursor = self.db.cursor()
+        cursor.execute("SELECT id FROM job_posting_new WHERE id = %s AND 링크 = %s", (job_id, link))
+        result = cursor.fetchone()
+        if result is None:
+            cursor.execute("SELECT id FROM job_posting_new WHERE 링크 = %s ORDER BY id DESC LIMIT 1", (link,))
+            result = cursor.fetchone()
+        cursor.close()
+        return result[0] if result else None
+
+    def search_select_job(self, state: State) -> Dict:
+        """선택한 공고의 상세 정보 검색"""
+        for _ in range(2):
+            job = self.resolve_job(state, state['selected_job'])
+            if job is None:
+                return None
+            cursor = self.db.cursor()
+            query = f"""
+            SELECT 제목, 사용기술, 주요업무, 자격요건, 우대사항, {active_condition()}
+            FROM job_posting_new
+            WHERE id = %s AND 링크 = %s
+            """
+            cursor.execute(query, job)
+            result = cursor.fetchall()
+            cursor.close()
+            if result:
+                return {
+                    'job_name': result[0][0],
+                    'tech_stack': result[0][1],
+                    'job_desc': result[0][2],
+                    'requirements': result[0][3],
+                    'preferences': result[0][4],
+                    # 검색 이후 마감된 공고 (자기소개서 작성 전에 안내)
+                    'expired': not result[0][5]
+                }
+            # 확인해 둔 공고 id 가 그 사이 다시 크롤링되어 바뀐 경우 링크로 다시 찾음
+            if not self.forget_job(state, state['selected_job']):
+                return None
         return None
     
     def search_select_save_job(self, num, state: State):
-        """상세 정보 조회 혹은 자기소개서 작성에서 선택한 공고 저장을 위한 조회"""
-        cursor = self.db.cursor()
-        get_job_query = """
-        SELECT 제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크, 주요업무, 자격요건,
-            우대사항, 복지_및_혜택, 채용절차, 학력, 근무지역_상세, 마감일자
-        FROM (
-            SELECT *, ROW_NUMBER() OVER (ORDER BY id ASC) AS rn
-            FROM saved_job_posting
-        ) AS numbered_jobs
-        WHERE rn = %s
+        """상세 정보 조회 혹은 자기소개서 작성에서 선택한 공고 저장, 선택한 공고 (id, 링크) 반환
+
+        이 워커에서 이미 저장했거나 저장된 것을 확인한 공고는 DB 를 거치지 않음
         """
-        cursor.execute(get_job_query, (num,))
-        job_data = cursor.fetchone()
-        print(job_data)
+        for _ in range(2):
+            job = self.resolve_job(state, num)
+            if job is None:
+                break
+            cached = self._rank_cache(state)
+            if cached and job[1] in cached[3]:
+                return job
+            if self.save_selected_job(state['user_id'], *job):
+                if cached:
+                    cached[3].add(job[1])
+                return job
+            # 확인해 둔 공고 id 가 그 사이 다시 크롤링되어 바뀐 경우 링크로 다시 찾음
+            if not self.forget_job(state, num):
+                break
+        logger.info("공고 %s번을 찾을 수 없습니다.", num)
+        return None
 
+    def save_selected_job(self, user_id, job_id, link):
+        """공고를 selected_job_posting 에 저장 (이미 있으면 그대로), job_posting_new 에 (id, 링크) 공고가 없으면 False"""
+        cursor = self.db.cursor()
         check_query = """
         SELECT EXISTS(
-            SELECT 1 FROM selected_job_posting WHERE customer_id = %s AND 제목 = %s AND 회사명 = %s
+            SELECT 1 FROM selected_job_posting s
+            JOIN job_posting_new j ON j.제목 = s.제목 AND j.회사명 = s.회사명
+            WHERE s.customer_id = %s AND j.id = %s AND j.링크 = %s
         )
         """
-        cursor.execute(check_query, (state['user_id'], job_data[0], job_data[1]))
+        cursor.execute(check_query, (user_id, job_id, link))
         exists = cursor.fetchone()[0]
 
         if not exists:
@@ -685,19 +983,47 @@ class JobAssistantBot:
                 근로조건, 모집기간, 링크, 주요업무, 자격요건,
                 우대사항, 복지_및_혜택, 채용절차, 학력,
                 근무지역_상세, 마감일자
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            )
+            SELECT %s, 제목, 회사명, 사용기술, 근무지역,
+                근로조건, 모집기간, 링크, 주요업무, 자격요건,
+                우대사항, 복지_및_혜택, 채용절차, 학력,
+                근무지역_상세, 마감일자
+            FROM job_posting_new
+            WHERE id = %s AND 링크 = %s
             """
-            cursor.execute(save_selected_job_query, (
-                state['user_id'], job_data[0], job_data[1], job_data[2],
-                job_data[3], job_data[4], job_data[5], job_data[6],
-                job_data[7], job_data[8], job_data[9], job_data[10],
-                job_data[11], job_data[12], job_data[13], job_data[14]
-            ))
+            inserted = cursor.execute(save_selected_job_query, (user_id, job_id, link))
             self.db.commit()
-            cursor.close()
-            print(f"공고 {num}번이 selected_job_posting 테이블에 저장되었습니다.")
+            if not inserted:
+                cursor.close()
+                return False
+            versions.bump(versions.JOB_POSTINGS, user_id)
+            logger.debug("공고 %s 이(가) selected_job_posting 테이블에 저장되었습니다.", job_id)
         else:
-            print(f"공고 {num}번은 이미 존재합니다. 삽입하지 않습니다.")
+            logger.debug("공고 %s 은(는) 이미 존재합니다. 삽입하지 않습니다.", job_id)
+        cursor.close()
+        return True
+
+    def fetch_job_detail(self, job_id, link, columns):
+        """공고 상세 정보 조회 (캐시에 없는 컬럼만 기본 키로 조회, 링크가 달라졌으면 다시 크롤링된 다른 공고이므로 None)"""
+        detail = self.detail_cache.get(job_id, link)
+        missing = detail.missing(columns)
+        CACHE_REQUESTS.inc(cache="posting_detail", result="miss" if missing else "hit")
+        if missing:
+            # columns 는 parse_detail_fields 로 검증된 컬럼 이름만 포함
+            query = f"""
+            SELECT {', '.join(missing)}
+            FROM job_posting_new
+            WHERE id = %s AND 링크 = %s
+            """
+            cursor = self.db.cursor()
+            cursor.execute(query, (job_id, link))
+            result = cursor.fetchone()
+            cursor.close()
+            if not result:
+                self.detail_cache.invalidate(job_id)
+                return None
+            detail.fields.update(zip(missing, result))
+        return detail
 
     def search_cover_letter(self, state: State) -> State:
         """작성한 가장 최근 자기소개서 검색"""
@@ -724,6 +1050,7 @@ class JobAssistantBot:
             SELECT 면접질문
             FROM saved_interview_question
             WHERE customer_id = %s
+            ORDER BY id
             """
             cursor.execute(query, (state['user_id'],))
             result = cursor.fetchall()
@@ -732,27 +1059,28 @@ class JobAssistantBot:
                 return {**state, "interview_q": []}
             questions = [row[0] for row in result]
             return {**state, "interview_q": questions}
-        except Exception as e:
-            print(f'에러 발생: {e}')
+        except Exception:
+            logger.exception("에러 발생")
     
     def save_jobs_to_table(self, user_id, jobs):
-        """검색한 공고들 저장"""
+        """검색한 공고들의 순위 → (공고 id, 링크) 매핑 저장, 새 검색 번호 반환"""
+        result_set = time.time_ns() // 1000
+        # 링크: 다시 크롤링해 id 가 바뀌어도 같은 공고를 찾는 키
+        ranked = [(job[15], job[6]) for job in jobs]
         cursor = self.db.cursor()
-        cursor.execute("DELETE FROM saved_job_posting")
-        self.db.commit()
+        # 다른 사용자의 검색 결과는 건드리지 않고 해당 사용자의 이전 결과만 교체
+        cursor.execute("DELETE FROM saved_job_posting WHERE customer_id = %s", (user_id,))
         insert_query = """
-        INSERT INTO saved_job_posting
-        (customer_id, 제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크, 
-         주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차,
-         학력, 근무지역_상세, 마감일자)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 
-                %s, %s, %s, %s, %s, 
-                %s, %s, %s)
+        INSERT INTO saved_job_posting (customer_id, 검색번호, 순위, 공고_id, 링크)
+        VALUES (%s, %s, %s, %s, %s)
         """
-        for job in jobs:
-            cursor.execute(insert_query, (user_id, *job))
+        cursor.executemany(insert_query, [
+            (user_id, result_set, rank, job_id, link) for rank, (job_id, link) in enumerate(ranked, 1)
+        ])
         self.db.commit()
         cursor.close()
+        self.job_rank_cache[user_id] = (result_set, ranked, {}, set())
+        return result_set
     
     def save_cover_letter_to_table(self, user_id, job_name, cover_letter):
         """작성한 자기소개서 저장"""
@@ -763,6 +1091,7 @@ class JobAssistantBot:
         """
         cursor.execute(query, (user_id, job_name, cover_letter))
         self.db.commit()
+        versions.bump(versions.RESUMES, user_id)
         cursor.close()
     
     def save_interview_question_to_table(self, user_id, interview_question):
@@ -782,57 +1111,48 @@ class JobAssistantBot:
             cursor.execute(save_personal_query, (user_id, interview_question))
             
             self.db.commit()
-        except Exception as e:
-            print(f"질문 저장 중 에러 발생: {e}")
+            versions.bump(versions.INTERVIEWS, user_id)
+        except Exception:
+            logger.exception("질문 저장 중 에러 발생")
         finally:
             cursor.close()
     
     def search_job_chat(self, state: State) -> State:
         """공고 검색 기능"""
-        search_road, num = self.llm.invoke(self.search_job_prompt.format(user_input=state["user_input"])).content.split(',')
-        num = int(num.strip())
-        print('채용공고 분기:', search_road, num)
+        if state.get("suggestion"):
+            # 자동완성에서 고른 검색어: 하위 분기/직무 포함 여부 분류 없이 공고 제공
+            search_road, num = "채용 공고 제공", 0
+        else:
+            search_road, num = self.ask_sub(state, "search_job_prompt").split(',')
+            num = int(num.strip())
+        logger.debug("채용공고 분기: %s %s", search_road, num)
         response = ""
 
         if search_road == "채용 공고 제공":
-            jobname_validate = str(self.llm.invoke(self.jobname_prompt.format(user_input=state["user_input"])).content).strip()
-            print(jobname_validate)
+            if state.get("suggestion"):
+                jobname_validate = "include"
+            else:
+                jobname_validate = self.ask("jobname_prompt", user_input=state["user_input"]).strip()
+            logger.debug("직무 키워드 포함 여부: %s", jobname_validate)
             if jobname_validate == "not_include":
                 return {**state, "response": "탐색을 원하는 직무를 입력해주세요."}
             else:
-                self.create_saved_jobs_table()
-                print("테이블 생성 완료")
                 search_result = self.search_job(state)
-                print("공고 검색 완료")
+                logger.debug("공고 검색 완료")
                 if search_result.get("response") and search_result.get("response") == "검색할 직무 키워드를 입력해주세요.":
                     return search_result
                 result = search_result.get("job_results", [])
-                self.save_jobs_to_table(state['user_id'], result)
+                state["job_result_set"] = self.save_jobs_to_table(state['user_id'], result)
                 if result:
                     state["job_results"] = result  # 검색 결과를 저장
                     state["index_job"] = 0  # 처음에는 0부터 시작
-                    for i, job in enumerate(result[:10], 1):
-                        response += (
-                            f"{i}.  {job[0]}\n"
-                            f"회사명: {job[1]}\n"
-                            f"기술스택: {job[2]}\n"
-                            f"근무지: {job[3]}\n"
-                            f"조건: {job[4]}\n"
-                            f"모집기간: {job[5]}\n"
-                            f"[지원 링크] {job[6]}\n\n"
-                        )
-                    response += (
-                        "✅ 더 많은 공고를 원하시면 추가 공고를 요청해주세요.\n"
-                        "✅ 다른 직무의 공고 검색을 원하시면, 직무 이름을 입력해주세요.\n"
-                        "✅ 상세 정보를 원하시면, ❗공고 번호와 함께❗ 상세 정보를 요청해주세요.\n"
-                        "✅ 열람 가능한 상세 정보에는 주요업무, 자격요건, 우대사항, 복지 및 혜택, 채용절차, 학력요건, 근무지역 상세, 마감일자가 있습니다.\n"
-                        "🧾 자기소개서 작성을 원하시면, ❗공고 번호와 함께❗ 자기소개서 작성을 요청해주세요.\n"
-                        "🗨️ 면접 연습을 원하시면, 면접 연습을 요청해주세요."
-                    )
+                    response = render_job_list(result[:10]) + JOB_LIST_FOOTER
+                    if search_result.get("search_correction"):
+                        response = f"🔎 {search_result['search_correction']} (으)로 고쳐서 검색했습니다.\n\n" + response
                     state["index_job"] = 10  # 10개까지 보여줬다고 상태 저장
                     return {**state, "response": response, "selected_job": num, "job_search": True}
                 else:
-                    return {**state, "response": "관련된 채용 공고를 찾지 못했습니다."}
+                    return {**state, "response": "관련된 채용 공고를 찾지 못했습니다.", "job_results": []}
 
         elif search_road == "채용 공고 추가 제공":
             if "job_results" not in state or not state["job_results"]:
@@ -845,70 +1165,40 @@ class JobAssistantBot:
             if start_index >= len(job_list):
                 return {**state, "response": "더 이상 공고가 없습니다.", "job_search": True}
 
-            response = ""
-            for i, job in enumerate(job_list[start_index:end_index], start_index + 1):
-                response += (
-                    f"{i}.  {job[0]}\n"
-                    f"회사명: {job[1]}\n"
-                    f"기술스택: {job[2]}\n"
-                    f"근무지: {job[3]}\n"
-                    f"조건: {job[4]}\n"
-                    f"모집기간: {job[5]}\n"
-                    f"[지원 링크] {job[6]}\n\n"
-                )
+            response = render_job_list(job_list[start_index:end_index], start_index)
 
             if end_index < len(job_list):
-                response += (
-                    "✅ 더 많은 공고를 원하시면 추가 공고를 요청해주세요.\n"
-                    "✅ 다른 직무의 공고 검색을 원하시면, 직무 이름을 입력해주세요.\n"
-                    "✅ 상세 정보를 원하시면, ❗공고 번호와 함께❗ 상세 정보를 요청해주세요.\n"
-                    "✅ 열람 가능한 상세 정보에는 주요업무, 자격요건, 우대사항, 복지 및 혜택, 채용절차, 학력요건, 근무지역 상세, 마감일자가 있습니다.\n"
-                    "🧾 자기소개서 작성을 원하시면, ❗공고 번호와 함께❗ 자기소개서 작성을 요청해주세요.\n"
-                    "🗨️ 면접 연습을 원하시면, 면접 연습을 요청해주세요."
-                )
+                response += JOB_LIST_FOOTER
                 state["index_job"] = end_index  # 다음 요청에서 이어서 제공
             else:
-                response += (
-                    "❌ 더 이상 공고가 없습니다.\n"
-                    "✅ 다른 직무의 공고 검색을 원하시면, 직무 이름을 입력해주세요.\n"
-                    "✅ 상세 정보를 원하시면, ❗공고 번호와 함께❗ 상세 정보를 요청해주세요.\n"
-                    "✅ 열람 가능한 상세 정보에는 주요업무, 자격요건, 우대사항, 복지 및 혜택, 채용절차, 학력요건, 근무지역 상세, 마감일자가 있습니다.\n"
-                    "🧾 자기소개서 작성을 원하시면, ❗공고 번호와 함께❗ 자기소개서 작성을 요청해주세요.\n"
-                    "🗨️ 면접 연습을 원하시면, 면접 연습을 요청해주세요."
-                )
+                response += JOB_LIST_LAST_FOOTER
 
             return {**state, "response": response, "job_search": True}
 
 
         elif search_road == "상세 정보":
-            self.create_selected_job_posting_table()
-            print("조회한 상세 정보 테이블 생성 완료")
-            self.search_select_save_job(num, state) 
-
-            moreinfo = self.llm.invoke(self.moreinfo_extract_prompt.format(user_input=state["user_input"])).content
-            moreinfo_list = moreinfo.split(',')
-            field_name = ', '.join(mi.strip() for mi in moreinfo_list)
-            moreinfo_query = f"""
-            SELECT {field_name} 
-            FROM (
-                SELECT {field_name}, ROW_NUMBER() OVER (ORDER BY id ASC) AS rn
-                FROM saved_job_posting
-            ) AS numbered_jobs
-            WHERE rn = %s
-            """
-            cursor = self.db.cursor()
-            cursor.execute(moreinfo_query, (num,))
-            result = cursor.fetchone()
-            cursor.close() 
+            # selected_job_posting 은 시작할 때 생성 (같은 공고를 다시 조회하면 DB 를 거치지 않음)
+            job = self.search_select_save_job(num, state)
+            if job is None:
+                return {**state, "response": "선택하신 상세 정보가 없습니다."}
 
-            if result:
-                extracted_info = "\n".join(f"{name}: {detail}" for name, detail in zip(moreinfo_list, result))
-                response = str(self.llm.invoke(self.natural_response.format(extracted_info=extracted_info)).content).strip()
-                response += (
-                    "\n\n✅ 다른 직무의 공고 검색을 원하시면, 직무 이름을 입력해주세요.\n"
-                    "🧾 해당 공고로 자기소개서 작성을 원하시면, 자기소개서 작성을 요청해주세요.\n"
-                    "🗨️ 면접 연습을 원하시면, 면접 연습을 요청해주세요."
-                )
+            moreinfo = self.ask("moreinfo_extract_prompt", user_input=state["user_input"])
+            columns = parse_detail_fields(moreinfo) or parse_detail_fields(state["user_input"])
+            if not columns:
+                return {**state, "response": "선택하신 상세 정보가 없습니다."}
+            detail = self.fetch_job_detail(*job, columns)
+            if detail is None and self.forget_job(state, num):
+                # 확인해 둔 공고 id 가 그 사이 다시 크롤링되어 바뀐 경우 링크로 다시 찾음
+                job = self.resolve_job(state, num)
+                detail = self.fetch_job_detail(*job, columns) if job else None
+
+            if detail:
+                if DETAIL_LLM_POLISH:
+                    extracted_info = "\n".join(f"{name}: {value}" for name, value in detail.items(columns))
+                    response = self.ask("natural_response", extracted_info=extracted_info).strip()
+                else:
+                    response = render_job_detail(detail.items(columns))
+                response += JOB_DETAIL_FOOTER
                 return {**state, "response": response, "selected_job": num, "job_search": True}
             else:
                 return {**state, "response": "선택하신 상세 정보가 없습니다."}
@@ -920,12 +1210,12 @@ class JobAssistantBot:
     def cover_letter_chat(self, state: State) -> State:
         """자기소개서 작성 기능"""
         try:
-            cl_road, num = str(self.llm.invoke(self.cover_letter_prompt.format(user_input=state["user_input"])).content).split(',')
+            cl_road, num = self.ask_sub(state, "cover_letter_prompt").split(',')
             cl_road = cl_road.strip()
             num = int(num.strip())
-        except Exception as e:
-            print(f'에러 발생: {e}')
-        print("자기소개서 분기", cl_road, num)
+        except Exception:
+            logger.exception("자기소개서 분기 파싱 중 에러 발생")
+        logger.debug("자기소개서 분기: %s %s", cl_road, num)
         response = ""
         if num and num > 0:
             state['selected_job'] = num
@@ -933,23 +1223,22 @@ class JobAssistantBot:
             num = state['selected_job']
         if cl_road == "자기소개서 작성":
             if state["job_search"]:
-                print('채용 공고 검색함')
-                job_exp = str(self.llm.invoke(self.experience_prompt.format(user_input=state["user_input"])).content).strip()
-                print('자기소개서 분기: ', job_exp)
-                print(state['selected_job'])
+                logger.debug("채용 공고 검색함")
+                job_exp = self.ask("experience_prompt", user_input=state["user_input"]).strip()
+                logger.debug("자기소개서 경험 분기: %s", job_exp, extra={"selected_job": state['selected_job']})
                 if state['selected_job'] and state['selected_job'] > 0:
 
                     self.create_selected_job_posting_table()
-                    print("조회한 상세 정보 테이블 생성 완료")
+                    logger.debug("조회한 상세 정보 테이블 생성 완료")
                     self.search_select_save_job(state['selected_job'], state)
 
                     if job_exp in ['experience_include']:
                         job_info = self.search_select_job(state)
                         if not job_info:
                             return {**state, "response": "선택한 공고를 찾을 수 없습니다."}
-                        cover_letter_writing = str(self.llm.invoke(
-                            self.cover_letter_write.format(**job_info, user_input=state["user_input"])
-                        ).content).strip()
+                        if job_info.pop('expired'):
+                            return {**state, "response": "선택한 공고는 모집이 마감되었습니다. 다른 공고 번호를 입력해주세요."}
+                        cover_letter_writing = self.ask("cover_letter_write", **job_info, user_input=state["user_input"]).strip()
                         self.create_saved_cover_letter_table()
                         self.save_cover_letter_to_table(state['user_id'], job_info['job_name'], cover_letter_writing)
                         response += cover_letter_writing
@@ -964,10 +1253,10 @@ class JobAssistantBot:
                 else:
                     return {**state, "response": "자기소개서 작성에 참고할 공고 번호를 입력해주세요.", "experience": state['user_input']}
             else:
-                print('채용 공고 검색하지 않음')
-                job_exp = str(self.llm.invoke(self.experience_prompt_without_job.format(user_input=state["user_input"])).content).strip()
+                logger.debug("채용 공고 검색하지 않음")
+                job_exp = self.ask("experience_prompt_without_job", user_input=state["user_input"]).strip()
                 if job_exp == 'all_include' or (job_exp == 'job_include' and state['experience']) or (job_exp == 'experience_include' and state['job_name']):
-                    cover_letter_writing = str(self.llm.invoke(self.cover_letter_write_without_job.format(user_input=state["user_input"])).content).strip()
+                    cover_letter_writing = self.ask("cover_letter_write_without_job", user_input=state["user_input"]).strip()
                     self.create_saved_cover_letter_table()
                     self.save_cover_letter_to_table(state['user_id'], '자체 자기소개서', cover_letter_writing)
                     response += cover_letter_writing
@@ -989,12 +1278,11 @@ class JobAssistantBot:
             if not state["cover_letter_in"]:
                 return {**state, "response": "작성된 자기소개서가 없습니다. 먼저 작성해주세요."}
             state = self.search_cover_letter(state)
-            refine_cover_letter = str(self.llm.invoke(
-                self.cover_letter_refine.format(
-                    user_input=state["user_input"],
-                    previous_response=state["cover_letter"]
-                )
-            ).content).strip()
+            refine_cover_letter = self.ask(
+                "cover_letter_refine",
+                user_input=state["user_input"],
+                previous_response=state["cover_letter"]
+            ).strip()
             self.save_cover_letter_to_table(state['user_id'], '수정본', refine_cover_letter)
             response += refine_cover_letter
             response += (
@@ -1012,9 +1300,7 @@ class JobAssistantBot:
             self.create_saved_interview_question_table()
             self.create_personal_interview_question_table()
             current_intent = state.get('intent_interview')
-            interview_road = str(self.llm.invoke(
-                self.interview_intent.format(user_input=state["user_input"])
-            ).content).strip()
+            interview_road = self.ask_sub(state, "interview_intent").strip()
             if current_intent in ['INTERVIEW', 'TENACITY', 'TECHNOLOGY']:
                 if interview_road == "종료":
                     return {**state, "response": "면접 연습을 종료합니다.", "intent_interview": "END", "interview_in": False}
@@ -1023,13 +1309,13 @@ class JobAssistantBot:
                     pass
                 else:
                     return {**state, "intent_interview": current_intent, "interview_in": True}
-            print("면접 분기: ", interview_road)
+            logger.debug("면접 분기: %s", interview_road)
             if interview_road == '인성 면접':
                 return {**state, "intent_interview": "TENACITY", "interview_in": True}
             elif interview_road == '기술 면접':
                 if not state.get('cover_letter_in'):
-                    self_cl = str(self.llm.invoke(self.interview_cover_letter.format(user_input=state["user_input"])).content).strip()
-                    print(self_cl)
+                    self_cl = self.ask("interview_cover_letter", user_input=state["user_input"]).strip()
+                    logger.debug("자기소개서 입력 여부 판단", extra={"result": self_cl, "sample": True})
                     if self_cl == "없음":
                         return {**state, "response": "기술 면접을 위해서는 먼저 자기소개서가 필요합니다.", "intent_interview": "END"}
                     else:
@@ -1042,8 +1328,8 @@ class JobAssistantBot:
                 return {**state, "response": "면접 연습을 종료합니다.", "intent_interview": "END", "interview_in": False}
             else:
                 return {**state, "intent_interview": "check_intent", "interview_in": False}
-        except Exception as e:
-            print(f'에러 발생: {e}')
+        except Exception:
+            logger.exception("에러 발생")
     
     def tenacity_interview(self, state: State) -> State:
         """인성 면접 기능"""
@@ -1051,19 +1337,18 @@ class JobAssistantBot:
             if state['interview_in']:
                 self.create_saved_interview_question_table()
                 search_result = self.search_interview_question(state)
-                print("면접 질문 검색 완료")
+                logger.debug("면접 질문 검색 완료")
             questions = search_result.get("interview_q", [])
-            response_text = str(self.llm.invoke(
-                self.interview_tenacity.format(
-                    user_input=state['user_input'], 
-                    interview_history=questions
-                )
-            ).content).strip()
+            response_text = self.ask(
+                "interview_tenacity",
+                user_input=state['user_input'],
+                interview_history=questions
+            ).strip()
             self.save_interview_question_to_table(state['user_id'], response_text)
             # TTS 파일 생성 대신 단순히 응답 텍스트 반환
             return {**state, "response": response_text, "intent_interview": "TENACITY", "interview_in": True}
-        except Exception as e:
-            print(f'에러 발생: {e}')
+        except Exception:
+            logger.exception("에러 발생")
     
     def technology_interview(self, state: State) -> State:
         """기술 면접 기능"""
@@ -1071,7 +1356,7 @@ class JobAssistantBot:
             if state['interview_in']:
                 self.create_saved_interview_question_table()
                 search_result = self.search_interview_question(state)
-                print("면접 질문 검색 완료")
+                logger.debug("면접 질문 검색 완료")
             if state['cover_letter_in']:
                 # self.create_saved_cover_letter_table()
                 state = self.search_cover_letter(state)
@@ -1080,19 +1365,31 @@ class JobAssistantBot:
             else:
                 return {**state, "response": "자기소개서가 없습니다.", "intent_interview": "END"}
             questions = search_result.get("interview_q", [])
-            response_text = str(self.llm.invoke(
-                self.interview_technology.format(
-                    user_input=state['user_input'], 
-                    interview_history=questions, 
-                    cover_letter=state['cover_letter']
-                )
-            ).content).strip()
+            response_text = self.ask(
+                "interview_technology",
+                user_input=state['user_input'],
+                interview_history=questions,
+                cover_letter=state['cover_letter']
+            ).strip()
             self.save_interview_question_to_table(state['user_id'], response_text)
             # TTS 파일 생성 대신 단순히 응답 텍스트 반환
             return {**state, "response": response_text, "intent_interview": "TECHNOLOGY", "interview_in": True}
-        except Exception as e:
-            print(f'에러 발생: {e}')
+        except Exception:
+            logger.exception("에러 발생")
     
+    def recommend_job(self, state: State) -> State:
+        """자기소개서와 조회한 공고 기반 맞춤 공고 추천 (배치 결과 사용, LLM 호출 없음)"""
+        job_ids = recommend_for_user(self.db, self.retriever.index(), state['user_id'])
+        result = self.fetch_jobs_by_id(job_ids)
+        if not result:
+            response = "추천할 공고가 아직 없습니다. 자기소개서를 작성하거나 공고 상세 정보를 조회하면 맞춤 공고를 추천해 드립니다."
+            return {**state, "response": response}
+        # 검색 결과와 같이 저장해 이어서 "1번 상세 정보", "더 보여줘" 가능
+        state["job_result_set"] = self.save_jobs_to_table(state['user_id'], result)
+        response = "작성한 자기소개서와 조회한 공고를 바탕으로 추천하는 공고입니다.\n\n" + render_job_list(result[:10])
+        response += JOB_LIST_FOOTER if len(result) > 10 else JOB_LIST_LAST_FOOTER
+        return {**state, "response": response, "job_results": result, "index_job": 10, "job_search": True}
+
     def unknown_message(self, state: State) -> State:
         """관련 없는 메세지"""
         response = "시스템과 관련 없는 질문입니다. 다른 질문을 입력해주세요."
@@ -1101,13 +1398,14 @@ class JobAssistantBot:
     def create_workflow(self) -> StateGraph:
         """workflow 생성"""
         workflow = StateGraph(State)
-        workflow.add_node("classify_intent", self.classify_intent)
-        workflow.add_node("search_job_chat", self.search_job_chat)
-        workflow.add_node("cover_letter_chat", self.cover_letter_chat)
-        workflow.add_node("interview_chat", self.interview_chat)
-        workflow.add_node("unknown_message", self.unknown_message)
-        workflow.add_node("tenacity_interview", self.tenacity_interview)
-        workflow.add_node("technology_interview", self.technology_interview)
+        workflow.add_node("classify_intent", traced_node("classify_intent", self.classify_intent))
+        workflow.add_node("search_job_chat", traced_node("search_job_chat", self.search_job_chat))
+        workflow.add_node("cover_letter_chat", traced_node("cover_letter_chat", self.cover_letter_chat))
+        workflow.add_node("interview_chat", traced_node("interview_chat", self.interview_chat))
+        workflow.add_node("recommend_job", traced_node("recommend_job", self.recommend_job))
+        workflow.add_node("unknown_message", traced_node("unknown_message", self.unknown_message))
+        workflow.add_node("tenacity_interview", traced_node("tenacity_interview", self.tenacity_interview))
+        workflow.add_node("technology_interview", traced_node("technology_interview", self.technology_interview))
         # workflow.add_node("hallucination_check", self.hallucination_check)
         
         workflow.set_entry_point("classify_intent")
@@ -1119,6 +1417,7 @@ class JobAssistantBot:
                 "JOB_SEARCH": "search_job_chat",
                 "COVER_LETTER": "cover_letter_chat",
                 "INTERVIEW": "interview_chat",
+                "RECOMMEND": "recommend_job",
                 "UNKNOWN": "unknown_message"
             }
         )
@@ -1180,6 +1479,7 @@ class JobAssistantBot:
             }
         )
 
+        workflow.add_edge("recommend_job", END)
         workflow.add_edge("unknown_message", END)
 
         return workflow.compile()
@@ -1189,6 +1489,6 @@ class JobAssistantBot:
             img_data = workflow.get_graph().draw_mermaid_png()
             with open("graph.png", "wb") as f:
                 f.write(img_data)
-            print("그래프 생성 완료")
+            logger.info("그래프 생성 완료")
         except Exception as e:
-            print(f"그래프 생성 중 오류 발생: {e}")
\ No newline at end of file
+            logger.warning("그래프 생성 중 오류 발생: %s", e)
\ No newline at end of file
@@ -0,0 +1,270 @@
+import contextvars
+import logging
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from langchain_openai import ChatOpenAI
+
+from .metrics import LLM_BREAKER_OPEN, LLM_FALLBACKS, LLM_HEDGES, LLM_TIMEOUTS
+
+logger = logging.getLogger(__name__)
+
+# 생성용(main) / 분류용(fast) 모델
+LLM_MODEL = os.getenv('LLM_MODEL', 'gpt-4o')
+LLM_FAST_MODEL = os.getenv('LLM_FAST_MODEL', 'gpt-4o-mini')
+# 템플릿별 최대 대기 시간(초), 덮어쓰기 예: LLM_DEADLINES="cover_letter_write=120,intent_template=5"
+LLM_CLASSIFIER_DEADLINE = float(os.getenv('LLM_CLASSIFIER_DEADLINE', '15'))
+LLM_GENERATION_DEADLINE = float(os.getenv('LLM_GENERATION_DEADLINE', '90'))
+LLM_DEADLINES = os.getenv('LLM_DEADLINES', '')
+# 첫 모델이 마감 시간을 다 쓰지 않도록 다음 등급 모델용으로 남겨 둘 비율 (첫 모델이 시간 초과면 남은 시간으로 재시도)
+LLM_FALLBACK_RESERVE = float(os.getenv('LLM_FALLBACK_RESERVE', '0.3'))
+# 응답이 최근 p95 보다 늦으면 같은 요청을 한 번 더 보냄 (생성 프롬프트는 비용이 커서 기본 비활성)
+LLM_HEDGE = os.getenv('LLM_HEDGE', 'true').lower() == 'true'
+LLM_HEDGE_GENERATION = os.getenv('LLM_HEDGE_GENERATION', 'false').lower() == 'true'
+LLM_HEDGE_PERCENTILE = float(os.getenv('LLM_HEDGE_PERCENTILE', '95'))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv('LLM_HEDGE_MIN_SAMPLES', '20'))
+LLM_HEDGE_DEFAULT_DELAY = float(os.getenv('LLM_HEDGE_DEFAULT_DELAY', '3'))
+# 연속 실패 횟수가 넘으면 cooldown 동안 해당 모델 대신 다른 등급 모델 사용
+LLM_BREAKER_FAILURES = int(os.getenv('LLM_BREAKER_FAILURES', '5'))
+LLM_BREAKER_COOLDOWN = float(os.getenv('LLM_BREAKER_COOLDOWN', '30'))
+LLM_MAX_RETRIES = int(os.getenv('LLM_MAX_RETRIES', '0'))
+LLM_WORKERS = int(os.getenv('LLM_WORKERS', '32'))
+
+# 짧은 분류 결과만 필요한 프롬프트 → fast 모델
+CLASSIFIER_TEMPLATES = frozenset([
+    "intent_template",
+    "search_job_prompt",
+    "jobname_prompt",
+    "jobname_extract_prompt",
+    "moreinfo_extract_prompt",
+    "cover_letter_prompt",
+    "experience_prompt",
+    "experience_prompt_without_job",
+    "interview_intent",
+])
+
+
+class LLMTimeout(Exception):
+    pass
+
+
+class LLMUnavailable(Exception):
+    pass
+
+
+def _parse_deadlines():
+    deadlines = {}
+    for item in LLM_DEADLINES.split(','):
+        name, _, value = item.partition('=')
+        if name.strip() and value.strip():
+            deadlines[name.strip()] = float(value)
+    return deadlines
+
+
+class LatencyWindow:
+    """최근 응답 시간 (헤지 지연 계산용)"""
+
+    def __init__(self, size=200):
+        self._values = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def add(self, seconds):
+        with self._lock:
+            self._values.append(seconds)
+
+    def percentile(self, q):
+        with self._lock:
+            values = sorted(self._values)
+        if len(values) < LLM_HEDGE_MIN_SAMPLES:
+            return None
+        return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+class CircuitBreaker:
+    """모델별 차단기: 연속 실패 시 열림, cooldown 후 요청 한 건으로 복구 여부 확인"""
+
+    def __init__(self, name, failures=LLM_BREAKER_FAILURES, cooldown=LLM_BREAKER_COOLDOWN):
+        self.name = name
+        self.failures = failures
+        self.cooldown = cooldown
+        self._consecutive = 0
+        self._opened_at = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if time.monotonic() - self._opened_at >= self.cooldown and not self._trial:
+                self._trial = True  # 반열림: 한 건만 통과
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive = 0
+            self._opened_at = None
+            self._trial = False
+        LLM_BREAKER_OPEN.set(0, model=self.name)
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive += 1
+            if self._trial or self._consecutive >= self.failures:
+                if self._opened_at is None or self._trial:
+                    logger.warning("LLM 차단기 열림: %s (연속 실패 %s회)", self.name, self._consecutive)
+                self._opened_at = time.monotonic()
+                self._trial = False
+                opened = True
+            else:
+                opened = False
+        if opened:
+            LLM_BREAKER_OPEN.set(1, model=self.name)
+
+
+class LLMGateway:
+    """템플릿별 모델 등급, 마감 시간, 헤지 요청, 차단기를 적용한 LLM 호출"""
+
+    def __init__(self, model=LLM_MODEL, fast_model=LLM_FAST_MODEL, client_factory=None):
+        self.model = model
+        self.fast_model = fast_model
+        self.deadlines = _parse_deadlines()
+        factory = client_factory or self._create_client
+        self._clients = {name: factory(name) for name in {model, fast_model}}
+        self._breakers = {name: CircuitBreaker(name) for name in self._clients}
+        self._latency = {}
+        self._latency_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=LLM_WORKERS, thread_name_prefix="llm")
+
+    @staticmethod
+    def _create_client(model):
+        return ChatOpenAI(
+            model=model,
+            streaming=True,
+            stream_usage=True,
+            temperature=0,
+            max_retries=LLM_MAX_RETRIES,
+            timeout=max(LLM_GENERATION_DEADLINE, LLM_CLASSIFIER_DEADLINE),
+        )
+
+    def route(self, template_name):
+        """시도할 모델 순서 (앞의 모델 차단기가 열려 있거나 오류면 다음 모델)"""
+        if template_name in CLASSIFIER_TEMPLATES:
+            order = [self.fast_model, self.model]
+        else:
+            order = [self.model, self.fast_model]
+        return list(dict.fromkeys(order))
+
+    def deadline(self, template_name):
+        if template_name in self.deadlines:
+            return self.deadlines[template_name]
+        return LLM_CLASSIFIER_DEADLINE if template_name in CLASSIFIER_TEMPLATES else LLM_GENERATION_DEADLINE
+
+    def _window(self, template_name, model):
+        key = (template_name, model)
+        with self._latency_lock:
+            window = self._latency.get(key)
+            if window is None:
+                window = self._latency[key] = LatencyWindow()
+            return window
+
+    def hedge_delay(self, template_name, model):
+        """헤지 요청을 보내기 전 기다릴 시간 (None 이면 헤지하지 않음)"""
+        if not LLM_HEDGE or (template_name not in CLASSIFIER_TEMPLATES and not LLM_HEDGE_GENERATION):
+            return None
+        delay = self._window(template_name, model).percentile(LLM_HEDGE_PERCENTILE)
+        return LLM_HEDGE_DEFAULT_DELAY if delay is None else delay
+
+    def _submit(self, model, prompt):
+        client = self._clients[model]
+
+        def call():
+            started = time.monotonic()
+            message = client.invoke(prompt)
+            return message, time.monotonic() - started
+
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, call)
+
+    def _call(self, template_name, model, prompt, deadline_at, timeout):
+        """한 모델에 요청 (p95 를 넘기면 헤지 요청 추가), 먼저 성공한 응답 반환"""
+        primary = self._submit(model, prompt)
+        futures = {primary}
+        hedge = None
+        delay = self.hedge_delay(template_name, model)
+        if delay is not None and deadline_at - time.monotonic() > delay:
+            done, _ = wait(futures, timeout=delay)
+            if not done:
+                hedge = self._submit(model, prompt)
+                futures.add(hedge)
+                LLM_HEDGES.inc(template=template_name, outcome="fired")
+        error = None
+        while futures:
+            remaining = deadline_at - time.monotonic()
+            done, futures = wait(futures, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                message, seconds = future.result()
+                self._window(template_name, model).add(seconds)
+                if future is hedge:
+                    LLM_HEDGES.inc(template=template_name, outcome="won")
+                for loser in futures:
+                    loser.cancel()  # 이미 호출 중이면 결과만 버림
+                return message, future is hedge
+        for loser in futures:
+            loser.cancel()
+        if error is not None and not futures:
+            raise error
+        LLM_TIMEOUTS.inc(template=template_name, model=model)
+        raise LLMTimeout(f"{template_name}: {model} 응답이 {timeout:.1f}초 안에 오지 않았습니다.")
+
+    def invoke(self, template_name, prompt):
+        """(AIMessage, 호출 정보) 반환, 모든 모델이 실패하면 LLMUnavailable / LLMTimeout
+
+        시간 초과도 오류와 같이 다음 등급 모델로 넘어감 (마감 시간 중 LLM_FALLBACK_RESERVE 만큼은 다음 모델 몫)
+        """
+        started = time.monotonic()
+        deadline_at = started + self.deadline(template_name)
+        models = self.route(template_name)
+        last_error = None
+        for attempt, model in enumerate(models):
+            breaker = self._breakers[model]
+            if not breaker.allow():
+                LLM_FALLBACKS.inc(template=template_name, reason="circuit_open")
+                continue
+            if last_error is not None:
+                reason = "timeout" if isinstance(last_error, LLMTimeout) else "error"
+                LLM_FALLBACKS.inc(template=template_name, reason=reason)
+            attempt_deadline = deadline_at
+            if attempt < len(models) - 1:
+                attempt_deadline -= (deadline_at - started) * LLM_FALLBACK_RESERVE
+            try:
+                message, hedged = self._call(template_name, model, prompt, attempt_deadline,
+                                             attempt_deadline - time.monotonic())
+            except LLMTimeout as e:
+                breaker.record_failure()
+                logger.warning("LLM 시간 초과: %s %s", template_name, model)
+                last_error = e
+                if time.monotonic() >= deadline_at:
+                    break
+                continue
+            except Exception as e:
+                breaker.record_failure()
+                logger.warning("LLM 호출 실패: %s %s: %r", template_name, model, e)
+                last_error = e
+                if time.monotonic() >= deadline_at:
+                    break
+                continue
+            breaker.record_success()
+            return message, {"model": model, "hedge_won": hedged, "fallback": attempt > 0}
+        if isinstance(last_error, LLMTimeout):
+            raise last_error
+        raise LLMUnavailable(f"{template_name}: 사용할 수 있는 LLM 이 없습니다.") from last_error
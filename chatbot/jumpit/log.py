@@ -0,0 +1,156 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+from .metrics import LOG_DROPPED
+from .tracing import current_request_id, current_trace_sampled
+
+# 기본 로그 레벨과 모듈별 레벨 (예: LOG_LEVELS="jumpit.hs=DEBUG,jumpit.db=WARNING")
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+# json (수집기용) / text (로컬 개발용)
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json').lower()
+# 필드 하나당 최대 길이 (공고 목록, 상태 전체 같은 큰 값이 그대로 찍히지 않도록)
+LOG_MAX_FIELD_CHARS = int(os.getenv('LOG_MAX_FIELD_CHARS', '500'))
+# extra={'sample': True} 로 남긴 상세 로그 중 기록할 비율 (트레이스가 샘플링된 요청은 항상 기록)
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', '0.01'))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+# LogRecord 기본 속성 (나머지는 extra 로 넘긴 필드)
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'request_id', 'sample'}
+
+
+def truncate(value, limit=None):
+    """문자열로 바꾼 뒤 limit 자를 넘으면 잘라내고 원래 길이 표시"""
+    limit = limit or LOG_MAX_FIELD_CHARS
+    if not isinstance(value, str):
+        try:
+            value = json.dumps(value, ensure_ascii=False, default=str)
+        except (TypeError, ValueError):
+            value = repr(value)
+    if len(value) > limit:
+        return f'{value[:limit]}…(+{len(value) - limit})'
+    return value
+
+
+def module_levels():
+    """LOG_LEVELS 환경 변수 → {logger 이름: 레벨}"""
+    levels = {}
+    for item in LOG_LEVELS.split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+class RequestIdFilter(logging.Filter):
+    """현재 요청 id 를 레코드에 추가 (view → 노드 → DB → LLM 로그 연결)"""
+
+    def filter(self, record):
+        if not hasattr(record, 'request_id'):
+            record.request_id = current_request_id() or '-'
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """extra={'sample': True} 로그는 일부만 통과"""
+
+    def filter(self, record):
+        if not getattr(record, 'sample', False):
+            return True
+        return current_trace_sampled() or random.random() < LOG_SAMPLE_RATE
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (extra 필드 포함, 필드별 길이 제한)"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'msg': truncate(record.getMessage()),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value if isinstance(value, (int, float, bool)) or value is None else truncate(value)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s [%(request_id)s] %(name)s: %(message)s')
+
+    def format(self, record):
+        text = super().format(record)
+        extras = {k: v for k, v in vars(record).items() if k not in _RECORD_ATTRS and not k.startswith('_')}
+        if extras:
+            text += ' ' + ' '.join(f'{k}={truncate(v)}' for k, v in extras.items())
+        return text
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐에 넣기만 하고 바로 반환, 큐가 가득 차면 버림 (요청 처리 스레드가 stdout 에 막히지 않도록)"""
+
+    def prepare(self, record):
+        # 큐에 넣기 전에 메시지를 만들고 큰 필드를 잘라서 큐가 큰 객체를 붙잡지 않게 함
+        record = copy.copy(record)
+        record.msg = truncate(record.getMessage())
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        for key, value in list(vars(record).items()):
+            if key not in _RECORD_ATTRS and not key.startswith('_') and not isinstance(value, (int, float, bool)):
+                setattr(record, key, truncate(value))
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_DROPPED.inc()
+
+
+def build_queue_handler(stream=None):
+    """LOGGING 설정용: 백그라운드 스레드가 stdout 으로 쓰는 큐 핸들러 생성"""
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(TextFormatter() if LOG_FORMAT == 'text' else JsonFormatter())
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    handler.addFilter(RequestIdFilter())
+    handler.addFilter(SamplingFilter())
+    listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    handler.listener = listener
+    return handler
+
+
+def logging_config():
+    """Django LOGGING 설정"""
+    loggers = {
+        'jumpit': {'handlers': ['queue'], 'level': LOG_LEVEL, 'propagate': False},
+        'LSJ': {'handlers': ['queue'], 'level': LOG_LEVEL, 'propagate': False},
+        'django': {'handlers': ['queue'], 'level': 'INFO', 'propagate': False},
+    }
+    for name, level in module_levels().items():
+        loggers.setdefault(name, {'handlers': ['queue'], 'propagate': False})['level'] = level
+    return {
+        'version': 1,
+        'disable_existing_loggers': False,
+        'handlers': {'queue': {'()': build_queue_handler}},
+        'root': {'handlers': ['queue'], 'level': 'WARNING'},
+        'loggers': loggers,
+    }
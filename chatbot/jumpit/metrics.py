@@ -0,0 +1,204 @@
+import bisect
+import functools
+import json
+import os
+import re
+import threading
+import time
+
+# 크롤러(LSJ/crawling.py)가 진행 상황을 기록하는 파일
+CRAWL_PROGRESS_PATH = os.getenv('CRAWL_PROGRESS_PATH', 'crawl_progress.json')
+
+# 지연 시간 히스토그램 구간(초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+DB_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+TOKEN_BUCKETS = (128, 256, 512, 1024, 2048, 3072, 4096, 6144, 8192, 16384, 32768)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+class _Metric:
+    type_name = ''
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels):
+        return tuple(labels.get(n, '') for n in self.labelnames)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} {self.type_name}']
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f'{self.name}{_format_labels(self.labelnames, key)} {value}')
+        return lines
+
+
+class Counter(_Metric):
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    type_name = 'gauge'
+
+    def set(self, value, **labels):
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+
+class Histogram(_Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, help_text, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                # [구간별 개수..., +Inf 개수], 합계
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def time(self, **labels):
+        return _Timer(self, labels)
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted((key, (list(counts), total)) for key, (counts, total) in self._values.items())
+        for key, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float('inf') else f'le="{bound!r}"'
+                lines.append(f'{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, key)} {total}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}')
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started, **self.labels)
+
+
+REGISTRY = []
+
+CHAT_TURNS = Counter('jobara_chat_turns_total', '챗봇 턴 수', ('intent', 'status'))
+CHAT_TURN_SECONDS = Histogram('jobara_chat_turn_seconds', '챗봇 턴 처리 시간', ('intent',))
+SESSION_STATE_BYTES = Histogram('jobara_session_state_bytes', '턴 종료 시 세션 상태 크기', buckets=SIZE_BUCKETS)
+NODE_SECONDS = Histogram('jobara_node_seconds', '워크플로우 노드 실행 시간', ('node',))
+NODE_ERRORS = Counter('jobara_node_errors_total', '워크플로우 노드 예외 수', ('node',))
+LLM_REQUESTS = Counter('jobara_llm_requests_total', 'LLM 호출 수', ('template', 'status'))
+LLM_SECONDS = Histogram('jobara_llm_request_seconds', 'LLM 호출 시간', ('template',))
+LLM_TOKENS = Counter('jobara_llm_tokens_total', 'LLM 토큰 사용량', ('template', 'type'))
+LLM_HEDGES = Counter('jobara_llm_hedges_total', 'p95 초과로 보낸 헤지 요청 (fired) 과 헤지 요청이 먼저 응답한 수 (won)', ('template', 'outcome'))
+LLM_FALLBACKS = Counter('jobara_llm_fallbacks_total', '다른 등급 모델로 넘어간 호출 수', ('template', 'reason'))
+LLM_TIMEOUTS = Counter('jobara_llm_timeouts_total', '마감 시간을 넘긴 LLM 호출 수', ('template', 'model'))
+LLM_BREAKER_OPEN = Gauge('jobara_llm_circuit_open', 'LLM 차단기 열림 여부', ('model',))
+PROMPT_TOKENS = Histogram('jobara_prompt_tokens', '예산 적용 후 프롬프트 토큰 수 (로컬 계산)', ('template',), buckets=TOKEN_BUCKETS)
+PROMPT_TRUNCATIONS = Counter('jobara_prompt_truncations_total', '예산 초과로 줄인 프롬프트 변수 수', ('template', 'field'))
+DB_QUERY_SECONDS = Histogram('jobara_db_query_seconds', 'DB 쿼리 실행 시간', ('statement',), buckets=DB_LATENCY_BUCKETS)
+DB_QUERY_ERRORS = Counter('jobara_db_query_errors_total', 'DB 쿼리 오류 수', ('statement',))
+SPECULATIONS = Counter('jobara_speculative_calls_total', '미리 실행한 하위 분기 분류 결과 (hit/miss/cancelled/wasted/error)', ('template', 'outcome'))
+CACHE_REQUESTS = Counter('jobara_cache_requests_total', '캐시 조회 수', ('cache', 'result'))
+TURN_LOCK_WAIT_SECONDS = Histogram('jobara_turn_lock_wait_seconds', '같은 사용자의 이전 턴이 끝나기를 기다린 시간')
+TURN_LOCK_TIMEOUTS = Counter('jobara_turn_lock_timeouts_total', '턴 잠금을 얻지 못해 거절한 요청 수', ('scope',))
+TURNS_COALESCED = Counter('jobara_turns_coalesced_total', '중복 요청이라 다시 실행하지 않고 직전 응답을 돌려준 수', ('scope',))
+ADMISSION_QUEUE_WAIT_SECONDS = Histogram('jobara_admission_queue_wait_seconds', '입장 대기열에서 기다린 시간', ('endpoint',))
+ADMISSION_REJECTIONS = Counter('jobara_admission_rejections_total', '입장 제한으로 거절한 요청 수 (per_user/queue_full/queue_timeout)', ('endpoint', 'reason'))
+ADMISSION_IN_FLIGHT = Gauge('jobara_admission_in_flight', '실행 중인 요청 수', ('endpoint',))
+ADMISSION_QUEUE_DEPTH = Gauge('jobara_admission_queue_depth', '입장 대기 중인 요청 수', ('endpoint',))
+RETRIEVAL_SECONDS = Histogram('jobara_retrieval_seconds', '공고 하이브리드 검색 단계별 시간 (lexical/vector/fusion/autocomplete)', ('stage',), buckets=DB_LATENCY_BUCKETS)
+RECOMMENDATIONS_SERVED = Counter('jobara_recommendations_served_total', '추천 공고 조회 수 (batch: 배치 결과, on_demand: 바로 계산, empty: 내역 없음)', ('source',))
+POSTINGS_EXPIRED = Counter('jobara_postings_expired_total', '스위퍼가 결과 캐시에서 지운 마감 공고 수')
+SEARCH_CORRECTIONS = Counter('jobara_search_corrections_total', '검색 결과가 없어 오타를 교정해 다시 검색한 수 (found: 결과 있음, empty: 교정 후에도 없음)', ('result',))
+SUGGESTIONS_SELECTED = Counter('jobara_suggestions_selected_total', '자동완성 제안을 골라 LLM 추출 없이 검색한 수', ('kind',))
+LOG_DROPPED = Counter('jobara_log_dropped_total', '로그 큐가 가득 차서 버린 로그 수')
+
+_STATEMENT_VERB = re.compile(r'^\s*(\w+)', re.S)
+_STATEMENT_TABLE = re.compile(r'\b(?:FROM|INTO|UPDATE|TABLE(?:\s+IF\s+(?:NOT\s+)?EXISTS)?)\s+`?(\w+)', re.I)
+
+
+@functools.lru_cache(maxsize=1024)
+def statement_label(query):
+    """쿼리 → 'SELECT job_posting_new' 형태의 라벨 (값, 조건 개수와 무관하게 묶임)"""
+    verb = _STATEMENT_VERB.match(query)
+    table = _STATEMENT_TABLE.search(query)
+    return ' '.join(filter(None, [verb.group(1).upper() if verb else 'OTHER', table.group(1) if table else '']))
+
+
+def _crawler_lines():
+    """크롤러 진행 상황 파일을 게이지로 변환"""
+    try:
+        with open(CRAWL_PROGRESS_PATH, encoding='utf-8') as f:
+            progress = json.load(f)
+    except (OSError, ValueError):
+        return []
+    lines = [
+        '# HELP jobara_crawler_postings 크롤러 단계별 공고 수',
+        '# TYPE jobara_crawler_postings gauge',
+    ]
+    for key in ('found', 'processed', 'saved', 'skipped', 'errors'):
+        if key in progress:
+            lines.append(f'jobara_crawler_postings{{state="{key}"}} {progress[key]}')
+    lines += [
+        '# HELP jobara_crawler_running 크롤러 실행 중 여부',
+        '# TYPE jobara_crawler_running gauge',
+        f'jobara_crawler_running {1 if progress.get("phase") not in ("done", "failed") else 0}',
+    ]
+    for key in ('started_at', 'updated_at'):
+        if key in progress:
+            lines += [f'# TYPE jobara_crawler_{key}_seconds gauge', f'jobara_crawler_{key}_seconds {progress[key]}']
+    return lines
+
+
+def render_metrics():
+    """Prometheus 텍스트 형식으로 전체 지표 출력"""
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    lines.extend(_crawler_lines())
+    return '\n'.join(lines) + '\n'
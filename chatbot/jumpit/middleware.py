@@ -0,0 +1,27 @@
+import re
+import uuid
+
+from .tracing import should_sample, start_trace
+
+# 외부에서 받은 요청 id 는 영문, 숫자, -, _ 만 허용
+_REQUEST_ID = re.compile(r'^[A-Za-z0-9_\-]{1,64}$')
+
+
+class RequestTraceMiddleware:
+    """요청마다 트레이스 시작, X-Request-ID 응답 헤더 추가 (X-Debug-Trace: 1 이면 항상 샘플링)"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request_id = request.headers.get('X-Request-ID', '')
+        if not _REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        request.request_id = request_id
+        sampled = should_sample(force=request.headers.get('X-Debug-Trace') == '1')
+        with start_trace(request_id, f'{request.method} {request.path}', sampled=sampled) as trace:
+            response = self.get_response(request)
+            response['X-Request-ID'] = request_id
+            if trace.sampled:
+                response['X-Trace-Sampled'] = '1'
+        return response
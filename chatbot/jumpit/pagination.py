@@ -0,0 +1,67 @@
+import base64
+import json
+import os
+
+import pymysql
+
+# 내역 조회 API 한 페이지 기본/최대 항목 수
+HISTORY_PAGE_SIZE = int(os.getenv('HISTORY_PAGE_SIZE', '20'))
+HISTORY_MAX_PAGE_SIZE = int(os.getenv('HISTORY_MAX_PAGE_SIZE', '100'))
+
+
+class InvalidPage(ValueError):
+    pass
+
+
+def encode_cursor(saved_at, row_id):
+    """마지막 항목의 (저장일시, id) → URL 에 넣을 수 있는 커서 문자열"""
+    raw = json.dumps([str(saved_at), row_id], ensure_ascii=False).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        saved_at, row_id = json.loads(raw)
+        return str(saved_at), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidPage('잘못된 cursor 입니다.')
+
+
+def page_params(request):
+    """?cursor=&limit= → (커서 또는 None, 항목 수)"""
+    try:
+        limit = int(request.GET.get('limit', HISTORY_PAGE_SIZE))
+    except ValueError:
+        raise InvalidPage('limit 은 숫자여야 합니다.')
+    cursor = request.GET.get('cursor') or None
+    return (decode_cursor(cursor) if cursor else None), max(1, min(limit, HISTORY_MAX_PAGE_SIZE))
+
+
+def fetch_page(conn, table, columns, customer_id, cursor, limit):
+    """(customer_id, 저장일시, id) 인덱스 순서로 최신 항목부터 limit 개 조회
+
+    columns 는 코드에 고정된 SELECT 목록만 전달 (사용자 입력 사용 금지).
+    반환: (항목 목록, 다음 페이지 커서 또는 None)
+    """
+    query = f"SELECT id, 저장일시 AS _saved_at, {columns} FROM {table} WHERE customer_id = %s"
+    args = [customer_id]
+    if cursor is not None:
+        # (저장일시, id) < 커서 를 인덱스 범위 검색이 되도록 풀어서 작성
+        query += " AND (저장일시 < %s OR (저장일시 = %s AND id < %s))"
+        args += [cursor[0], cursor[0], cursor[1]]
+    query += " ORDER BY 저장일시 DESC, id DESC LIMIT %s"
+    args.append(limit + 1)
+    db_cursor = conn.cursor(pymysql.cursors.DictCursor)
+    try:
+        db_cursor.execute(query, args)
+        rows = list(db_cursor.fetchall())
+    finally:
+        db_cursor.close()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1]['_saved_at'], rows[-1]['id'])
+    for row in rows:
+        row.pop('_saved_at')
+    return rows, next_cursor
@@ -0,0 +1,227 @@
+import heapq
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+from .metrics import PROMPT_TOKENS, PROMPT_TRUNCATIONS
+from .tracing import current_request_id
+
+logger = logging.getLogger(__name__)
+
+# 토큰 수 계산에 사용할 모델 (tiktoken 인코딩 선택용)
+TOKENIZER_MODEL = os.getenv('TOKENIZER_MODEL', 'gpt-4o')
+# 템플릿별 최대 프롬프트 토큰 수 덮어쓰기 (예: PROMPT_BUDGETS="cover_letter_refine=3000,interview_technology=5000")
+PROMPT_BUDGETS = os.getenv('PROMPT_BUDGETS', '')
+# 보고서에 남길 가장 큰 프롬프트 수
+PROMPT_REPORT_SIZE = int(os.getenv('PROMPT_REPORT_SIZE', '20'))
+
+_ELLIPSIS = '\n…(중략)…\n'
+
+_encoding = None
+_encoding_failed = False
+_encoding_lock = threading.Lock()
+
+
+def _get_encoding():
+    """tiktoken 인코딩 (설치되지 않았거나 인코딩 파일을 받을 수 없으면 None)"""
+    global _encoding, _encoding_failed
+    if _encoding is not None or _encoding_failed:
+        return _encoding
+    with _encoding_lock:
+        if _encoding is None and not _encoding_failed:
+            try:
+                import tiktoken
+                _encoding = tiktoken.encoding_for_model(TOKENIZER_MODEL)
+            except Exception as e:
+                _encoding_failed = True
+                logger.warning("tiktoken 을 사용할 수 없어 토큰 수를 추정합니다: %s", e)
+    return _encoding
+
+
+def count_tokens(text) -> int:
+    """텍스트의 토큰 수 (tiktoken 이 없으면 UTF-8 바이트 기준 추정, 한글 1자 ≈ 1토큰)"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return (len(text.encode('utf-8')) + 2) // 3
+
+
+def _cut_to_tokens(text, max_tokens, keep):
+    """keep 위치(head/tail/middle)를 남기고 max_tokens 이내로 자르기"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        if keep == 'head':
+            return encoding.decode(tokens[:max_tokens]) + '…'
+        if keep == 'tail':
+            return '…' + encoding.decode(tokens[-max_tokens:])
+        half = max_tokens // 2
+        return encoding.decode(tokens[:half]) + _ELLIPSIS + encoding.decode(tokens[-half:] if half else [])
+    # 추정 모드: 토큰 수에 비례해 글자 수로 자름
+    total = count_tokens(text)
+    if total <= max_tokens:
+        return text
+    chars = max(0, int(len(text) * max_tokens / total))
+    if keep == 'head':
+        return text[:chars] + '…'
+    if keep == 'tail':
+        return '…' + text[len(text) - chars:]
+    half = chars // 2
+    return text[:half] + _ELLIPSIS + text[len(text) - half:]
+
+
+def _window(items, max_tokens):
+    """리스트의 최근 항목부터 max_tokens 안에 들어가는 만큼만 남김"""
+    kept = []
+    used = 0
+    for item in reversed(list(items)):
+        cost = count_tokens(str(item)) + 2
+        if used + cost > max_tokens:
+            break
+        kept.append(item)
+        used += cost
+    kept.reverse()
+    return kept
+
+
+def _shrink(value, max_tokens, strategy):
+    if strategy == 'window':
+        return _window(value or [], max_tokens)
+    keep = {'truncate': 'head', 'truncate_head': 'tail', 'middle': 'middle'}[strategy]
+    return _cut_to_tokens(str(value), max_tokens, keep)
+
+
+class TemplateBudget:
+    """템플릿 한 개의 최대 프롬프트 토큰 수와 줄일 수 있는 변수 목록 (줄이는 순서대로)
+
+    strategy
+    - truncate: 앞부분만 남김 (사용자 입력, 공고 설명)
+    - truncate_head: 뒷부분만 남김
+    - middle: 앞뒤를 남기고 가운데를 생략 (이전 자기소개서, 자기소개서 본문)
+    - window: 리스트에서 최근 항목만 남김 (면접 질문 내역)
+    """
+
+    def __init__(self, max_tokens, fields=(), min_field_tokens=64):
+        self.max_tokens = max_tokens
+        self.fields = list(fields)  # [(변수 이름, strategy)]
+        self.min_field_tokens = min_field_tokens
+
+
+# 사용자 입력은 모든 템플릿에서 너무 길면 앞부분만 사용
+_USER_INPUT = ('user_input', 'truncate')
+
+DEFAULT_BUDGETS = {
+    'intent_template': TemplateBudget(1500, [_USER_INPUT]),
+    'search_job_prompt': TemplateBudget(1500, [_USER_INPUT]),
+    'jobname_prompt': TemplateBudget(1000, [_USER_INPUT]),
+    'jobname_extract_prompt': TemplateBudget(1000, [_USER_INPUT]),
+    'moreinfo_extract_prompt': TemplateBudget(1000, [_USER_INPUT]),
+    'natural_response': TemplateBudget(3000, [('extracted_info', 'truncate')]),
+    'cover_letter_prompt': TemplateBudget(2000, [_USER_INPUT]),
+    'experience_prompt': TemplateBudget(1500, [_USER_INPUT]),
+    'experience_prompt_without_job': TemplateBudget(1500, [_USER_INPUT]),
+    'cover_letter_write': TemplateBudget(4000, [
+        ('preferences', 'truncate'), ('requirements', 'truncate'), ('job_desc', 'truncate'),
+        ('tech_stack', 'truncate'), _USER_INPUT,
+    ]),
+    'cover_letter_write_without_job': TemplateBudget(3000, [_USER_INPUT]),
+    'cover_letter_refine': TemplateBudget(4000, [('previous_response', 'middle'), _USER_INPUT]),
+    'interview_intent': TemplateBudget(1500, [_USER_INPUT]),
+    'interview_cover_letter': TemplateBudget(3000, [_USER_INPUT]),
+    'interview_tenacity': TemplateBudget(2500, [('interview_history', 'window'), _USER_INPUT]),
+    'interview_technology': TemplateBudget(5000, [
+        ('interview_history', 'window'), ('cover_letter', 'middle'), _USER_INPUT,
+    ]),
+}
+
+
+def _load_budgets():
+    budgets = dict(DEFAULT_BUDGETS)
+    for item in PROMPT_BUDGETS.split(','):
+        name, _, value = item.partition('=')
+        if name.strip() and value.strip():
+            base = budgets.get(name.strip(), TemplateBudget(0, [_USER_INPUT]))
+            budgets[name.strip()] = TemplateBudget(int(value), base.fields, base.min_field_tokens)
+    return budgets
+
+
+BUDGETS = _load_budgets()
+
+
+class PromptReport:
+    """템플릿별 프롬프트 크기 통계와 가장 큰 프롬프트 목록"""
+
+    def __init__(self, size=PROMPT_REPORT_SIZE):
+        self.size = size
+        self._stats = OrderedDict()
+        self._worst = []  # (토큰 수, 순번, 항목) 최소 힙
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def record(self, template_name, tokens, final_tokens, truncated_fields):
+        with self._lock:
+            stats = self._stats.setdefault(template_name, {'calls': 0, 'tokens': 0, 'max': 0, 'truncated': 0})
+            stats['calls'] += 1
+            stats['tokens'] += final_tokens
+            stats['max'] = max(stats['max'], tokens)
+            stats['truncated'] += bool(truncated_fields)
+            self._seq += 1
+            entry = (tokens, self._seq, {
+                'template': template_name,
+                'tokens': tokens,
+                'final_tokens': final_tokens,
+                'truncated_fields': truncated_fields,
+                'request_id': current_request_id(),
+            })
+            if len(self._worst) < self.size:
+                heapq.heappush(self._worst, entry)
+            elif tokens > self._worst[0][0]:
+                heapq.heapreplace(self._worst, entry)
+
+    def snapshot(self):
+        with self._lock:
+            templates = {
+                name: {**stats, 'mean': round(stats['tokens'] / stats['calls'], 1),
+                       'budget': BUDGETS[name].max_tokens if name in BUDGETS else None}
+                for name, stats in self._stats.items()
+            }
+            worst = [entry for _, _, entry in sorted(self._worst, key=lambda e: -e[0])]
+        return {'templates': templates, 'worst_offenders': worst}
+
+
+report = PromptReport()
+
+
+def fit_prompt(template_name, template, values):
+    """템플릿 예산에 맞게 변수를 줄인 뒤 완성된 프롬프트와 토큰 수 반환"""
+    prompt = template.format(**values)
+    tokens = count_tokens(prompt)
+    final_tokens = tokens
+    truncated = []
+    budget = BUDGETS.get(template_name)
+    if budget is not None and budget.max_tokens and tokens > budget.max_tokens:
+        values = dict(values)
+        for field, strategy in budget.fields:
+            if final_tokens <= budget.max_tokens:
+                break
+            value = values.get(field)
+            if not value:
+                continue
+            field_tokens = count_tokens(str(value))
+            # 생략 표시, 토큰 경계 오차만큼 여유를 둠
+            allowed = max(budget.min_field_tokens, field_tokens - (final_tokens - budget.max_tokens) - 16)
+            if allowed >= field_tokens:
+                continue
+            values[field] = _shrink(value, allowed, strategy)
+            truncated.append(field)
+            PROMPT_TRUNCATIONS.inc(template=template_name, field=field)
+            prompt = template.format(**values)
+            final_tokens = count_tokens(prompt)
+        if final_tokens > budget.max_tokens:
+            logger.warning("프롬프트가 예산을 초과합니다: %s %s/%s", template_name, final_tokens, budget.max_tokens)
+    PROMPT_TOKENS.observe(final_tokens, template=template_name)
+    report.record(template_name, tokens, final_tokens, truncated)
+    return prompt, final_tokens
@@ -0,0 +1,267 @@
+"""
+사용자 맞춤 공고 추천 (자기소개서 + 상세 정보를 조회한 공고 → 사용자 프로필 벡터)
+
+야간 배치가 모든 사용자의 프로필 벡터와 전체 공고 벡터를 행렬곱으로 비교해 상위 공고를 저장하고,
+챗봇(RECOMMEND 분기)과 /api/recommendations/ 는 저장된 결과를 LLM 호출 없이 바로 보여줍니다.
+크롤링 후 실행 (run_scraper.sh, 검색 인덱스 생성 다음):
+    python -m jumpit.recommend build
+"""
+import argparse
+import logging
+import os
+import time
+from datetime import datetime
+
+import numpy as np
+
+from .expiry import active_condition
+from .metrics import RECOMMENDATIONS_SERVED
+from .retrieval import JOB_INDEX_PATH, JobIndex
+
+logger = logging.getLogger(__name__)
+
+# 사용자별로 저장할 추천 공고 수
+RECOMMEND_TOP_K = int(os.getenv('RECOMMEND_TOP_K', '30'))
+# 프로필에 반영할 사용자별 최근 자기소개서/조회 공고 수
+RECOMMEND_HISTORY_LIMIT = int(os.getenv('RECOMMEND_HISTORY_LIMIT', '20'))
+# 오래된 내역의 가중치가 절반이 되는 기간(일)
+RECOMMEND_HALF_LIFE_DAYS = float(os.getenv('RECOMMEND_HALF_LIFE_DAYS', '30'))
+# 배치에서 한 번에 행렬곱할 사용자 수
+RECOMMEND_BATCH_USERS = int(os.getenv('RECOMMEND_BATCH_USERS', '512'))
+
+# 내역 종류별 가중치 (자기소개서는 지원 의사가 더 분명함)
+COVER_LETTER_WEIGHT = 2.0
+VIEWED_POSTING_WEIGHT = 1.0
+_COVER_LETTER_CHARS = 2000
+
+
+def create_recommendation_table(conn):
+    """사용자별 추천 공고 DB (배치가 사용자 단위로 교체)
+
+    링크: 크롤링하면 job_posting_new 를 다시 만들어 id 가 재사용되므로 조회할 때 id 와 함께 확인
+    """
+    cursor = conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS recommended_job_posting (
+        customer_id VARCHAR(20),
+        순위 INT,
+        공고_id INT,
+        링크 VARCHAR(500),
+        점수 FLOAT,
+        생성일시 DATETIME DEFAULT CONVERT_TZ(NOW(), 'UTC', 'Asia/Seoul'),
+        PRIMARY KEY (customer_id, 순위)
+    )
+    """)
+    conn.commit()
+    try:
+        # 링크 컬럼 추가 전에 만든 테이블 (이전 결과는 링크가 없어 조회되지 않고, 다음 배치가 채움)
+        cursor.execute("ALTER TABLE recommended_job_posting ADD COLUMN 링크 VARCHAR(500)")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+    cursor.close()
+
+
+def current_links(conn, index, job_ids):
+    """공고 id 목록 → {id: 링크}, 지금 job_posting_new 의 행이 인덱스를 만든 공고와 같은 id 만
+
+    인덱스 생성 후 다시 크롤링했다면 같은 id 가 다른 공고이므로 제외
+    """
+    if not job_ids:
+        return {}
+    cursor = conn.cursor()
+    cursor.execute(
+        f"SELECT id, 링크 FROM job_posting_new WHERE id IN ({', '.join(['%s'] * len(job_ids))})", list(job_ids))
+    links = {job_id: link for job_id, link in cursor.fetchall() if index.same_posting(job_id, link)}
+    cursor.close()
+    return links
+
+
+def _age_days(saved_at, now):
+    if saved_at is None:
+        return 0.0
+    if isinstance(saved_at, str):
+        try:
+            saved_at = datetime.fromisoformat(saved_at)
+        except ValueError:
+            return 0.0
+    return max(0.0, (now - saved_at).total_seconds() / 86400)
+
+
+def fetch_histories(conn, customer_ids=None):
+    """사용자 → [(종류, 텍스트 필드, 저장일시)] 최근 순, customer_ids 가 없으면 전체 사용자"""
+    where, args = "", ()
+    if customer_ids is not None:
+        where = f"WHERE customer_id IN ({', '.join(['%s'] * len(customer_ids))})"
+        args = tuple(customer_ids)
+    cursor = conn.cursor()
+    histories = {}
+    cursor.execute(f"""
+    SELECT customer_id, 채용공고, 자기소개서, 저장일시 FROM saved_cover_letter {where}
+    ORDER BY customer_id, 저장일시 DESC, id DESC
+    """, args or None)
+    for customer_id, job_name, letter, saved_at in cursor.fetchall():
+        items = histories.setdefault(customer_id, [])
+        if sum(1 for kind, _, _ in items if kind == 'cover_letter') < RECOMMEND_HISTORY_LIMIT:
+            items.append(('cover_letter', (job_name or '', (letter or '')[:_COVER_LETTER_CHARS]), saved_at))
+    cursor.execute(f"""
+    SELECT customer_id, 제목, 사용기술, 주요업무, 저장일시 FROM selected_job_posting {where}
+    ORDER BY customer_id, 저장일시 DESC, id DESC
+    """, args or None)
+    for customer_id, title, skills, description, saved_at in cursor.fetchall():
+        items = histories.setdefault(customer_id, [])
+        if sum(1 for kind, _, _ in items if kind == 'viewed') < RECOMMEND_HISTORY_LIMIT:
+            items.append(('viewed', (title or '', skills or '', description or ''), saved_at))
+    cursor.close()
+    return histories
+
+
+def fetch_viewed_job_ids(conn, customer_ids=None):
+    """사용자 → 이미 상세 정보를 조회한 공고 id 집합 (추천에서 제외)"""
+    where, args = "", None
+    if customer_ids is not None:
+        where = f"WHERE s.customer_id IN ({', '.join(['%s'] * len(customer_ids))})"
+        args = tuple(customer_ids)
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT s.customer_id, j.id FROM selected_job_posting s
+    JOIN job_posting_new j ON j.제목 = s.제목 AND j.회사명 = s.회사명
+    {where}
+    """, args)
+    viewed = {}
+    for customer_id, job_id in cursor.fetchall():
+        viewed.setdefault(customer_id, set()).add(job_id)
+    cursor.close()
+    return viewed
+
+
+def profile_vectors(embedder, histories, now=None):
+    """사용자별 내역 벡터의 가중 평균 (최근 내역일수록 큰 가중치), 반환: (사용자 목록, (n, dim) 행렬)"""
+    now = now or datetime.now()
+    users = sorted(histories)
+    profiles = np.zeros((len(users), embedder.dim), dtype=np.float32)
+    for i, user in enumerate(users):
+        for kind, fields, saved_at in histories[user]:
+            if kind == 'cover_letter':
+                job_name, letter = fields
+                vector = embedder.embed_fields([(job_name, 3.0), (letter, 1.0)])
+                weight = COVER_LETTER_WEIGHT
+            else:
+                vector = embedder.normalize(embedder.embed_posting(*fields))
+                weight = VIEWED_POSTING_WEIGHT
+            profiles[i] += weight * 0.5 ** (_age_days(saved_at, now) / RECOMMEND_HALF_LIFE_DAYS) * vector
+    norms = np.linalg.norm(profiles, axis=1, keepdims=True)
+    return users, profiles / np.maximum(norms, 1e-12)
+
+
+def score_users(index, users, profiles, viewed, top_k=RECOMMEND_TOP_K):
+    """사용자 → [(공고 id, 점수)] 상위 top_k (조회한 공고, 마감된 공고 제외)"""
+    results = {}
+    expired = index.facets.expired_mask()
+    for begin in range(0, len(users), RECOMMEND_BATCH_USERS):
+        chunk = users[begin:begin + RECOMMEND_BATCH_USERS]
+        # 제외할 공고 수만큼 더 가져온 뒤 거름
+        extra = max((len(viewed.get(user, ())) for user in chunk), default=0)
+        rows, scores = index.vectors.scan_batch(profiles[begin:begin + len(chunk)], top_k + extra, exclude=expired)
+        ids = np.asarray(index.ids)[rows]
+        for user, user_ids, user_scores in zip(chunk, ids.tolist(), scores.tolist()):
+            excluded = viewed.get(user, set())
+            results[user] = [
+                (job_id, score) for job_id, score in zip(user_ids, user_scores)
+                if job_id not in excluded and score != -np.inf
+            ][:top_k]
+    return results
+
+
+def save_recommendations(conn, results, links=None):
+    """results: 사용자 → [(공고 id, 점수)], links: {공고 id: 링크} (없는 공고는 저장하지 않음)"""
+    links = links or {}
+    cursor = conn.cursor()
+    users = list(results)
+    for begin in range(0, len(users), RECOMMEND_BATCH_USERS):
+        chunk = users[begin:begin + RECOMMEND_BATCH_USERS]
+        cursor.execute(
+            f"DELETE FROM recommended_job_posting WHERE customer_id IN ({', '.join(['%s'] * len(chunk))})",
+            chunk,
+        )
+        rows = [
+            (user, rank, job_id, links[job_id], float(score))
+            for user in chunk
+            for rank, (job_id, score) in enumerate([item for item in results[user] if item[0] in links], start=1)
+        ]
+        if rows:
+            cursor.executemany(
+                "INSERT INTO recommended_job_posting (customer_id, 순위, 공고_id, 링크, 점수) VALUES (%s, %s, %s, %s, %s)",
+                rows,
+            )
+        conn.commit()
+    cursor.close()
+
+
+def run_batch(conn, index):
+    """전체 사용자 추천 공고 재계산, 반환: 추천을 저장한 사용자 수"""
+    create_recommendation_table(conn)
+    histories = fetch_histories(conn)
+    users, profiles = profile_vectors(index.embedder, histories)
+    results = score_users(index, users, profiles, fetch_viewed_job_ids(conn))
+    links = current_links(conn, index, sorted({job_id for items in results.values() for job_id, _ in items}))
+    save_recommendations(conn, results, links)
+    # 내역이 없어진 사용자의 이전 추천 삭제
+    cursor = conn.cursor()
+    cursor.execute("SELECT DISTINCT customer_id FROM recommended_job_posting")
+    stale = [row[0] for row in cursor.fetchall() if row[0] not in results]
+    cursor.close()
+    if stale:
+        save_recommendations(conn, {user: [] for user in stale})
+    return len(results)
+
+
+def recommend_for_user(conn, index, user_id, top_k=RECOMMEND_TOP_K):
+    """사용자 한 명의 추천 공고 id 목록: 배치 결과, 없으면 (배치 이후 가입/첫 내역) 바로 계산
+
+    배치 이후 마감된 공고는 마감일 범위 조건으로 제외 (스위퍼가 지우기 전이라도),
+    배치 이후 다시 크롤링해 id 가 다른 공고를 가리키면 링크가 달라 제외
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"""
+    SELECT r.공고_id FROM recommended_job_posting r
+    JOIN job_posting_new j ON j.id = r.공고_id AND j.링크 = r.링크
+    WHERE r.customer_id = %s AND {active_condition("j")}
+    ORDER BY r.순위 LIMIT %s
+    """, (user_id, top_k))
+    job_ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    if job_ids:
+        RECOMMENDATIONS_SERVED.inc(source='batch')
+        return job_ids
+    histories = fetch_histories(conn, [user_id]) if index is not None else {}
+    if not histories:
+        RECOMMENDATIONS_SERVED.inc(source='empty')
+        return []
+    users, profiles = profile_vectors(index.embedder, histories)
+    results = score_users(index, users, profiles, fetch_viewed_job_ids(conn, [user_id]), top_k)
+    RECOMMENDATIONS_SERVED.inc(source='on_demand')
+    job_ids = [job_id for job_id, _ in results.get(user_id, [])]
+    links = current_links(conn, index, job_ids)
+    return [job_id for job_id in job_ids if job_id in links]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 맞춤 공고 추천 배치")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--index", default=JOB_INDEX_PATH, help="검색 인덱스 파일 (python -m jumpit.retrieval build)")
+    args = parser.parse_args()
+
+    from .db import get_db_connection
+    started = time.perf_counter()
+    index = JobIndex.load(args.index)
+    conn = get_db_connection()
+    try:
+        users = run_batch(conn, index)
+    finally:
+        conn.close()
+    print(f"사용자 {users}명 추천 공고 저장 ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+from string import Template
+
+# 공고 목록 한 건 (search_job 결과 튜플의 job[0] ~ job[6])
+JOB_LIST_ITEM = Template(
+    "$rank.  $title\n"
+    "회사명: $company\n"
+    "기술스택: $skill\n"
+    "근무지: $location\n"
+    "조건: $condition\n"
+    "모집기간: $period\n"
+    "[지원 링크] $link\n\n"
+)
+
+# 상세 정보 한 항목
+JOB_DETAIL_ITEM = Template("[$name]\n$value\n")
+
+_GUIDE_OTHER_JOB = "✅ 다른 직무의 공고 검색을 원하시면, 직무 이름을 입력해주세요.\n"
+_GUIDE_DETAIL = (
+    "✅ 상세 정보를 원하시면, ❗공고 번호와 함께❗ 상세 정보를 요청해주세요.\n"
+    "✅ 열람 가능한 상세 정보에는 주요업무, 자격요건, 우대사항, 복지 및 혜택, 채용절차, 학력요건, 근무지역 상세, 마감일자가 있습니다.\n"
+)
+_GUIDE_INTERVIEW = "🗨️ 면접 연습을 원하시면, 면접 연습을 요청해주세요."
+
+# 공고 목록 뒤에 붙는 안내 문구 (다음 공고가 있는 경우 / 마지막 페이지)
+JOB_LIST_FOOTER = (
+    "✅ 더 많은 공고를 원하시면 추가 공고를 요청해주세요.\n"
+    + _GUIDE_OTHER_JOB
+    + _GUIDE_DETAIL
+    + "🧾 자기소개서 작성을 원하시면, ❗공고 번호와 함께❗ 자기소개서 작성을 요청해주세요.\n"
+    + _GUIDE_INTERVIEW
+)
+JOB_LIST_LAST_FOOTER = (
+    "❌ 더 이상 공고가 없습니다.\n"
+    + _GUIDE_OTHER_JOB
+    + _GUIDE_DETAIL
+    + "🧾 자기소개서 작성을 원하시면, ❗공고 번호와 함께❗ 자기소개서 작성을 요청해주세요.\n"
+    + _GUIDE_INTERVIEW
+)
+
+# 상세 정보 뒤에 붙는 안내 문구
+JOB_DETAIL_FOOTER = (
+    "\n\n"
+    + _GUIDE_OTHER_JOB
+    + "🧾 해당 공고로 자기소개서 작성을 원하시면, 자기소개서 작성을 요청해주세요.\n"
+    + _GUIDE_INTERVIEW
+)
+
+
+def render_job_list(jobs, start=0):
+    """공고 목록 출력 (번호는 start + 1 부터)"""
+    return "".join(
+        JOB_LIST_ITEM.substitute(
+            rank=rank, title=job[0], company=job[1], skill=job[2],
+            location=job[3], condition=job[4], period=job[5], link=job[6],
+        )
+        for rank, job in enumerate(jobs, start + 1)
+    )
+
+
+def render_job_detail(items):
+    """(표시 이름, 값) 목록을 [상세 정보 제목] \\n 내용 형식으로 출력"""
+    return "\n".join(
+        JOB_DETAIL_ITEM.substitute(name=name, value=value if value else "정보 없음")
+        for name, value in items
+    ).strip()
@@ -0,0 +1,570 @@
+"""
+채용 공고 하이브리드 검색 (키워드 일치 + 벡터 유사도, RRF 로 순위 결합)
+
+공고의 제목/사용기술/주요업무를 CPU 에서 임베딩해 인덱스 파일로 저장하고 챗봇 서버가 읽어서 사용합니다.
+벡터는 int8 로 양자화해 벡터 저장소(vector_store.py)에 크롤링 세대별로 저장하고 워커끼리 메모리 맵으로 공유합니다.
+
+벡터 유사도는 학습된 언어 모델이 아니라 단어/글자 n-gram 해시(HashingEmbedder)와 수작업 동의어 사전(SYNONYM_GROUPS)으로
+만든 어휘 기반 근사입니다. 글자가 겹치거나 사전에 있는 표현만 가깝게 나오고, 글자가 다른 같은 뜻("서버 개발" 과
+"API 설계")이나 문맥은 구분하지 못합니다. 의미 검색이 필요하면 모델 임베딩으로 바꿔야 합니다 (저장소/RRF 결합은 그대로 사용).
+
+크롤링 후 인덱스 생성 (run_scraper.sh):
+    python -m jumpit.retrieval build
+"""
+import argparse
+import logging
+import math
+import os
+import re
+import threading
+import time
+import zlib
+
+import numpy as np
+
+from .autocomplete import SuggestionTrie, suggestion_entries
+from .facets import FacetIndex, parse_posting_facets
+from .fuzzy import FuzzyIndex
+from .metrics import RETRIEVAL_SECONDS
+from .skills import SKILL_ALIASES, SkillIndex, normalize_skills
+from .vector_store import VECTOR_STORE_DIR, VectorStore, file_lock, write_generation
+
+logger = logging.getLogger(__name__)
+
+JOB_INDEX_PATH = os.getenv('JOB_INDEX_PATH', 'job_index.npz')
+# 인덱스 파일이 없으면 서버가 DB 에서 직접 만들지 여부 (기본: 끔, 크롤링 후 run_scraper.sh 에서 생성)
+# 켜면 워커끼리 파일 잠금으로 한 번만 만들고 나머지 워커는 만들어진 파일을 읽음
+JOB_INDEX_AUTOBUILD = os.getenv('JOB_INDEX_AUTOBUILD', 'false').lower() == 'true'
+# 인덱스 파일이 바뀌었는지 확인하는 간격(초)
+JOB_INDEX_RELOAD_SECONDS = float(os.getenv('JOB_INDEX_RELOAD_SECONDS', '30'))
+JOB_EMBEDDING_DIM = int(os.getenv('JOB_EMBEDDING_DIM', '256'))
+# 공고 수가 이보다 많으면 IVF(클러스터) 인덱스, 적으면 전체 비교
+JOB_ANN_THRESHOLD = int(os.getenv('JOB_ANN_THRESHOLD', '20000'))
+JOB_ANN_NPROBE = int(os.getenv('JOB_ANN_NPROBE', '8'))
+# 벡터 검색으로 가져올 후보 수와 최소 코사인 유사도 (키워드가 일치하지 않는 공고는 이 값 이상만 포함)
+VECTOR_TOP_K = int(os.getenv('VECTOR_TOP_K', '50'))
+VECTOR_MIN_SIMILARITY = float(os.getenv('VECTOR_MIN_SIMILARITY', '0.35'))
+RRF_K = int(os.getenv('RRF_K', '60'))
+# 오타 교정 어휘에 넣을 제목 단어의 최소 공고 수 (공고 하나에만 있는 단어는 그 자체가 오타일 수 있음)
+JOB_VOCAB_MIN_COUNT = int(os.getenv('JOB_VOCAB_MIN_COUNT', '2'))
+
+# 벡터 저장소의 공고 벡터 컬렉션 이름
+JOB_VECTOR_COLLECTION = 'job_posting'
+
+INDEX_VERSION = 7
+
+# 같은 뜻으로 쓰이는 직무 표현 (검색어에 하나가 있으면 나머지도 검색어에 추가)
+SYNONYM_GROUPS = [
+    ["머신러닝", "ml", "machine learning"],
+    ["인공지능", "ai", "딥러닝"],
+    ["개발자", "엔지니어", "프로그래머", "engineer", "developer"],
+    ["백엔드", "backend", "서버 개발"],
+    ["프론트엔드", "frontend", "프론트", "웹 퍼블리셔"],
+    ["풀스택", "fullstack", "full stack"],
+    ["데브옵스", "devops", "sre"],
+    ["데이터 엔지니어", "data engineer", "데이터 파이프라인"],
+    ["데이터 분석가", "data analyst", "데이터 분석"],
+    ["안드로이드", "android"],
+    ["ios", "아이폰", "swift"],
+    ["임베디드", "embedded", "펌웨어"],
+    ["로봇", "robot", "ros"],
+    ["보안", "security"],
+    ["게임", "game"],
+    ["클라우드", "cloud"],
+    ["반도체", "semiconductor"],
+    ["챗봇", "llm", "langchain"],
+]
+_SYNONYMS = {}
+for _group in SYNONYM_GROUPS:
+    for _term in _group:
+        _SYNONYMS[_term] = [t for t in _group if t != _term]
+
+_WORD = re.compile(r'[0-9a-zA-Z가-힣#+.]+')
+_FIELD_WEIGHTS = (3.0, 2.0, 1.0)  # 제목, 사용기술, 주요업무
+_DESCRIPTION_CHARS = 400
+
+
+def _features(text):
+    """단어와 글자 2/3-gram (한국어 복합어, 띄어쓰기 차이 대응)"""
+    for word in _WORD.findall(text.lower()):
+        yield 'w:' + word
+        padded = f'<{word}>'
+        for n in (2, 3):
+            for i in range(len(padded) - n + 1):
+                yield padded[i:i + n]
+
+
+def _hash_counts(text, dim, weight, counts):
+    for feature in _features(text):
+        h = zlib.crc32(feature.encode('utf-8'))
+        # 부호도 해시로 정해 충돌한 특징끼리 상쇄되도록 함
+        counts[h % dim] = counts.get(h % dim, 0.0) + (weight if h & 0x80000000 else -weight)
+
+
+def expand_query(text):
+    """검색어에 동의어 추가 (영문 약어는 단어 단위로 일치할 때만, "ml" 이 "html" 에 걸리지 않도록)"""
+    lowered = text.lower()
+    words = set(_WORD.findall(lowered))
+    extra = []
+    for term, others in _SYNONYMS.items():
+        matched = term in words if term.isascii() and ' ' not in term else term in lowered
+        if matched:
+            extra.extend(others)
+    return extra
+
+
+class HashingEmbedder:
+    """해시 n-gram 임베딩 (모델 파일, GPU 없이 CPU 에서 계산, IDF 가중치 적용 후 L2 정규화)
+
+    글자 겹침만 보는 어휘 기반 근사라 동의어 사전에 없는 같은 뜻의 표현은 가깝게 나오지 않음
+    """
+
+    def __init__(self, dim=JOB_EMBEDDING_DIM, idf=None):
+        self.dim = dim
+        self.idf = idf if idf is not None else np.ones(dim, dtype=np.float32)
+
+    def _raw(self, fields):
+        counts = {}
+        for text, weight in fields:
+            if text:
+                _hash_counts(text, self.dim, weight, counts)
+        vector = np.zeros(self.dim, dtype=np.float32)
+        if counts:
+            index = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+            values = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            # 반복된 특징의 영향을 줄이기 위해 로그 스케일
+            vector[index] = np.sign(values) * np.log1p(np.abs(values))
+        return vector
+
+    def fit_idf(self, raw_vectors):
+        df = (raw_vectors != 0).sum(axis=0)
+        self.idf = np.log((1 + len(raw_vectors)) / (1 + df)).astype(np.float32) + 1.0
+
+    def normalize(self, vectors):
+        vectors = vectors * self.idf
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def embed_posting(self, title, skills, description):
+        return self._raw(zip((title, skills, (description or '')[:_DESCRIPTION_CHARS]), _FIELD_WEIGHTS))
+
+    def embed_fields(self, fields):
+        """(텍스트, 가중치) 목록 → 정규화된 벡터 (공고 외 문서: 자기소개서 등)"""
+        return self.normalize(self._raw(fields))
+
+    def embed_query(self, text):
+        fields = [(text, 1.0)] + [(term, 0.7) for term in expand_query(text)]
+        return self.normalize(self._raw(fields))
+
+
+def _kmeans(vectors, clusters, iterations=8, seed=0, sample=50000):
+    """코사인 k-means (학습은 표본으로, 정규화된 벡터 기준)"""
+    rng = np.random.default_rng(seed)
+    train = vectors if len(vectors) <= sample else vectors[rng.choice(len(vectors), sample, replace=False)]
+    centroids = train[rng.choice(len(train), clusters, replace=False)].copy()
+    for _ in range(iterations):
+        assign = np.argmax(train @ centroids.T, axis=1)
+        for c in range(clusters):
+            members = train[assign == c]
+            if len(members):
+                centroid = members.sum(axis=0)
+                centroids[c] = centroid / max(np.linalg.norm(centroid), 1e-12)
+    return centroids
+
+
+class JobIndex:
+    """공고 벡터 + 키워드 검색용 텍스트, 공고 수가 많으면 IVF 로 후보를 줄여 비교
+
+    vectors 는 생성 직후에는 float32 배열, 파일에서 읽으면 VectorStore (int8 메모리 맵)
+    """
+
+    def __init__(self, ids, vectors, idf, title_blob, title_starts, skill_blob, skill_starts,
+                 centroids=None, list_offsets=None, built_at=None, skills=None, facets=None, vocabulary=None,
+                 suggestions=None, link_hashes=None):
+        self.ids = ids
+        self.vectors = vectors
+        self.embedder = HashingEmbedder(len(idf), idf)
+        self.title_blob, self.title_starts = title_blob, title_starts
+        self.skill_blob, self.skill_starts = skill_blob, skill_starts
+        self.centroids = centroids
+        self.list_offsets = list_offsets
+        self.built_at = built_at or time.time()
+        # 표준 기술 → 공고 위치 비트맵 (기술 이름 검색은 부분 일치 대신 정확히 일치)
+        self.skills = skills or SkillIndex([], [], len(ids))
+        # 지역/경력/마감일 → 공고 위치 비트맵 (조건 검색, 결과별 패싯 개수)
+        self.facets = facets or FacetIndex.empty(len(ids))
+        # 오타 교정용 (어휘, 공고 수), 역색인은 처음 교정할 때 생성
+        self.vocabulary = vocabulary or ([], [])
+        self._fuzzy = None
+        self._fuzzy_lock = threading.Lock()
+        # 자동완성 접두사 트라이 (제목 단어/구, 기술, 회사명)
+        self.suggestions = suggestions or SuggestionTrie.empty()
+        # 공고 위치별 링크 CRC32: 크롤링마다 job_posting_new 를 다시 만들어 id 가 재사용되므로
+        # 조회한 행이 인덱스를 만든 공고와 같은지 확인 (없으면 확인하지 않음)
+        self.link_hashes = link_hashes
+        self._positions = None
+
+    def __len__(self):
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, rows, dim=JOB_EMBEDDING_DIM, ann_threshold=JOB_ANN_THRESHOLD):
+        """rows: (id, 제목, 사용기술, 주요업무[, 표준기술[, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일[, 상시채용, 회사명[, 링크]]]])
+
+        표준기술이 없으면 사용기술을 표준화, 패싯 컬럼이 없으면 패싯 없이 생성, 회사명이 없으면 회사명 제안 없음
+        """
+        embedder = HashingEmbedder(dim)
+        rows = list(rows)
+        raw = np.zeros((len(rows), dim), dtype=np.float32)
+        for i, (_, title, skills, description, *_) in enumerate(rows):
+            raw[i] = embedder.embed_posting(title or '', skills or '', description or '')
+        embedder.fit_idf(raw)
+        vectors = embedder.normalize(raw).astype(np.float32)
+        ids = np.array([row[0] for row in rows], dtype=np.int64)
+        titles = [(row[1] or '').lower() for row in rows]
+        skills = [(row[2] or '').lower() for row in rows]
+        skill_lists = [
+            row[4].split(',') if len(row) > 4 and row[4] else normalize_skills(row[2]) for row in rows
+        ]
+        facets = FacetIndex.build(row[5:10] if len(row) > 9 else (None,) * 5 for row in rows)
+        # 자동완성 공고 수는 만들 때 마감되지 않은 공고 기준
+        active = np.zeros(len(rows), dtype=bool)
+        active[facets.active().to_array()] = True
+        link_hashes = np.array([link_hash(row[12]) if len(row) > 12 else 0 for row in rows], dtype=np.uint32)
+        suggestions = SuggestionTrie.build(suggestion_entries(
+            [row[1] for row in rows], skill_lists, [row[11] if len(row) > 11 else None for row in rows], active))
+
+        centroids = list_offsets = None
+        if len(rows) > ann_threshold:
+            clusters = max(16, int(math.sqrt(len(rows))))
+            centroids = _kmeans(vectors, clusters)
+            assign = np.argmax(vectors @ centroids.T, axis=1)
+            # 같은 클러스터의 벡터가 연속되도록 정렬 (검색 시 구간만 읽음)
+            order = np.argsort(assign, kind='stable')
+            vectors, ids, link_hashes = vectors[order], ids[order], link_hashes[order]
+            titles = [titles[i] for i in order]
+            skills = [skills[i] for i in order]
+            skill_lists = [skill_lists[i] for i in order]
+            facets = facets.take(order)
+            list_offsets = np.searchsorted(assign[order], np.arange(clusters + 1)).astype(np.int64)
+
+        title_blob, title_starts = _pack(titles)
+        skill_blob, skill_starts = _pack(skills)
+        return cls(ids, vectors, embedder.idf, title_blob, title_starts, skill_blob, skill_starts,
+                   centroids, list_offsets, skills=SkillIndex.build(skill_lists), facets=facets,
+                   vocabulary=_vocabulary(titles, skill_lists), suggestions=suggestions,
+                   link_hashes=link_hashes)
+
+    def save(self, path, store_dir=VECTOR_STORE_DIR):
+        # 벡터를 새 세대로 먼저 저장한 뒤, 그 세대 번호를 인덱스 파일에 기록
+        generation = write_generation(store_dir, JOB_VECTOR_COLLECTION, self.ids, self.vectors)
+        tmp_path = f'{path}.tmp.npz'
+        arrays = {
+            'version': np.array(INDEX_VERSION), 'built_at': np.array(self.built_at),
+            'vector_generation': np.array(generation), 'idf': self.embedder.idf,
+            'title_blob': np.frombuffer(self.title_blob, dtype=np.uint8), 'title_starts': self.title_starts,
+            'skill_blob': np.frombuffer(self.skill_blob, dtype=np.uint8), 'skill_starts': self.skill_starts,
+        }
+        arrays['skill_names'], arrays['skill_rows'], arrays['skill_offsets'] = self.skills.to_arrays()
+        arrays.update(self.facets.to_arrays())
+        arrays['vocab_terms'] = np.array(self.vocabulary[0], dtype=str)
+        arrays['vocab_counts'] = np.array(self.vocabulary[1], dtype=np.int64)
+        arrays.update(self.suggestions.to_arrays())
+        if self.link_hashes is not None:
+            arrays['link_hashes'] = self.link_hashes
+        if self.centroids is not None:
+            arrays.update(centroids=self.centroids, list_offsets=self.list_offsets)
+        np.savez(tmp_path, **arrays)
+        # 서버가 쓰는 중인 파일을 읽지 않도록 교체
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, store_dir=VECTOR_STORE_DIR):
+        with np.load(path) as data:
+            if int(data['version']) != INDEX_VERSION:
+                raise ValueError(f'지원하지 않는 인덱스 버전: {int(data["version"])}')
+            # 인덱스 파일과 같은 세대로 고정 (IVF 구간이 그 세대의 행 순서 기준)
+            store = VectorStore(store_dir, JOB_VECTOR_COLLECTION, generation=int(data['vector_generation']))
+            return cls(
+                store.ids, store, data['idf'],
+                data['title_blob'].tobytes(), data['title_starts'],
+                data['skill_blob'].tobytes(), data['skill_starts'],
+                data['centroids'] if 'centroids' in data else None,
+                data['list_offsets'] if 'list_offsets' in data else None,
+                float(data['built_at']),
+                SkillIndex.from_arrays(data['skill_names'], data['skill_rows'], data['skill_offsets'], len(store)),
+                FacetIndex.from_arrays(data),
+                (data['vocab_terms'].tolist(), data['vocab_counts'].tolist()),
+                SuggestionTrie.from_arrays(data),
+                data['link_hashes'] if 'link_hashes' in data else None,
+            )
+
+    @property
+    def fuzzy(self):
+        """어휘 자모 trigram 역색인 (처음 사용할 때 한 번 생성)"""
+        if self._fuzzy is None:
+            with self._fuzzy_lock:
+                if self._fuzzy is None:
+                    self._fuzzy = FuzzyIndex(*self.vocabulary)
+        return self._fuzzy
+
+    def same_posting(self, job_id, link):
+        """job_posting_new 에서 조회한 (id, 링크) 가 인덱스를 만들 때의 공고와 같은지
+
+        크롤링 중이거나 크롤링 후 인덱스 생성이 실패하면 같은 id 가 다른 공고이므로 False
+        """
+        if self.link_hashes is None:
+            return True
+        if self._positions is None:
+            self._positions = {int(job_id): position for position, job_id in enumerate(self.ids.tolist())}
+        position = self._positions.get(int(job_id))
+        return position is not None and int(self.link_hashes[position]) == link_hash(link)
+
+    def _rows_containing(self, blob, starts, term):
+        """blob 에서 term 이 포함된 공고 위치 집합"""
+        needle = term.lower().encode('utf-8')
+        rows = set()
+        position = blob.find(needle)
+        while position != -1:
+            row = int(np.searchsorted(starts, position, side='right')) - 1
+            rows.add(row)
+            # 같은 공고 안의 다음 위치는 건너뜀
+            position = blob.find(needle, int(starts[row + 1]) if row + 1 < len(starts) else len(blob))
+        return rows
+
+    def lexical(self, keywords):
+        """제목/사용기술에 키워드가 포함된 공고 위치, 점수 순 (제목 일치 2점, 사용기술 1점)
+
+        여러 단어로 된 키워드는 모든 단어(또는 동의어)가 포함되어야 일치 ("ML 엔지니어" → "머신러닝 (ML) 개발자")
+        기술 이름이면 사용기술은 표준 기술 비트맵으로 정확히 일치 ("Java" 가 "JavaScript" 에 걸리지 않음)
+        """
+        scores = {}
+        for keyword in keywords:
+            # "Spring Boot" 처럼 여러 단어로 된 기술 이름은 한 단어로 취급
+            words = [keyword] if self.skills.resolve(keyword) else keyword.split()
+            if not words:
+                continue
+            in_title = in_any = None
+            for word in words:
+                # 짧은 영문 동의어("ml", "ai")는 다른 단어 안에도 흔히 들어 있어 제외
+                terms = [word] + [t for t in expand_query(word) if not (t.isascii() and len(t) <= 3)]
+                title_rows, skill_rows = set(), set()
+                skill = self.skills.resolve(word)
+                if skill:
+                    skill_rows = set(self.skills.bitmap(skill).to_array().tolist())
+                for term in terms:
+                    title_rows |= self._rows_containing(self.title_blob, self.title_starts, term)
+                    if not skill:
+                        skill_rows |= self._rows_containing(self.skill_blob, self.skill_starts, term)
+                in_title = title_rows if in_title is None else in_title & title_rows
+                in_any = (title_rows | skill_rows) if in_any is None else in_any & (title_rows | skill_rows)
+            for row in in_any:
+                scores[row] = scores.get(row, 0) + (2 if row in in_title else 1)
+        return sorted(scores, key=lambda row: (-scores[row], self.ids[row]))
+
+    def vector(self, query, top_k=VECTOR_TOP_K, nprobe=JOB_ANN_NPROBE):
+        """(위치, 코사인 유사도) 상위 top_k"""
+        if not len(self.ids):
+            return []
+        q = self.embedder.embed_query(query)
+        ranges = None
+        if self.centroids is not None:
+            probe = np.argpartition(-(self.centroids @ q), min(nprobe, len(self.centroids)) - 1)[:nprobe]
+            # 같은 클러스터는 연속된 행이므로 구간 단위로 읽음
+            ranges = [(int(self.list_offsets[c]), int(self.list_offsets[c + 1])) for c in sorted(probe)]
+        if isinstance(self.vectors, VectorStore):
+            rows, scores = self.vectors.scan(q, top_k, ranges)
+            return list(zip(rows.tolist(), scores.tolist()))
+        if ranges is None:
+            candidates = None
+            scores = self.vectors @ q
+        else:
+            candidates = np.concatenate([np.arange(start, stop) for start, stop in ranges])
+            scores = self.vectors[candidates] @ q
+        k = min(top_k, len(scores))
+        if k == 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        rows = top if candidates is None else candidates[top]
+        return list(zip(rows.tolist(), scores[top].tolist()))
+
+    def search(self, keywords, query, top_k=VECTOR_TOP_K, min_similarity=VECTOR_MIN_SIMILARITY, allowed=None):
+        """키워드 일치 순위와 벡터 유사도 순위를 RRF 로 결합한 공고 id 목록
+
+        키워드가 일치한 공고는 모두 포함 (기존 LIKE 검색과 같은 재현율),
+        일치하지 않는 공고는 유사도가 min_similarity 이상일 때만 포함
+        allowed: 패싯 조건(지역/경력)을 만족하는 공고 위치 비트맵, 있으면 그 안에서만 검색
+        """
+        started = time.perf_counter()
+        lexical = self.lexical(keywords)
+        lexical_done = time.perf_counter()
+        RETRIEVAL_SECONDS.observe(lexical_done - started, stage='lexical')
+        if allowed is not None:
+            mask = np.zeros(len(self.ids), dtype=bool)
+            mask[allowed.to_array()] = True
+            lexical = [row for row in lexical if mask[row]]
+            # 조건에 맞지 않는 후보가 걸러지므로 더 많이 가져옴
+            vector = [(row, score) for row, score in self.vector(query, top_k * 4) if mask[row]][:top_k]
+        else:
+            vector = self.vector(query, top_k)
+        vector_done = time.perf_counter()
+        RETRIEVAL_SECONDS.observe(vector_done - lexical_done, stage='vector')
+
+        fused = {}
+        for rank, row in enumerate(lexical):
+            fused[row] = 1.0 / (RRF_K + rank + 1)
+        lexical_rows = set(fused)
+        for rank, (row, similarity) in enumerate(vector):
+            if row in lexical_rows or similarity >= min_similarity:
+                fused[row] = fused.get(row, 0.0) + 1.0 / (RRF_K + rank + 1)
+        ordered = sorted(fused, key=lambda row: -fused[row])
+        RETRIEVAL_SECONDS.observe(time.perf_counter() - vector_done, stage='fusion')
+        return [int(self.ids[row]) for row in ordered]
+
+
+def _vocabulary(titles, skill_lists):
+    """오타 교정 어휘: 제목 단어, 표준 기술 이름 (공고 수 포함) + 기술 별칭, 동의어 사전 (공고 수 0)"""
+    counts = {}
+    for title in titles:
+        for word in set(_WORD.findall(title)):
+            if len(word) >= 2 and not word.isdigit():
+                counts[word] = counts.get(word, 0) + 1
+    counts = {word: count for word, count in counts.items() if count >= JOB_VOCAB_MIN_COUNT}
+    display = {}
+    for skills in skill_lists:
+        for skill in skills:
+            counts[skill.lower()] = counts.get(skill.lower(), 0) + 1
+            display[skill.lower()] = skill
+    for name, aliases in SKILL_ALIASES.items():
+        for term in [name] + aliases:
+            counts.setdefault(term.lower(), 0)
+            display.setdefault(term.lower(), term)
+    for term in _SYNONYMS:
+        counts.setdefault(term, 0)
+    terms = sorted(counts)
+    return [display.get(term, term) for term in terms], [counts[term] for term in terms]
+
+
+def link_hash(link):
+    """공고 링크 → CRC32 (인덱스와 테이블의 공고 일치 확인용)"""
+    return zlib.crc32((link or '').encode('utf-8'))
+
+
+def _pack(texts):
+    """문자열 목록 → 줄바꿈으로 이은 UTF-8 바이트, 각 문자열 시작 위치"""
+    encoded = [text.replace('\n', ' ').encode('utf-8') for text in texts]
+    starts = np.zeros(len(encoded), dtype=np.int64)
+    position = 0
+    for i, item in enumerate(encoded):
+        starts[i] = position
+        position += len(item) + 1
+    return b'\n'.join(encoded), starts
+
+
+def fetch_index_rows(conn):
+    """인덱스 생성용 (id, 제목, 사용기술, 주요업무, 표준기술, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용, 회사명, 링크) 목록"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+        SELECT id, 제목, 사용기술, 주요업무, 표준기술, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용, 회사명, 링크
+        FROM job_posting_new ORDER BY id
+        """)
+        rows = cursor.fetchall()
+    except Exception:
+        # 표준기술/패싯 컬럼이 생기기 전에 크롤링한 테이블 (인덱스 생성 시 원문을 표준화)
+        conn.rollback()
+        cursor.close()
+        cursor = conn.cursor()
+        cursor.execute("""
+        SELECT id, 제목, 사용기술, 주요업무, 근무지역, 근로조건, 모집기간, 마감일자, 저장일시, 회사명, 링크
+        FROM job_posting_new ORDER BY id
+        """)
+        rows = [
+            (job_id, title, skills, description, ",".join(normalize_skills(skills)),
+             *parse_posting_facets(region, condition, period, deadline, saved_at), company, link)
+            for job_id, title, skills, description, region, condition, period, deadline, saved_at, company, link
+            in cursor.fetchall()
+        ]
+    cursor.close()
+    return rows
+
+
+class JobRetriever:
+    """인덱스 파일을 읽어 두고, 파일이 바뀌면 다시 읽음 (크롤링 후 재생성)"""
+
+    def __init__(self, path=JOB_INDEX_PATH, connection_factory=None, store_dir=VECTOR_STORE_DIR):
+        self.path = path
+        self.store_dir = store_dir
+        self.connection_factory = connection_factory
+        self._index = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def index(self):
+        """현재 인덱스 (없고 만들 수도 없으면 None → 호출하는 쪽에서 LIKE 검색)"""
+        now = time.monotonic()
+        if self._index is not None and now - self._checked_at < JOB_INDEX_RELOAD_SECONDS:
+            return self._index
+        with self._lock:
+            if self._index is not None and now - self._checked_at < JOB_INDEX_RELOAD_SECONDS:
+                return self._index
+            self._checked_at = now
+            try:
+                mtime = os.path.getmtime(self.path)
+            except OSError:
+                mtime = None
+            if mtime is not None and mtime != self._mtime:
+                try:
+                    self._index = JobIndex.load(self.path, self.store_dir)
+                    self._mtime = mtime
+                    logger.info("공고 인덱스 로드: %s건", len(self._index))
+                except Exception:
+                    logger.exception("공고 인덱스를 읽을 수 없습니다: %s", self.path)
+            elif mtime is None and self._index is None and JOB_INDEX_AUTOBUILD and self.connection_factory:
+                self._index = self._build_from_db()
+            return self._index
+
+    def _build_from_db(self):
+        try:
+            # 여러 워커가 동시에 인덱스가 없다고 판단해도 한 워커만 만들고, 나머지는 잠금을 기다린 뒤 그 파일을 읽음
+            with file_lock(f'{self.path}.lock'):
+                if not os.path.exists(self.path):
+                    conn = self.connection_factory()
+                    try:
+                        rows = fetch_index_rows(conn)
+                    finally:
+                        conn.close()
+                    JobIndex.build(rows).save(self.path, self.store_dir)
+            # 만든 float32 벡터 대신 저장소를 메모리 맵으로 열어 사용
+            index = JobIndex.load(self.path, self.store_dir)
+            self._mtime = os.path.getmtime(self.path)
+            logger.info("공고 인덱스 생성: %s건", len(index))
+            return index
+        except Exception:
+            logger.exception("공고 인덱스 생성 실패")
+            return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채용 공고 하이브리드 검색 인덱스")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--path", default=JOB_INDEX_PATH)
+    parser.add_argument("--store-dir", default=VECTOR_STORE_DIR, help="벡터 저장소 디렉터리")
+    args = parser.parse_args()
+
+    from .db import get_db_connection
+    started = time.perf_counter()
+    conn = get_db_connection()
+    try:
+        rows = fetch_index_rows(conn)
+    finally:
+        conn.close()
+    index = JobIndex.build(rows)
+    index.save(args.path, args.store_dir)
+    print(f"공고 {len(index)}건 인덱스 생성 ({time.perf_counter() - started:.1f}초): {args.path}, {args.store_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,19 @@
+import logging
+
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
-import pymysql
-import os
-from dotenv import load_dotenv
 
-load_dotenv()
+from .auth_cache import user_cache
+from .db import get_db_connection
+
+logger = logging.getLogger(__name__)
 
-def get_db_connection():
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        port=int(os.getenv('DB_PORT')),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME'),
-        charset="utf8mb4"
-    )
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    # 가입, 정보 수정, 탈퇴 시 캐시된 사용자 정보 삭제
+    user_cache.invalidate(instance.username)
 
 @receiver(post_save, sender=User)
 def add_user_to_customer_table(sender, instance, created, **kwargs):
@@ -41,5 +39,5 @@ def add_user_to_customer_table(sender, instance, created, **kwargs):
                 db.commit()
             cursor.close()
             db.close()
-        except Exception as e:
-            print(f"회원가입 후 customer 테이블 업데이트 중 오류 발생: {e}")
\ No newline at end of file
+        except Exception:
+            logger.exception("회원가입 후 customer 테이블 업데이트 중 오류 발생")
\ No newline at end of file
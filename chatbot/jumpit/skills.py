@@ -0,0 +1,192 @@
+"""
+기술 스택 표준화 (별칭 사전) + 기술별 공고 비트맵 인덱스
+
+크롤러(LSJ/crawling.py)가 사용기술 원문을 표준 기술 이름으로 바꿔 표준기술 컬럼에 저장하고,
+검색 인덱스(retrieval.py)는 표준 기술마다 공고 비트맵을 만들어 AND/OR/NOT 조건을 비트 연산으로 계산합니다.
+("Java" 검색에 "JavaScript" 공고가 걸리던 LIKE 부분 일치 문제 해결)
+"""
+import re
+
+import numpy as np
+
+from .bitmap import Bitmap
+
+# 표준 기술 이름 → 별칭 (소문자 비교, 표준 이름 자체도 별칭으로 취급)
+SKILL_ALIASES = {
+    "Python": ["파이썬", "python3"],
+    "Java": ["자바", "java8", "java11", "java17"],
+    "JavaScript": ["js", "자바스크립트", "es6", "ecmascript"],
+    "TypeScript": ["ts", "타입스크립트"],
+    "Node.js": ["node", "nodejs", "node js", "노드"],
+    "React": ["react.js", "reactjs", "리액트"],
+    "React Native": ["reactnative"],
+    "Vue.js": ["vue", "vuejs", "vue3"],
+    "Angular": ["angularjs", "angular.js"],
+    "Next.js": ["nextjs"],
+    "HTML": ["html5"],
+    "CSS": ["css3", "scss", "sass"],
+    "Django": ["장고", "drf", "django rest framework"],
+    "Flask": ["플라스크"],
+    "FastAPI": ["fast api"],
+    "Spring": ["spring framework", "스프링"],
+    "Spring Boot": ["springboot", "스프링부트", "스프링 부트"],
+    "JPA": ["hibernate"],
+    "Kotlin": ["코틀린"],
+    "Swift": ["스위프트"],
+    "SwiftUI": [],
+    "Objective-C": ["objc", "objective c"],
+    "Go": ["golang", "고랭"],
+    "Rust": [],
+    "C": ["c언어"],
+    "C++": ["cpp", "c/c++"],
+    "C#": ["csharp"],
+    ".NET": ["dotnet", "asp.net"],
+    "PHP": [],
+    "Ruby": ["ruby on rails", "rails"],
+    "SQL": [],
+    "MySQL": [],
+    "MariaDB": [],
+    "PostgreSQL": ["postgres", "postgre", "postgresql"],
+    "Oracle": ["oracle db"],
+    "MongoDB": ["mongo"],
+    "Redis": ["레디스"],
+    "Elasticsearch": ["elastic search", "elk"],
+    "Kafka": ["apache kafka", "카프카"],
+    "RabbitMQ": ["rabbit mq"],
+    "AWS": ["amazon web services", "aws ec2", "ec2"],
+    "GCP": ["google cloud", "google cloud platform"],
+    "Azure": ["microsoft azure"],
+    "Docker": ["도커"],
+    "Kubernetes": ["k8s", "쿠버네티스"],
+    "Terraform": [],
+    "Jenkins": [],
+    "Git": ["github", "gitlab"],
+    "Linux": ["리눅스", "ubuntu", "centos"],
+    "Firebase": [],
+    "Android": ["안드로이드"],
+    "iOS": [],
+    "Flutter": ["플러터", "dart"],
+    "TensorFlow": ["텐서플로우", "keras"],
+    "PyTorch": ["torch", "파이토치"],
+    "scikit-learn": ["sklearn", "scikit learn"],
+    "Pandas": ["판다스"],
+    "NumPy": [],
+    "Spark": ["apache spark", "pyspark"],
+    "Hadoop": ["hdfs"],
+    "Airflow": ["apache airflow"],
+    "Tableau": [],
+    "R": [],
+    "LangChain": ["랭체인"],
+    "OpenAI": ["gpt", "chatgpt"],
+    "OpenCV": [],
+    "ROS": ["ros2"],
+    "Unity": ["유니티"],
+    "Unreal Engine": ["unreal", "ue4", "ue5", "언리얼"],
+    "RTOS": ["freertos"],
+    "ARM": ["arm cortex"],
+    "Verilog": ["systemverilog"],
+    "MATLAB": ["매트랩"],
+    "GraphQL": [],
+    "Nginx": [],
+    "Figma": ["피그마"],
+}
+
+_ALIASES = {}
+for _name, _aliases in SKILL_ALIASES.items():
+    for _alias in [_name] + _aliases:
+        _ALIASES[re.sub(r'\s+', ' ', _alias.lower())] = _name
+
+# 사용기술 원문의 구분자 (preprocess_skill 이 · 를 , 로 바꿈)
+_SEPARATORS = re.compile(r'[,/|·\n]+')
+
+
+def canonical_skill(token):
+    """기술 이름 하나 → 표준 이름 (사전에 없으면 None)"""
+    return _ALIASES.get(re.sub(r'\s+', ' ', token.strip().lower()))
+
+
+def normalize_skills(skill_text):
+    """사용기술 원문 → 중복 없는 표준 기술 이름 목록 (사전에 없는 기술은 원문 그대로 유지)"""
+    skills = []
+    for token in _SEPARATORS.split(skill_text or ''):
+        token = token.strip()
+        if not token or token == "정보 없음":
+            continue
+        skill = canonical_skill(token) or token
+        if skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+class SkillIndex:
+    """표준 기술 → 공고 위치 비트맵"""
+
+    def __init__(self, names, bitmaps, size):
+        self.names = list(names)
+        self.bitmaps = dict(zip(self.names, bitmaps))
+        self.size = size
+        self._lower = {name.lower(): name for name in self.names}
+        self._all = None
+
+    @classmethod
+    def build(cls, skill_lists):
+        """공고 위치 순서의 표준 기술 목록들로 생성"""
+        positions = {}
+        for row, skills in enumerate(skill_lists):
+            for skill in skills:
+                positions.setdefault(skill, []).append(row)
+        names = sorted(positions)
+        return cls(names, [Bitmap.from_positions(positions[name]) for name in names], len(skill_lists))
+
+    def to_arrays(self):
+        """인덱스 파일 저장용: (기술 이름, 위치 배열, 기술별 시작 위치)"""
+        rows = [self.bitmaps[name].to_array() for name in self.names]
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(r) for r in rows])
+        flat = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        return np.array(self.names, dtype=str), flat, offsets
+
+    @classmethod
+    def from_arrays(cls, names, flat, offsets, size):
+        bitmaps = [Bitmap.from_positions(flat[offsets[i]:offsets[i + 1]]) for i in range(len(names))]
+        return cls([str(name) for name in names], bitmaps, size)
+
+    def resolve(self, term):
+        """검색어 → 인덱스에 있는 표준 기술 이름 (없으면 None)"""
+        skill = canonical_skill(term)
+        if skill in self.bitmaps:
+            return skill
+        return self._lower.get(term.strip().lower())
+
+    def bitmap(self, skill):
+        return self.bitmaps.get(skill) or Bitmap()
+
+    def all(self):
+        if self._all is None:
+            self._all = Bitmap.full(self.size)
+        return self._all
+
+    def match(self, all_of=(), any_of=(), none_of=()):
+        """모든 기술(AND), 하나 이상(OR), 제외(NOT) 조건을 만족하는 공고 위치 비트맵
+
+        검색어는 별칭도 가능 ("파이썬", "k8s"), 인덱스에 없는 기술은 AND 조건이면 결과 없음
+        """
+        result = None
+        for term in all_of:
+            skill = self.resolve(term)
+            bitmap = self.bitmap(skill) if skill else Bitmap()
+            result = bitmap if result is None else result & bitmap
+        if any_of:
+            union = Bitmap()
+            for term in any_of:
+                skill = self.resolve(term)
+                if skill:
+                    union = union | self.bitmap(skill)
+            result = union if result is None else result & union
+        if result is None:
+            result = self.all()
+        for term in none_of:
+            skill = self.resolve(term)
+            if skill:
+                result = result - self.bitmap(skill)
+        return result
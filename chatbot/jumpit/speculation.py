@@ -0,0 +1,131 @@
+import contextvars
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .metrics import SPECULATIONS
+
+logger = logging.getLogger(__name__)
+
+# classify_intent 에서 하위 분기 분류를 미리 동시에 실행할지 여부
+SPECULATIVE_ROUTING = os.getenv('SPECULATIVE_ROUTING', 'false').lower() == 'true'
+# 동시에 미리 실행할 하위 분기 분류 수 (가능성이 높은 순)
+SPECULATIVE_MAX_BRANCHES = int(os.getenv('SPECULATIVE_MAX_BRANCHES', '1'))
+SPECULATIVE_WORKERS = int(os.getenv('SPECULATIVE_WORKERS', '16'))
+# 노드에서 미리 실행한 결과를 기다리는 최대 시간(초), 넘으면 직접 호출
+SPECULATIVE_WAIT_SECONDS = float(os.getenv('SPECULATIVE_WAIT_SECONDS', '60'))
+
+# 기본 분기 → 해당 노드가 처음 호출하는 하위 분기 분류 프롬프트
+SUB_TEMPLATES = {
+    "JOB_SEARCH": "search_job_prompt",
+    "COVER_LETTER": "cover_letter_prompt",
+    "INTERVIEW": "interview_intent",
+}
+
+# 사용자 입력 키워드 → 분기 가중치
+_KEYWORD_PRIORS = [
+    (re.compile(r'자기\s*소개서|자소서|수정'), "COVER_LETTER", 3),
+    (re.compile(r'면접|그만|종료'), "INTERVIEW", 3),
+    (re.compile(r'공고|채용|더\s*보|다음|상세|우대|자격|복지|마감'), "JOB_SEARCH", 2),
+]
+
+
+def forced_intent(state):
+    """LLM 결과와 상관없이 정해지는 기본 분기 (면접 진행 중)"""
+    if state.get("interview_in") and state.get("intent_interview"):
+        return "INTERVIEW"
+    return None
+
+
+def predict_intents(state):
+    """대화 상태와 입력 키워드로 가능성이 높은 기본 분기 순서 추정"""
+    scores = {"JOB_SEARCH": 1, "COVER_LETTER": 0, "INTERVIEW": 0}
+    if state.get("cover_letter_now"):
+        scores["COVER_LETTER"] += 3
+    if state.get("cover_letter_in"):
+        scores["COVER_LETTER"] += 1
+        scores["INTERVIEW"] += 1
+    if state.get("job_search"):
+        scores["JOB_SEARCH"] += 1
+        scores["COVER_LETTER"] += 1
+    for pattern, intent, weight in _KEYWORD_PRIORS:
+        if pattern.search(state.get("user_input") or ""):
+            scores[intent] += weight
+    return sorted(scores, key=lambda intent: -scores[intent])
+
+
+class Speculator:
+    """기본 분기 분류와 하위 분기 분류를 동시에 실행하고, 선택된 분기의 결과를 노드에 넘김"""
+
+    def __init__(self, ask, max_branches=SPECULATIVE_MAX_BRANCHES, max_workers=SPECULATIVE_WORKERS):
+        self.ask = ask
+        self.max_branches = max_branches
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculative")
+        # 사용자 id → {템플릿 이름: (사용자 입력, future)}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def _submit(self, template_name, user_input):
+        # 트레이스, 요청 id 가 이어지도록 현재 컨텍스트에서 실행
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, self.ask, template_name, user_input=user_input)
+
+    def classify(self, state, classify):
+        """classify() 로 기본 분기를 구하는 동안 가능성이 높은 하위 분기 분류를 미리 실행"""
+        user_id, user_input = state["user_id"], state["user_input"]
+        forced = forced_intent(state)
+        intents = [forced] if forced else predict_intents(state)[:self.max_branches]
+        pending = {SUB_TEMPLATES[intent]: (user_input, self._submit(SUB_TEMPLATES[intent], user_input))
+                   for intent in intents}
+        with self._lock:
+            previous = self._pending.pop(user_id, {})
+            self._pending[user_id] = pending
+        self._discard(previous)
+        try:
+            # 면접 진행 중에는 기본 분기가 정해져 있으므로 분류 호출 생략
+            intent = forced or classify()
+        except Exception:
+            self.settle(user_id, None)
+            raise
+        return intent
+
+    def settle(self, user_id, intent):
+        """기본 분기가 정해지면 선택되지 않은 하위 분기 분류 취소"""
+        winner = SUB_TEMPLATES.get(intent)
+        with self._lock:
+            pending = self._pending.get(user_id, {})
+            losers = {name: entry for name, entry in pending.items() if name != winner}
+            for name in losers:
+                pending.pop(name)
+            if not pending:
+                self._pending.pop(user_id, None)
+        self._discard(losers)
+        if winner and winner not in pending:
+            SPECULATIONS.inc(template=winner, outcome="miss")
+
+    def take(self, user_id, template_name, user_input):
+        """미리 실행한 하위 분기 분류 결과 (없거나 실패했으면 None)"""
+        with self._lock:
+            pending = self._pending.get(user_id, {})
+            entry = pending.pop(template_name, None)
+            if not pending:
+                self._pending.pop(user_id, None)
+        if entry is None or entry[0] != user_input:
+            if entry is not None:
+                self._discard({template_name: entry})
+            return None
+        try:
+            result = entry[1].result(timeout=SPECULATIVE_WAIT_SECONDS)
+        except Exception:
+            logger.warning("미리 실행한 분류 결과를 사용할 수 없습니다: %s", template_name, exc_info=True)
+            SPECULATIONS.inc(template=template_name, outcome="error")
+            return None
+        SPECULATIONS.inc(template=template_name, outcome="hit")
+        return result
+
+    def _discard(self, entries):
+        for template_name, (_, future) in entries.items():
+            # 시작 전이면 취소, 이미 호출 중이면 결과를 버림 (동기 HTTP 호출은 중간에 끊을 수 없음)
+            SPECULATIONS.inc(template=template_name, outcome="cancelled" if future.cancel() else "wasted")
@@ -0,0 +1,75 @@
+import threading
+import time
+from unittest import mock
+
+from django.test import RequestFactory, SimpleTestCase
+
+from jumpit import admission
+from jumpit.admission import AdmissionGate, Rejected, client_ip
+
+
+class AdmissionGateTests(SimpleTestCase):
+    def assertRejected(self, gate, user, status, reason):
+        with self.assertRaises(Rejected) as caught:
+            gate.acquire(user)
+        self.assertEqual((caught.exception.status, caught.exception.reason), (status, reason))
+        self.assertGreaterEqual(caught.exception.retry_after, 1)
+
+    def test_per_user_limit(self):
+        """한 사용자의 동시 요청이 per_user 를 넘으면 대기하지 않고 바로 429"""
+        gate = AdmissionGate("test", concurrency=4, queue_size=4, per_user=2, queue_timeout=1.0)
+        admitted = [gate.acquire("a"), gate.acquire("a")]
+        self.assertRejected(gate, "a", 429, "per_user")
+        # 다른 사용자는 영향 없음
+        gate.release("b", gate.acquire("b"))
+        gate.release("a", admitted.pop())
+        gate.release("a", gate.acquire("a"))
+
+    def test_queue_timeout(self):
+        gate = AdmissionGate("test", concurrency=1, queue_size=4, per_user=2, queue_timeout=0.05)
+        admitted_at = gate.acquire("a")
+        started = time.monotonic()
+        self.assertRejected(gate, "b", 503, "queue_timeout")
+        self.assertGreaterEqual(time.monotonic() - started, 0.05)
+        # 시간 초과된 대기는 사용자별 요청 수와 대기열에서 빠짐
+        self.assertEqual(len(gate._waiting), 0)
+        self.assertNotIn("b", gate._users)
+        gate.release("a", admitted_at)
+        gate.release("b", gate.acquire("b"))
+
+    def test_queue_full(self):
+        gate = AdmissionGate("test", concurrency=1, queue_size=0, per_user=2, queue_timeout=1.0)
+        admitted_at = gate.acquire("a")
+        self.assertRejected(gate, "b", 503, "queue_full")
+        gate.release("a", admitted_at)
+
+    def test_waiting_request_admitted_on_release(self):
+        gate = AdmissionGate("test", concurrency=1, queue_size=4, per_user=2, queue_timeout=5.0)
+        admitted_at = gate.acquire("a")
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(gate.acquire("b")))
+        waiter.start()
+        while not gate._waiting:
+            time.sleep(0.001)
+        gate.release("a", admitted_at)
+        waiter.join(5)
+        self.assertEqual(len(results), 1)
+        gate.release("b", results[0])
+        self.assertEqual(gate._active, 0)
+
+
+class ClientIpTests(SimpleTestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_forwarded_header_ignored_without_trusted_proxy(self):
+        request = self.factory.get("/", REMOTE_ADDR="203.0.113.7", HTTP_X_FORWARDED_FOR="198.51.100.1")
+        with mock.patch.object(admission, "TRUSTED_PROXIES", set()):
+            self.assertEqual(client_ip(request), "203.0.113.7")
+
+    def test_last_address_before_trusted_proxies(self):
+        """클라이언트가 앞에 붙인 주소는 무시하고 신뢰하는 프록시 바로 앞 주소 사용"""
+        request = self.factory.get("/", REMOTE_ADDR="10.0.0.1",
+                                   HTTP_X_FORWARDED_FOR="1.1.1.1, 198.51.100.1, 10.0.0.2")
+        with mock.patch.object(admission, "TRUSTED_PROXIES", {"10.0.0.1", "10.0.0.2"}):
+            self.assertEqual(client_ip(request), "198.51.100.1")
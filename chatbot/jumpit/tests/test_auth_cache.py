@@ -0,0 +1,71 @@
+import time
+from unittest import mock
+
+import jwt
+from django.test import SimpleTestCase
+
+from jumpit import auth_cache
+from jumpit.auth_cache import TokenCache, decode_token, token_cache
+
+SECRET = "test-secret"
+
+
+class TokenCacheTests(SimpleTestCase):
+    def test_entry_expires_at_exp(self):
+        cache = TokenCache()
+        now = time.time()
+        cache.put(b"token", {"username": "a", "exp": int(now) + 60})
+        self.assertEqual(cache.get(b"token"), {"username": "a", "exp": int(now) + 60})
+        with mock.patch.object(auth_cache.time, "time", return_value=now + 61):
+            self.assertIsNone(cache.get(b"token"))
+        # 만료된 항목은 삭제되어 시간이 되돌아가도 다시 나오지 않음
+        self.assertIsNone(cache.get(b"token"))
+
+    def test_without_numeric_exp(self):
+        """exp 가 없거나 숫자가 아니면 만료 시각 없이 캐시 (크기 제한으로만 삭제)"""
+        cache = TokenCache()
+        cache.put(b"none", {"username": "a"})
+        cache.put(b"text", {"username": "b", "exp": "soon"})
+        with mock.patch.object(auth_cache.time, "time", return_value=time.time() + 10 ** 6):
+            self.assertEqual(cache.get(b"none"), {"username": "a"})
+            self.assertEqual(cache.get(b"text")["username"], "b")
+
+    def test_size_limit(self):
+        cache = TokenCache(max_size=2)
+        for digest in (b"a", b"b"):
+            cache.put(digest, {"username": digest.decode()})
+        cache.get(b"a")
+        cache.put(b"c", {"username": "c"})
+        self.assertIsNone(cache.get(b"b"))
+        self.assertIsNotNone(cache.get(b"a"))
+        disabled = TokenCache(max_size=0)
+        disabled.put(b"a", {"username": "a"})
+        self.assertIsNone(disabled.get(b"a"))
+
+
+class DecodeTokenTests(SimpleTestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.addCleanup(token_cache.clear)
+
+    def test_cached_after_first_decode(self):
+        token = jwt.encode({"username": "a", "exp": int(time.time()) + 60}, SECRET, algorithm="HS256")
+        payload = decode_token(token, SECRET, ["HS256"])
+        with mock.patch.object(auth_cache.jwt, "decode", side_effect=AssertionError("캐시를 사용해야 함")):
+            self.assertEqual(decode_token(token, SECRET, ["HS256"]), payload)
+
+    def test_expired_token_rejected_and_not_cached(self):
+        token = jwt.encode({"username": "a", "exp": int(time.time()) - 10}, SECRET, algorithm="HS256")
+        for _ in range(2):
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                decode_token(token, SECRET, ["HS256"])
+
+    def test_cached_token_verified_again_after_exp(self):
+        now = time.time()
+        token = jwt.encode({"username": "a", "exp": int(now) + 60}, SECRET, algorithm="HS256")
+        decode_token(token, SECRET, ["HS256"])
+        with mock.patch.object(auth_cache.time, "time", return_value=now + 120), \
+                mock.patch.object(auth_cache.jwt, "decode", side_effect=jwt.ExpiredSignatureError) as decode:
+            with self.assertRaises(jwt.ExpiredSignatureError):
+                decode_token(token, SECRET, ["HS256"])
+        decode.assert_called_once()
@@ -0,0 +1,67 @@
+import os
+import tempfile
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from jumpit.autocomplete import SuggestionTrie, suggestion_entries
+
+TITLES = ["[점핏] 백엔드 개발자 (Java)", "백엔드 개발자 채용", "백엔드 엔지니어", "프론트엔드 개발자"]
+SKILLS = [["Python", "Java"], ["Python"], ["Java"], ["React"]]
+COMPANIES = ["(주)점핏", "점핏 주식회사", "백엔드랩", "㈜프론트"]
+ACTIVE = [True, True, True, False]
+
+
+def texts(suggestions):
+    return [suggestion["text"] for suggestion in suggestions]
+
+
+class SuggestionEntriesTests(SimpleTestCase):
+    def test_counts_only_active_postings(self):
+        entries = {entry[0]: entry for entry in suggestion_entries(TITLES, SKILLS, COMPANIES, ACTIVE)}
+        self.assertEqual(entries["백엔드"][2], 3)
+        self.assertEqual(entries["백엔드 개발자"][2], 2)
+        self.assertNotIn("React", entries)
+        # 공고 하나에만 있는 제목 단어는 제외
+        self.assertNotIn("엔지니어", entries)
+
+    def test_company_counted_without_legal_form(self):
+        """"(주)점핏" 과 "점핏 주식회사" 는 점핏 하나로 세고, 원래 표기는 검색 키로만 사용"""
+        entries = {entry[0]: entry for entry in suggestion_entries(TITLES, SKILLS, COMPANIES)}
+        self.assertEqual(entries["점핏"][2], 2)
+        self.assertEqual(entries["점핏"][3], ["점핏", "(주)점핏", "점핏 주식회사"])
+        self.assertNotIn("(주)점핏", entries)
+        self.assertEqual(entries["프론트"][3], ["프론트", "㈜프론트"])
+
+
+class SuggestTests(SimpleTestCase):
+    def setUp(self):
+        self.trie = SuggestionTrie.build(suggestion_entries(TITLES, SKILLS, COMPANIES, ACTIVE))
+
+    def test_partial_syllables_while_typing(self):
+        """입력 중인 글자("ㅂ", "배", "백ㅇ")도 완성된 단어의 앞부분과 일치, 공고 수 순"""
+        expected = ["백엔드", "백엔드 개발자", "백엔드랩"]
+        for prefix in ("ㅂ", "배", "백", "백ㅇ", "백엔"):
+            self.assertEqual(texts(self.trie.suggest(prefix)), expected, prefix)
+        self.assertEqual(texts(self.trie.suggest("백엔드 ㄱ")), ["백엔드 개발자"])
+
+    def test_aliases_and_kinds(self):
+        self.assertEqual(self.trie.suggest("파이"), [{"text": "Python", "kind": "skill", "count": 2}])
+        self.assertEqual(texts(self.trie.suggest("jav")), ["Java"])
+        self.assertEqual(self.trie.suggest("(주)점"), [{"text": "점핏", "kind": "company", "count": 2}])
+
+    def test_limit_and_misses(self):
+        self.assertEqual(texts(self.trie.suggest("", 2)), ["백엔드", "점핏"])
+        self.assertEqual(self.trie.suggest("zzz"), [])
+        self.assertEqual(SuggestionTrie.empty().suggest("백"), [])
+
+    def test_save_load_round_trip(self):
+        handle, path = tempfile.mkstemp(suffix=".npz")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        np.savez(path, **self.trie.to_arrays())
+        with np.load(path) as data:
+            loaded = SuggestionTrie.from_arrays(data)
+        self.assertEqual(len(loaded), len(self.trie))
+        for prefix in ("", "ㅂ", "백엔드 개", "파이", "(주)", "jav", "없음"):
+            self.assertEqual(loaded.suggest(prefix), self.trie.suggest(prefix), prefix)
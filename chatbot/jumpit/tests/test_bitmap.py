@@ -0,0 +1,60 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from jumpit.bitmap import ARRAY_MAX, CHUNK_SIZE, Bitmap, _is_bits
+
+
+def _positions(rng, count, chunk=0):
+    return set((rng.choice(CHUNK_SIZE, count, replace=False) + chunk * CHUNK_SIZE).tolist())
+
+
+class BitmapTests(SimpleTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        # 청크 0: 배열 / 비트 배열, 청크 1: 한쪽에만 있음, 청크 2: 둘 다 비트 배열
+        self.sparse = _positions(rng, 300) | _positions(rng, 50, chunk=2) | _positions(rng, 5000, chunk=3)
+        self.dense = _positions(rng, 20000) | _positions(rng, 100, chunk=1) | _positions(rng, 30000, chunk=3)
+        self.a = Bitmap.from_positions(sorted(self.sparse))
+        self.b = Bitmap.from_positions(sorted(self.dense))
+
+    def assertSet(self, bitmap, expected):
+        self.assertEqual(bitmap.to_array().tolist(), sorted(expected))
+        self.assertEqual(len(bitmap), len(expected))
+
+    def test_container_kinds(self):
+        self.assertFalse(_is_bits(self.a.containers[0]))
+        self.assertTrue(_is_bits(self.b.containers[0]))
+        self.assertTrue(_is_bits(self.a.containers[3]))
+        self.assertTrue(_is_bits(self.b.containers[3]))
+
+    def test_and(self):
+        self.assertSet(self.a & self.b, self.sparse & self.dense)
+        self.assertSet(self.b & self.a, self.sparse & self.dense)
+
+    def test_or(self):
+        self.assertSet(self.a | self.b, self.sparse | self.dense)
+        self.assertSet(self.b | self.a, self.sparse | self.dense)
+
+    def test_andnot(self):
+        self.assertSet(self.a - self.b, self.sparse - self.dense)
+        self.assertSet(self.b - self.a, self.dense - self.sparse)
+
+    def test_results_use_smallest_container(self):
+        """연산 결과 원소가 ARRAY_MAX 이하가 된 비트 배열은 정렬 배열로, 빈 청크는 삭제"""
+        for container in (self.a & self.b).containers.values():
+            self.assertEqual(_is_bits(container), len(Bitmap({0: container})) > ARRAY_MAX)
+        self.assertFalse(self.a - self.a)
+        self.assertEqual((self.a - self.a).containers, {})
+
+    def test_contains_and_full(self):
+        for position in list(self.sparse)[:50]:
+            self.assertIn(position, self.a)
+        self.assertNotIn(CHUNK_SIZE + 1, self.a)
+        full = Bitmap.full(CHUNK_SIZE + 10)
+        self.assertEqual(len(full), CHUNK_SIZE + 10)
+        self.assertSet(full - self.b, set(range(CHUNK_SIZE + 10)) - self.dense)
+
+    def test_empty(self):
+        self.assertEqual(Bitmap.from_positions([]).to_array().tolist(), [])
+        self.assertSet(Bitmap() | self.a, self.sparse)
+        self.assertSet(Bitmap() & self.a, set())
@@ -0,0 +1,54 @@
+from django.test import SimpleTestCase
+
+from jumpit.detail_fields import DETAIL_COLUMNS, PostingDetailCache, parse_detail_fields
+
+
+class ParseDetailFieldsTests(SimpleTestCase):
+    def test_column_names_and_aliases(self):
+        self.assertEqual(parse_detail_fields("자격요건, 우대사항"), ["자격요건", "우대사항"])
+        self.assertEqual(parse_detail_fields("기술 스택 / 복리후생"), ["사용기술", "복지_및_혜택"])
+
+    def test_every_field_mentioned_in_a_sentence(self):
+        """한 문장에 나온 필드를 모두, 문장 순서대로"""
+        self.assertEqual(parse_detail_fields("회사 위치랑 기술 스택 알려줘"), ["회사명", "근무지역", "사용기술"])
+        self.assertEqual(parse_detail_fields("우대조건이랑 복지, 마감일"), ["우대사항", "복지_및_혜택", "마감일자"])
+
+    def test_longer_alias_wins_over_its_suffix(self):
+        """"우대조건" 은 우대사항만 ("조건" → 근로조건으로 잡지 않음)"""
+        self.assertEqual(parse_detail_fields("우대조건"), ["우대사항"])
+
+    def test_all_fields(self):
+        self.assertEqual(parse_detail_fields("전부"), list(DETAIL_COLUMNS))
+
+    def test_unknown_fields_and_duplicates(self):
+        self.assertEqual(parse_detail_fields("연봉"), [])
+        self.assertEqual(parse_detail_fields(""), [])
+        self.assertEqual(parse_detail_fields("복지, 혜택, 복리후생"), ["복지_및_혜택"])
+
+
+class PostingDetailCacheTests(SimpleTestCase):
+    def test_keyed_by_id_and_link(self):
+        """같은 id 라도 링크가 다르면 (다시 크롤링한 다른 공고) 다른 항목"""
+        cache = PostingDetailCache()
+        detail = cache.get(1, "https://jumpit.saramin.co.kr/position/1")
+        detail.fields["제목"] = "백엔드 개발자"
+        self.assertIs(cache.get(1, "https://jumpit.saramin.co.kr/position/1"), detail)
+        self.assertEqual(cache.get(1, "https://jumpit.saramin.co.kr/position/2").fields, {})
+
+    def test_invalidate_removes_every_link(self):
+        cache = PostingDetailCache()
+        first = cache.get(1, "a")
+        cache.get(1, "b")
+        cache.invalidate(1)
+        self.assertIsNot(cache.get(1, "a"), first)
+
+    def test_ttl_and_size(self):
+        cache = PostingDetailCache(max_size=2, ttl=0)
+        detail = cache.get(1, "a")
+        self.assertIsNot(cache.get(1, "a"), detail)
+        cache = PostingDetailCache(max_size=2)
+        first = cache.get(1, "a")
+        cache.get(2, "b")
+        cache.get(3, "c")
+        self.assertIsNot(cache.get(1, "a"), first)
+        self.assertEqual(first.missing(["제목", "회사명"]), ["제목", "회사명"])
@@ -0,0 +1,113 @@
+import os
+import tempfile
+from datetime import date
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jumpit import expiry
+from jumpit.db import SQLiteConnection
+from jumpit.expiry import ExpirySweeper, active_condition, backfill_deadlines, create_deadline_index
+from jumpit.facets import parse_deadline
+from jumpit.recommend import create_recommendation_table
+
+DAY = date(2026, 10, 19)
+
+
+class ParseDeadlineTests(SimpleTestCase):
+    def test_relative_and_absolute(self):
+        self.assertEqual(parse_deadline("", "D-3", DAY), date(2026, 10, 22))
+        self.assertEqual(parse_deadline("2025-03-01", "D-3", DAY), date(2025, 3, 1))
+
+    def test_open_ended_and_garbage(self):
+        self.assertIsNone(parse_deadline("상시", "D-3", DAY))
+        self.assertIsNone(parse_deadline("채용시 마감", "곧 마감", DAY))
+        self.assertIsNone(parse_deadline(None, None, DAY))
+
+
+class ActiveConditionTests(SimpleTestCase):
+    def test_sql(self):
+        with mock.patch.object(expiry, "today", return_value=DAY):
+            self.assertEqual(active_condition(),
+                             "(상시채용 = 1 OR 마감일 IS NULL OR 마감일 >= '2026-10-19')")
+            self.assertEqual(active_condition("j"),
+                             "(j.상시채용 = 1 OR j.마감일 IS NULL OR j.마감일 >= '2026-10-19')")
+
+
+class SQLiteTestCase(SimpleTestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.conn = self.connect()
+        self.addCleanup(self.conn.close)
+
+    def connect(self):
+        return SQLiteConnection(self.path)
+
+    def execute(self, query, args=None):
+        cursor = self.conn.cursor()
+        cursor.execute(query, args)
+        rows = list(cursor.fetchall())
+        cursor.close()
+        return rows
+
+
+class ExpirySweeperTests(SQLiteTestCase):
+    def setUp(self):
+        super().setUp()
+        self.execute("CREATE TABLE job_posting_new (id INT AUTO_INCREMENT PRIMARY KEY, 마감일 DATE, "
+                     "상시채용 TINYINT(1) DEFAULT 0)")
+        cursor = self.conn.cursor()
+        cursor.executemany("INSERT INTO job_posting_new (id, 마감일, 상시채용) VALUES (%s, %s, %s)", [
+            (1, "2026-10-10", 0),
+            (2, "2026-10-18", 0),
+            (3, "2026-10-19", 0),
+            (4, "2026-10-25", 0),
+            (5, None, 1),
+        ])
+        cursor.close()
+        create_recommendation_table(self.conn)
+        cursor = self.conn.cursor()
+        cursor.executemany("INSERT INTO recommended_job_posting (customer_id, 순위, 공고_id, 링크, 점수) "
+                           "VALUES (%s, %s, %s, %s, %s)",
+                           [("a", rank, job_id, f"link{job_id}", 1.0) for rank, job_id in enumerate([1, 2, 3, 4, 5])])
+        cursor.close()
+        self.expired = []
+        self.sweeper = ExpirySweeper(self.connect, on_expired=[self.expired.append], interval=0)
+
+    def recommended(self):
+        return [row[0] for row in self.execute("SELECT 공고_id FROM recommended_job_posting ORDER BY 순위")]
+
+    def test_sweep_removes_expired_recommendations(self):
+        self.assertEqual(self.sweeper.sweep(day=DAY), 2)
+        self.assertEqual(self.expired, [[1, 2]])
+        self.assertEqual(self.recommended(), [3, 4, 5])
+
+    def test_same_day_swept_once_and_next_days_incremental(self):
+        self.sweeper.sweep(day=DAY)
+        self.assertEqual(self.sweeper.sweep(day=DAY), 0)
+        # 다음 날은 전날(19일)에 마감된 공고만
+        self.assertEqual(self.sweeper.sweep(day=date(2026, 10, 20)), 1)
+        self.assertEqual(self.sweeper.sweep(day=date(2026, 11, 1)), 1)
+        self.assertEqual(self.expired, [[1, 2], [3], [4]])
+        self.assertEqual(self.recommended(), [5])
+
+
+class BackfillTests(SQLiteTestCase):
+    def test_columns_filled_from_text(self):
+        self.execute("CREATE TABLE job_posting_new (id INT AUTO_INCREMENT PRIMARY KEY, 마감일자 TEXT, 모집기간 TEXT, "
+                     "저장일시 TEXT, 마감일 DATE, 상시채용 TINYINT(1) DEFAULT 0)")
+        cursor = self.conn.cursor()
+        cursor.executemany("INSERT INTO job_posting_new (id, 마감일자, 모집기간, 저장일시) VALUES (%s, %s, %s, %s)", [
+            (1, "2026-11-30", "D-42", "2026-10-19 09:00:00"),
+            (2, "", "D-3", "2026-10-19 09:00:00"),
+            (3, "상시채용", "상시", "2026-10-19 09:00:00"),
+            (4, "정보 없음", "", "2026-10-19 09:00:00"),
+        ])
+        cursor.close()
+        self.assertEqual(backfill_deadlines(self.conn), 3)
+        self.assertEqual(self.execute("SELECT id, 마감일, 상시채용 FROM job_posting_new ORDER BY id"), [
+            (1, "2026-11-30", 0), (2, "2026-10-22", 0), (3, None, 1), (4, None, 0)])
+        create_deadline_index(self.conn)
+        create_deadline_index(self.conn)
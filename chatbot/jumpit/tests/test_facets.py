@@ -0,0 +1,95 @@
+from datetime import date, datetime
+
+from django.test import SimpleTestCase
+
+from jumpit.facets import CAREER_NO_LIMIT, FacetIndex, parse_career, parse_deadline, parse_region
+
+DAY = date(2026, 10, 19)
+
+
+class ParseCareerTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = {
+            "신입": (0, 0),
+            "경력 1~3년": (1, 3),
+            "경력 1-3년": (1, 3),
+            "신입·경력 0~3년": (0, 3),
+            "신입·경력 1~5년": (0, 5),
+            "경력 7년": (7, 7),
+            "경력 무관": (0, CAREER_NO_LIMIT),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_career(text), expected, text)
+
+    def test_open_ended(self):
+        cases = {
+            "경력 5년 이상": (5, CAREER_NO_LIMIT),
+            "경력 3년↑": (3, CAREER_NO_LIMIT),
+            "경력 2년+": (2, CAREER_NO_LIMIT),
+            "경력 10년~": (10, CAREER_NO_LIMIT),
+            "경력 10년 ~": (10, CAREER_NO_LIMIT),
+            "신입/경력": (0, CAREER_NO_LIMIT),
+            "신입·경력": (0, CAREER_NO_LIMIT),
+            "경력": (1, CAREER_NO_LIMIT),
+        }
+        for text, expected in cases.items():
+            self.assertEqual(parse_career(text), expected, text)
+
+    def test_unknown(self):
+        self.assertEqual(parse_career(""), (None, None))
+        self.assertEqual(parse_career(None), (None, None))
+        self.assertEqual(parse_career("정규직"), (None, None))
+
+
+class ParseDeadlineTests(SimpleTestCase):
+    def test_dates(self):
+        self.assertEqual(parse_deadline("2026-11-30"), date(2026, 11, 30))
+        self.assertEqual(parse_deadline("26.11.30 23:59"), date(2026, 11, 30))
+        self.assertIsNone(parse_deadline("2026-02-30"))
+
+    def test_d_day_from_crawl_date(self):
+        self.assertEqual(parse_deadline("", "D-12", DAY), date(2026, 10, 31))
+        self.assertEqual(parse_deadline(None, "D - 3", datetime(2026, 10, 19, 23, 0)), date(2026, 10, 22))
+        self.assertEqual(parse_deadline("", "D-0", "2026-10-19"), DAY)
+
+    def test_open_ended_and_unknown(self):
+        self.assertIsNone(parse_deadline("상시채용", "D-12", DAY))
+        self.assertIsNone(parse_deadline("", "", DAY))
+
+    def test_region(self):
+        self.assertEqual(parse_region("서울 강남구 외 1"), ("KR-11", "강남구"))
+        self.assertEqual(parse_region("경기도 성남시 분당구"), ("KR-41", "성남시"))
+        self.assertEqual(parse_region("해외"), (None, None))
+
+
+class DeadlineFilterTests(SimpleTestCase):
+    def setUp(self):
+        # (지역코드, 시군구, 경력_최소, 경력_최대, 마감일)
+        self.index = FacetIndex.build([
+            ("KR-11", "강남구", 0, 0, date(2026, 10, 18)),   # 어제 마감
+            ("KR-11", "강남구", 1, 3, DAY),                   # 오늘 마감
+            ("KR-41", "성남시", 3, CAREER_NO_LIMIT, date(2026, 10, 26)),
+            ("KR-26", None, 0, CAREER_NO_LIMIT, date(2026, 11, 30)),
+            (None, None, None, None, None),                   # 상시채용
+        ])
+
+    def positions(self, bitmap):
+        return bitmap.to_array().tolist()
+
+    def test_days_left_range(self):
+        self.assertEqual(self.positions(self.index.deadline_filter(0, 7, DAY)), [1, 2])
+        self.assertEqual(self.positions(self.index.deadline_filter(0, 7, DAY, include_open=True)), [1, 2, 4])
+        self.assertEqual(self.positions(self.index.deadline_filter(8, None, DAY)), [3])
+        self.assertEqual(self.positions(self.index.deadline_filter(None, -1, DAY)), [0])
+
+    def test_active_and_expired(self):
+        self.assertEqual(self.positions(self.index.active(DAY)), [1, 2, 3, 4])
+        self.assertEqual(self.index.expired_mask(DAY).tolist(), [True, False, False, False, False])
+        self.assertEqual(self.positions(self.index.active(date(2026, 10, 27))), [3, 4])
+
+    def test_career_and_region(self):
+        self.assertEqual(self.positions(self.index.career_filter(0)), [0, 3])
+        self.assertEqual(self.positions(self.index.career_filter(3)), [1, 2, 3])
+        self.assertEqual(self.positions(self.index.career_filter(15)), [2, 3])
+        bitmap, unknown = self.index.region_filter(["서울", "경기 성남시", "화성"])
+        self.assertEqual((self.positions(bitmap), unknown), ([0, 1, 2], ["화성"]))
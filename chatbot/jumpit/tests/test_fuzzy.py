@@ -0,0 +1,47 @@
+from django.test import SimpleTestCase
+
+from jumpit.fuzzy import FuzzyIndex, edit_distance, max_distance
+
+TERMS = {"백엔드": 50, "파이썬": 30, "Python": 40, "프론트엔드": 20, "Java": 10, "JavaScript": 10,
+         "데이터": 5, "데이타": 5}
+
+
+class EditDistanceTests(SimpleTestCase):
+    def test_transposition_counts_once(self):
+        self.assertEqual(edit_distance("pyhton", "python", 2), 1)
+        self.assertEqual(edit_distance("abc", "abc", 1), 0)
+        self.assertEqual(edit_distance("abcdef", "azcdxf", 1), 2)
+
+    def test_short_words_not_corrected(self):
+        self.assertEqual(max_distance(3), 0)
+        self.assertEqual(max_distance(8), 1)
+        self.assertEqual(max_distance(9), 2)
+
+
+class CorrectTests(SimpleTestCase):
+    def setUp(self):
+        self.index = FuzzyIndex(list(TERMS), list(TERMS.values()))
+
+    def test_jamo_typos(self):
+        """받침/모음 하나 틀린 한글 오타, 영문 글자 순서 바뀜"""
+        self.assertEqual(self.index.correct("백앤드"), "백엔드")
+        self.assertEqual(self.index.correct("파이선"), "파이썬")
+        self.assertEqual(self.index.correct("프런트엔드"), "프론트엔드")
+        self.assertEqual(self.index.correct("pyhton"), "Python")
+        self.assertEqual(self.index.correct("Jvaa"), "Java")
+
+    def test_known_or_unmatched_words(self):
+        self.assertIsNone(self.index.correct("백엔드"))
+        self.assertIsNone(self.index.correct("python"))
+        self.assertIsNone(self.index.correct("쿠버네티스"))
+        # 짧은 단어는 다른 단어로 바뀌기 쉬워 교정하지 않음
+        self.assertIsNone(self.index.correct("자바"))
+
+    def test_ambiguous_tie(self):
+        """거리와 공고 수가 같은 후보가 둘이면 교정하지 않음"""
+        self.assertEqual([match[0] for match in self.index.lookup("데이투")], ["데이터", "데이타"])
+        self.assertIsNone(self.index.correct("데이투"))
+
+    def test_correct_keywords(self):
+        self.assertEqual(self.index.correct_keywords(["백앤드 개발자", "파이선"]),
+                         (["백엔드 개발자", "파이썬"], {"백앤드": "백엔드", "파이선": "파이썬"}))
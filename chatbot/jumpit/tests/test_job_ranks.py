@@ -0,0 +1,183 @@
+import os
+import tempfile
+
+from django.test import SimpleTestCase
+
+from jumpit.db import SQLiteConnection
+from jumpit.detail_fields import PostingDetailCache
+from jumpit.hs import JOB_RESULT_COLUMNS, JobAssistantBot
+
+COLUMNS = [name.strip() for name in JOB_RESULT_COLUMNS.split(",") if name.strip() != "id"]
+
+
+def posting(job_id, link, title=None):
+    """검색 결과 형식의 행 (링크 6번째, id 마지막)"""
+    values = {name: f"{name} {job_id}" for name in COLUMNS}
+    values.update(링크=link, 제목=title or f"공고 {job_id}", 회사명=f"회사 {job_id}")
+    return tuple(values[name] for name in COLUMNS) + (job_id,)
+
+
+class CountingConnection:
+    """cursor() 호출 수(DB 왕복)를 세는 연결"""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.cursors = 0
+
+    def cursor(self, *args):
+        self.cursors += 1
+        return self.conn.cursor(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.conn, name)
+
+
+class JobRankTestCase(SimpleTestCase):
+    """job_posting_new, saved_job_posting 만 있는 SQLite DB 와 LLM 없이 만든 봇"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.conn = SQLiteConnection(self.path)
+        self.addCleanup(self.conn.close)
+        self.execute(f"CREATE TABLE job_posting_new (id INT AUTO_INCREMENT PRIMARY KEY, "
+                     f"{', '.join(f'{name} TEXT' for name in COLUMNS)}, 마감일 DATE, 상시채용 TINYINT(1) DEFAULT 0)")
+        self.insert(*[posting(job_id, f"link{job_id}") for job_id in range(1, 6)])
+        self.bot = self.make_bot()
+        self.bot.create_saved_jobs_table()
+        self.bot.create_selected_job_posting_table()
+
+    def make_bot(self):
+        """다른 워커: 같은 DB, 빈 순위 캐시"""
+        bot = JobAssistantBot.__new__(JobAssistantBot)
+        bot.db = self.conn
+        bot.job_rank_cache = {}
+        bot.detail_cache = PostingDetailCache()
+        return bot
+
+    def execute(self, query, args=None):
+        cursor = self.conn.cursor()
+        cursor.execute(query, args)
+        rows = list(cursor.fetchall())
+        cursor.close()
+        return rows
+
+    def insert(self, *rows):
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            f"INSERT INTO job_posting_new ({', '.join(COLUMNS)}, id) VALUES ({', '.join(['%s'] * (len(COLUMNS) + 1))})",
+            rows)
+        cursor.close()
+
+    def search(self, user_id, job_ids, bot=None):
+        """공고 목록 검색 결과 저장, 그 검색의 state 반환"""
+        rows = [posting(job_id, f"link{job_id}") for job_id in job_ids]
+        result_set = (bot or self.bot).save_jobs_to_table(user_id, rows)
+        return {"user_id": user_id, "job_result_set": result_set}
+
+
+class ResolveJobTests(JobRankTestCase):
+    def test_cached_and_other_worker(self):
+        state = self.search("a", [3, 1, 5])
+        self.assertEqual(self.bot.resolve_job(state, 2), (1, "link1"))
+        # 다른 워커는 (customer_id, 검색번호, 순위) 로 DB 에서 찾음
+        self.assertEqual(self.make_bot().resolve_job(state, 3), (5, "link5"))
+        self.assertEqual(self.bot.resolve_job_id(state, 1), 3)
+
+    def test_rank_from_older_search(self):
+        """캐시와 state 의 검색 번호가 다르면 state 의 검색 기준으로 찾음"""
+        old_state = self.search("a", [1, 2])
+        other = self.make_bot()
+        new_state = self.search("a", [4, 5], bot=other)
+        # 이 워커의 캐시는 이전 검색: 이전 검색 state 로 온 요청은 이전 검색의 공고 (새 검색의 1번이 아님)
+        self.assertEqual(self.bot.resolve_job(old_state, 1), (1, "link1"))
+        # state 는 다른 워커의 새 검색: DB 에서 찾고, 더 최근 검색이므로 캐시 교체
+        self.assertEqual(self.bot.resolve_job(new_state, 2), (5, "link5"))
+        self.assertEqual(self.bot.job_rank_cache["a"][0], new_state["job_result_set"])
+        self.assertEqual(self.bot.resolve_job(new_state, 1), (4, "link4"))
+        # 새 검색만 저장된 DB 에서는 이전 검색의 순위를 다른 공고로 바꾸지 않고 찾을 수 없음
+        for bot in (self.bot, other):
+            self.assertIsNone(bot.resolve_job(old_state, 1))
+        self.assertEqual(self.bot.job_rank_cache["a"][0], new_state["job_result_set"])
+
+    def test_other_users_unaffected(self):
+        state_a = self.search("a", [1, 2])
+        state_b = self.search("b", [3, 4])
+        worker = self.make_bot()
+        self.assertEqual(worker.resolve_job(state_a, 1), (1, "link1"))
+        self.assertEqual(worker.resolve_job(state_b, 1), (3, "link3"))
+
+    def test_recrawled_id_resolved_by_link(self):
+        """다시 크롤링해 공고 id 가 바뀌면 링크로 새 id 를 찾고, 원래 id 의 다른 공고는 돌려주지 않음"""
+        state = self.search("a", [2, 3])
+        self.execute("DELETE FROM job_posting_new WHERE id IN (2, 3)")
+        self.insert(posting(2, "link3"), posting(20, "link2"))
+        for bot in (self.bot, self.make_bot()):
+            self.assertEqual(bot.resolve_job(state, 1), (20, "link2"))
+            self.assertEqual(bot.resolve_job(state, 2), (2, "link3"))
+
+    def test_missing_rank(self):
+        state = self.search("a", [1, 2])
+        worker = self.make_bot()
+        for bot in (self.bot, worker):
+            self.assertIsNone(bot.resolve_job(state, 3))
+            self.assertIsNone(bot.resolve_job(state, 0))
+            self.assertIsNone(bot.resolve_job({"user_id": "a", "job_result_set": None}, 1))
+        self.assertIsNone(worker.resolve_job({**state, "user_id": "b"}, 1))
+        # 다시 크롤링해 빠진 공고
+        self.execute("DELETE FROM job_posting_new WHERE id = 2")
+        self.assertIsNone(self.bot.resolve_job(state, 2))
+        self.assertIsNone(self.bot.resolve_job_id(state, 2))
+
+    def test_select_missing_rank_not_saved(self):
+        state = self.search("a", [1, 2])
+        self.assertIsNone(self.bot.search_select_save_job(5, state))
+        self.assertEqual(self.execute("SELECT COUNT(*) FROM selected_job_posting"), [(0,)])
+        self.assertEqual(self.bot.search_select_save_job(2, state), (2, "link2"))
+        self.bot.search_select_save_job(2, state)
+        self.assertEqual(self.execute("SELECT customer_id, 링크 FROM selected_job_posting"), [("a", "link2")])
+
+
+class DetailRequestTests(JobRankTestCase):
+    def setUp(self):
+        super().setUp()
+        self.state = self.search("a", [1, 2, 3])
+        self.db = self.bot.db = CountingConnection(self.conn)
+        # 하위 분기 "상세 정보, 2번", 요청한 상세 정보 "주요업무"
+        self.bot.ask_sub = lambda state, template_name: "상세 정보, 2"
+        self.bot.ask = lambda template_name, **values: "주요업무"
+
+    def request(self):
+        self.db.cursors = 0
+        return self.bot.search_job_chat({**self.state, "user_input": "2번 주요업무 알려줘"})["response"]
+
+    def test_repeat_request_without_db(self):
+        first = self.request()
+        self.assertIn("주요업무 2", first)
+        self.assertGreater(self.db.cursors, 0)
+        self.assertEqual(self.request(), first)
+        self.assertEqual(self.db.cursors, 0)
+        self.assertEqual(self.execute("SELECT 링크 FROM selected_job_posting"), [("link2",)])
+
+    def test_recrawled_between_requests(self):
+        """확인해 둔 id 가 다시 크롤링되어 다른 공고가 되면 링크로 다시 찾음 (다른 공고의 내용, 저장 없음)"""
+        self.request()
+        self.execute("DELETE FROM job_posting_new WHERE id = 2")
+        self.insert(posting(2, "link9"), posting(20, "link2"))
+        # 상세 정보 캐시 만료
+        self.bot.detail_cache.invalidate()
+        response = self.request()
+        self.assertIn("주요업무 20", response)
+        self.assertEqual(self.bot.job_rank_cache["a"][2][2], (20, "link2"))
+        self.assertEqual(self.execute("SELECT 링크 FROM selected_job_posting"), [("link2",)])
+
+    def test_cover_letter_uses_current_posting(self):
+        self.request()
+        self.execute("DELETE FROM job_posting_new WHERE id = 2")
+        self.insert(posting(2, "link9"), posting(20, "link2"))
+        job = self.bot.search_select_job({**self.state, "selected_job": 2})
+        self.assertEqual(job["job_name"], "공고 20")
+        self.assertEqual(self.bot.search_select_save_job(3, self.state), (3, "link3"))
+        self.execute("DELETE FROM job_posting_new WHERE id = 3")
+        self.assertIsNone(self.bot.search_select_job({**self.state, "selected_job": 3}))
@@ -0,0 +1,142 @@
+import threading
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jumpit import llm_gateway
+from jumpit.llm_gateway import CircuitBreaker, LLMGateway, LLMTimeout, LLMUnavailable
+
+# 분류용(fast 모델 먼저) / 생성용(main 모델 먼저) 템플릿
+CLASSIFIER = "intent_template"
+GENERATION = "cover_letter_write"
+
+
+class FakeClient:
+    """호출마다 behaviors 의 다음 동작 실행: 숫자면 그만큼 (release 전까지) 기다린 뒤 응답, 예외면 발생"""
+
+    def __init__(self, name, behaviors=(), release=None):
+        self.name = name
+        self.behaviors = list(behaviors)
+        self.release = release
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.calls += 1
+            number = self.calls
+            behavior = self.behaviors.pop(0) if self.behaviors else 0
+        if isinstance(behavior, Exception):
+            raise behavior
+        if behavior:
+            self.release.wait(behavior)
+        return f"{self.name}#{number}"
+
+
+class GatewayTestCase(SimpleTestCase):
+    def setUp(self):
+        # 테스트가 끝나면 기다리던 가짜 호출을 모두 풀어 줌
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+        self.clients = {}
+
+    def gateway(self, **behaviors):
+        def factory(name):
+            client = self.clients[name] = FakeClient(name, behaviors.get(name, ()), self.release)
+            return client
+        return LLMGateway("main", "fast", client_factory=factory)
+
+
+@mock.patch.object(llm_gateway, "LLM_HEDGE", True)
+@mock.patch.object(llm_gateway, "LLM_HEDGE_DEFAULT_DELAY", 0.05)
+class HedgeTests(GatewayTestCase):
+    def test_hedge_fires_after_delay_and_first_result_wins(self):
+        gateway = self.gateway(fast=[5, 0])
+        started = time.monotonic()
+        message, info = gateway.invoke(CLASSIFIER, "prompt")
+        elapsed = time.monotonic() - started
+        self.assertEqual(message, "fast#2")
+        self.assertEqual(info, {"model": "fast", "hedge_won": True, "fallback": False})
+        self.assertGreaterEqual(elapsed, 0.05)
+        self.assertLess(elapsed, 1)
+        self.assertEqual(self.clients["fast"].calls, 2)
+
+    def test_no_hedge_when_primary_answers_in_time(self):
+        gateway = self.gateway()
+        message, info = gateway.invoke(CLASSIFIER, "prompt")
+        self.assertEqual((message, info["hedge_won"]), ("fast#1", False))
+        self.assertEqual(self.clients["fast"].calls, 1)
+
+    def test_generation_templates_not_hedged_by_default(self):
+        gateway = self.gateway(main=[0.2])
+        message, info = gateway.invoke(GENERATION, "prompt")
+        self.assertEqual((message, info["hedge_won"]), ("main#1", False))
+        self.assertEqual(self.clients["main"].calls, 1)
+
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_open_half_open_close(self):
+        breaker = CircuitBreaker("main", failures=3, cooldown=0.05)
+        for _ in range(2):
+            breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+        time.sleep(0.06)
+        # 반열림: 한 건만 통과
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertTrue(breaker.allow())
+        self.assertTrue(breaker.allow())
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker("main", failures=1, cooldown=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertFalse(breaker.allow())
+
+
+@mock.patch.object(llm_gateway, "LLM_HEDGE", False)
+class FallbackTests(GatewayTestCase):
+    def test_open_primary_skipped(self):
+        gateway = self.gateway()
+        for _ in range(llm_gateway.LLM_BREAKER_FAILURES):
+            gateway._breakers["main"].record_failure()
+        message, info = gateway.invoke(GENERATION, "prompt")
+        self.assertEqual((message, info["model"], info["fallback"]), ("fast#1", "fast", True))
+        self.assertEqual(self.clients["main"].calls, 0)
+
+    def test_error_falls_back(self):
+        gateway = self.gateway(main=[RuntimeError("502")])
+        message, info = gateway.invoke(GENERATION, "prompt")
+        self.assertEqual((message, info["fallback"]), ("fast#1", True))
+
+    def test_all_tiers_fail(self):
+        gateway = self.gateway(main=[RuntimeError("502")], fast=[RuntimeError("503")])
+        with self.assertRaises(LLMUnavailable):
+            gateway.invoke(GENERATION, "prompt")
+
+    def test_timeout_falls_back_within_reserve(self):
+        """첫 모델은 마감 시간의 (1 - LLM_FALLBACK_RESERVE) 까지만 기다리고 남은 시간에 다음 모델 호출"""
+        gateway = self.gateway(main=[5])
+        gateway.deadlines = {GENERATION: 0.5}
+        started = time.monotonic()
+        with mock.patch.object(llm_gateway, "LLM_FALLBACK_RESERVE", 0.4):
+            message, info = gateway.invoke(GENERATION, "prompt")
+        elapsed = time.monotonic() - started
+        self.assertEqual((message, info["fallback"]), ("fast#1", True))
+        self.assertGreaterEqual(elapsed, 0.29)
+        self.assertLess(elapsed, 0.45)
+
+    def test_timeout_on_last_tier(self):
+        gateway = self.gateway(main=[5], fast=[5])
+        gateway.deadlines = {GENERATION: 0.2}
+        started = time.monotonic()
+        with self.assertRaises(LLMTimeout):
+            gateway.invoke(GENERATION, "prompt")
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual((self.clients["main"].calls, self.clients["fast"].calls), (1, 1))
@@ -0,0 +1,77 @@
+import os
+import tempfile
+
+from django.test import RequestFactory, SimpleTestCase
+
+from jumpit.db import SQLiteConnection
+from jumpit.pagination import (HISTORY_MAX_PAGE_SIZE, InvalidPage, decode_cursor, encode_cursor, fetch_page,
+                               page_params)
+
+# (id, customer_id, 저장일시): 같은 저장일시가 여러 건 (한 번에 저장한 항목)
+ROWS = [
+    (1, 7, "2026-10-01 09:00:00"),
+    (2, 7, "2026-10-02 09:00:00"),
+    (3, 7, "2026-10-02 09:00:00"),
+    (4, 8, "2026-10-02 09:00:00"),
+    (5, 7, "2026-10-02 09:00:00"),
+    (6, 7, "2026-10-03 09:00:00"),
+    (7, 7, "2026-10-01 09:00:00"),
+]
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        self.assertEqual(decode_cursor(encode_cursor("2026-10-02 09:00:00", 5)), ("2026-10-02 09:00:00", 5))
+
+    def test_invalid_cursor(self):
+        for cursor in ("", "abc", encode_cursor("2026-10-02", "x")):
+            with self.assertRaises(InvalidPage):
+                decode_cursor(cursor)
+
+    def test_page_params(self):
+        factory = RequestFactory()
+        self.assertEqual(page_params(factory.get("/", {"limit": "100000"})), (None, HISTORY_MAX_PAGE_SIZE))
+        self.assertEqual(page_params(factory.get("/", {"limit": "0"}))[1], 1)
+        cursor = encode_cursor("2026-10-02 09:00:00", 5)
+        self.assertEqual(page_params(factory.get("/", {"cursor": cursor, "limit": "3"})),
+                         (("2026-10-02 09:00:00", 5), 3))
+        with self.assertRaises(InvalidPage):
+            page_params(factory.get("/", {"limit": "many"}))
+
+
+class FetchPageTests(SimpleTestCase):
+    def setUp(self):
+        handle, path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        self.conn = SQLiteConnection(path)
+        self.addCleanup(self.conn.close)
+        cursor = self.conn.cursor()
+        cursor.execute("CREATE TABLE history (id INT AUTO_INCREMENT PRIMARY KEY, customer_id INT, 저장일시 TEXT, "
+                       "제목 TEXT)")
+        cursor.executemany("INSERT INTO history (id, customer_id, 저장일시, 제목) VALUES (%s, %s, %s, %s)",
+                           [row + (f"항목 {row[0]}",) for row in ROWS])
+        cursor.close()
+
+    def pages(self, limit):
+        cursor, pages = None, []
+        while True:
+            rows, cursor = fetch_page(self.conn, "history", "제목", 7, cursor and decode_cursor(cursor), limit)
+            pages.append([row["id"] for row in rows])
+            if cursor is None:
+                return pages
+
+    def test_newest_first_with_ties_on_saved_at(self):
+        """저장일시가 같은 항목은 id 역순, 페이지 경계에서 빠지거나 겹치는 항목 없음"""
+        self.assertEqual(self.pages(2), [[6, 5], [3, 2], [7, 1]])
+        self.assertEqual(self.pages(3), [[6, 5, 3], [2, 7, 1]])
+        self.assertEqual(self.pages(10), [[6, 5, 3, 2, 7, 1]])
+
+    def test_rows_without_internal_columns(self):
+        rows, cursor = fetch_page(self.conn, "history", "제목", 7, None, 1)
+        self.assertEqual(rows, [{"id": 6, "제목": "항목 6"}])
+        self.assertEqual(decode_cursor(cursor), ("2026-10-03 09:00:00", 6))
+
+    def test_other_customer(self):
+        self.assertEqual(fetch_page(self.conn, "history", "제목", 8, None, 5), ([{"id": 4, "제목": "항목 4"}], None))
+        self.assertEqual(fetch_page(self.conn, "history", "제목", 9, None, 5), ([], None))
@@ -0,0 +1,63 @@
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jumpit import prompt_budget
+from jumpit.prompt_budget import TemplateBudget, _window, count_tokens, fit_prompt
+
+SYSTEM = "당신은 면접관입니다. 이전 질문과 겹치지 않게 다음 질문을 하나만 만드세요."
+TEMPLATE = SYSTEM + "\n이전 질문: {history}\n지원자 답변: {user_input}"
+HISTORY = [f"질문 {i:02d}: 프로젝트에서 맡은 역할과 사용한 기술을 설명해 주세요" for i in range(20)]
+
+
+class WindowTests(SimpleTestCase):
+    def test_drops_oldest_first(self):
+        cost = count_tokens(HISTORY[0]) + 2
+        self.assertEqual(_window(HISTORY, cost * 3), HISTORY[-3:])
+        self.assertEqual(_window(HISTORY, cost * 3 - 1), HISTORY[-2:])
+        self.assertEqual(_window(HISTORY, cost * 100), HISTORY)
+        self.assertEqual(_window(HISTORY, 0), [])
+
+
+@mock.patch.object(prompt_budget, "BUDGETS", {
+    "interview": TemplateBudget(300, [("history", "window"), ("user_input", "truncate")], min_field_tokens=16),
+})
+class FitPromptTests(SimpleTestCase):
+    def fit(self, history, user_input):
+        return fit_prompt("interview", TEMPLATE, {"history": history, "user_input": user_input})
+
+    def test_under_budget_unchanged(self):
+        prompt, tokens = self.fit(HISTORY[:2], "네")
+        self.assertEqual(prompt, TEMPLATE.format(history=HISTORY[:2], user_input="네"))
+        self.assertEqual(tokens, count_tokens(prompt))
+
+    def test_history_dropped_oldest_first(self):
+        """시스템 프롬프트와 마지막 답변은 그대로, 이전 질문은 오래된 것부터 빠짐"""
+        answer = "Django 로 API 서버를 만들었습니다."
+        prompt, tokens = self.fit(HISTORY, answer)
+        self.assertLessEqual(tokens, 300)
+        self.assertTrue(prompt.startswith(SYSTEM))
+        self.assertTrue(prompt.endswith(f"지원자 답변: {answer}"))
+        kept = [item for item in HISTORY if item in prompt]
+        self.assertTrue(kept)
+        self.assertLess(len(kept), len(HISTORY))
+        self.assertEqual(kept, HISTORY[-len(kept):])
+
+    def test_oversized_message_truncated(self):
+        """답변 하나가 예산보다 커도 예외 없이 앞부분만 남김"""
+        answer = "대규모 트래픽을 처리하는 서버를 운영했습니다. " * 200
+        prompt, tokens = self.fit(HISTORY, answer)
+        self.assertLessEqual(tokens, 300)
+        self.assertTrue(prompt.startswith(SYSTEM))
+        head = prompt.split("지원자 답변: ", 1)[1]
+        self.assertTrue(head.endswith("…"))
+        self.assertTrue(answer.startswith(head[:-1]))
+        self.assertGreater(len(head), 10)
+
+    def test_budget_unreachable_keeps_system_prompt(self):
+        """줄일 수 있는 변수를 최소 크기까지 줄여도 넘으면 경고만 하고 시스템 프롬프트는 자르지 않음"""
+        with mock.patch.object(prompt_budget.BUDGETS["interview"], "max_tokens", count_tokens(SYSTEM)):
+            with self.assertLogs(prompt_budget.logger, "WARNING"):
+                prompt, tokens = self.fit(HISTORY, "답변 " * 500)
+        self.assertTrue(prompt.startswith(SYSTEM))
+        self.assertGreater(tokens, count_tokens(SYSTEM))
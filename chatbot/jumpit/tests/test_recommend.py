@@ -0,0 +1,127 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from jumpit.db import SQLiteConnection
+from jumpit.recommend import create_recommendation_table, profile_vectors, recommend_for_user, run_batch, score_users
+from jumpit.retrieval import JobIndex
+
+NOW = datetime(2026, 10, 19, 9, 0)
+PAST, FUTURE = "2020-01-01", "2099-12-31"
+
+# (id, 제목, 사용기술, 주요업무, 회사명, 링크, 마감일, 상시채용)
+POSTINGS = [
+    (1, "백엔드 개발자", "Java, Spring", "API 서버 개발", "점핏", "link1", FUTURE, 0),
+    (2, "백엔드 개발자 (Spring)", "Java, Spring", "API 서버 개발", "랩", "link2", PAST, 0),
+    (3, "Java 백엔드 엔지니어", "Java, Spring", "서버 개발", "랩", "link3", FUTURE, 0),
+    (4, "백엔드 서버 개발자", "Java", "API 개발", "스튜디오", "link4", None, 1),
+    (5, "프론트엔드 개발자", "React, TypeScript", "웹 화면 개발", "점핏", "link5", None, 1),
+    (6, "데이터 분석가", "SQL, Python", "지표 분석", "랩", "link6", FUTURE, 0),
+]
+
+
+class RecommendBatchTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="recommend_tests_")
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.conn = SQLiteConnection(os.path.join(self.directory, "db.sqlite3"))
+        self.addCleanup(self.conn.close)
+        cursor = self.conn.cursor()
+        cursor.execute("CREATE TABLE job_posting_new (id INT AUTO_INCREMENT PRIMARY KEY, 제목 TEXT, 사용기술 TEXT, "
+                       "주요업무 TEXT, 회사명 TEXT, 링크 TEXT, 마감일 DATE, 상시채용 TINYINT(1) DEFAULT 0)")
+        cursor.executemany("INSERT INTO job_posting_new VALUES (%s, %s, %s, %s, %s, %s, %s, %s)", POSTINGS)
+        cursor.execute("CREATE TABLE saved_cover_letter (id INT AUTO_INCREMENT PRIMARY KEY, customer_id TEXT, "
+                       "채용공고 TEXT, 자기소개서 TEXT, 저장일시 DATETIME)")
+        cursor.executemany(
+            "INSERT INTO saved_cover_letter (customer_id, 채용공고, 자기소개서, 저장일시) VALUES (%s, %s, %s, %s)", [
+                ("backend", "백엔드 개발자", "Java Spring 으로 API 서버를 개발했습니다", "2026-10-18 09:00:00"),
+                ("frontend", "프론트엔드 개발자", "React 로 웹 화면을 개발했습니다", "2026-10-18 09:00:00"),
+            ])
+        cursor.execute("CREATE TABLE selected_job_posting (id INT AUTO_INCREMENT PRIMARY KEY, customer_id TEXT, "
+                       "제목 TEXT, 사용기술 TEXT, 주요업무 TEXT, 회사명 TEXT, 저장일시 DATETIME)")
+        # backend 사용자는 1번 공고를 이미 조회함
+        cursor.execute("INSERT INTO selected_job_posting (customer_id, 제목, 사용기술, 주요업무, 회사명, 저장일시) "
+                       "VALUES (%s, %s, %s, %s, %s, %s)",
+                       ("backend", "백엔드 개발자", "Java, Spring", "API 서버 개발", "점핏", "2026-10-18 10:00:00"))
+        cursor.close()
+        self.index = self.build_index()
+
+    def build_index(self):
+        """작은 인덱스를 저장한 뒤 다시 읽어 벡터 저장소(메모리 맵)로 검색"""
+        rows = [(job_id, title, skills, description, None, None, None, None, None, deadline, open_ended, company, link)
+                for job_id, title, skills, description, company, link, deadline, open_ended in POSTINGS]
+        path = os.path.join(self.directory, "job_index.npz")
+        JobIndex.build(rows).save(path, store_dir=self.directory)
+        return JobIndex.load(path, store_dir=self.directory)
+
+    def execute(self, query, args=None):
+        cursor = self.conn.cursor()
+        cursor.execute(query, args)
+        rows = list(cursor.fetchall())
+        cursor.close()
+        return rows
+
+    def stored(self):
+        return self.execute("SELECT customer_id, 순위, 공고_id FROM recommended_job_posting ORDER BY customer_id, 순위")
+
+    def test_score_users_excludes_viewed_and_expired(self):
+        histories = {
+            "backend": [("viewed", ("백엔드 개발자", "Java, Spring", "API 서버 개발"), NOW)],
+            "frontend": [("cover_letter", ("프론트엔드 개발자", "React 웹 화면"), NOW)],
+        }
+        users, profiles = profile_vectors(self.index.embedder, histories, now=NOW)
+        self.assertEqual(users, ["backend", "frontend"])
+        np.testing.assert_allclose(np.linalg.norm(profiles, axis=1), 1.0, rtol=1e-5)
+        results = score_users(self.index, users, profiles, {"backend": {1}}, top_k=3)
+        backend = [job_id for job_id, _ in results["backend"]]
+        self.assertEqual(len(backend), 3)
+        self.assertNotIn(1, backend)
+        self.assertNotIn(2, backend)
+        self.assertLessEqual(set(backend), {3, 4, 5, 6})
+        self.assertIn(backend[0], (3, 4))
+        self.assertEqual(results["frontend"][0][0], 5)
+        scores = [score for _, score in results["backend"]]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_batch_top_k_per_user(self):
+        self.assertEqual(run_batch(self.conn, self.index), 2)
+        stored = self.stored()
+        backend = [job_id for user, _, job_id in stored if user == "backend"]
+        frontend = [job_id for user, _, job_id in stored if user == "frontend"]
+        self.assertNotIn(1, backend)
+        self.assertNotIn(2, backend + frontend)
+        self.assertIn(backend[0], (3, 4))
+        self.assertEqual(frontend[0], 5)
+        self.assertEqual([rank for user, rank, _ in stored if user == "backend"], list(range(1, len(backend) + 1)))
+        self.assertEqual(recommend_for_user(self.conn, self.index, "backend"), backend)
+
+    def test_rerun_replaces_rows(self):
+        run_batch(self.conn, self.index)
+        first = self.stored()
+        run_batch(self.conn, self.index)
+        self.assertEqual(self.stored(), first)
+        # 내역이 없어진 사용자의 추천은 삭제
+        self.execute("DELETE FROM saved_cover_letter WHERE customer_id = %s", ("frontend",))
+        self.assertEqual(run_batch(self.conn, self.index), 1)
+        self.assertEqual({user for user, _, _ in self.stored()}, {"backend"})
+
+    def test_expired_after_batch_filtered_on_read(self):
+        """배치 후 마감된 공고, 다시 크롤링해 링크가 바뀐 공고는 저장된 결과를 읽을 때 제외"""
+        run_batch(self.conn, self.index)
+        backend = recommend_for_user(self.conn, self.index, "backend")
+        expired, recrawled = backend[0], backend[1]
+        self.execute("UPDATE job_posting_new SET 마감일 = %s, 상시채용 = 0 WHERE id = %s", (PAST, expired))
+        self.execute("UPDATE job_posting_new SET 링크 = %s WHERE id = %s", ("other", recrawled))
+        self.assertEqual(recommend_for_user(self.conn, self.index, "backend"), backend[2:])
+
+    def test_on_demand_without_batch(self):
+        create_recommendation_table(self.conn)
+        self.assertEqual(self.stored(), [])
+        job_ids = recommend_for_user(self.conn, self.index, "backend", top_k=3)
+        self.assertEqual(len(job_ids), 3)
+        self.assertFalse({1, 2} & set(job_ids))
+        self.assertEqual(recommend_for_user(self.conn, self.index, "nobody"), [])
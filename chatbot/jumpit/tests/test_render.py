@@ -0,0 +1,38 @@
+from django.test import SimpleTestCase
+
+from jumpit.render import render_job_detail, render_job_list
+
+JOB = ("백엔드 개발자", "점핏", "Python, Django", "서울 강남구", "경력 3~5년", "2026-11-30",
+       "https://jumpit.saramin.co.kr/position/1")
+
+
+class RenderJobListTests(SimpleTestCase):
+    def test_numbered_from_start(self):
+        text = render_job_list([JOB, JOB], start=5)
+        self.assertTrue(text.startswith("6.  백엔드 개발자\n"))
+        self.assertIn("\n7.  백엔드 개발자\n", text)
+
+    def test_all_columns_in_order(self):
+        self.assertEqual(render_job_list([JOB]), (
+            "1.  백엔드 개발자\n"
+            "회사명: 점핏\n"
+            "기술스택: Python, Django\n"
+            "근무지: 서울 강남구\n"
+            "조건: 경력 3~5년\n"
+            "모집기간: 2026-11-30\n"
+            "[지원 링크] https://jumpit.saramin.co.kr/position/1\n\n"
+        ))
+
+    def test_extra_columns_ignored_and_dollar_signs_kept(self):
+        """검색 결과 튜플의 뒤쪽 컬럼은 무시, 값에 $ 가 있어도 그대로 출력"""
+        job = ("$100k 백엔드",) + JOB[1:] + (42, "extra")
+        self.assertTrue(render_job_list([job]).startswith("1.  $100k 백엔드\n"))
+
+    def test_empty(self):
+        self.assertEqual(render_job_list([]), "")
+
+
+class RenderJobDetailTests(SimpleTestCase):
+    def test_missing_values(self):
+        self.assertEqual(render_job_detail([("자격요건", "Python 3년"), ("우대사항", None)]),
+                         "[자격요건]\nPython 3년\n\n[우대사항]\n정보 없음")
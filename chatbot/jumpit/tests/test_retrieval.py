@@ -0,0 +1,110 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jumpit import retrieval
+from jumpit.bitmap import Bitmap
+from jumpit.db import SQLiteConnection
+from jumpit.retrieval import JobIndex, fetch_index_rows, link_hash
+
+# (id, 제목, 사용기술, 주요업무, 표준기술, 지역코드, 시군구, 경력_최소, 경력_최대, 마감일, 상시채용, 회사명, 링크)
+ROWS = [
+    (10, "백엔드 개발자", "Java, Spring", "API 서버 개발", "Java,Spring", "11", "강남구", 0, 3, None, 1, "점핏", "link10"),
+    (11, "프론트엔드 개발자", "React", "웹 화면 개발", "React", "11", None, 1, 5, None, 1, "점핏", "link11"),
+    (12, "Backend Engineer", "Python, Django", "서버 개발", "Python,Django", "41", None, 3, 99, None, 1, "랩", "link12"),
+    (13, "데이터 분석가", "SQL", "지표 분석", "SQL", "26", None, 0, 0, None, 1, "랩", "link13"),
+    (14, "서버 개발자 (Java)", "Java", "백엔드 API 개발", "Java", "11", None, 0, 99, None, 1, "랩", "link14"),
+]
+
+
+class SearchTests(SimpleTestCase):
+    def setUp(self):
+        self.index = JobIndex.build(ROWS)
+
+    def test_rrf_fusion_order(self):
+        """두 순위의 1 / (RRF_K + 순위) 합 순, 키워드 일치는 모두 포함하고 벡터만 일치하면 유사도 기준 이상만"""
+        lexical = [0, 1, 2]
+        vector = [(2, 0.9), (3, 0.5), (4, 0.1)]
+        with mock.patch.object(self.index, "lexical", return_value=lexical), \
+                mock.patch.object(self.index, "vector", return_value=vector), \
+                mock.patch.object(retrieval, "RRF_K", 60):
+            # 2: 1/63 + 1/61, 0: 1/61, 1 과 3: 1/62 (같으면 키워드 순위 먼저), 4: 유사도 미달
+            self.assertEqual(self.index.search(["백엔드"], "백엔드", min_similarity=0.3), [12, 10, 11, 13])
+
+    def test_keyword_matches_always_included(self):
+        # "서버 개발자" 는 동의어 "서버 개발" 로 일치
+        self.assertEqual(self.index.lexical(["백엔드"]), [0, 2, 4])
+        results = self.index.search(["백엔드"], "백엔드", min_similarity=1.01)
+        self.assertEqual(sorted(results), [10, 12, 14])
+        self.assertLessEqual({10, 12, 14}, set(self.index.search(["백엔드"], "백엔드", min_similarity=-1)))
+
+    def test_allowed_bitmap(self):
+        """조건(패싯) 비트맵 밖의 공고는 키워드가 일치해도 제외"""
+        allowed = Bitmap.from_positions([1, 2, 3])
+        results = self.index.search(["백엔드", "개발자"], "백엔드 개발자", min_similarity=-1, allowed=allowed)
+        self.assertTrue(results)
+        self.assertLessEqual(set(results), {11, 12, 13})
+        self.assertEqual(self.index.search(["백엔드"], "백엔드", min_similarity=1.01, allowed=allowed), [12])
+        self.assertEqual(self.index.search(["백엔드"], "백엔드", allowed=Bitmap.from_positions([])), [])
+
+
+class SamePostingTests(SimpleTestCase):
+    def test_link_checked(self):
+        index = JobIndex.build(ROWS)
+        self.assertTrue(index.same_posting(10, "link10"))
+        # 다시 크롤링해서 같은 id 가 다른 공고가 된 경우
+        self.assertFalse(index.same_posting(10, "link11"))
+        self.assertFalse(index.same_posting(99, "link10"))
+
+    def test_saved_index_keeps_link_hashes(self):
+        directory = tempfile.mkdtemp(prefix="retrieval_tests_")
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "job_index.npz")
+        JobIndex.build(ROWS).save(path, store_dir=directory)
+        loaded = JobIndex.load(path, store_dir=directory)
+        self.assertEqual(int(loaded.link_hashes[4]), link_hash("link14"))
+        self.assertTrue(loaded.same_posting(14, "link14"))
+        self.assertFalse(loaded.same_posting(14, "link13"))
+        self.assertEqual(loaded.search(["백엔드"], "백엔드", min_similarity=1.01), [10, 12, 14])
+
+    def test_without_link_hashes(self):
+        """링크 해시가 없는 예전 인덱스는 확인하지 않음"""
+        index = JobIndex.build(ROWS)
+        index.link_hashes = None
+        self.assertTrue(index.same_posting(10, "link11"))
+
+
+class FetchIndexRowsTests(SimpleTestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite3")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+        self.conn = SQLiteConnection(self.path)
+        self.addCleanup(self.conn.close)
+
+    def test_old_schema_fallback(self):
+        """표준기술/패싯 컬럼이 없는 테이블은 원문 컬럼을 파싱해 같은 13개 컬럼으로"""
+        cursor = self.conn.cursor()
+        cursor.execute("CREATE TABLE job_posting_new (id INT AUTO_INCREMENT PRIMARY KEY, 제목 TEXT, 사용기술 TEXT, "
+                       "주요업무 TEXT, 근무지역 TEXT, 근로조건 TEXT, 모집기간 TEXT, 마감일자 TEXT, 저장일시 TEXT, "
+                       "회사명 TEXT, 링크 TEXT)")
+        cursor.executemany("INSERT INTO job_posting_new VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)", [
+            (2, "백엔드 개발자", "자바, 스프링부트", "API", "서울 강남구", "경력 1~3년", "D-3", "2026-11-30",
+             "2026-10-19 09:00:00", "점핏", "link2"),
+            (1, "데이터 분석가", "SQL", "분석", "부산", "신입", "상시", "상시채용", "2026-10-19 09:00:00", "랩", "link1"),
+        ])
+        cursor.close()
+        rows = fetch_index_rows(self.conn)
+        self.assertEqual([row[0] for row in rows], [1, 2])
+        self.assertTrue(all(len(row) == 13 for row in rows))
+        self.assertEqual(rows[1][4], "Java,Spring Boot")
+        self.assertEqual(rows[1][7:9], (1, 3))
+        self.assertEqual(str(rows[1][9]), "2026-11-30")
+        self.assertEqual(rows[0][10], 1)
+        self.assertEqual(rows[1][11:], ("점핏", "link2"))
+        index = JobIndex.build(rows)
+        self.assertTrue(index.same_posting(2, "link2"))
+        self.assertEqual(index.search(["백엔드"], "백엔드", min_similarity=1.01), [2])
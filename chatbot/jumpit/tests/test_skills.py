@@ -0,0 +1,55 @@
+import numpy as np
+from django.test import SimpleTestCase
+
+from jumpit.skills import SkillIndex, canonical_skill, normalize_skills
+
+POSTINGS = [
+    ["Java", "Spring"],
+    ["JavaScript", "React"],
+    ["Python", "Django"],
+    ["Python", "FastAPI", "React"],
+    ["Java", "Python"],
+    [],
+]
+
+
+class NormalizeSkillsTests(SimpleTestCase):
+    def test_aliases_and_unknown_skills(self):
+        self.assertEqual(canonical_skill(" 파이썬 "), "Python")
+        self.assertIsNone(canonical_skill("Cobol"))
+        self.assertEqual(normalize_skills("자바, JS / reactjs·Spring Boot, java8\n정보 없음"),
+                         ["Java", "JavaScript", "React", "Spring Boot"])
+        self.assertEqual(normalize_skills(None), [])
+
+
+class SkillIndexMatchTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SkillIndex.build(POSTINGS)
+
+    def match(self, **conditions):
+        return self.index.match(**conditions).to_array().tolist()
+
+    def test_exact_skill_not_substring(self):
+        """"Java" 검색에 JavaScript 공고가 걸리지 않음"""
+        self.assertEqual(self.match(all_of=["Java"]), [0, 4])
+        self.assertEqual(self.match(all_of=["자바스크립트"]), [1])
+
+    def test_and_or_not(self):
+        self.assertEqual(self.match(all_of=["python", "React"]), [3])
+        self.assertEqual(self.match(any_of=["Java", "Django"]), [0, 2, 4])
+        self.assertEqual(self.match(all_of=["Python"], none_of=["Java"]), [2, 3])
+        self.assertEqual(self.match(any_of=["React", "Spring"], none_of=["js"]), [0, 3])
+
+    def test_unknown_skills(self):
+        """AND 조건의 없는 기술은 결과 없음, OR/NOT 조건에서는 무시"""
+        self.assertEqual(self.match(all_of=["Cobol"]), [])
+        self.assertEqual(self.match(any_of=["Cobol", "Django"]), [2])
+        self.assertEqual(self.match(none_of=["Cobol"]), [0, 1, 2, 3, 4, 5])
+
+    def test_arrays_round_trip(self):
+        names, flat, offsets = self.index.to_arrays()
+        loaded = SkillIndex.from_arrays(names, flat, offsets, len(POSTINGS))
+        self.assertEqual(loaded.names, self.index.names)
+        for name in self.index.names:
+            np.testing.assert_array_equal(loaded.bitmap(name).to_array(), self.index.bitmap(name).to_array())
+        self.assertEqual(loaded.match(all_of=["Python"], none_of=["Java"]).to_array().tolist(), [2, 3])
@@ -0,0 +1,120 @@
+import threading
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from jumpit.hs import JobAssistantBot
+from jumpit.speculation import Speculator, predict_intents
+
+
+def state(user_id, user_input, **flags):
+    return {"user_id": user_id, "user_input": user_input, "interview_in": False, "intent_interview": False,
+            "cover_letter_now": False, "cover_letter_in": False, "job_search": False, **flags}
+
+
+class StubLLM:
+    """템플릿/입력별 호출을 기록하고 "템플릿:입력#호출 번호" 를 반환"""
+
+    def __init__(self, fail=()):
+        self.calls = []
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def ask(self, template_name, user_input):
+        with self._lock:
+            self.calls.append((template_name, user_input))
+            number = len(self.calls)
+        if template_name in self.fail:
+            raise RuntimeError("502")
+        return f"{template_name}:{user_input}#{number}"
+
+
+class SpeculatorTests(SimpleTestCase):
+    def setUp(self):
+        self.llm = StubLLM()
+        self.speculator = Speculator(self.llm.ask, max_branches=1, max_workers=4)
+        self.addCleanup(self.speculator._executor.shutdown)
+        self.bot = SimpleNamespace(speculator=self.speculator, ask=self.llm.ask)
+
+    def ask_sub(self, turn, template_name):
+        """노드가 하위 분기를 분류하는 경로 (미리 실행한 결과가 없으면 직접 호출)"""
+        return JobAssistantBot.ask_sub(self.bot, turn, template_name)
+
+    def speculate(self, turn, intent):
+        """기본 분기 분류, 미리 실행한 호출이 끝날 때까지 기다림 (호출 순서를 고정)"""
+        result = self.speculator.classify(turn, lambda: intent)
+        for _, future in self.speculator._pending.get(turn["user_id"], {}).values():
+            future.exception()
+        return result
+
+    def run_turn(self, turn, intent):
+        result = self.speculate(turn, intent)
+        self.speculator.settle(turn["user_id"], result)
+        return result
+
+    def test_prediction(self):
+        self.assertEqual(predict_intents(state("a", "공고 더 보여줘"))[0], "JOB_SEARCH")
+        self.assertEqual(predict_intents(state("a", "자소서 수정해줘"))[0], "COVER_LETTER")
+
+    def test_matching_intent_uses_speculative_result(self):
+        turn = state("a", "백엔드 공고 찾아줘")
+        self.assertEqual(self.run_turn(turn, "JOB_SEARCH"), "JOB_SEARCH")
+        self.assertEqual(self.ask_sub(turn, "search_job_prompt"), "search_job_prompt:백엔드 공고 찾아줘#1")
+        self.assertEqual(self.llm.calls, [("search_job_prompt", "백엔드 공고 찾아줘")])
+        # 한 번 사용한 결과는 남지 않음
+        self.assertIsNone(self.speculator.take("a", "search_job_prompt", turn["user_input"]))
+
+    def test_different_intent_discarded_and_recomputed(self):
+        turn = state("a", "백엔드 공고 찾아줘")
+        self.run_turn(turn, "COVER_LETTER")
+        self.assertIsNone(self.speculator.take("a", "search_job_prompt", turn["user_input"]))
+        self.assertEqual(self.ask_sub(turn, "cover_letter_prompt"), "cover_letter_prompt:백엔드 공고 찾아줘#2")
+        self.assertEqual([call[0] for call in self.llm.calls], ["search_job_prompt", "cover_letter_prompt"])
+
+    def test_not_shared_between_users_or_turns(self):
+        turn = state("a", "공고 찾아줘")
+        self.speculate(turn, "JOB_SEARCH")
+        # 같은 입력이라도 다른 사용자의 턴에서는 사용하지 않음
+        other = state("b", "공고 찾아줘")
+        self.assertEqual(self.ask_sub(other, "search_job_prompt"), "search_job_prompt:공고 찾아줘#2")
+        # 같은 사용자의 다음 턴(입력이 다름)에서도 사용하지 않음
+        self.speculator.settle("a", "JOB_SEARCH")
+        next_turn = state("a", "다음 공고")
+        self.assertEqual(self.ask_sub(next_turn, "search_job_prompt"), "search_job_prompt:다음 공고#3")
+        self.assertIsNone(self.speculator.take("a", "search_job_prompt", turn["user_input"]))
+
+    def test_new_turn_replaces_pending(self):
+        first = state("a", "공고 찾아줘")
+        self.speculate(first, "JOB_SEARCH")
+        second = state("a", "상세 정보 보여줘")
+        self.run_turn(second, "JOB_SEARCH")
+        self.assertEqual(self.ask_sub(second, "search_job_prompt"), "search_job_prompt:상세 정보 보여줘#2")
+        self.assertEqual(self.llm.calls, [("search_job_prompt", "공고 찾아줘"), ("search_job_prompt", "상세 정보 보여줘")])
+
+    def test_forced_interview_skips_classifier(self):
+        turn = state("a", "네 답변입니다", interview_in=True, intent_interview=True)
+
+        def classify():
+            raise AssertionError("면접 진행 중에는 분류하지 않음")
+
+        self.assertEqual(self.speculator.classify(turn, classify), "INTERVIEW")
+        self.speculator.settle("a", "INTERVIEW")
+        self.assertEqual(self.ask_sub(turn, "interview_intent"), "interview_intent:네 답변입니다#1")
+
+    def test_failed_speculation_recomputed(self):
+        self.llm.fail.add("search_job_prompt")
+        turn = state("a", "공고 찾아줘")
+        self.run_turn(turn, "JOB_SEARCH")
+        with self.assertLogs("jumpit.speculation", "WARNING"):
+            self.assertIsNone(self.speculator.take("a", "search_job_prompt", turn["user_input"]))
+        self.assertEqual(self.speculator._pending, {})
+
+    def test_classifier_error_clears_pending(self):
+        turn = state("a", "공고 찾아줘")
+
+        def classify():
+            raise RuntimeError("timeout")
+
+        with self.assertRaises(RuntimeError):
+            self.speculator.classify(turn, classify)
+        self.assertEqual(self.speculator._pending, {})
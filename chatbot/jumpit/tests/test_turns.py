@@ -0,0 +1,99 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from jumpit import turns
+from jumpit.turns import TurnBusy, TurnScheduler, input_digest, is_recent_duplicate
+
+
+class TurnSchedulerTests(SimpleTestCase):
+    def test_duplicate_input_runs_once(self):
+        """실행 중인 턴과 같은 입력은 새로 실행하지 않고 같은 결과를 받음"""
+        scheduler = TurnScheduler()
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def turn(digest):
+            calls.append(digest)
+            started.set()
+            release.wait(5)
+            return "응답"
+
+        with ThreadPoolExecutor(2) as executor:
+            first = executor.submit(scheduler.run, "user", "백엔드 공고", turn)
+            started.wait(5)
+            second = executor.submit(scheduler.run, "user", "백엔드 공고", turn)
+            time.sleep(0.05)
+            release.set()
+            self.assertEqual(first.result(5), ("응답", False))
+            self.assertEqual(second.result(5), ("응답", True))
+        self.assertEqual(calls, [input_digest("백엔드 공고")])
+
+    def test_finished_turn_coalesced_until_window_ends(self):
+        scheduler = TurnScheduler()
+        calls = []
+
+        def turn(digest):
+            calls.append(digest)
+            return len(calls)
+
+        self.assertEqual(scheduler.run("user", "안녕", turn), (1, False))
+        self.assertEqual(scheduler.run("user", "안녕", turn), (1, True))
+        with mock.patch.object(turns, "TURN_COALESCE_SECONDS", 0):
+            self.assertEqual(scheduler.run("user", "안녕", turn), (2, False))
+
+    def test_different_inputs_are_serialized_per_user(self):
+        scheduler = TurnScheduler()
+        running, overlaps = [], []
+        guard = threading.Lock()
+
+        def turn(digest):
+            with guard:
+                running.append(digest)
+                overlaps.append(len(running))
+            time.sleep(0.02)
+            with guard:
+                running.remove(digest)
+            return digest
+
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda text: scheduler.run("user", text, turn), ["a", "b", "c", "d"]))
+        self.assertEqual([coalesced for _, coalesced in results], [False] * 4)
+        self.assertEqual(max(overlaps), 1)
+
+    def test_error_is_shared_and_not_coalesced_afterwards(self):
+        scheduler = TurnScheduler()
+
+        def failing(digest):
+            raise ValueError("실패")
+
+        with self.assertRaises(ValueError):
+            scheduler.run("user", "안녕", failing)
+        self.assertEqual(scheduler.run("user", "안녕", lambda digest: "다시"), ("다시", False))
+
+    def test_lock_timeout(self):
+        scheduler = TurnScheduler()
+        entered, release = threading.Event(), threading.Event()
+
+        def slow(digest):
+            entered.set()
+            release.wait(5)
+
+        with mock.patch.object(turns, "TURN_LOCK_TIMEOUT", 0.05), ThreadPoolExecutor(1) as executor:
+            executor.submit(scheduler.run, "user", "a", slow)
+            entered.wait(5)
+            with self.assertRaises(TurnBusy):
+                scheduler.run("user", "b", lambda digest: None)
+            release.set()
+
+
+class RecentDuplicateTests(SimpleTestCase):
+    def test_recent_same_digest(self):
+        digest = input_digest("안녕")
+        self.assertTrue(is_recent_duplicate({"digest": digest, "at": time.time()}, digest))
+        self.assertFalse(is_recent_duplicate({"digest": digest, "at": time.time() - 60}, digest))
+        self.assertFalse(is_recent_duplicate({"digest": input_digest("다른 입력"), "at": time.time()}, digest))
+        self.assertFalse(is_recent_duplicate(None, digest))
@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+import numpy as np
+from django.test import SimpleTestCase
+
+from jumpit import vector_store
+from jumpit.vector_store import VectorStore, append, current_generation, quantize, write_generation
+
+DIM = 32
+
+
+def _vectors(rows, seed=0):
+    return np.random.default_rng(seed).standard_normal((rows, DIM)).astype(np.float32)
+
+
+class QuantizeTests(SimpleTestCase):
+    def test_int8_error_within_half_step(self):
+        """행별 배율(최대 절댓값 / 127)의 절반 이내로 복원"""
+        vectors = _vectors(200)
+        quantized, scale = quantize(vectors, 'int8')
+        self.assertEqual(quantized.dtype, np.int8)
+        error = np.abs(quantized.astype(np.float32) * scale[:, None] - vectors)
+        self.assertTrue(np.all(error <= scale[:, None] / 2 + 1e-6))
+
+    def test_float16_relative_error(self):
+        vectors = _vectors(200)
+        quantized, scale = quantize(vectors, 'float16')
+        self.assertIsNone(scale)
+        error = np.abs(quantized.astype(np.float32) - vectors)
+        self.assertTrue(np.all(error <= np.abs(vectors) * 2 ** -11 + 1e-7))
+
+    def test_zero_rows(self):
+        quantized, scale = quantize(np.zeros((2, DIM)), 'int8')
+        self.assertFalse(quantized.any())
+        self.assertTrue(np.all(scale == 1.0))
+
+
+class VectorStoreTests(SimpleTestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix='vector_store_tests_')
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.vectors = _vectors(500)
+        # id 는 정렬되지 않은 순서 (IVF 클러스터 순으로 저장하는 경우)
+        self.ids = np.random.default_rng(1).permutation(np.arange(1000, 1500))
+
+    def open(self, dtype='int8', **kwargs):
+        write_generation(self.directory, 'jobs', self.ids, self.vectors, dtype=dtype)
+        return VectorStore(self.directory, 'jobs', **kwargs)
+
+    def assertTopK(self, store, reference, rows, scores, k):
+        expected = np.argsort(-reference, kind='stable')[:k]
+        self.assertEqual(set(rows.tolist()), set(expected.tolist()))
+        np.testing.assert_allclose(scores, reference[rows], rtol=1e-4, atol=1e-4)
+        self.assertTrue(np.all(np.diff(scores) <= 0))
+
+    def test_scan_matches_numpy(self):
+        for dtype in ('int8', 'float16'):
+            store = self.open(dtype)
+            restored = store.get(np.arange(len(store)))
+            for seed in range(5):
+                query = _vectors(1, seed=100 + seed)[0]
+                rows, scores = store.scan(query, 10)
+                self.assertTopK(store, restored @ query, rows, scores, 10)
+                # 양자화 전 float32 점수와도 거의 같음
+                np.testing.assert_allclose(scores, self.vectors[rows] @ query, atol=0.2)
+
+    def test_scan_ranges(self):
+        store = self.open()
+        query = _vectors(1, seed=7)[0]
+        rows, _ = store.scan(query, 5, ranges=[(0, 100), (300, 350)])
+        self.assertTrue(all(row < 100 or 300 <= row < 350 for row in rows.tolist()))
+        reference = np.full(len(store), -np.inf, dtype=np.float32)
+        allowed = np.r_[0:100, 300:350]
+        reference[allowed] = store.get(allowed) @ query
+        self.assertEqual(set(rows.tolist()), set(np.argsort(-reference)[:5].tolist()))
+
+    def test_cosine_uses_row_norms(self):
+        store = self.open()
+        self.assertIsNotNone(store.norms)
+        query = _vectors(1, seed=9)[0] * 3
+        restored = store.get(np.arange(len(store)))
+        reference = restored @ query / np.linalg.norm(restored, axis=1) / np.linalg.norm(query)
+        rows, scores = store.scan(query, 10, metric='cosine')
+        self.assertTopK(store, reference, rows, scores, 10)
+        self.assertTrue(np.all(np.abs(scores) <= 1 + 1e-5))
+
+    def test_scan_batch_matches_numpy(self):
+        store = self.open()
+        restored = store.get(np.arange(len(store)))
+        queries = _vectors(4, seed=11)
+        exclude = np.zeros(len(store), dtype=bool)
+        exclude[::3] = True
+        with mock.patch.object(vector_store, 'VECTOR_SCAN_CHUNK', 64):
+            rows, scores = store.scan_batch(queries, 8, exclude=exclude)
+        for query, query_rows, query_scores in zip(queries, rows, scores):
+            reference = restored @ query
+            reference[exclude] = -np.inf
+            self.assertTopK(store, reference, query_rows, query_scores, 8)
+
+    def test_offsets(self):
+        store = self.open()
+        positions = store.offsets([self.ids[5], 999, self.ids[400], 2000])
+        self.assertEqual(positions.tolist(), [5, -1, 400, -1])
+
+    def test_append_visible_after_refresh(self):
+        store = self.open()
+        other = VectorStore(self.directory, 'jobs')
+        generation = store.generation
+        new_vectors = _vectors(3, seed=21)
+        self.assertEqual(append(self.directory, 'jobs', [1700, 1600, 1800], new_vectors), generation)
+        self.assertEqual(len(other), 500)
+        self.assertTrue(other.refresh())
+        self.assertFalse(other.refresh())
+        self.assertEqual(len(other), 503)
+        self.assertEqual(other.generation, generation)
+        self.assertEqual(other.offsets([1600, 1800, self.ids[0]]).tolist(), [501, 502, 0])
+        rows, _ = other.scan(new_vectors[1], 1, metric='cosine')
+        self.assertEqual(rows.tolist(), [501])
+        with self.assertRaises(ValueError):
+            append(self.directory, 'jobs', [1900], np.zeros((1, DIM + 1)))
+
+    def test_pinned_generation(self):
+        store = self.open()
+        write_generation(self.directory, 'jobs', self.ids[:10], self.vectors[:10])
+        pinned = VectorStore(self.directory, 'jobs', generation=store.generation)
+        self.assertEqual(len(pinned), 500)
+        self.assertEqual(len(VectorStore(self.directory, 'jobs')), 10)
+
+    def test_old_generations_removed(self):
+        with mock.patch.object(vector_store, 'VECTOR_STORE_KEEP_GENERATIONS', 1):
+            for _ in range(3):
+                write_generation(self.directory, 'jobs', self.ids[:10], self.vectors[:10])
+        self.assertEqual(current_generation(self.directory, 'jobs'), 3)
+        generations = {name.split('.')[1] for name in os.listdir(self.directory) if name.count('.') == 2}
+        self.assertEqual(generations, {'2', '3'})
+        self.assertFalse([name for name in os.listdir(self.directory) if name.endswith('.tmp')])
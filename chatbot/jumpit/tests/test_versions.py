@@ -0,0 +1,57 @@
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from jumpit import versions
+from jumpit.versions import INTERVIEWS, RESUMES
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "versions-tests"}}
+
+
+@override_settings(HISTORY_ETAGS=True, CACHES=LOCMEM)
+class ConditionalTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+
+    def etag(self, collections=(RESUMES,), username="a", variant=""):
+        response, headers = versions.conditional(self.factory.get("/"), list(collections), username, variant)
+        self.assertIsNone(response)
+        return headers["ETag"]
+
+    def revalidate(self, etag, collections=(RESUMES,), username="a", variant=""):
+        request = self.factory.get("/", HTTP_IF_NONE_MATCH=etag)
+        return versions.conditional(request, list(collections), username, variant)[0]
+
+    def test_not_modified_until_bump(self):
+        etag = self.etag()
+        response = self.revalidate(etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response["Cache-Control"], "private, no-cache")
+        versions.bump(RESUMES, "a")
+        self.assertIsNone(self.revalidate(etag))
+        self.assertNotEqual(self.etag(), etag)
+
+    def test_etag_depends_on_user_collection_and_variant(self):
+        etag = self.etag((RESUMES, INTERVIEWS))
+        self.assertNotEqual(self.etag((RESUMES, INTERVIEWS), variant="cursor=abc"), etag)
+        versions.bump(RESUMES, "b")
+        self.assertEqual(self.revalidate(etag, (RESUMES, INTERVIEWS)).status_code, 304)
+        versions.bump(INTERVIEWS, "a")
+        self.assertIsNone(self.revalidate(etag, (RESUMES, INTERVIEWS)))
+
+    def test_lost_versions_do_not_revive_old_etags(self):
+        """캐시에서 버전이 사라지면 새 임의 값에서 시작하므로 예전 ETag 로 304 가 나오지 않음"""
+        etag = self.etag()
+        cache.clear()
+        self.assertIsNone(self.revalidate(etag))
+
+
+@override_settings(HISTORY_ETAGS=False, CACHES=LOCMEM)
+class DisabledTests(SimpleTestCase):
+    def test_no_etag_and_no_304(self):
+        cache.clear()
+        request = RequestFactory().get("/", HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(versions.conditional(request, [RESUMES], "a"), (None, {"Cache-Control": "private, no-cache"}))
+        versions.bump(RESUMES, "a")
+        self.assertEqual(cache.get_many(["history_version:resumes:a", "history_modified:resumes:a"]), {})
@@ -0,0 +1,341 @@
+import contextvars
+import functools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import urllib.request
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .metrics import DB_QUERY_ERRORS, DB_QUERY_SECONDS, NODE_ERRORS, NODE_SECONDS, statement_label
+
+# 요청 중 몇 %를 기록할지 (0 ~ 1), X-Debug-Trace 헤더가 있으면 항상 기록
+TRACE_SAMPLE_RATE = float(os.getenv('TRACE_SAMPLE_RATE', '0.1'))
+# none / json (JSON Lines 파일) / otlp (OpenTelemetry 수집기, OTLP/HTTP JSON)
+TRACE_EXPORT = os.getenv('TRACE_EXPORT', 'none').lower()
+TRACE_LOG_PATH = os.getenv('TRACE_LOG_PATH', 'traces.jsonl')
+TRACE_OTLP_ENDPOINT = os.getenv('TRACE_OTLP_ENDPOINT', 'http://127.0.0.1:4318/v1/traces')
+# 디버그 엔드포인트에서 조회할 수 있도록 메모리에 보관할 최근 트레이스 수
+TRACE_BUFFER_SIZE = int(os.getenv('TRACE_BUFFER_SIZE', '200'))
+
+logger = logging.getLogger(__name__)
+
+_current_trace = contextvars.ContextVar('current_trace', default=None)
+_current_span = contextvars.ContextVar('current_span', default=None)
+
+
+class Span:
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'kind', 'start', 'duration_ms', 'attributes', 'error')
+
+    def __init__(self, trace_id, parent_id, name, kind, attributes):
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.time()
+        self.duration_ms = None
+        self.attributes = attributes
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def to_dict(self):
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start': self.start,
+            'duration_ms': self.duration_ms,
+            'attributes': self.attributes,
+            'error': self.error,
+        }
+
+
+class Trace:
+    """요청 한 건의 span 모음"""
+
+    def __init__(self, request_id, name, sampled):
+        self.request_id = request_id
+        self.name = name
+        self.sampled = sampled
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, span):
+        with self._lock:
+            self.spans.append(span)
+
+    def waterfall(self):
+        """시작 시각 순 span 목록 (요청 시작 기준 offset, 트리 깊이 포함)"""
+        spans = sorted(self.spans, key=lambda s: s.start)
+        if not spans:
+            return {'request_id': self.request_id, 'name': self.name, 'spans': []}
+        origin = spans[0].start
+        depth = {}
+        rows = []
+        for span in spans:
+            depth[span.span_id] = depth.get(span.parent_id, -1) + 1
+            rows.append({
+                **span.to_dict(),
+                'offset_ms': round((span.start - origin) * 1000, 3),
+                'depth': depth[span.span_id],
+            })
+        return {'request_id': self.request_id, 'name': self.name, 'spans': rows}
+
+
+class _NoopSpan:
+    def set(self, **attributes):
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+# request_id → Trace (최근 TRACE_BUFFER_SIZE 건)
+_recent_traces = OrderedDict()
+_recent_lock = threading.Lock()
+
+
+def current_request_id():
+    trace = _current_trace.get()
+    return trace.request_id if trace else None
+
+
+def current_trace_sampled():
+    trace = _current_trace.get()
+    return bool(trace and trace.sampled)
+
+
+def should_sample(force=False):
+    return force or random.random() < TRACE_SAMPLE_RATE
+
+
+@contextmanager
+def start_trace(request_id=None, name='request', sampled=None):
+    """요청 단위 트레이스 시작, 샘플링된 경우 종료 시 내보내기 및 보관"""
+    trace = Trace(request_id or uuid.uuid4().hex, name, should_sample() if sampled is None else sampled)
+    trace_token = _current_trace.set(trace)
+    span_token = _current_span.set(None)
+    try:
+        with span(name, kind='request'):
+            yield trace
+    finally:
+        _current_span.reset(span_token)
+        _current_trace.reset(trace_token)
+        if trace.sampled:
+            with _recent_lock:
+                _recent_traces[trace.request_id] = trace
+                while len(_recent_traces) > TRACE_BUFFER_SIZE:
+                    _recent_traces.popitem(last=False)
+            _exporter.export(trace)
+
+
+@contextmanager
+def span(name, kind='internal', **attributes):
+    """현재 트레이스 안에서 span 기록, 샘플링되지 않은 요청에서는 아무것도 하지 않음"""
+    trace = _current_trace.get()
+    if trace is None or not trace.sampled:
+        yield _NOOP_SPAN
+        return
+    parent = _current_span.get()
+    current = Span(trace.request_id, parent.span_id if parent else None, name, kind, attributes)
+    token = _current_span.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except Exception as e:
+        current.error = f'{type(e).__name__}: {e}'
+        raise
+    finally:
+        current.duration_ms = round((time.perf_counter() - started) * 1000, 3)
+        _current_span.reset(token)
+        trace.add(current)
+
+
+def traced_node(name, func):
+    """LangGraph 노드 함수를 span 으로 감싸기 (실행 시간, 예외 수는 샘플링과 무관하게 지표로 기록)"""
+    @functools.wraps(func)
+    def wrapper(state):
+        started = time.perf_counter()
+        try:
+            with span(name, kind='node'):
+                return func(state)
+        except Exception:
+            NODE_ERRORS.inc(node=name)
+            raise
+        finally:
+            NODE_SECONDS.observe(time.perf_counter() - started, node=name)
+    return wrapper
+
+
+def get_trace(request_id):
+    with _recent_lock:
+        return _recent_traces.get(request_id)
+
+
+def recent_request_ids():
+    with _recent_lock:
+        return list(reversed(_recent_traces))
+
+
+class TracedCursor:
+    """쿼리 실행 시간, 반환 행 수, 크기를 span 으로 기록하는 커서"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._span = _NOOP_SPAN
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def _run(self, name, method, query, args):
+        label = statement_label(query)
+        started = time.perf_counter()
+        try:
+            with span(name, kind='db', statement=label) as current:
+                if current is not _NOOP_SPAN:
+                    current.set(sql=' '.join(query.split())[:200])
+                result = method(query, args)
+                current.set(rowcount=self._cursor.rowcount)
+        except Exception:
+            DB_QUERY_ERRORS.inc(statement=label)
+            raise
+        finally:
+            DB_QUERY_SECONDS.observe(time.perf_counter() - started, statement=label)
+        self._span = current
+        return result
+
+    def execute(self, query, args=None):
+        return self._run('db.execute', self._cursor.execute, query, args)
+
+    def executemany(self, query, args):
+        return self._run('db.executemany', self._cursor.executemany, query, args)
+
+    def _record_rows(self, rows):
+        if self._span is not _NOOP_SPAN and rows:
+            size = sum(len(str(value).encode('utf-8')) for row in rows
+                       for value in (row.values() if isinstance(row, dict) else row))
+            self._span.set(rows=len(rows), bytes=size)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._record_rows([row] if row is not None else [])
+        return row
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._record_rows(rows)
+        return rows
+
+    def close(self):
+        self._cursor.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TracedConnection:
+    """DB 연결 래퍼, 커서를 TracedCursor 로 반환"""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def cursor(self, *args, **kwargs):
+        return TracedCursor(self._connection.cursor(*args, **kwargs))
+
+
+def _otlp_payload(trace):
+    """OTLP/HTTP JSON 형식으로 변환"""
+    def value(v):
+        if isinstance(v, bool):
+            return {'boolValue': v}
+        if isinstance(v, int):
+            return {'intValue': str(v)}
+        if isinstance(v, float):
+            return {'doubleValue': v}
+        return {'stringValue': str(v)}
+
+    spans = []
+    for s in trace.spans:
+        start_ns = int(s.start * 1e9)
+        spans.append({
+            'traceId': _otlp_trace_id(trace.request_id),
+            'spanId': s.span_id,
+            'parentSpanId': s.parent_id or '',
+            'name': s.name,
+            'kind': 3 if s.kind in ('db', 'llm') else 1,
+            'startTimeUnixNano': str(start_ns),
+            'endTimeUnixNano': str(start_ns + int((s.duration_ms or 0) * 1e6)),
+            'attributes': [{'key': k, 'value': value(v)} for k, v in {**s.attributes, 'kind': s.kind}.items()],
+            'status': {'code': 2, 'message': s.error} if s.error else {'code': 1},
+        })
+    return {'resourceSpans': [{
+        'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': 'jobara-chatbot'}}]},
+        'scopeSpans': [{'scope': {'name': 'jumpit.tracing'}, 'spans': spans}],
+    }]}
+
+
+def _otlp_trace_id(request_id):
+    """OTLP trace id(32자리 16진수), 외부에서 받은 요청 id 는 UUID5 로 변환"""
+    try:
+        if len(request_id) == 32:
+            int(request_id, 16)
+            return request_id
+    except ValueError:
+        pass
+    return uuid.uuid5(uuid.NAMESPACE_OID, request_id).hex
+
+
+class _Exporter:
+    """샘플링된 트레이스를 백그라운드 스레드에서 내보내기 (요청 처리 경로를 막지 않음)"""
+
+    def __init__(self):
+        self._queue = queue.Queue(maxsize=1000)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def export(self, trace):
+        if TRACE_EXPORT not in ('json', 'otlp'):
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='trace-exporter', daemon=True)
+                self._thread.start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            pass  # 수집기가 느리면 버림
+
+    def _run(self):
+        while True:
+            trace = self._queue.get()
+            try:
+                if TRACE_EXPORT == 'json':
+                    with open(TRACE_LOG_PATH, 'a', encoding='utf-8') as f:
+                        f.write(json.dumps(trace.waterfall(), ensure_ascii=False) + '\n')
+                else:
+                    request = urllib.request.Request(
+                        TRACE_OTLP_ENDPOINT,
+                        data=json.dumps(_otlp_payload(trace)).encode('utf-8'),
+                        headers={'Content-Type': 'application/json'},
+                    )
+                    urllib.request.urlopen(request, timeout=5).close()
+            except Exception:
+                logger.warning("트레이스 내보내기 중 오류 발생", exc_info=True)
+
+
+_exporter = _Exporter()
@@ -0,0 +1,179 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+from .db import DB_BACKEND, get_db_connection
+from .metrics import TURN_LOCK_TIMEOUTS, TURN_LOCK_WAIT_SECONDS, TURNS_COALESCED
+
+logger = logging.getLogger(__name__)
+
+# local: 프로세스 안에서만 직렬화 / mysql: GET_LOCK 으로 여러 워커 사이에서도 직렬화
+TURN_LOCK_BACKEND = os.getenv('TURN_LOCK_BACKEND', 'local').lower()
+# 같은 사용자의 이전 턴이 끝나기를 기다리는 최대 시간(초)
+TURN_LOCK_TIMEOUT = float(os.getenv('TURN_LOCK_TIMEOUT', '120'))
+# 같은 입력이 이 시간 안에 다시 들어오면 새로 실행하지 않고 직전 응답을 반환 (더블 클릭, 재전송)
+TURN_COALESCE_SECONDS = float(os.getenv('TURN_COALESCE_SECONDS', '5'))
+
+
+class TurnBusy(Exception):
+    """같은 사용자의 이전 턴이 TURN_LOCK_TIMEOUT 안에 끝나지 않음"""
+
+
+def input_digest(user_input):
+    return hashlib.sha256(user_input.encode('utf-8')).hexdigest()
+
+
+class LocalLocks:
+    """키별 threading.Lock (사용 중인 키만 보관)"""
+
+    def __init__(self):
+        self._locks = {}  # 키 → [Lock, 참조 수]
+        self._guard = threading.Lock()
+
+    def acquire(self, key, timeout):
+        with self._guard:
+            entry = self._locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        if entry[0].acquire(timeout=timeout):
+            return entry
+        self._forget(key, entry)
+        return None
+
+    def release(self, key, entry):
+        entry[0].release()
+        self._forget(key, entry)
+
+    def _forget(self, key, entry):
+        with self._guard:
+            entry[1] -= 1
+            if entry[1] == 0 and self._locks.get(key) is entry:
+                del self._locks[key]
+
+
+class MySQLLocks:
+    """MySQL/MariaDB GET_LOCK 기반 잠금 (잠금은 연결에 묶이므로 잡는 동안 연결 하나를 유지)"""
+
+    def acquire(self, key, timeout):
+        # GET_LOCK 이름은 64자 제한
+        name = 'jobara_turn:' + hashlib.sha1(key.encode('utf-8')).hexdigest()
+        conn = get_db_connection()
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT GET_LOCK(%s, %s)", (name, max(0, int(timeout))))
+            acquired = cursor.fetchone()[0] == 1
+            cursor.close()
+        except Exception:
+            conn.close()
+            raise
+        if not acquired:
+            conn.close()
+            return None
+        return conn, name
+
+    def release(self, key, handle):
+        conn, name = handle
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT RELEASE_LOCK(%s)", (name,))
+            cursor.fetchone()
+            cursor.close()
+        finally:
+            conn.close()
+
+
+class TurnScheduler:
+    """사용자별 턴 직렬화, 중복 요청 병합 (사용자끼리는 병렬)"""
+
+    def __init__(self, shared_locks=None):
+        self._local = LocalLocks()
+        self._shared = shared_locks
+        # 사용자 → (입력 digest, 결과 Future) : 실행 중이거나 방금 끝난 턴
+        self._turns = {}
+        self._guard = threading.Lock()
+
+    def _join(self, user_id, digest):
+        """같은 입력의 실행 중/최근 턴이 있으면 그 Future, 아니면 새 Future 등록 후 (Future, True)"""
+        with self._guard:
+            entry = self._turns.get(user_id)
+            if entry is not None and entry[0] == digest:
+                future = entry[1]
+                finished_at = getattr(future, 'finished_at', None)
+                if finished_at is None or time.monotonic() - finished_at < TURN_COALESCE_SECONDS:
+                    return future, False
+            future = Future()
+            self._turns[user_id] = (digest, future)
+            return future, True
+
+    def _finish(self, user_id, digest, future):
+        future.finished_at = time.monotonic()
+        # 병합 시간이 지나면 정리 (다음 턴이 이미 등록했다면 그대로 둠)
+        timer = threading.Timer(TURN_COALESCE_SECONDS, self._expire, (user_id, future))
+        timer.daemon = True
+        timer.start()
+
+    def _expire(self, user_id, future):
+        with self._guard:
+            entry = self._turns.get(user_id)
+            if entry is not None and entry[1] is future:
+                del self._turns[user_id]
+
+    def run(self, user_id, user_input, turn):
+        """turn(coalesce_key) 를 사용자별로 하나씩 실행, (결과, 병합 여부) 반환
+
+        turn 은 잠금 안에서 세션을 읽고 저장까지 마쳐야 함.
+        다른 워커에서 이미 처리한 중복 입력은 turn 이 세션의 직전 턴 기록으로 판단.
+        """
+        digest = input_digest(user_input)
+        future, owner = self._join(user_id, digest)
+        if not owner:
+            TURNS_COALESCED.inc(scope="process")
+            return future.result(timeout=TURN_LOCK_TIMEOUT), True
+        try:
+            result = self._run_locked(user_id, digest, turn)
+        except BaseException as e:
+            future.set_exception(e)
+            self._expire(user_id, future)
+            raise
+        future.set_result(result)
+        self._finish(user_id, digest, future)
+        return result, False
+
+    def _run_locked(self, user_id, digest, turn):
+        started = time.perf_counter()
+        local = self._local.acquire(user_id, TURN_LOCK_TIMEOUT)
+        if local is None:
+            TURN_LOCK_TIMEOUTS.inc(scope="process")
+            raise TurnBusy(user_id)
+        try:
+            shared = None
+            if self._shared is not None:
+                remaining = TURN_LOCK_TIMEOUT - (time.perf_counter() - started)
+                shared = self._shared.acquire(user_id, remaining)
+                if shared is None:
+                    TURN_LOCK_TIMEOUTS.inc(scope="shared")
+                    raise TurnBusy(user_id)
+            TURN_LOCK_WAIT_SECONDS.observe(time.perf_counter() - started)
+            try:
+                return turn(digest)
+            finally:
+                if shared is not None:
+                    self._shared.release(user_id, shared)
+        finally:
+            self._local.release(user_id, local)
+
+
+def create_turn_scheduler():
+    if TURN_LOCK_BACKEND == 'mysql' and DB_BACKEND != 'sqlite':
+        return TurnScheduler(MySQLLocks())
+    if TURN_LOCK_BACKEND == 'mysql':
+        logger.warning("SQLite 에서는 GET_LOCK 을 사용할 수 없어 프로세스 내 잠금만 사용합니다.")
+    return TurnScheduler()
+
+
+def is_recent_duplicate(last_turn, digest):
+    """세션에 기록된 직전 턴이 같은 입력이고 병합 시간 안인지 (다른 워커에서 처리된 중복 요청)"""
+    return bool(last_turn) and last_turn.get('digest') == digest and \
+        time.time() - last_turn.get('at', 0) < TURN_COALESCE_SECONDS
@@ -5,8 +5,19 @@ from .views import (
     register_user,
     login_user,
     get_resumes,
+    get_resume_detail,
     get_interviews,
-    get_job_postings
+    get_interview_detail,
+    get_job_postings,
+    get_job_posting_detail,
+    get_dashboard,
+    get_recommendations,
+    search_jobs,
+    autocomplete,
+    metrics,
+    debug_traces,
+    debug_trace_detail,
+    debug_prompts
 )
 
 urlpatterns = [
@@ -15,7 +26,21 @@ urlpatterns = [
     path("users/register/", register_user, name="register_user"),
     path("users/login/", login_user, name="login_user"),
     # 새로 추가된 엔드포인트
+    # 내역 목록은 ?cursor=&limit= 로 페이지 단위 조회, 본문은 <id>/ 로 조회
     path("resumes/", get_resumes, name="get_resumes"),
+    path("resumes/<int:resume_id>/", get_resume_detail, name="get_resume_detail"),
     path("interviews/", get_interviews, name="get_interviews"),
+    path("interviews/<int:interview_id>/", get_interview_detail, name="get_interview_detail"),
     path("job-postings/", get_job_postings, name="get_job_postings"),
+    path("job-postings/<int:posting_id>/", get_job_posting_detail, name="get_job_posting_detail"),
+    # 설정 화면: 세 내역의 첫 페이지를 한 번에 조회
+    path("dashboard/", get_dashboard, name="get_dashboard"),
+    path("recommendations/", get_recommendations, name="get_recommendations"),
+    path("jobs/", search_jobs, name="search_jobs"),
+    path("autocomplete/", autocomplete, name="autocomplete"),
+    path("metrics/", metrics, name="metrics"),
+    # 요청별 트레이스 (DEBUG 에서만 응답)
+    path("debug/traces/", debug_traces, name="debug_traces"),
+    path("debug/traces/<str:request_id>/", debug_trace_detail, name="debug_trace_detail"),
+    path("debug/prompts/", debug_prompts, name="debug_prompts"),
 ]
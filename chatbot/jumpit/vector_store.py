@@ -0,0 +1,352 @@
+"""
+임베딩 벡터 저장소 (int8/float16 양자화, 메모리 맵 파일, 크롤링 세대별 버전)
+
+gunicorn 워커마다 float32 행렬을 읽으면 워커 수만큼 메모리를 쓰므로,
+벡터를 양자화해 파일로 저장하고 각 워커는 np.memmap 으로 열어 OS 페이지 캐시를 공유합니다.
+
+컬렉션 하나(예: job_posting)의 파일 구성:
+    {name}.json             현재 세대 번호 (원자적으로 교체)
+    {name}.lock             새 세대를 쓰거나 행을 추가하는 동안 잡는 파일 잠금 (여러 워커/프로세스가 동시에 쓰지 않도록)
+    {name}.{세대}.meta       차원, 저장 형식, 행 수, id 정렬 여부 (행 추가 후 교체 → 읽는 쪽은 이 행 수만큼만 사용)
+    {name}.{세대}.vec        양자화된 벡터 (행 단위, 추가만 함)
+    {name}.{세대}.scale      int8 행별 배율 (float32)
+    {name}.{세대}.ids        행 위치 → id (int64)
+    {name}.{세대}.norm       행별 L2 노름 (양자화 복원 값 기준, float32, 코사인 유사도용)
+"""
+import contextlib
+import json
+import logging
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경 (잠금 없이 동작)
+    fcntl = None
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTOR_STORE_DIR = os.getenv('VECTOR_STORE_DIR', 'vector_store')
+# int8 (차원당 1바이트, 행별 배율) 또는 float16
+VECTOR_STORE_DTYPE = os.getenv('VECTOR_STORE_DTYPE', 'int8')
+# 유사도 계산 시 한 번에 float32 로 바꾸는 행 수 (임시 메모리 = 행 수 x 차원 x 4바이트)
+VECTOR_SCAN_CHUNK = int(os.getenv('VECTOR_SCAN_CHUNK', '16384'))
+# 현재 세대 외에 남겨 둘 이전 세대 수 (아직 이전 세대를 열고 있는 워커용)
+VECTOR_STORE_KEEP_GENERATIONS = int(os.getenv('VECTOR_STORE_KEEP_GENERATIONS', '1'))
+
+STORE_VERSION = 1
+_DTYPES = {'int8': np.int8, 'float16': np.float16}
+
+
+def _manifest_path(directory, name):
+    return os.path.join(directory, f'{name}.json')
+
+
+def _data_path(directory, name, generation, suffix):
+    return os.path.join(directory, f'{name}.{generation}.{suffix}')
+
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(path, data):
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def current_generation(directory, name):
+    """현재 세대 번호 (저장소가 없으면 None)"""
+    try:
+        manifest = _read_json(_manifest_path(directory, name))
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != STORE_VERSION:
+        raise ValueError(f'지원하지 않는 벡터 저장소 버전: {manifest.get("version")}')
+    return manifest['generation']
+
+
+def quantize(vectors, dtype):
+    """float32 (n, dim) → (양자화 벡터, 행별 배율 또는 None)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype == 'float16':
+        return vectors.astype(np.float16), None
+    # 행마다 최대 절댓값을 127 로 맞추는 대칭 양자화
+    scale = np.abs(vectors).max(axis=1) / 127.0
+    scale = np.where(scale > 0, scale, 1.0).astype(np.float32)
+    return np.round(vectors / scale[:, None]).astype(np.int8), scale
+
+
+@contextlib.contextmanager
+def file_lock(path):
+    """path 파일에 배타적 잠금 (다른 프로세스가 잡고 있으면 풀릴 때까지 대기)"""
+    with open(path, 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _append_files(directory, name, generation, dtype, ids, vectors, suffix=''):
+    quantized, scale = quantize(vectors, dtype)
+    with open(_data_path(directory, name, generation, 'vec') + suffix, 'ab') as f:
+        f.write(quantized.tobytes())
+    if scale is not None:
+        with open(_data_path(directory, name, generation, 'scale') + suffix, 'ab') as f:
+            f.write(scale.tobytes())
+    with open(_data_path(directory, name, generation, 'ids') + suffix, 'ab') as f:
+        f.write(np.asarray(ids, dtype=np.int64).tobytes())
+    restored = quantized.astype(np.float32)
+    if scale is not None:
+        restored *= scale[:, None]
+    with open(_data_path(directory, name, generation, 'norm') + suffix, 'ab') as f:
+        f.write(np.linalg.norm(restored, axis=1).astype(np.float32).tobytes())
+
+
+def _is_ascending(ids, after=None):
+    ids = np.asarray(ids, dtype=np.int64)
+    if not len(ids):
+        return True
+    if after is not None and ids[0] <= after:
+        return False
+    return bool(np.all(ids[1:] > ids[:-1]))
+
+
+def write_generation(directory, name, ids, vectors, dtype=VECTOR_STORE_DTYPE):
+    """새 세대로 전체 벡터 저장 (크롤링 후 재생성), 반환: 세대 번호
+
+    세대 번호 결정부터 현재 세대 교체까지 저장소 잠금 안에서 실행하고, 데이터 파일은 임시 이름으로 쓴 뒤 교체
+    (동시에 저장하는 프로세스가 같은 세대 파일에 이어 쓰지 않도록)
+    """
+    if dtype not in _DTYPES:
+        raise ValueError(f'지원하지 않는 저장 형식: {dtype}')
+    vectors = np.asarray(vectors, dtype=np.float32)
+    os.makedirs(directory, exist_ok=True)
+    with file_lock(os.path.join(directory, f'{name}.lock')):
+        generation = (current_generation(directory, name) or 0) + 1
+        suffixes = ('vec', 'scale', 'ids', 'norm')
+        for suffix in suffixes:
+            try:
+                os.remove(_data_path(directory, name, generation, suffix) + '.tmp')
+            except FileNotFoundError:
+                pass
+        _append_files(directory, name, generation, dtype, ids, vectors, suffix='.tmp')
+        for suffix in suffixes:
+            tmp_path = _data_path(directory, name, generation, suffix) + '.tmp'
+            if os.path.exists(tmp_path):
+                os.replace(tmp_path, _data_path(directory, name, generation, suffix))
+        _write_json(_data_path(directory, name, generation, 'meta'), {
+            'dim': int(vectors.shape[1]), 'dtype': dtype, 'rows': len(ids), 'ascending': _is_ascending(ids),
+            'last_id': int(ids[-1]) if len(ids) else None, 'norms': True, 'created_at': time.time(),
+        })
+        # 세대 파일을 다 쓴 뒤 현재 세대를 바꿈
+        _write_json(_manifest_path(directory, name), {'version': STORE_VERSION, 'generation': generation})
+        _remove_old_generations(directory, name, generation)
+    logger.info("벡터 저장소 %s 세대 %s: %s건 (%s)", name, generation, len(ids), dtype)
+    return generation
+
+
+def append(directory, name, ids, vectors):
+    """현재 세대에 새 행 추가 (새로 크롤링된 공고 등, 이미 있는 id 의 변경은 새 세대로 저장), 반환: 세대 번호
+
+    저장소 잠금 안에서 실행 (새 세대 저장이나 다른 프로세스의 추가와 같은 파일에 섞여 쓰지 않도록)
+    """
+    if current_generation(directory, name) is None:
+        return write_generation(directory, name, ids, vectors)
+    with file_lock(os.path.join(directory, f'{name}.lock')):
+        generation = current_generation(directory, name)
+        meta_path = _data_path(directory, name, generation, 'meta')
+        meta = _read_json(meta_path)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != meta['dim']:
+            raise ValueError(f'벡터 차원이 저장소({meta["dim"]})와 다릅니다: {vectors.shape}')
+        if not len(ids):
+            return generation
+        if not meta.get('norms'):
+            raise ValueError(f'행 노름이 없는 이전 형식의 세대입니다. 새 세대로 저장하세요: {name} {generation}')
+        _append_files(directory, name, generation, meta['dtype'], ids, vectors)
+        meta['ascending'] = meta['ascending'] and _is_ascending(ids, meta['last_id'])
+        meta['last_id'] = int(ids[-1])
+        meta['rows'] += len(ids)
+        # meta 가 바뀌면 읽는 쪽이 늘어난 파일을 다시 엶
+        _write_json(meta_path, meta)
+    logger.info("벡터 저장소 %s 세대 %s: %s건 추가", name, generation, len(ids))
+    return generation
+
+
+def _remove_old_generations(directory, name, generation):
+    prefix = f'{name}.'
+    for filename in os.listdir(directory):
+        if not filename.startswith(prefix) or filename.count('.') != 2:
+            continue
+        _, file_generation, _ = filename.split('.')
+        # 이미 열어 둔 워커는 삭제된 파일도 계속 읽을 수 있음 (POSIX)
+        if file_generation.isdigit() and int(file_generation) < generation - VECTOR_STORE_KEEP_GENERATIONS:
+            try:
+                os.remove(os.path.join(directory, filename))
+            except OSError:
+                logger.warning("이전 세대 벡터 파일 삭제 실패: %s", filename, exc_info=True)
+
+
+def _memmap(path, dtype, rows, width=None):
+    if rows == 0:
+        return np.zeros((0, width) if width else 0, dtype=dtype)
+    shape = (rows, width) if width else (rows,)
+    return np.memmap(path, dtype=dtype, mode='r', shape=shape)
+
+
+class VectorStore:
+    """읽기 전용 메모리 맵 (복사 없이 열기, generation 을 주면 그 세대로 고정: 인덱스 파일과 짝을 맞출 때)"""
+
+    def __init__(self, directory, name, generation=None):
+        self.directory = directory
+        self.name = name
+        self.pinned = generation
+        self.generation = None
+        self._meta_mtime = None
+        self._order = None
+        self.refresh()
+
+    def refresh(self):
+        """새 세대가 생겼거나 행이 추가되었으면 다시 엶, 반환: 다시 열었는지 여부"""
+        generation = self.pinned or current_generation(self.directory, self.name)
+        if generation is None:
+            raise FileNotFoundError(f'벡터 저장소가 없습니다: {_manifest_path(self.directory, self.name)}')
+        meta_path = _data_path(self.directory, self.name, generation, 'meta')
+        # meta 는 교체로 갱신하므로 inode 까지 비교 (같은 시각에 추가된 행도 놓치지 않도록)
+        stat = os.stat(meta_path)
+        mtime = (stat.st_ino, stat.st_mtime_ns)
+        if generation == self.generation and mtime == self._meta_mtime:
+            return False
+        meta = _read_json(meta_path)
+        self.dim, self.dtype, self.ascending = meta['dim'], meta['dtype'], meta['ascending']
+        rows = meta['rows']
+        ids_path = _data_path(self.directory, self.name, generation, 'ids')
+        self.ids = _memmap(ids_path, np.int64, rows)
+        self.vectors = _memmap(_data_path(self.directory, self.name, generation, 'vec'),
+                               _DTYPES[self.dtype], rows, self.dim)
+        self.scale = None
+        if self.dtype == 'int8':
+            self.scale = _memmap(_data_path(self.directory, self.name, generation, 'scale'), np.float32, rows)
+        # 행 노름 파일이 없는 이전 세대는 코사인 계산 때 복원해서 계산
+        self.norms = None
+        if meta.get('norms'):
+            self.norms = _memmap(_data_path(self.directory, self.name, generation, 'norm'), np.float32, rows)
+        self.generation = generation
+        self._meta_mtime = mtime
+        self._order = None
+        return True
+
+    def __len__(self):
+        return len(self.ids)
+
+    def nbytes(self):
+        return sum(array.nbytes for array in (self.ids, self.vectors, self.scale, self.norms) if array is not None)
+
+    def offsets(self, ids):
+        """id 목록 → 행 위치 (없는 id 는 -1)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self.ids):
+            return np.full(len(ids), -1, dtype=np.int64)
+        if self.ascending:
+            sorted_ids, order = self.ids, None
+        else:
+            if self._order is None:
+                self._order = np.argsort(self.ids, kind='stable')
+            order = self._order
+            sorted_ids = self.ids[order]
+        positions = np.minimum(np.searchsorted(sorted_ids, ids), len(sorted_ids) - 1)
+        found = sorted_ids[positions] == ids
+        if order is not None:
+            positions = order[positions]
+        return np.where(found, positions, -1).astype(np.int64)
+
+    def get(self, positions):
+        """행 위치 → float32 벡터 (양자화 복원)"""
+        positions = np.asarray(positions, dtype=np.int64)
+        vectors = np.asarray(self.vectors[positions], dtype=np.float32)
+        if self.scale is not None:
+            vectors *= self.scale[positions][:, None]
+        return vectors
+
+    def dot(self, query, start=0, stop=None):
+        """[start, stop) 행과 query 의 내적 (청크 단위로 float32 변환)"""
+        query = np.asarray(query, dtype=np.float32)
+        stop = len(self.ids) if stop is None else min(stop, len(self.ids))
+        scores = np.empty(max(0, stop - start), dtype=np.float32)
+        for begin in range(start, stop, VECTOR_SCAN_CHUNK):
+            end = min(begin + VECTOR_SCAN_CHUNK, stop)
+            block = self.vectors[begin:end].astype(np.float32) @ query
+            if self.scale is not None:
+                block *= self.scale[begin:end]
+            scores[begin - start:end - start] = block
+        return scores
+
+    def cosine(self, query, start=0, stop=None):
+        """코사인 유사도 (저장한 벡터가 정규화되어 있지 않아도 계산, 행 노름은 저장한 값 사용)"""
+        query = np.asarray(query, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        stop = len(self.ids) if stop is None else min(stop, len(self.ids))
+        scores = self.dot(query, start, stop)
+        for begin in range(start, stop, VECTOR_SCAN_CHUNK):
+            end = min(begin + VECTOR_SCAN_CHUNK, stop)
+            if self.norms is not None:
+                norms = self.norms[begin:end]
+            else:
+                norms = np.linalg.norm(self.get(np.arange(begin, end)), axis=1)
+            scores[begin - start:end - start] /= np.maximum(norms, 1e-12)
+        return scores
+
+    def scan(self, query, top_k, ranges=None, metric='dot'):
+        """상위 top_k (행 위치 배열, 점수 배열), ranges: 검사할 (시작, 끝) 행 구간 목록 (기본: 전체)"""
+        score = self.cosine if metric == 'cosine' else self.dot
+        if ranges is None:
+            ranges = [(0, len(self.ids))]
+        positions = [np.arange(start, min(stop, len(self.ids))) for start, stop in ranges if start < stop]
+        if not positions:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        positions = np.concatenate(positions)
+        scores = np.concatenate([score(query, start, stop) for start, stop in ranges if start < stop])
+        k = min(top_k, len(scores))
+        if k == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return positions[top], scores[top]
+
+    def scan_batch(self, queries, top_k, exclude=None):
+        """질의 여러 개 (n, dim) 의 상위 top_k, 반환: (행 위치 (n, k), 점수 (n, k)), 청크마다 행렬곱 한 번
+
+        exclude: 행 위치별 제외 여부 (마감된 공고 등), 제외된 행은 점수 -inf (남은 행이 k 개보다 적을 때만 결과에 포함)
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        k = min(top_k, len(self.ids))
+        best_rows = np.zeros((len(queries), 0), dtype=np.int64)
+        best_scores = np.zeros((len(queries), 0), dtype=np.float32)
+        for begin in range(0, len(self.ids), VECTOR_SCAN_CHUNK):
+            end = min(begin + VECTOR_SCAN_CHUNK, len(self.ids))
+            block = queries @ self.vectors[begin:end].astype(np.float32).T
+            if self.scale is not None:
+                block *= self.scale[begin:end]
+            if exclude is not None:
+                block[:, exclude[begin:end]] = -np.inf
+            # 지금까지의 상위 k 와 이번 청크를 합쳐 다시 상위 k 선택
+            scores = np.concatenate([best_scores, block], axis=1)
+            rows = np.concatenate([best_rows, np.broadcast_to(np.arange(begin, end), block.shape)], axis=1)
+            if scores.shape[1] > k:
+                top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, top, axis=1)
+                rows = np.take_along_axis(rows, top, axis=1)
+            best_scores, best_rows = scores, rows
+        order = np.argsort(-best_scores, axis=1)
+        return np.take_along_axis(best_rows, order, axis=1), np.take_along_axis(best_scores, order, axis=1)
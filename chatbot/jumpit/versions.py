@@ -0,0 +1,82 @@
+import hashlib
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+logger = logging.getLogger(__name__)
+
+# 사용자별 내역 종류 (views.HISTORY_SECTIONS 와 같은 이름)
+RESUMES = "resumes"
+INTERVIEWS = "interviews"
+JOB_POSTINGS = "job_postings"
+
+
+def _keys(collection, username):
+    return f"history_version:{collection}:{username}", f"history_modified:{collection}:{username}"
+
+
+def _initial_version():
+    # 캐시에서 사라진 뒤 다시 만든 버전이 예전 ETag 와 겹치지 않도록 임의 값에서 시작
+    return random.getrandbits(48)
+
+
+def enabled():
+    """ETag/304 사용 여부 (settings.HISTORY_ETAGS, 공유 캐시가 있을 때만 켜짐)"""
+    return getattr(settings, "HISTORY_ETAGS", False)
+
+
+def bump(collection, username):
+    """내역이 바뀐 뒤 호출: 버전 증가, 변경 시각 기록 (실패해도 저장은 계속 진행)"""
+    if not enabled():
+        return
+    version_key, modified_key = _keys(collection, username)
+    try:
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.add(version_key, _initial_version(), timeout=None)
+        cache.set(modified_key, time.time(), timeout=None)
+    except Exception:
+        logger.warning("내역 버전 갱신 실패: %s %s", collection, username, exc_info=True)
+
+
+def current(collection, username):
+    """(버전, 마지막 변경 시각), 캐시에 없으면 새로 만듦"""
+    version_key, modified_key = _keys(collection, username)
+    values = cache.get_many([version_key, modified_key])
+    if version_key not in values or modified_key not in values:
+        cache.add(version_key, _initial_version(), timeout=None)
+        cache.add(modified_key, time.time(), timeout=None)
+        values = cache.get_many([version_key, modified_key])
+    return values.get(version_key, 0), values.get(modified_key, time.time())
+
+
+def conditional(request, collections, username, variant=""):
+    """내역 버전으로 ETag/Last-Modified 계산, 조건부 요청이 일치하면 304 응답
+
+    반환: (304 응답 또는 None, 응답에 붙일 헤더)
+    variant 에는 같은 버전에서도 응답이 달라지는 값(cursor, limit)을 넣음
+    꺼져 있으면 (워커별 캐시) 항상 새로 조회하도록 ETag 없이 반환
+    """
+    if not enabled():
+        return None, {"Cache-Control": "private, no-cache"}
+    versions = [current(collection, username) for collection in collections]
+    tag = ";".join(f"{collection}={version}" for collection, (version, _) in zip(collections, versions))
+    etag = '"' + hashlib.sha256(f"{tag};{variant}".encode("utf-8")).hexdigest()[:32] + '"'
+    last_modified = int(max(modified for _, modified in versions))
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        # 브라우저가 저장하되 매번 ETag 로 확인
+        "Cache-Control": "private, no-cache",
+    }
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        for name, value in headers.items():
+            response[name] = value
+    return response, headers
@@ -1,8 +1,13 @@
 import jwt
+import contextvars
 import datetime
+import hmac
 import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.models import User
@@ -10,25 +15,27 @@ from django.contrib.auth.hashers import make_password
 from django.contrib.auth import authenticate
 from django.conf import settings
 
-import os
 import pymysql
 
+from .admission import admission, client_ip
+from .autocomplete import AUTOCOMPLETE_TOP_K, SUGGESTION_KINDS
+from .auth_cache import decode_token, user_cache
+from .db import DB_POOL_SIZE, pool as db_pool
 from .hs import JobAssistantBot
+from .metrics import (CHAT_TURN_SECONDS, CHAT_TURNS, RETRIEVAL_SECONDS, SESSION_STATE_BYTES, TURNS_COALESCED,
+                      render_metrics)
+from .pagination import HISTORY_MAX_PAGE_SIZE, HISTORY_PAGE_SIZE, InvalidPage, fetch_page, page_params
+from .prompt_budget import report as prompt_report
+from .recommend import recommend_for_user
+from .tracing import get_trace, recent_request_ids
+from .turns import TurnBusy, create_turn_scheduler, is_recent_duplicate
+from . import versions
 
 JWT_SECRET = settings.JWT_SECRET
 JWT_EXP_DELTA_SECONDS = settings.JWT_EXP_DELTA_SECONDS
 JWT_ALGORITHM = "HS256"
 
-# 각 요청마다 새 연결을 생성하는 헬퍼 함수
-def get_db_connection():
-    return pymysql.connect(
-        host=os.getenv('DB_HOST'),
-        port=int(os.getenv('DB_PORT')),
-        user=os.getenv('DB_USER'),
-        password=os.getenv('DB_PASSWORD'),
-        database=os.getenv('DB_NAME'),
-        charset="utf8mb4"
-    )
+logger = logging.getLogger(__name__)
 
 # 챗봇 상태 초기값
 INITIAL_STATE = {
@@ -40,6 +47,7 @@ INITIAL_STATE = {
     "job_name": "",
     "selected_job": None,
     "index_job": None,
+    "job_result_set": None,
     "job_search": False,
     "response": None,
     "job_results": [],
@@ -51,13 +59,16 @@ INITIAL_STATE = {
     "interview_in": False,
     "intent_interview": None,
     "experience": None,
-    "job_name": None
+    "job_name": None,
+    "suggestion": None
 }
 
 # JobAssistantBot 실행
 bot = JobAssistantBot()
 workflow = bot.create_workflow()
 bot.show_graph(workflow)
+# 같은 사용자의 턴은 하나씩 실행 (세션 상태 덮어쓰기 방지)
+turns = create_turn_scheduler()
 
 def jwt_required(view_func):
     """
@@ -70,7 +81,7 @@ def jwt_required(view_func):
             return JsonResponse({'error': '로그인 후 사용해 주세요.'}, status=401)
         try:
             token = auth_header.split(' ')[1]
-            payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            payload = decode_token(token, JWT_SECRET, [JWT_ALGORITHM])
             request.user_payload = payload
         except IndexError:
             return JsonResponse({'error': '잘못된 인증 헤더 형식입니다.'}, status=401)
@@ -84,13 +95,9 @@ def jwt_required(view_func):
 @csrf_exempt
 @require_http_methods(["POST"])
 @jwt_required
+@admission("chat")
 def chatbot_api(request):
     try:
-        state = request.session.get('state', None)
-        if state is None:
-            state = INITIAL_STATE.copy()
-        state["user_id"] = request.user_payload["username"]
-
         if not request.body:
             return JsonResponse({"error": "요청 데이터가 없습니다."}, status=400)
         try:
@@ -99,38 +106,96 @@ def chatbot_api(request):
             return JsonResponse({"error": "올바른 JSON 형식이 아닙니다."}, status=400)
 
         user_input = data.get("user_input", "").strip()
+        # 자동완성에서 고른 제안 {"text", "kind"} 이 있으면 LLM 분류/키워드 추출 없이 바로 공고 검색
+        suggestion = data.get("suggestion")
+        if suggestion is not None:
+            valid = isinstance(suggestion, dict) and suggestion.get("kind") in SUGGESTION_KINDS
+            text = str(suggestion.get("text") or "").strip() if valid else ""
+            if not text:
+                return JsonResponse({"error": "suggestion 에는 text 와 kind(title, skill, company)가 필요합니다."}, status=400)
+            suggestion = {"text": text, "kind": suggestion["kind"]}
+            user_input = user_input or text
         if not user_input:
             return JsonResponse({"error": "메시지를 입력해주세요."}, status=400)
 
-        state["user_input"] = user_input
+        username = request.user_payload["username"]
+        # 같은 글자를 직접 입력한 턴과 제안을 고른 턴은 다른 입력으로 취급
+        coalesce_input = f"{suggestion['kind']}:{suggestion['text']}" if suggestion else user_input
+        try:
+            (response_data, status), _ = turns.run(
+                username, coalesce_input, lambda digest: _run_turn(request, username, user_input, digest, suggestion))
+        except TurnBusy:
+            response = JsonResponse({"error": "이전 메시지를 처리하고 있습니다. 잠시 후 다시 시도해주세요."}, status=409)
+            response["Retry-After"] = "1"
+            return response
+        return JsonResponse(response_data, status=status)
+    except Exception as e:
+        logger.exception("챗봇 처리 중 오류 발생")
+        return JsonResponse({"error": f"오류가 발생했습니다: {str(e)}"}, status=500)
+
+
+def _run_turn(request, username, user_input, digest, suggestion=None):
+    """사용자 턴 잠금 안에서 실행: 세션을 다시 읽고 워크플로우 실행 후 세션 저장까지 마침"""
+    session = request.session
+    if session.session_key:
+        # 잠금을 기다리는 동안 이전 턴이 저장한 상태를 반영
+        stored = session.load()
+        session.clear()
+        session.update(stored)
 
+    # 다른 워커가 이미 처리한 중복 요청이면 직전 응답 반환
+    last_turn = session.get('last_turn')
+    if is_recent_duplicate(last_turn, digest):
+        TURNS_COALESCED.inc(scope="session")
+        return {"message": last_turn["message"]}, 200
+
+    state = session.get('state', None)
+    if state is None:
+        state = INITIAL_STATE.copy()
+    state["user_id"] = username
+    state["user_input"] = user_input
+    state["suggestion"] = suggestion
+
+    started = time.perf_counter()
+    try:
         result = workflow.invoke(state)
-        if result is None:
-            return JsonResponse({"error": "워크플로우 실행 결과가 없습니다."}, status=500)
-        print(result)
-        state.update(result)
+    except Exception:
+        CHAT_TURNS.inc(intent="error", status="error")
+        raise
+    if result is None:
+        CHAT_TURNS.inc(intent="none", status="error")
+        return {"error": "워크플로우 실행 결과가 없습니다."}, 500
+    intent = result.get("intent") or "UNKNOWN"
+    CHAT_TURN_SECONDS.observe(time.perf_counter() - started, intent=intent)
+    CHAT_TURNS.inc(intent=intent, status="ok")
+    logger.debug("워크플로우 결과", extra={"state": result, "sample": True})
+    state.update(result)
 
-        request.session['state'] = state
+    message = state.get("response", "죄송합니다. 처리 중 문제가 발생했습니다.")
+    session['state'] = state
+    session['last_turn'] = {"digest": digest, "message": message, "at": time.time()}
+    SESSION_STATE_BYTES.observe(len(json.dumps(state, ensure_ascii=False, default=str).encode("utf-8")))
 
-        response_data = {
-            "message": state.get("response", "죄송합니다. 처리 중 문제가 발생했습니다.")
-        }
-        return JsonResponse(response_data, status=200)
-    except Exception as e:
-        return JsonResponse({"error": f"오류가 발생했습니다: {str(e)}"}, status=500)
+    # 잠금을 풀기 전에 저장해야 다음 턴이 이 상태를 읽음 (새 세션이면 쿠키 발급을 위해 modified 유지)
+    created = session.session_key is None
+    session.save()
+    session.modified = created
+    return {"message": message}, 200
 
 @csrf_exempt
 @require_http_methods(["GET"])
+@admission("auth")
 def check_username(request):
     username = request.GET.get("username", "").strip()
     if not username:
         return JsonResponse({"error": "아이디를 입력해주세요."}, status=400)
 
-    exists = User.objects.filter(username=username).exists()
+    exists = user_cache.get(username) is not None
     return JsonResponse({"exists": exists}, status=200)
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@admission("auth")
 def register_user(request):
     try:
         if not request.body:
@@ -164,6 +229,7 @@ def generate_jwt(user):
 
 @csrf_exempt
 @require_http_methods(["POST"])
+@admission("auth")
 def login_user(request):
     try:
         if not request.body:
@@ -196,71 +262,332 @@ def login_user(request):
     except Exception as e:
         return JsonResponse({"error": f"로그인 중 오류가 발생했습니다: {str(e)}"}, status=500)
 
-# 새 엔드포인트: 로그인한 사용자의 자기소개서(자소서) 조회 (saved_cover_letter 테이블)
+# 내역 목록: 이름 → (테이블, 목록에 포함할 컬럼) / 목록에는 제목과 본문 앞부분만 포함
+HISTORY_SECTIONS = {
+    "resumes": ("saved_cover_letter", """
+        SUBSTR(채용공고, 1, 200) AS title,
+        SUBSTR(자기소개서, 1, 100) AS snippet,
+        DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
+    """),
+    "interviews": ("personal_interview_question", """
+        SUBSTR(면접질문, 1, 300) AS question,
+        DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
+    """),
+    "job_postings": ("selected_job_posting", """
+        제목,
+        회사명,
+        링크 AS link,
+        DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
+    """),
+}
+
+# 대시보드의 세 내역 조회를 동시에 실행
+_dashboard_executor = ThreadPoolExecutor(max_workers=DB_POOL_SIZE, thread_name_prefix="dashboard")
+
+# 새 엔드포인트: 로그인한 사용자의 자기소개서(자소서) 목록 (saved_cover_letter 테이블)
+# 목록에는 제목과 본문 앞부분만 포함, 본문 전체는 resumes/<id>/ 로 조회
 @csrf_exempt
 @require_http_methods(["GET"])
 @jwt_required
+@admission("history")
 def get_resumes(request):
-    username = request.user_payload["username"]
-    conn = get_db_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    return _history_page(request, "resumes")
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def get_resume_detail(request, resume_id):
     query = """
-    SELECT 
+    SELECT
         id,
         채용공고 AS title,
         자기소개서 AS content,
         DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
     FROM saved_cover_letter
-    WHERE customer_id = %s
+    WHERE id = %s AND customer_id = %s
     """
-    cursor.execute(query, (username,))
-    resumes = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return JsonResponse(resumes, safe=False)
+    return _history_detail(request, query, resume_id)
 
-# 새 엔드포인트: 로그인한 사용자의 면접 질문 조회 (personal_interview_question 테이블)
+# 새 엔드포인트: 로그인한 사용자의 면접 질문 목록 (personal_interview_question 테이블)
 @csrf_exempt
 @require_http_methods(["GET"])
 @jwt_required
+@admission("history")
 def get_interviews(request):
-    username = request.user_payload["username"]
-    conn = get_db_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    return _history_page(request, "interviews")
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def get_interview_detail(request, interview_id):
     query = """
-    SELECT 
-        id, 
-        면접질문 AS question, 
+    SELECT
+        id,
+        면접질문 AS question,
         DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
     FROM personal_interview_question
-    WHERE customer_id = %s
+    WHERE id = %s AND customer_id = %s
     """
-    cursor.execute(query, (username,))
-    interviews = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return JsonResponse(interviews, safe=False)
+    return _history_detail(request, query, interview_id)
 
-# 새 엔드포인트: 로그인한 사용자의 확인한 채용공고 조회 (selected_job_posting 테이블)
+# 새 엔드포인트: 로그인한 사용자의 확인한 채용공고 목록 (selected_job_posting 테이블)
 @csrf_exempt
 @require_http_methods(["GET"])
 @jwt_required
+@admission("history")
 def get_job_postings(request):
-    username = request.user_payload["username"]
-    conn = get_db_connection()
-    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    return _history_page(request, "job_postings")
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def get_job_posting_detail(request, posting_id):
     query = """
-    SELECT 
-        id,
-        제목,
-        회사명,
-        링크 AS link,
+    SELECT
+        id, 제목, 회사명, 사용기술, 근무지역, 근로조건, 모집기간, 링크 AS link,
+        주요업무, 자격요건, 우대사항, 복지_및_혜택, 채용절차, 학력, 근무지역_상세, 마감일자,
         DATE_FORMAT(저장일시, '%%Y-%%m-%%d') AS date
     FROM selected_job_posting
-    WHERE customer_id = %s
+    WHERE id = %s AND customer_id = %s
     """
-    cursor.execute(query, (username,))
-    job_postings = cursor.fetchall()
+    return _history_detail(request, query, posting_id)
+
+# 새 엔드포인트: 로그인한 사용자의 맞춤 추천 공고 (야간 배치 결과, LLM 호출 없음)
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def get_recommendations(request):
+    username = request.user_payload["username"]
+    with db_pool.connection() as conn:
+        job_ids = recommend_for_user(conn, bot.retriever.index(), username)
+        items = _fetch_postings(conn, job_ids)
+    return JsonResponse({"items": items})
+
+# 새 엔드포인트: 검색어 자동완성 ?q=입력 중인 글자&limit=개수 (최대 AUTOCOMPLETE_TOP_K)
+# 제목 단어/구, 기술, 회사명 제안을 공고 수 순으로 반환, 고른 제안은 /api/chat/ 에 {"suggestion": {"text", "kind"}} 로 전달
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def autocomplete(request):
+    index = bot.retriever.index()
+    if index is None:
+        return JsonResponse({"error": "공고 검색 인덱스를 준비 중입니다."}, status=503)
+    try:
+        limit = max(1, min(int(request.GET.get("limit", AUTOCOMPLETE_TOP_K)), AUTOCOMPLETE_TOP_K))
+    except ValueError:
+        return JsonResponse({"error": "limit 은 숫자여야 합니다."}, status=400)
+    query = request.GET.get("q", "")
+    started = time.perf_counter()
+    suggestions = index.suggestions.suggest(query, limit)
+    RETRIEVAL_SECONDS.observe(time.perf_counter() - started, stage='autocomplete')
+    response = JsonResponse({"query": query, "suggestions": suggestions})
+    # 키 입력마다 호출되므로 같은 입력은 브라우저 캐시 사용 (인덱스는 크롤링 세대마다 바뀜)
+    response["Cache-Control"] = "private, max-age=60"
+    return response
+
+# 새 엔드포인트: 기술/지역/경력/마감일 조건 공고 검색, 쉼표 구분
+#   ?skills=모두 포함&any_skills=하나 이상&exclude_skills=제외
+#   &regions=서울,경기 성남시 (하나 이상)&career=연차 (신입 0)&deadline_within=마감까지 일수&include_open=true (상시채용 포함)
+#   &include_expired=true (마감된 공고 포함, 기본은 제외)
+# 조건은 검색 인덱스의 비트맵 연산으로 계산, 최신 공고부터 offset/limit
+# facets: 지역/시군구/경력/마감일 값별 공고 수 (각 패싯은 자기 조건을 뺀 나머지 조건의 결과에서 셈, 다른 값으로 바꿨을 때의 개수)
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def search_jobs(request):
+    index = bot.retriever.index()
+    if index is None:
+        return JsonResponse({"error": "공고 검색 인덱스를 준비 중입니다."}, status=503)
+    try:
+        limit = max(1, min(int(request.GET.get("limit", HISTORY_PAGE_SIZE)), HISTORY_MAX_PAGE_SIZE))
+        offset = max(0, int(request.GET.get("offset", 0)))
+        career = request.GET.get("career")
+        career = int(career) if career not in (None, "") else None
+        deadline_within = request.GET.get("deadline_within")
+        deadline_within = int(deadline_within) if deadline_within not in (None, "") else None
+    except ValueError:
+        return JsonResponse({"error": "limit, offset, career, deadline_within 은 숫자여야 합니다."}, status=400)
+    all_of, any_of, none_of = (_split_param(request, name) for name in ("skills", "any_skills", "exclude_skills"))
+    regions = _split_param(request, "regions")
+    include_open = request.GET.get("include_open", "false").lower() == "true"
+    include_expired = request.GET.get("include_expired", "false").lower() == "true"
+
+    facets = index.facets
+    base = index.skills.match(all_of, any_of, none_of)
+    if not include_expired:
+        base = base & facets.active()
+    filters, unknown_regions = {}, []
+    if regions:
+        filters["region"], unknown_regions = facets.region_filter(regions)
+    if career is not None:
+        filters["career"] = facets.career_filter(career)
+    if deadline_within is not None:
+        filters["deadline"] = facets.deadline_filter(0, deadline_within, include_open=include_open)
+    elif include_open:
+        filters["deadline"] = facets.open_ended()
+
+    def matching(skip=None):
+        result = base
+        for name, bitmap in filters.items():
+            if name != skip:
+                result = result & bitmap
+        return result
+
+    positions = matching().to_array()
+    job_ids = sorted(index.ids[positions].tolist(), reverse=True)
+    region_positions = matching("region").to_array() if "region" in filters else positions
+    counts = {
+        "region": facets.region_counts(region_positions),
+        "district": facets.district_counts(region_positions),
+        "career": facets.career_counts(matching("career").to_array() if "career" in filters else positions),
+        "deadline": facets.deadline_counts(matching("deadline").to_array() if "deadline" in filters else positions),
+    }
+    with db_pool.connection() as conn:
+        items = _fetch_postings(conn, job_ids[offset:offset + limit])
+    if not all(index.same_posting(item["id"], item["link"]) for item in items):
+        # 인덱스를 만든 뒤 공고 테이블을 다시 크롤링 (같은 id 가 다른 공고)
+        return JsonResponse({"error": "공고 검색 인덱스를 준비 중입니다."}, status=503)
+    unknown_skills = [term for term in all_of + any_of + none_of if not index.skills.resolve(term)]
+    suggestions = {}
+    for term in unknown_skills:
+        fixed = index.fuzzy.correct(term)
+        if fixed:
+            suggestions[term] = fixed
+    return JsonResponse({
+        "total": len(job_ids),
+        "items": items,
+        "facets": counts,
+        # 사전/인덱스에 없는 기술 이름, 지역 이름 (오타 확인용), 기술 이름은 가까운 어휘 제안 ("pyhton" → "Python")
+        "unknown_skills": unknown_skills,
+        "suggestions": suggestions,
+        "unknown_regions": unknown_regions,
+    })
+
+def _split_param(request, name):
+    return [term.strip() for term in request.GET.get(name, "").split(",") if term.strip()]
+
+def _fetch_postings(conn, job_ids):
+    """공고 id 목록 → 목록용 공고 정보 (id 순서 유지)"""
+    if not job_ids:
+        return []
+    cursor = conn.cursor(pymysql.cursors.DictCursor)
+    cursor.execute(f"""
+    SELECT id, 제목, 회사명, 사용기술, 근무지역, 근로조건, 마감일자, 링크 AS link
+    FROM job_posting_new
+    WHERE id IN ({", ".join(["%s"] * len(job_ids))})
+    """, job_ids)
+    rows = {row["id"]: row for row in cursor.fetchall()}
     cursor.close()
-    conn.close()
-    return JsonResponse(job_postings, safe=False)
+    return [rows[job_id] for job_id in job_ids if job_id in rows]
+
+def _history_page(request, section):
+    """내역 목록 한 페이지: {"items": [...], "next_cursor": 다음 페이지 커서 또는 null}"""
+    try:
+        cursor, limit = page_params(request)
+    except InvalidPage as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    username = request.user_payload["username"]
+    # 내역이 바뀌지 않았으면 DB 조회 없이 304
+    not_modified, headers = versions.conditional(
+        request, [section], username, variant=f"{request.GET.get('cursor', '')};{limit}")
+    if not_modified is not None:
+        return not_modified
+    items, next_cursor = _fetch_section(section, username, cursor, limit)
+    response = JsonResponse({"items": items, "next_cursor": next_cursor})
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+def _fetch_section(section, username, cursor, limit):
+    table, columns = HISTORY_SECTIONS[section]
+    with db_pool.connection() as conn:
+        return fetch_page(conn, table, columns, username, cursor, limit)
+
+@csrf_exempt
+@require_http_methods(["GET"])
+@jwt_required
+@admission("history")
+def get_dashboard(request):
+    """설정 화면용: 세 내역의 첫 페이지를 한 번에 조회 (이어지는 페이지는 각 목록 API 에 cursor 로 요청)
+
+    ETag/Last-Modified 는 사용자별 내역 버전으로 계산 (jumpit/versions.py)
+    """
+    try:
+        _, limit = page_params(request)
+    except InvalidPage as e:
+        return JsonResponse({"error": str(e)}, status=400)
+    username = request.user_payload["username"]
+    # 세 내역 모두 바뀌지 않았으면 DB 조회 없이 304
+    not_modified, headers = versions.conditional(request, list(HISTORY_SECTIONS), username, variant=str(limit))
+    if not_modified is not None:
+        return not_modified
+    futures = {
+        section: _dashboard_executor.submit(
+            contextvars.copy_context().run, _fetch_section, section, username, None, limit)
+        for section in HISTORY_SECTIONS
+    }
+    payload = {}
+    for section, future in futures.items():
+        items, next_cursor = future.result()
+        payload[section] = {"items": items, "next_cursor": next_cursor}
+    response = JsonResponse(payload, json_dumps_params={"ensure_ascii": False, "separators": (",", ":")})
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+def _history_detail(request, query, item_id):
+    with db_pool.connection() as conn:
+        cursor = conn.cursor(pymysql.cursors.DictCursor)
+        cursor.execute(query, (item_id, request.user_payload["username"]))
+        item = cursor.fetchone()
+        cursor.close()
+    if item is None:
+        return JsonResponse({"error": "내역을 찾을 수 없습니다."}, status=404)
+    return JsonResponse(item)
+
+
+@require_http_methods(["GET"])
+def metrics(request):
+    """Prometheus 형식 지표 (턴/노드/LLM/DB 지연 시간, 토큰 사용량, 캐시 적중률, 크롤러 진행 상황)
+
+    METRICS_TOKEN 을 Bearer 로 보냈거나 METRICS_ALLOWED_IPS 의 주소에서 온 요청만 허용
+    """
+    auth_header = request.META.get("HTTP_AUTHORIZATION", "")
+    token_ok = bool(settings.METRICS_TOKEN) and auth_header.startswith("Bearer ") and hmac.compare_digest(
+        auth_header[len("Bearer "):].encode(), settings.METRICS_TOKEN.encode())
+    if not token_ok and client_ip(request) not in settings.METRICS_ALLOWED_IPS:
+        return JsonResponse({"error": "지표를 조회할 권한이 없습니다."}, status=403)
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@require_http_methods(["GET"])
+def debug_traces(request):
+    """최근 샘플링된 요청 id 목록 (DEBUG 모드 전용)"""
+    if not settings.DEBUG:
+        return JsonResponse({'error': '찾을 수 없습니다.'}, status=404)
+    return JsonResponse({'request_ids': recent_request_ids()})
+
+
+@require_http_methods(["GET"])
+def debug_trace_detail(request, request_id):
+    """요청 한 건의 노드/LLM/DB span 워터폴 (DEBUG 모드 전용)"""
+    if not settings.DEBUG:
+        return JsonResponse({'error': '찾을 수 없습니다.'}, status=404)
+    trace = get_trace(request_id)
+    if trace is None:
+        return JsonResponse({'error': '해당 요청의 트레이스가 없습니다.'}, status=404)
+    return JsonResponse(trace.waterfall(), json_dumps_params={'ensure_ascii': False})
+
+
+@require_http_methods(["GET"])
+def debug_prompts(request):
+    """템플릿별 프롬프트 토큰 통계와 가장 큰 프롬프트 목록 (DEBUG 모드 전용)"""
+    if not settings.DEBUG:
+        return JsonResponse({'error': '찾을 수 없습니다.'}, status=404)
+    return JsonResponse(prompt_report.snapshot(), json_dumps_params={'ensure_ascii': False})
@@ -24,6 +24,10 @@ const Settings = () => {
   const [resumes, setResumes] = useState([]);
   const [interviews, setInterviews] = useState([]);
   const [jobPostings, setJobPostings] = useState([]);
+  // 다음 페이지 커서 (null 이면 마지막 페이지)
+  const [resumesCursor, setResumesCursor] = useState(null);
+  const [interviewsCursor, setInterviewsCursor] = useState(null);
+  const [jobPostingsCursor, setJobPostingsCursor] = useState(null);
 
   // 모달에서 표시할 자기소개서
   const [selectedResume, setSelectedResume] = useState(null);
@@ -43,42 +47,46 @@ const Settings = () => {
     }
   }, []);
 
-  // (2) 로그인된 경우, 백엔드 API를 통해 데이터 불러오기
-  useEffect(() => {
+  // 내역 API 한 페이지 조회: { items, next_cursor }
+  const fetchPage = (path, cursor) => {
     const token = localStorage.getItem("token");
-    if (isLoggedIn && token) {
-      // 자기소개서 목록
-      fetch("http://127.0.0.1:8000/api/resumes/", {
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${token}`,
-        },
-      })
-        .then((res) => res.json())
-        .then((data) => setResumes(data))
-        .catch((err) => console.error("Resumes API 에러:", err));
+    const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : "";
+    return fetch(`http://127.0.0.1:8000/api/${path}/${query}`, {
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${token}`,
+      },
+    }).then((res) => res.json());
+  };
 
-      // 면접 연습 내역
-      fetch("http://127.0.0.1:8000/api/interviews/", {
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${token}`,
-        },
+  // 다음 페이지를 불러와 기존 목록 뒤에 붙임
+  const loadMore = (path, setItems, setCursor, cursor, label) => {
+    fetchPage(path, cursor)
+      .then((data) => {
+        setItems((prev) => [...prev, ...data.items]);
+        setCursor(data.next_cursor);
       })
-        .then((res) => res.json())
-        .then((data) => setInterviews(data))
-        .catch((err) => console.error("Interviews API 에러:", err));
+      .catch((err) => console.error(`${label} API 에러:`, err));
+  };
 
-      // 확인한 채용공고 목록
-      fetch("http://127.0.0.1:8000/api/job-postings/", {
-        headers: {
-          "Content-Type": "application/json",
-          Authorization: `Bearer ${token}`,
-        },
-      })
-        .then((res) => res.json())
-        .then((data) => setJobPostings(data))
-        .catch((err) => console.error("Job Postings API 에러:", err));
+  // (2) 로그인된 경우, 대시보드 API 한 번으로 세 내역의 첫 페이지 불러오기
+  // (변경이 없으면 브라우저가 ETag 로 확인해 304 응답을 재사용)
+  useEffect(() => {
+    const token = localStorage.getItem("token");
+    if (isLoggedIn && token) {
+      fetchPage("dashboard", null)
+        .then((data) => {
+          // 자기소개서 목록 (제목, 본문 앞부분)
+          setResumes(data.resumes.items);
+          setResumesCursor(data.resumes.next_cursor);
+          // 면접 연습 내역
+          setInterviews(data.interviews.items);
+          setInterviewsCursor(data.interviews.next_cursor);
+          // 확인한 채용공고 목록
+          setJobPostings(data.job_postings.items);
+          setJobPostingsCursor(data.job_postings.next_cursor);
+        })
+        .catch((err) => console.error("Dashboard API 에러:", err));
     }
   }, [isLoggedIn]);
 
@@ -92,11 +100,32 @@ const Settings = () => {
     setResumes([]);
     setInterviews([]);
     setJobPostings([]);
+    setResumesCursor(null);
+    setInterviewsCursor(null);
+    setJobPostingsCursor(null);
   };
 
-  // 자소서 "보기" 버튼 -> 모달 오픈
+  // 자소서 "보기" 버튼 -> 본문 조회 후 모달 오픈 (목록에는 본문 앞부분만 포함)
   const viewResume = (resume) => {
-    setSelectedResume(resume);
+    fetchPage(`resumes/${resume.id}`, null)
+      .then((data) => setSelectedResume(data))
+      .catch((err) => console.error("Resume API 에러:", err));
+  };
+
+  // "더 보기" 버튼 (다음 페이지가 있을 때만 표시)
+  const renderMoreButton = (cursor, onClick) => {
+    if (!cursor) return null;
+    return (
+      <div className="text-center">
+        <button
+          className="btn btn-sm px-4 rounded-5"
+          style={{ backgroundColor: "#5e6aec", color: "white" }}
+          onClick={onClick}
+        >
+          더 보기
+        </button>
+      </div>
+    );
   };
 
   // 모달 닫기
@@ -403,6 +432,9 @@ const Settings = () => {
                           <strong>작성된 자기소개서</strong>
                         </h3>
                         {renderResumesTable()}
+                        {renderMoreButton(resumesCursor, () =>
+                          loadMore("resumes", setResumes, setResumesCursor, resumesCursor, "Resumes")
+                        )}
                       </div>
                     );
                   case "interviews":
@@ -412,6 +444,9 @@ const Settings = () => {
                           <strong>면접 연습 내역</strong>
                         </h3>
                         {renderInterviewsTable()}
+                        {renderMoreButton(interviewsCursor, () =>
+                          loadMore("interviews", setInterviews, setInterviewsCursor, interviewsCursor, "Interviews")
+                        )}
                       </div>
                     );
                   case "jobs":
@@ -421,6 +456,9 @@ const Settings = () => {
                           <strong>확인한 채용공고</strong>
                         </h3>
                         {renderJobsTable()}
+                        {renderMoreButton(jobPostingsCursor, () =>
+                          loadMore("job-postings", setJobPostings, setJobPostingsCursor, jobPostingsCursor, "Job Postings")
+                        )}
                       </div>
                     );
                   default: